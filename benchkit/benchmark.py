@@ -4,26 +4,61 @@
 Module of the main benchmark class, parent of all benchkit benchmarks.
 """
 
+import datetime
 import inspect
+import io
 import itertools
 import json
+import math
 import os
 import pathlib
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from multiprocessing import Barrier
-from subprocess import CalledProcessError
+from subprocess import CalledProcessError, TimeoutExpired
 from typing import IO, Any, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from benchkit.commandwrappers import CommandWrapper
 from benchkit.dependencies import check_dependencies
 from benchkit.dependencies.packages import PackageDependency
+from benchkit.helpers.linux.quiescence import QuiescenceGate, SystemSnapshot, own_tids
 from benchkit.platforms import get_current_platform
+from benchkit.platforms.utils import partition_cpus
+from benchkit.results.adaptive import AdaptiveRepetitions
+from benchkit.results.cache import ResultCache
+from benchkit.results.durations import RunDurationModel, record_key
+from benchkit.results.journal import CampaignJournal
+from benchkit.results.parquet import (
+    ROLE_BUILD_VARIABLE,
+    ROLE_CONSTANT,
+    ROLE_RUN_VARIABLE,
+    ParquetResultSink,
+    header_metadata,
+    parquet_enabled,
+)
+from benchkit.results.sink import CsvResultSink, FlushPolicy
+from benchkit.results.warmup import WarmupPolicy
 from benchkit.sharedlibs import SharedLib
 from benchkit.sharedlibs.tiltlib import TiltLib
 from benchkit.shell.shellasync import AsyncProcess, shell_async
+from benchkit.utils.buildcache import BuildCache
 from benchkit.utils.gdb import generate_gdb_script_from_cmd
-from benchkit.utils.misc import CSV_SEPARATOR, TimeMeasure, dict_union, seconds2pretty
+from benchkit.utils.misc import TimeMeasure, dict_union, seconds2pretty
 from benchkit.utils.system import get_boot_args
-from benchkit.utils.tee import teeprint
+from benchkit.utils.tracing import (
+    CATEGORY_RUN,
+    Tracer,
+    callable_name,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+)
 from benchkit.utils.types import (
     Command,
     Constants,
@@ -32,13 +67,19 @@ from benchkit.utils.types import (
     Pretty,
     SplitCommand,
 )
-from benchkit.utils.variables import list_groupby
+from benchkit.utils.variables import ParameterSpace, list_groupby
 
 RecordKey = str
 RecordValue = Any
 RecordParameters = Dict[RecordKey, RecordValue]
 RecordResult = Dict[RecordKey, RecordValue]
 
+_REMAINING_ESTIMATE_PERIOD_SECONDS = 1.0
+
+
+class _RunInterrupted(Exception):
+    """Raised when a run is interrupted because the campaign is requested to stop."""
+
 
 class WriteRecordFileFunction(Protocol):
     """
@@ -79,6 +120,38 @@ class PostRunHook(Protocol):
     ) -> Optional[RecordResult]: ...
 
 
+def deferrable(post_run_hook: PostRunHook) -> PostRunHook:
+    """
+    Decorator declaring that a post-run hook can be deferred, i.e. run in the background while the
+    next records of the campaign run (e.g. hooks post-processing profiles into reports or
+    flamegraphs). The result lines of the run are written once its deferred hooks are done.
+    A deferrable hook must only depend on its arguments (not on the state of its object, that the
+    next runs may overwrite), and it runs after the other post-run hooks of the run.
+
+    Args:
+        post_run_hook (PostRunHook): the post-run hook (function or method) to decorate.
+
+    Returns:
+        PostRunHook: the same hook, declared as deferrable.
+    """
+    post_run_hook.deferrable = True
+    return post_run_hook
+
+
+def is_deferrable(post_run_hook: PostRunHook) -> bool:
+    """
+    Return whether the given post-run hook is declared as deferrable.
+
+    Args:
+        post_run_hook (PostRunHook): the post-run hook (possibly a partial function).
+
+    Returns:
+        bool: whether the hook can be deferred.
+    """
+    hook = getattr(post_run_hook, "func", post_run_hook)  # functools.partial
+    return getattr(hook, "deferrable", False)
+
+
 class CommandAttachment(Protocol):
     """
     Callback for a command that will be attached to the benchmark command (asynchronously).
@@ -134,12 +207,42 @@ class Benchmark:
 
         self._total_nb_runs = None
         self._nb_runs_done = 0
-        self._first_line_is_printed = False
+        self._result_sink: CsvResultSink | None = None
+        self._parquet_sink: ParquetResultSink | None = None
+        self._parquet_output_path: pathlib.Path | None = None
+        self._flush_policy: FlushPolicy | None = None
 
         self._debug = False
         self._gdb = False
         self._flamegraph_path: Optional[PathType] = None
 
+        self._nb_workers = 1
+        self._stop_on_first_finish = False
+        self._results_lock = threading.RLock()
+        self._worker_local = threading.local()
+        self._stop_event = threading.Event()
+        self._build_cache: BuildCache | None = None
+        self._pipelined_builds = False
+        self._build_cpus: List[int] | None = None
+        self._allocated_cpus: List[int] | None = None
+        self._current_build_dir: pathlib.Path | None = None
+        self._adaptive_repetitions: AdaptiveRepetitions | None = None
+        self._duration_model = RunDurationModel()
+        self._warmup: WarmupPolicy | None = None
+        self._journal_path: pathlib.Path | None = None
+        self._journal: CampaignJournal | None = None
+        self._trace = False
+        self._timeout_factor: float | None = None
+        self._pending_runs = 0
+        self._group_pending_runs: Dict[Any, List[Any]] = {}
+        self._remaining_seconds: float | None = None
+        self._post_processing_workers = 1
+        self._post_processing_cpus: List[int] | None = None
+        self._post_processing: ThreadPoolExecutor | None = None
+        self._post_processing_futures: List[Future] = []
+        self._remaining_seconds_deadline = 0.0
+        self._quiescence: QuiescenceGate | None = None
+
     @property
     def bench_src_path(self) -> pathlib.Path:
         """
@@ -234,11 +337,14 @@ class Benchmark:
         nb_runs_done: int,
         bench_duration: int,
         other_campaigns_seconds: int,
+        remaining_seconds: float | None = None,
     ) -> None:
         time_suffix = ""
         full_time_str = ""
         if bench_duration is not None:
             remaining_seconds = (total_nb_runs - nb_runs_done) * bench_duration
+        if remaining_seconds is not None:
+            remaining_seconds = math.ceil(remaining_seconds)
             remaining_time = seconds2pretty(remaining_seconds)
             time_suffix = (
                 f", current campaign expected remaining time: "
@@ -269,7 +375,8 @@ class Benchmark:
         cmdwraps_deps = [
             command_wrapper.dependencies() for command_wrapper in self._command_wrappers
         ]
-        all_deps_it = itertools.chain.from_iterable(sharedlibs_deps + cmdwraps_deps)
+        workers_deps = [[PackageDependency("util-linux")]] if self._nb_workers > 1 else []
+        all_deps_it = itertools.chain.from_iterable(sharedlibs_deps + cmdwraps_deps + workers_deps)
         all_deps = list(all_deps_it)
         return all_deps
 
@@ -277,13 +384,10 @@ class Benchmark:
         """
         Check that dependencies of the current benchmark are present on the target platform.
         """
-        if self.platform.comm.is_local:
-            check_dependencies(
-                all_dependencies=self.dependencies(),
-                platform=self.platform,
-            )
-        else:  # TODO skip remote dependency check for now because of inconsistencies
-            pass
+        check_dependencies(
+            all_dependencies=self.dependencies(),
+            platform=self.platform,
+        )
 
     def configure_variables(
         self,
@@ -298,6 +402,22 @@ class Benchmark:
         pretty_variables: Pretty,
         debug: bool,
         gdb: bool,
+        nb_workers: int = 1,
+        stop_on_first_finish: bool = False,
+        build_cache_dir: PathType | None = None,
+        pipelined_builds: bool = False,
+        build_cpus: List[int] | None = None,
+        adaptive_repetitions: AdaptiveRepetitions | None = None,
+        flush_policy: FlushPolicy | None = None,
+        parquet_output_path: PathType | None = None,
+        duration_model_path: PathType | None = None,
+        timeout_factor: float | None = None,
+        warmup: WarmupPolicy | None = None,
+        journal_path: PathType | None = None,
+        trace: bool = False,
+        post_processing_workers: int = 1,
+        post_processing_cpus: List[int] | None = None,
+        quiescence: QuiescenceGate | None = None,
     ) -> None:
         """
         Configure the benchmark variables once they are associated with a campaign.
@@ -327,12 +447,94 @@ class Benchmark:
                 whether to enable debug.
             gdb (bool):
                 whether to enable gdb.
+            nb_workers (int, optional):
+                number of worker slots running records in parallel. Each worker slot is pinned to
+                its own disjoint set of CPUs. Records of the same build group are dispatched on the
+                available slots. Defaults to 1 (records run one after the other).
+            stop_on_first_finish (bool, optional):
+                whether to stop the whole campaign as soon as the first record completes; the runs
+                still executing in the other worker slots are interrupted and not recorded.
+                Defaults to False.
+            build_cache_dir (PathType | None, optional):
+                directory of the platform where the artifacts of the builds (see
+                `build_artifacts`) are cached, keyed by the build variables, the constants, the
+                benchmark duration and the state of the git sources. A build with the same key
+                restores its artifacts instead of building again.
+                Defaults to None (no build cache).
+            pipelined_builds (bool, optional):
+                whether to build the next build group while the records of the current one run
+                (see `pipelined_build_base_dir`). The builds need their own CPUs, disjoint from the
+                ones of the runs: `build_cpus`, the CPUs that are not isolated, or the CPUs left
+                out of the worker slots; without them, the builds are sequential.
+                Defaults to False.
+            build_cpus (List[int] | None, optional):
+                CPUs reserved for the pipelined builds and the deferred post-processing, the
+                records run on the other CPUs. Defaults to None.
+            adaptive_repetitions (AdaptiveRepetitions | None, optional):
+                policy repeating each record between a minimum and a maximum number of runs, until
+                the precision of a metric reaches its target; `nb_runs` is then ignored.
+                Defaults to None (each record runs `nb_runs` times).
+            flush_policy (FlushPolicy | None, optional):
+                when the result lines are written to the CSV output file. They are also written at
+                the end of each build group and when the campaign ends or is terminated.
+                Defaults to None (default policy).
+            parquet_output_path (PathType | None, optional):
+                path of an additional Parquet output file, with the role of each column (constant,
+                build variable, run variable or metric) and the header in its metadata. Requires
+                pyarrow. Defaults to None (no Parquet output).
+            duration_model_path (PathType | None, optional):
+                path of the file where the measured wall time of each run is stored, such that the
+                run duration model (used for the remaining time estimates, the order of the records
+                in parallel workers and the default timeouts) is reused by the next executions.
+                Defaults to None (the model only learns from the current execution).
+            timeout_factor (float | None, optional):
+                when set, runs that do not specify a timeout are stopped after this factor times
+                their predicted duration, once the duration model can predict it.
+                Defaults to None (no default timeout).
+            warmup (WarmupPolicy | None, optional):
+                warmup runs of each record (and warmup result lines within each run), whose
+                results are only stored in the record data directory, flagged with a `warmup`
+                column. Defaults to None (no warmup).
+            journal_path (PathType | None, optional):
+                path of the journal recording the start, completion and failure of each
+                execution with its results. When continuing, the completed executions are read
+                from the journal and the CSV output is regenerated from it.
+                Defaults to None (no journal).
+            trace (bool, optional):
+                whether to record the time spent in each phase of the campaign (builds, hooks,
+                wrappers, shell commands, copies, parsing, result writes) and export it as a
+                Chrome trace (`trace.json` in the base data directory, or next to the CSV output
+                file), along with a summary of the overhead of the framework. Only one campaign of
+                a process can be traced at a time. Defaults to False.
+            post_processing_workers (int, optional):
+                number of background workers running the deferrable post-run hooks (see
+                `deferrable`) while the next records run; 0 runs them synchronously.
+                Defaults to 1.
+            post_processing_cpus (List[int] | None, optional):
+                CPUs the background workers are pinned to. Defaults to None (the CPUs outside the
+                ones running the benchmark; the deferrable hooks run synchronously when there is
+                none and the benchmark runs locally).
+            quiescence (QuiescenceGate | None, optional):
+                gate waiting for the system to be quiet before each repetition, and retrying the
+                repetitions with interference. The result lines get the time waited
+                (`quiescence_wait_seconds`), the remaining noise (`quiescence_noise`), the
+                interference (`interference`) and the number of retries (`nb_retries`); the
+                retried runs are kept in the record data directory, suffixed with `-retry-<n>`.
+                Defaults to None (no gate).
 
         Raises:
             ValueError: if the benchmark is already configured.
         """
         if self._configured:
             raise ValueError("Benchmark already configured")
+        if nb_workers < 1:
+            raise ValueError(f"Invalid number of workers: {nb_workers}")
+        if timeout_factor is not None and timeout_factor <= 0:
+            raise ValueError(f"Invalid timeout factor: {timeout_factor}")
+        if post_processing_workers < 0:
+            raise ValueError(
+                f"Invalid number of post-processing workers: {post_processing_workers}"
+            )
 
         self._configured = True
         self._experiment_name = experiment_name
@@ -351,6 +553,34 @@ class Benchmark:
         self._debug = debug
         self._gdb = gdb
 
+        self._nb_workers = nb_workers
+        self._stop_on_first_finish = stop_on_first_finish
+
+        if build_cache_dir is not None:
+            self._build_cache = BuildCache(cache_dir=build_cache_dir, platform=self.platform)
+
+        self._pipelined_builds = pipelined_builds
+        self._build_cpus = build_cpus
+
+        self._adaptive_repetitions = adaptive_repetitions
+        if adaptive_repetitions is not None:
+            # upper bound, records stop earlier once precise enough
+            self._nb_runs = adaptive_repetitions.max_runs
+
+        self._flush_policy = flush_policy
+        if parquet_output_path is not None:
+            self._parquet_output_path = pathlib.Path(parquet_output_path)
+
+        self._duration_model = RunDurationModel(model_path=duration_model_path)
+        self._timeout_factor = timeout_factor
+        self._warmup = warmup
+        if journal_path is not None:
+            self._journal_path = pathlib.Path(journal_path)
+        self._trace = trace
+        self._post_processing_workers = post_processing_workers
+        self._post_processing_cpus = post_processing_cpus
+        self._quiescence = quiescence
+
     def valid_experiment_parameters(
         self,
         **kwargs,
@@ -375,6 +605,15 @@ class Benchmark:
 
         return all(results)
 
+    def _all_records_valid(self) -> bool:
+        # Without custom validation, only the core0/core1 variables may invalidate records, which
+        # enables to count the records of a lazy space without iterating over it.
+        return (
+            isinstance(self._variables, ParameterSpace)
+            and type(self).valid_experiment_parameters is Benchmark.valid_experiment_parameters
+            and not {"core0", "core1"}.intersection(self._variables.names)
+        )
+
     def total_nb_runs(self) -> int:
         """
         Compute the total number of runs of this benchmark once configured.
@@ -384,6 +623,18 @@ class Benchmark:
         """
         self._check_config()
 
+        if self._total_nb_runs is None and self._all_records_valid():
+            self._total_nb_runs = len(self._variables) * self._nb_runs
+
+        if (
+            self._total_nb_runs is None
+            and isinstance(self._variables, ParameterSpace)
+            and self._variables.depends_on_results
+        ):
+            # the records are not known before the results of the previous ones, the length of
+            # the space is an upper bound
+            self._total_nb_runs = len(self._variables) * self._nb_runs
+
         if self._total_nb_runs is None:
             nb_runs = self._nb_runs
 
@@ -410,7 +661,8 @@ class Benchmark:
     def expected_total_duration_seconds(self) -> int | None:
         """
         Compute the expected total time (in seconds) of this benchmark once configured.
-        If benchmark_duration_seconds is not set, it returns None.
+        If benchmark_duration_seconds is not set, it is estimated with the run duration model, and
+        None is returned if the model cannot predict it yet.
 
         Returns:
             int | None:
@@ -419,16 +671,117 @@ class Benchmark:
         self._check_config()
 
         if self._benchmark_duration_seconds is None:
-            return None
+            # predicting each record would walk the whole parameter space: the runs are estimated
+            # at the mean measured duration, until their build group is reached
+            mean_seconds = self._duration_model.mean_seconds
+            if mean_seconds is None:
+                return None
+            return math.ceil(mean_seconds * self.total_nb_runs())
 
         bds = self._benchmark_duration_seconds
-        result = self.total_nb_runs() * bds
+        if self._all_records_valid():
+            result = self._variables.expected_duration_seconds(bds) * self._nb_runs
+        else:
+            result = self.total_nb_runs() * bds
         return result
 
+    def expected_total_duration_range_seconds(self) -> Tuple[int, int] | None:
+        """
+        Compute the range of the expected total time (in seconds) of this benchmark once
+        configured. With adaptive repetitions, the number of repetitions of each record is only
+        known to be within the bounds of the policy; otherwise the range is a single value.
+        It returns None if the expected total time is unknown.
+
+        Returns:
+            Tuple[int, int] | None:
+                the minimum and maximum expected total time (in seconds) of this benchmark.
+        """
+        max_seconds = self.expected_total_duration_seconds()
+        if max_seconds is None:
+            return None
+
+        if self._adaptive_repetitions is None:
+            return max_seconds, max_seconds
+
+        min_seconds = max_seconds * self._adaptive_repetitions.min_runs // self._nb_runs
+        return min_seconds, max_seconds
+
+    def _start_pending_group(self, records: List[RecordParameters]) -> None:
+        # only the records of the build group being run are predicted one by one
+        group_pending_runs = {}
+        for record_params in records:
+            experiment_results = self._experiment_results(record_parameters=record_params, run_id=1)
+            if self.valid_experiment_parameters(**experiment_results):
+                entry = group_pending_runs.setdefault(record_key(record_params), [record_params, 0])
+                entry[1] += self._nb_runs
+        self._group_pending_runs = group_pending_runs
+        self._remaining_seconds_deadline = 0.0
+
+    def _predicted_remaining_seconds(self) -> int | None:
+        mean_seconds = self._duration_model.mean_seconds
+        if mean_seconds is None:
+            return None
+
+        total_seconds = 0.0
+        group_nb_runs = 0
+        for record_params, nb_runs in self._group_pending_runs.values():
+            if nb_runs <= 0:
+                continue
+            total_seconds += self._duration_model.predict(record=record_params) * nb_runs
+            group_nb_runs += nb_runs
+        # the records of the next build groups are predicted once their group is reached
+        total_seconds += max(self._pending_runs - group_nb_runs, 0) * mean_seconds
+        return math.ceil(total_seconds)
+
+    def _pending_run_done(
+        self,
+        record_parameters: RecordParameters,
+        all_runs: bool = False,
+    ) -> None:
+        entry = self._group_pending_runs.get(record_key(record_parameters))
+        if entry is None:
+            return
+        nb_runs_done = entry[1] if all_runs else min(1, entry[1])
+        entry[1] -= nb_runs_done
+        self._pending_runs -= nb_runs_done
+        if self._remaining_seconds is not None:
+            predicted_seconds = self._duration_model.predict(record=entry[0])
+            if predicted_seconds is not None:
+                self._remaining_seconds -= min(
+                    predicted_seconds * nb_runs_done, self._remaining_seconds
+                )
+
+    def _remaining_duration_seconds(self) -> float | None:
+        # Predicting the pending runs of the build group costs as much as its number of records,
+        # so the estimate is only recomputed periodically (keeping this cost below a tenth of the
+        # campaign time), and is decremented as the runs complete in between.
+        now = time.monotonic()
+        if now >= self._remaining_seconds_deadline:
+            self._remaining_seconds = self._predicted_remaining_seconds()
+            cost_seconds = time.monotonic() - now
+            self._remaining_seconds_deadline = now + max(
+                _REMAINING_ESTIMATE_PERIOD_SECONDS,
+                10 * cost_seconds,
+            )
+        return self._remaining_seconds
+
+    def _default_timeout(self, record_parameters: RecordParameters) -> int | None:
+        if self._timeout_factor is None or not self._duration_model.knows(record=record_parameters):
+            return None
+        predicted_seconds = self._duration_model.predict(record=record_parameters)
+        return math.ceil(self._timeout_factor * predicted_seconds)
+
+    def _longest_first(self, records: List[RecordParameters]) -> List[RecordParameters]:
+        predictions = [self._duration_model.predict(record=r) for r in records]
+        if None in predictions:
+            return records
+        order = sorted(range(len(records)), key=lambda i: -predictions[i])
+        return [records[i] for i in order]
+
     def get_execution_set(
         self,
         continuing: bool,
-    ) -> Tuple[List[Dict[str, str]], bool]:
+    ) -> Tuple[ResultCache, bool]:
         """
         Return the set of executions.
 
@@ -436,31 +789,26 @@ class Benchmark:
             continuing (bool): whether caching of the results is enabled.
 
         Returns:
-            Tuple[List[Dict[str, str]], bool]:
-                the execution set and whether to print comments (in the CSV header).
+            Tuple[ResultCache, bool]:
+                the index of the execution set and whether to print comments (in the CSV header).
         """
+        if continuing and self._journal is not None and not self._journal.is_new:
+            # the journal is the source of truth, e.g. the CSV output may miss buffered lines
+            nb_lines = self._journal.regenerate_csv(csv_path=self._csv_output_path)
+            nb_interrupted = len(self._journal.interrupted()) + len(self._journal.failed())
+            print(
+                f"[CONTINUING] Resuming from the journal: {nb_lines} result lines recorded, "
+                f"{nb_interrupted} interrupted or failed executions to run again."
+            )
+            return self._journal.result_cache(), False
+
         if not continuing or not self._csv_output_path.exists():
-            return [], True
-
-        with open(self._csv_output_path, "r") as csv_output_file:
-            output_executions = [
-                line.strip()
-                for line in csv_output_file.readlines()
-                if not line.strip().startswith("#")
-            ]
-
-            if len(output_executions) > 0:
-                print_comments = False
-                header = output_executions[0]
-                records_lines = output_executions[1:]
-
-                keys = header.split(";")
-                records = [dict(zip(keys, record_line.split(";"))) for record_line in records_lines]
-            else:
-                print_comments = True
-                records = []
+            return ResultCache.empty(), True
+
+        result_cache = ResultCache.from_csv(csv_path=self._csv_output_path)
+        print_comments = not result_cache.header
 
-        return records, print_comments
+        return result_cache, print_comments
 
     def filter_result_execution_set(
         self,
@@ -470,6 +818,9 @@ class Benchmark:
         """
         Remove from executions_dict keys that are not parameters. I.e., remove result keys.
 
+        Deprecated: the campaigns no longer use it, the results already recorded are looked up by
+        record in a `ResultCache` instead. It will be removed in a future version.
+
         Args:
             record_params (Dict[str, Any]):
                 parameters of the current record.
@@ -480,6 +831,12 @@ class Benchmark:
             List[Dict[str, str]]:
                 the filtered executions_dict.
         """
+        warnings.warn(
+            "filter_result_execution_set is deprecated, use ResultCache to look up the results "
+            "already recorded",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if executions_dict:
             for execution in executions_dict:
                 results_keys = execution.keys() - record_params.keys()
@@ -515,7 +872,52 @@ class Benchmark:
         """
         self._check_config()
 
+        if barrier is not None and self._nb_workers > 1:
+            raise ValueError("Parallel workers cannot be combined with a synchronization barrier")
+
+        if not self._trace:
+            self._run_campaign(
+                other_campaigns_seconds=other_campaigns_seconds,
+                barrier=barrier,
+                continuing=continuing,
+            )
+            return
+
+        tracer = start_tracing()
+        run_start = time.perf_counter()
+        try:
+            self._run_campaign(
+                other_campaigns_seconds=other_campaigns_seconds,
+                barrier=barrier,
+                continuing=continuing,
+            )
+        finally:
+            stop_tracing()
+            self._write_trace(tracer=tracer, total_seconds=time.perf_counter() - run_start)
+
+    def _write_trace(self, tracer: Tracer, total_seconds: float) -> None:
+        if self._base_data_dir is not None:
+            trace_path = self._base_data_dir / "trace.json"
+        else:
+            trace_path = self._csv_output_path.with_suffix(".trace.json")
+        os.makedirs(trace_path.parent, exist_ok=True)
+        tracer.write_chrome_trace(trace_path=trace_path)
+
+        summary = tracer.summary(total_seconds=total_seconds)
+        trace_path.with_name(f"{trace_path.stem}_summary.txt").write_text(summary + "\n")
+        print(f"[INFO] Framework overhead:\n{summary}")
+        print(f'[INFO] Trace of the campaign stored in: "{trace_path}"')
+
+    def _run_campaign(
+        self,
+        other_campaigns_seconds: int,
+        barrier: Optional[Barrier],
+        continuing: bool,
+    ) -> None:
         self._other_campaigns_seconds = other_campaigns_seconds
+        # before any thread of the campaign is pinned to a subset of its CPUs
+        self._allocated_cpus = None
+        self._allocation_cpus()
 
         self._configure_shared_libs()
 
@@ -528,9 +930,10 @@ class Benchmark:
             for tilt_variables, _ in tilt_gb:
                 self.build_tilt(**tilt_variables)
 
-        prebuild_seconds = self.prebuild_bench(
-            benchmark_duration_seconds=self._benchmark_duration_seconds,
-        )
+        with trace_span(name="prebuild_bench", category="build"):
+            prebuild_seconds = self.prebuild_bench(
+                benchmark_duration_seconds=self._benchmark_duration_seconds,
+            )
 
         expected_total_seconds = self.expected_total_duration_seconds()
 
@@ -538,68 +941,294 @@ class Benchmark:
             total_nb_runs=self.total_nb_runs(),
             total_seconds=expected_total_seconds,
         )
+        expected_range_seconds = self.expected_total_duration_range_seconds()
+        if self._adaptive_repetitions is not None and expected_range_seconds is not None:
+            min_seconds, max_seconds = expected_range_seconds
+            print(
+                "[INFO] Expected duration range (adaptive repetitions): "
+                f"{min_seconds}-{max_seconds}"
+            )
 
-        with TimeMeasure() as run_duration:
-            executions_dict, print_comments_header = self.get_execution_set(continuing)
-
-            if print_comments_header:
-                with open(self._csv_output_path, "a") as csv_output_file:
-                    self._log_headers(
-                        output_file=csv_output_file,
-                        experiment_name=self._experiment_name,
-                        benchmark_duration_seconds=self._benchmark_duration_seconds,
-                        nb_runs=self._nb_runs,
-                        start_time=run_duration.start_time,
-                        expected_duration_seconds=expected_total_seconds,
-                    )
-                    if prebuild_seconds is not None:
-                        self._log_prebuild_time(
-                            output_file=csv_output_file,
-                            prebuild_seconds=prebuild_seconds,
+        self._open_journal(continuing=continuing)
+        try:
+            with TimeMeasure() as run_duration:
+                result_cache, print_comments_header = self.get_execution_set(continuing)
+
+                journal_header = self._journal is not None and self._journal.is_new
+                header = ""
+                if print_comments_header or self._parquet_output_path is not None or journal_header:
+                    with io.StringIO() as header_file:
+                        self._log_headers(
+                            output_file=header_file,
+                            experiment_name=self._experiment_name,
+                            benchmark_duration_seconds=self._benchmark_duration_seconds,
+                            nb_runs=self._nb_runs,
+                            start_time=run_duration.start_time,
+                            expected_duration_seconds=expected_total_seconds,
                         )
+                        if self._adaptive_repetitions is not None:
+                            self._log_adaptive_repetitions(
+                                output_file=header_file,
+                                expected_range_seconds=expected_range_seconds,
+                            )
+                        if prebuild_seconds is not None:
+                            self._log_prebuild_time(
+                                output_file=header_file,
+                                prebuild_seconds=prebuild_seconds,
+                            )
+                        header = header_file.getvalue()
+
+                if print_comments_header:
+                    with open(self._csv_output_path, "a") as csv_output_file:
+                        csv_output_file.write(header)
+                if journal_header:
+                    self._journal.write_header(header=header, max_nb_threads=self._max_nb_threads())
+
+                self._nb_runs_done = 0
+                self._pending_runs = self.total_nb_runs()
+                self._group_pending_runs = {}
+                self._remaining_seconds_deadline = 0.0
+                self._stop_event.clear()
+                self._open_result_sinks(header=header)
+                if result_cache.header:
+                    self._result_sink.skip_header()
+                    self._result_sink.write_comment("Continuing campaign execution")
+                self._open_post_processing()
+                try:
+                    self._run_build_groups(
+                        result_cache=result_cache,
+                        continuing=continuing,
+                        barrier=barrier,
+                    )
+                    self._wait_post_processing()
+                finally:
+                    self._close_post_processing()
+                    self._close_result_sinks(start_time=run_duration.start_time)
 
-            self._nb_runs_done = 0
-            self._first_line_is_printed = False
+            actual_total_seconds = run_duration.duration_seconds
 
-            build_gb = list_groupby(
-                variables_names=self.get_build_var_names(),
-                bench_variables=self._variables,
-            )
+            with io.StringIO() as footer_file:
+                self._log_footers(
+                    output_file=footer_file,
+                    total_duration_seconds=actual_total_seconds,
+                )
+                footer = footer_file.getvalue()
+            with open(self._csv_output_path, "a") as csv_output_file:
+                csv_output_file.write(footer)
+            if self._journal is not None:
+                self._journal.write_comments(text=footer)
+        finally:
+            self._close_journal()
 
-            for build_variables, build_run_variables in build_gb:
-                example_build_run_variables = build_run_variables[0]
-                actual_build_variables = {
-                    var_name: var_value
-                    for var_name, var_value in build_variables.items()
-                    if (
-                        var_name in example_build_run_variables
-                        and var_value == example_build_run_variables[var_name]
-                    )
-                }
-                valid = self._build_one_bench(actual_build_variables)
-                if valid:
-                    for record_params in build_run_variables:
-                        executions_dict = self.filter_result_execution_set(
-                            record_params,
-                            executions_dict,
-                        )
+        print(f"[INFO] Benchmark done. " f'Results are stored in: "{self._csv_output_path}"')
 
-                        self._run_single_run(
-                            record_parameters=record_params,
-                            executions_dict=executions_dict,
-                            continuing=continuing,
-                            barrier=barrier,
-                        )
+    def _open_journal(self, continuing: bool) -> None:
+        if self._journal_path is None:
+            return
+        self._journal = CampaignJournal(journal_path=self._journal_path).open(reset=not continuing)
+        if self._journal.nb_dropped_bytes:
+            print(
+                f"[WARNING] Dropped {self._journal.nb_dropped_bytes} bytes of incomplete entries "
+                f'at the end of the journal "{self._journal_path}".'
+            )
 
-        actual_total_seconds = run_duration.duration_seconds
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
 
-        with open(self._csv_output_path, "a") as csv_output_file:
-            self._log_footers(
-                output_file=csv_output_file,
-                total_duration_seconds=actual_total_seconds,
+    def _open_post_processing(self) -> None:
+        if not any(is_deferrable(hook) for hook in self._post_run_hooks):
+            return
+        if 0 == self._post_processing_workers:
+            return
+        if isinstance(self._variables, ParameterSpace) and self._variables.depends_on_results:
+            print(
+                "[WARNING] Records depend on the results of the previous ones, "
+                "deferrable post-run hooks run synchronously."
             )
+            return
 
-        print(f"[INFO] Benchmark done. " f'Results are stored in: "{self._csv_output_path}"')
+        cpus = self._post_processing_cpus
+        if cpus is None and self.platform.comm.is_local:
+            cpus = self._housekeeping_cpus()
+            if cpus is None:
+                print(
+                    "[WARNING] No CPU left outside the benchmark for post-processing, "
+                    "deferrable post-run hooks run synchronously."
+                )
+                return
+
+        def pin_worker() -> None:
+            if cpus is not None:
+                # pid 0 is the worker thread, the processes it spawns inherit its affinity
+                os.sched_setaffinity(0, cpus)
+
+        self._post_processing = ThreadPoolExecutor(
+            max_workers=self._post_processing_workers,
+            thread_name_prefix="benchkit-post-processing",
+            initializer=pin_worker,
+        )
+        self._post_processing_futures = []
+
+    def _wait_post_processing(self) -> None:
+        # barrier, e.g. before the benchmark is rebuilt or the result sinks are closed
+        while self._post_processing_futures:
+            future = self._post_processing_futures.pop(0)
+            future.result()
+
+    def _close_post_processing(self) -> None:
+        if self._post_processing is not None:
+            self._post_processing.shutdown(wait=True)
+            self._post_processing = None
+        self._post_processing_futures = []
+
+    def _open_result_sinks(self, header: str) -> None:
+        self._result_sink = CsvResultSink(
+            csv_path=self._csv_output_path,
+            max_nb_threads=self._max_nb_threads(),
+            flush_policy=self._flush_policy,
+        ).open()
+
+        if self._parquet_output_path is None:
+            return
+        if not parquet_enabled():
+            print("[WARNING] pyarrow is not installed, the Parquet results are not written.")
+            return
+        self._parquet_sink = ParquetResultSink(
+            parquet_path=self._parquet_output_path,
+            column_roles=self._column_roles(),
+            metadata=header_metadata(header=header),
+            flush_policy=self._flush_policy,
+        ).open()
+
+    def _close_result_sinks(self, start_time: datetime.datetime) -> None:
+        self._result_sink.close()
+        self._result_sink = None
+
+        if self._parquet_sink is not None:
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            total_duration_seconds = (now - start_time).total_seconds()
+            self._parquet_sink.add_metadata({"total_duration_seconds": str(total_duration_seconds)})
+            self._parquet_sink.close()
+            self._parquet_sink = None
+
+    def _flush_result_sinks(self) -> None:
+        with trace_span(name="flush_results", category="io"):
+            self._result_sink.flush()
+            if self._parquet_sink is not None:
+                self._parquet_sink.flush()
+
+    def _column_roles(self) -> Dict[str, str]:
+        roles = {
+            "experiment_name": ROLE_CONSTANT,
+            "benchmark_name": ROLE_CONSTANT,
+        }
+        if self._constants is not None:
+            roles.update({name: ROLE_CONSTANT for name in self._constants})
+
+        if isinstance(self._variables, ParameterSpace):
+            variable_names = self._variables.names
+        else:
+            variable_names = list(dict.fromkeys(k for record in self._variables for k in record))
+        build_var_names = set(self.get_build_var_names())
+        for name in variable_names:
+            role = ROLE_BUILD_VARIABLE if name in build_var_names else ROLE_RUN_VARIABLE
+            roles[name] = role
+            roles[f"{name}_pretty"] = role
+
+        roles["rep"] = ROLE_RUN_VARIABLE
+        return roles
+
+    def _run_build_groups(
+        self,
+        result_cache: ResultCache,
+        continuing: bool,
+        barrier: Optional[Barrier],
+    ) -> None:
+        """
+        Build and run all the groups of records sharing the same build variables.
+
+        Args:
+            result_cache (ResultCache):
+                index of the currently recorded results of executions.
+            continuing (bool):
+                whether caching of the results is enabled.
+            barrier (Optional[Barrier]):
+                if applicable, the barrier for the benchmark to wait.
+        """
+        build_gb = list_groupby(
+            variables_names=self.get_build_var_names(),
+            bench_variables=self._variables,
+        )
+
+        def actual_build_group(build_variables, build_run_variables):
+            example_build_run_variables = build_run_variables[0]
+            actual_build_variables = {
+                var_name: var_value
+                for var_name, var_value in build_variables.items()
+                if (
+                    var_name in example_build_run_variables
+                    and var_value == example_build_run_variables[var_name]
+                )
+            }
+            return actual_build_variables, build_run_variables
+
+        # groups are generated lazily, the records of a parameter space may depend on the
+        # results of the previous groups, and be empty (e.g. no configuration of the previous
+        # search round had results)
+        build_groups = (actual_build_group(bv, brv) for bv, brv in build_gb if brv)
+
+        pipelined_base_dir = None
+        if self._pipelined_builds:
+            pipelined_base_dir = self.pipelined_build_base_dir()
+            if pipelined_base_dir is None:
+                print(
+                    "[WARNING] Benchmark does not support pipelined builds, "
+                    "falling back to sequential builds."
+                )
+            elif isinstance(self._variables, ParameterSpace) and self._variables.depends_on_results:
+                pipelined_base_dir = None
+                print(
+                    "[WARNING] Records depend on the results of the previous ones, "
+                    "falling back to sequential builds."
+                )
+            elif self._housekeeping_cpus() is None or not self._benchmark_cpus():
+                pipelined_base_dir = None
+                print(
+                    "[WARNING] No CPU left outside the benchmark for pipelined builds (see "
+                    "build_cpus), falling back to sequential builds."
+                )
+
+        if pipelined_base_dir is not None:
+            self._run_pipelined_build_groups(
+                build_groups=build_groups,
+                base_dir=pathlib.Path(pipelined_base_dir),
+                result_cache=result_cache,
+                continuing=continuing,
+                barrier=barrier,
+            )
+        else:
+            for actual_build_variables, build_run_variables in build_groups:
+                if self._stop_event.is_set():
+                    print("[INFO] First record finished, stopping the campaign.")
+                    break
+
+                valid = self._build_one_bench(
+                    build_variables=actual_build_variables,
+                    records=build_run_variables,
+                    result_cache=result_cache,
+                    continuing=continuing,
+                )
+                if valid:
+                    self._run_records(
+                        records=build_run_variables,
+                        result_cache=result_cache,
+                        continuing=continuing,
+                        barrier=barrier,
+                    )
+                    self._wait_post_processing()
+                    self._flush_result_sinks()
 
     def build_tilt(
         self,
@@ -636,6 +1265,35 @@ class Benchmark:
         """
         raise NotImplementedError
 
+    def build_artifacts(
+        self,
+        **_kwargs,
+    ) -> List[PathType]:
+        """
+        Get the paths of the artifacts (files or directories) produced by `build_bench` for the
+        given build variables, i.e. everything the runs need from the build.
+        They are stored in and restored from the build cache when it is enabled.
+        By default, no artifact is declared and the builds are not cached.
+
+        Returns:
+            List[PathType]: the paths of the artifacts produced by the build.
+        """
+        return []
+
+    def pipelined_build_base_dir(self) -> PathType | None:
+        """
+        Get the directory under which the pipelined builds are done.
+        In pipelined mode, `build_bench` is called with a `build_dir` argument (a sub-directory of
+        this one) where it must build, possibly while the records of the previous build run, and
+        `single_run` receives the same `build_dir` argument to run the matching build.
+        `build_bench` also receives the `build_cpus` it is allowed to use (None if unrestricted).
+        By default, the benchmark does not support pipelined builds.
+
+        Returns:
+            PathType | None: the base directory of the pipelined builds, or None if unsupported.
+        """
+        return None
+
     def single_run(
         self,
         **kwargs,
@@ -712,6 +1370,9 @@ class Benchmark:
                 environment wrapped with everything configured in the benchmark.
             print_output (bool):
                 whether to print the output of the benchmark command.
+            timeout (int | None, optional):
+                maximum duration of the command, in seconds. When None, the default timeout of the
+                current record is used if a timeout factor is configured. Defaults to None.
             ignore_ret_codes (Iterable[int], optional):
                 List of error code to ignore if it is the return code of the command.
                 Defaults to () (empty collection).
@@ -723,6 +1384,9 @@ class Benchmark:
                 the output of the benchmark command in the case of synchronous command, and the
                 asynchronous process in the case of asynchronous command.
         """
+        if timeout is None:
+            timeout = getattr(self._worker_local, "default_timeout", None)
+
         if self._gdb:
             self.debug_session(
                 run_command=run_command,
@@ -739,6 +1403,17 @@ class Benchmark:
             )
             return process
 
+        if self._stop_on_first_finish and self._nb_workers > 1:
+            output = self._run_interruptible_bench_command(
+                wrapped_run_command=wrapped_run_command,
+                current_dir=current_dir,
+                wrapped_environment=wrapped_environment,
+                timeout=timeout,
+                ignore_ret_codes=ignore_ret_codes,
+                ignore_any_error_code=ignore_any_error_code,
+            )
+            return output
+
         # Synchronous case where the benchmark returns the output string:
         output = self.platform.comm.shell(
             command=wrapped_run_command,
@@ -856,11 +1531,19 @@ class Benchmark:
         wrapped_environment = environment
 
         for command_wrapper in self._command_wrappers[::-1]:
-            wrapped_command, wrapped_environment = command_wrapper.wrap(
-                command=wrapped_command,
-                environment=wrapped_environment,
-                **kwargs,
-            )
+            with trace_span(name=callable_name(command_wrapper.wrap), category="wrapper"):
+                wrapped_command, wrapped_environment = command_wrapper.wrap(
+                    command=wrapped_command,
+                    environment=wrapped_environment,
+                    **kwargs,
+                )
+
+        # Locally, the worker thread affinity is inherited by the command (see
+        # _enter_worker_slot), remotely the command needs to be pinned explicitly:
+        worker_cpus = self._current_worker_cpus()
+        if worker_cpus is not None and not self.platform.comm.is_local:
+            worker_cpus_str = ",".join(map(str, worker_cpus))
+            wrapped_command = ["taskset", "--cpu-list", worker_cpus_str] + wrapped_command
 
         if not wrapped_environment:
             wrapped_environment = None
@@ -870,12 +1553,30 @@ class Benchmark:
     def _build_one_bench(
         self,
         build_variables: Dict[str, Any],
+        records: List[RecordParameters],
+        result_cache: ResultCache,
+        continuing: bool,
+        build_dir: pathlib.Path | None = None,
+        build_cpus: List[int] | None = None,
     ) -> bool:
         """
         Build a single instance of the benchmark using the given build variables.
+        The build is skipped when all the records depending on it are already in the results, and
+        restored from the build cache (if enabled) when the same build has already been done.
 
         Args:
-            build_variables (Dict[str, Any]): variables useful at build-time to build the benchmark.
+            build_variables (Dict[str, Any]):
+                variables useful at build-time to build the benchmark.
+            records (List[RecordParameters]):
+                records that will run with this build.
+            result_cache (ResultCache):
+                index of the currently recorded results of executions.
+            continuing (bool):
+                whether caching of the results is enabled.
+            build_dir (pathlib.Path | None, optional):
+                directory where to build in pipelined mode, None otherwise. Defaults to None.
+            build_cpus (List[int] | None, optional):
+                CPUs the pipelined build is allowed to use. Defaults to None.
 
         Returns:
             bool: if the build variables are valid to generate a benchmark.
@@ -883,12 +1584,52 @@ class Benchmark:
         if not self.valid_experiment_parameters(**build_variables):
             return False
 
-        self.clean_bench()
-        self.build_bench(
-            benchmark_duration_seconds=self._benchmark_duration_seconds,
-            constants=self._constants,
-            **build_variables,
-        )
+        if continuing and self._all_records_cached(records=records, result_cache=result_cache):
+            print("[CONTINUING] All the records of this build have already been done.")
+            return True
+
+        pipeline_kwargs = {}
+        if build_dir is not None:
+            pipeline_kwargs = {"build_dir": build_dir, "build_cpus": build_cpus}
+
+        build_cache_key = None
+        artifacts = []
+        if self._build_cache is not None:
+            artifacts = self.build_artifacts(**pipeline_kwargs, **build_variables)
+            # the other pipelined builds are not sources of this one either
+            key_artifacts = list(artifacts)
+            if build_dir is not None:
+                key_artifacts.append(self.pipelined_build_base_dir())
+            if artifacts:
+                build_cache_key = self._build_cache.key(
+                    benchmark_name=self._benchmark_name,
+                    src_path=self.bench_src_path,
+                    build_variables=build_variables,
+                    constants=self._constants,
+                    benchmark_duration_seconds=self._benchmark_duration_seconds,
+                    artifacts=key_artifacts,
+                )
+            if build_cache_key is None:
+                print("[WARNING] Build artifacts of this benchmark cannot be cached.")
+            elif self._build_cache.restore(key=build_cache_key, artifacts=artifacts):
+                print(f"[INFO] Build artifacts restored from cache (key {build_cache_key}).")
+                return True
+
+        # pipelined builds are done in their own directory, that build_bench is expected to reuse
+        if build_dir is None:
+            with trace_span(name="clean_bench", category="build"):
+                self.clean_bench()
+        with trace_span(name="build_bench", category="build", args=build_variables):
+            self.build_bench(
+                benchmark_duration_seconds=self._benchmark_duration_seconds,
+                constants=self._constants,
+                **pipeline_kwargs,
+                **build_variables,
+            )
+
+        if build_cache_key is not None:
+            self._build_cache.store(key=build_cache_key, artifacts=artifacts)
+
         return True
 
     def _group_record_parameters(
@@ -923,53 +1664,314 @@ class Benchmark:
         }
         return build_variables, run_variables, tilt_variables, other_variables
 
-    def _is_result_cached(
-        self,
-        record_to_run: Dict[str, Any],
-        cached_records: Iterable[Dict[str, Any]],
-    ) -> bool:
-        for cached_record in cached_records:
-            same_record = True
-            for key in record_to_run:
-                if key in cached_record:
-                    if cached_record[key] != record_to_run[key]:
-                        same_record = False
-                        break
-            if same_record:
-                return True
-
     def _temp_record_prefix(self) -> pathlib.Path:
-        # TODO warning, does not support concurrent execution
-        # for this, need a unique record path for each benchmark run
-        return pathlib.Path("/tmp/benchkit_record")
+        # unique for each benchmark run, such that concurrent runs never share their files
+        return pathlib.Path(f"/tmp/benchkit_record-{uuid.uuid4().hex}")
 
-    def _temp_record_data_dir(self, record_data_dir: pathlib.Path):
+    @staticmethod
+    def _temp_record_data_dir(
+        record_data_dir: pathlib.Path,
+        temp_record_prefix: pathlib.Path,
+    ) -> pathlib.Path:
         # The ./ prefix is necessary since pathlib ignores the first
         # argument to the / operator if the second argument is an
         # absolute path. So we need to ensure the second argument is
         # never an absolute path.
-        return self._temp_record_prefix() / f"./{record_data_dir}"
+        return temp_record_prefix / f"./{record_data_dir}"
+
+    def _current_worker_cpus(self) -> Optional[List[int]]:
+        return getattr(self._worker_local, "cpus", None)
+
+    def _allocation_cpus(self) -> List[int]:
+        # the CPUs the process is pinned to, e.g. the ones allocated to the campaign by the
+        # scheduler of a suite, all the CPUs of the platform otherwise
+        if self._allocated_cpus is None:
+            cpus = range(self.platform.nb_cpus())
+            if self.platform.comm.is_local and hasattr(os, "sched_getaffinity"):
+                affinity = os.sched_getaffinity(0)
+                cpus = [cpu for cpu in cpus if cpu in affinity]
+            self._allocated_cpus = list(cpus)
+        return self._allocated_cpus
+
+    def _benchmark_cpus(self) -> List[int]:
+        # the measured runs go on the isolated CPUs if any, the other ones do the housekeeping
+        cpus = self._allocation_cpus()
+        isolated_cpus = set(self.platform.isolated_cpus())
+        if isolated_cpus:
+            cpus = [cpu for cpu in cpus if cpu in isolated_cpus]
+        if self._build_cpus is not None:
+            return [cpu for cpu in cpus if cpu not in self._build_cpus]
+        return list(cpus)
+
+    def _worker_slots(self) -> List[List[int]]:
+        return partition_cpus(cpus=self._benchmark_cpus(), nb_partitions=self._nb_workers)
+
+    def _enter_worker_slot(self, slot_cpus: List[int]) -> None:
+        self._worker_local.cpus = slot_cpus
+        if self.platform.comm.is_local:
+            # pid 0 is the calling thread, processes it spawns inherit its affinity
+            os.sched_setaffinity(0, slot_cpus)
 
-    def _run_single_run(
+    def _housekeeping_cpus(self) -> List[int] | None:
+        if self._build_cpus is not None:
+            return list(self._build_cpus)
+
+        cpus = self._allocation_cpus()
+        isolated_cpus = set(self.platform.isolated_cpus())
+        if isolated_cpus:
+            housekeeping_cpus = [cpu for cpu in cpus if cpu not in isolated_cpus]
+            return housekeeping_cpus if housekeeping_cpus else None
+
+        if self._nb_workers > 1:
+            worker_cpus = {cpu for slot_cpus in self._worker_slots() for cpu in slot_cpus}
+            free_cpus = [cpu for cpu in cpus if cpu not in worker_cpus]
+            if free_cpus:
+                return free_cpus
+
+        return None
+
+    def _pipelined_build(
         self,
-        record_parameters: Dict[str, Any],
-        executions_dict: Iterable[Dict[str, str]],
+        build_variables: Dict[str, Any],
+        records: List[RecordParameters],
+        result_cache: ResultCache,
+        continuing: bool,
+        build_dir: pathlib.Path,
+        build_cpus: List[int] | None,
+    ) -> bool:
+        if build_cpus is not None and self.platform.comm.is_local:
+            # pid 0 is the builder thread, the build processes it spawns inherit its affinity
+            os.sched_setaffinity(0, build_cpus)
+        self.platform.comm.makedirs(path=build_dir, exist_ok=True)
+        return self._build_one_bench(
+            build_variables=build_variables,
+            records=records,
+            result_cache=result_cache,
+            continuing=continuing,
+            build_dir=build_dir,
+            build_cpus=build_cpus,
+        )
+
+    def _run_pipelined_build_groups(
+        self,
+        build_groups: Iterable[Tuple[Dict[str, Any], List[RecordParameters]]],
+        base_dir: pathlib.Path,
+        result_cache: ResultCache,
         continuing: bool,
         barrier: Optional[Barrier],
     ) -> None:
         """
-        Run `nb_runs` times a single instance of the benchmark using the given record parameters.
+        Run the build groups while building the next group in the background.
+        Two build directories are used in turn: while the records of a group run with the build
+        of one directory, the next group is built in the other one.
 
         Args:
-            record_parameters (Dict[str, Any]):
-                input parameters for the current record run.
-            executions_dict (Iterable[Dict[str, str]]):
-                current information that need to be stored in the record.
+            build_groups (Iterable[Tuple[Dict[str, Any], List[RecordParameters]]]):
+                build variables and records of each build group, in execution order.
+            base_dir (pathlib.Path):
+                directory under which the pipelined builds are done.
+            result_cache (ResultCache):
+                index of the currently recorded results of executions.
+            continuing (bool):
+                whether caching of the results is enabled.
+            barrier (Optional[Barrier]):
+                if applicable, the barrier for the benchmark to wait.
+        """
+        build_cpus = self._housekeeping_cpus()
+        if not self.platform.comm.is_local:
+            print(
+                "[INFO] Pipelined builds on a remote host are restricted to the "
+                "housekeeping CPUs only through the build_cpus argument of build_bench."
+            )
+
+        def build_dir(group_index: int) -> pathlib.Path:
+            return base_dir / f"pipeline-{group_index % 2}"
+
+        with ThreadPoolExecutor(max_workers=1) as builder:
+
+            def submit_build(group_index: int, build_group):
+                build_variables, records = build_group
+                return builder.submit(
+                    self._pipelined_build,
+                    build_variables=build_variables,
+                    records=records,
+                    result_cache=result_cache,
+                    continuing=continuing,
+                    build_dir=build_dir(group_index),
+                    build_cpus=build_cpus,
+                )
+
+            build_groups_it = iter(build_groups)
+            group_index = 0
+            current_group = next(build_groups_it, None)
+            next_build = submit_build(0, current_group) if current_group is not None else None
+
+            previous_cpus = None
+            if self._nb_workers <= 1 and self.platform.comm.is_local:
+                # without worker slots, the records run in this thread, off the CPUs of the builds
+                previous_cpus = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, self._benchmark_cpus())
+
+            try:
+                while current_group is not None:
+                    valid = next_build.result()
+
+                    # the directory of the next group has been released by the previous group
+                    next_build = None
+                    following_group = None
+                    if not self._stop_event.is_set():
+                        following_group = next(build_groups_it, None)
+                    if following_group is not None:
+                        next_build = submit_build(group_index + 1, following_group)
+
+                    if self._stop_event.is_set():
+                        print("[INFO] First record finished, stopping the campaign.")
+                        break
+
+                    if valid:
+                        self._current_build_dir = build_dir(group_index)
+                        self._run_records(
+                            records=current_group[1],
+                            result_cache=result_cache,
+                            continuing=continuing,
+                            barrier=barrier,
+                        )
+                        self._wait_post_processing()
+                        self._flush_result_sinks()
+
+                    current_group = following_group
+                    group_index += 1
+            finally:
+                self._current_build_dir = None
+                if next_build is not None:
+                    next_build.cancel()
+                if previous_cpus is not None:
+                    os.sched_setaffinity(0, previous_cpus)
+
+    def _run_records(
+        self,
+        records: List[RecordParameters],
+        result_cache: ResultCache,
+        continuing: bool,
+        barrier: Optional[Barrier],
+    ) -> None:
+        """
+        Run all the records of a build group, one after the other or dispatched on the worker
+        slots when parallel workers are enabled.
+
+        Args:
+            records (List[RecordParameters]):
+                records sharing the same build variables.
+            result_cache (ResultCache):
+                index of the currently recorded results of executions.
             continuing (bool):
                 whether caching of the results is enabled.
             barrier (Optional[Barrier]):
                 if applicable, the barrier for the benchmark to wait.
         """
+        with self._results_lock:
+            self._start_pending_group(records=records)
+
+        if self._nb_workers <= 1 or self._gdb:
+            for record_params in records:
+                if self._stop_event.is_set():
+                    return
+                self._run_single_run(
+                    record_parameters=record_params,
+                    result_cache=result_cache,
+                    continuing=continuing,
+                    barrier=barrier,
+                )
+                if self._stop_on_first_finish:
+                    self._stop_event.set()
+            return
+
+        # longest records first, such that the last ones to finish are short
+        records = self._longest_first(records=records)
+
+        free_slots = queue.SimpleQueue()
+        for slot_cpus in self._worker_slots():
+            free_slots.put(slot_cpus)
+
+        def run_record(record_params: RecordParameters) -> None:
+            slot_cpus = free_slots.get()
+            try:
+                if self._stop_event.is_set():
+                    return
+                self._enter_worker_slot(slot_cpus=slot_cpus)
+                try:
+                    self._run_single_run(
+                        record_parameters=record_params,
+                        result_cache=result_cache,
+                        continuing=continuing,
+                        barrier=None,
+                    )
+                except _RunInterrupted:
+                    return
+                if self._stop_on_first_finish:
+                    self._stop_event.set()
+            finally:
+                free_slots.put(slot_cpus)
+
+        with ThreadPoolExecutor(max_workers=self._nb_workers) as executor:
+            futures = [executor.submit(run_record, record_params) for record_params in records]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                self._stop_event.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _run_interruptible_bench_command(
+        self,
+        wrapped_run_command: SplitCommand,
+        current_dir: PathType,
+        wrapped_environment: Environment,
+        timeout: int | None,
+        ignore_ret_codes: Iterable[int],
+        ignore_any_error_code: bool,
+    ) -> str:
+        output_dir = pathlib.Path(tempfile.mkdtemp(prefix="benchkit_cmd-"))
+        stdout_path = output_dir / "stdout.txt"
+        try:
+            process = shell_async(
+                command=wrapped_run_command,
+                stdout_path=stdout_path,
+                stderr_path=output_dir / "stderr.txt",
+                platform=self.platform,
+                current_dir=current_dir,
+                environment=wrapped_environment,
+            )
+
+            start_time = time.monotonic()
+            while not process.is_finished():
+                if self._stop_event.wait(timeout=0.1):
+                    process.kill()
+                    raise _RunInterrupted()
+                if timeout is not None and time.monotonic() - start_time > timeout:
+                    process.kill()
+                    raise TimeoutExpired(cmd=wrapped_run_command, timeout=timeout)
+
+            try:
+                process.wait()
+            except AsyncProcess.AsyncProcessError as err:
+                if not ignore_any_error_code and err.returncode not in ignore_ret_codes:
+                    raise err
+
+            with open(stdout_path, "r") as stdout_file:
+                output = stdout_file.read()
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        return output
+
+    def _experiment_results(
+        self,
+        record_parameters: RecordParameters,
+        run_id: int,
+    ) -> RecordResult:
         (
             build_variables,
             run_variables,
@@ -977,67 +1979,275 @@ class Benchmark:
             other_variables,
         ) = self._group_record_parameters(record_parameters=record_parameters)
 
+        experiment_results = {
+            "experiment_name": self._experiment_name,
+            "benchmark_name": self._benchmark_name,
+        }
+        if self._constants is not None:
+            experiment_results.update(self._constants)
+        experiment_results.update(build_variables)
+        experiment_results.update(run_variables)
+        experiment_results.update(other_variables)
+
+        if self._pretty_variables:
+            for var_name in self._pretty_variables:
+                ugly2pretty = self._pretty_variables[var_name]
+                ugly_var_value = experiment_results.get(var_name)
+                pretty_var_value = ugly2pretty.get(ugly_var_value, ugly_var_value)
+                experiment_results[f"{var_name}_pretty"] = f'"{pretty_var_value}"'
+
+        experiment_results.update({"rep": run_id})
+        return experiment_results
+
+    @staticmethod
+    def _execution_parameters(experiment_results: RecordResult) -> Dict[str, str]:
+        def str_param(value: List[str] | str) -> str:
+            if isinstance(value, list):
+                return f'[{", ".join(map(str, value))}]'
+            return str(value)
+
+        return {k: str_param(v) for k, v in experiment_results.items()}
+
+    def _all_records_cached(
+        self,
+        records: List[RecordParameters],
+        result_cache: ResultCache,
+    ) -> bool:
+        # adaptive records are written at once, so their first repetition is enough to check
+        nb_runs = 1 if self._adaptive_repetitions is not None else self._nb_runs
+        for record_parameters in records:
+            for run_id in range(1, nb_runs + 1):
+                experiment_results = self._experiment_results(
+                    record_parameters=record_parameters,
+                    run_id=run_id,
+                )
+                if not self.valid_experiment_parameters(**experiment_results):
+                    break
+                if self._execution_parameters(experiment_results) not in result_cache:
+                    return False
+        return True
+
+    def _run_single_run(
+        self,
+        record_parameters: Dict[str, Any],
+        result_cache: ResultCache,
+        continuing: bool,
+        barrier: Optional[Barrier],
+    ) -> None:
+        """
+        Run `nb_runs` times a single instance of the benchmark using the given record parameters,
+        after its warmup runs if a warmup policy is configured.
+
+        Args:
+            record_parameters (Dict[str, Any]):
+                input parameters for the current record run.
+            result_cache (ResultCache):
+                index of the currently recorded results of executions.
+            continuing (bool):
+                whether caching of the results is enabled.
+            barrier (Optional[Barrier]):
+                if applicable, the barrier for the benchmark to wait.
+        """
+        adaptive = self._adaptive_repetitions
+        record_lines = []
+        metric_values = []
+        # warmup only runs before the first repetition that is not cached
+        warmed_up = self._warmup is None
+
         for run_id in range(1, self._nb_runs + 1):
             record_data_dir = self._record_data_dir(
                 record_parameters=record_parameters,
                 run_id=run_id,
             )
 
-            experiment_results = {
-                "experiment_name": self._experiment_name,
-                "benchmark_name": self._benchmark_name,
-            }
-            if self._constants is not None:
-                experiment_results.update(self._constants)
-            experiment_results.update(build_variables)
-            experiment_results.update(run_variables)
-            experiment_results.update(other_variables)
-
-            if self._pretty_variables:
-                for var_name in self._pretty_variables:
-                    ugly2pretty = self._pretty_variables[var_name]
-                    ugly_var_value = experiment_results.get(var_name)
-                    pretty_var_value = ugly2pretty.get(ugly_var_value, ugly_var_value)
-                    experiment_results[f"{var_name}_pretty"] = f'"{pretty_var_value}"'
-
-            experiment_results.update({"rep": run_id})
+            experiment_results = self._experiment_results(
+                record_parameters=record_parameters,
+                run_id=run_id,
+            )
 
             if not self.valid_experiment_parameters(**experiment_results):
                 break
 
-            self._log_current_time_info(
-                total_nb_runs=self.total_nb_runs(),
-                nb_runs_done=self._nb_runs_done,
-                bench_duration=self._benchmark_duration_seconds,
-                other_campaigns_seconds=self._other_campaigns_seconds,
-            )
-
-            def str_param(value: List[str] | str) -> str:
-                if isinstance(value, list):
-                    return f'[{", ".join(map(str, value))}]'
-                return str(value)
+            with self._results_lock:
+                self._log_current_time_info(
+                    total_nb_runs=self.total_nb_runs(),
+                    nb_runs_done=self._nb_runs_done,
+                    bench_duration=self._benchmark_duration_seconds,
+                    other_campaigns_seconds=self._other_campaigns_seconds,
+                    remaining_seconds=(
+                        self._remaining_duration_seconds()
+                        if self._benchmark_duration_seconds is None
+                        else None
+                    ),
+                )
 
-            execution_parameters = {k: str_param(v) for k, v in experiment_results.items()}
+            execution_parameters = self._execution_parameters(experiment_results)
 
             # If this execution has already been done and continuing option is activated,
             # then skip
-            if continuing and self._is_result_cached(execution_parameters, executions_dict):
+            cached_row = result_cache.lookup(execution_parameters) if continuing else None
+            if cached_row is not None:
                 print("[CONTINUING] This execution has already been done. Skipping it")
-                self._nb_runs_done += 1
-                if not self._first_line_is_printed:
-                    self._first_line_is_printed = True
-                    with open(self._csv_output_path, "a") as csv_output_file:
-                        teeprint(content="# Continuing campaign execution", file=csv_output_file)
+                with self._results_lock:
+                    self._record_results(
+                        record_parameters=record_parameters,
+                        results_lines=[cached_row],
+                    )
+                    self._nb_runs_done += 1
+                    self._pending_run_done(record_parameters=record_parameters)
+                    if self._result_sink.header_pending:
+                        self._result_sink.skip_header()
+                        self._result_sink.write_comment("Continuing campaign execution")
+                if adaptive is not None:
+                    # adaptive records are written at once, the whole record is already done
+                    break
                 continue
 
-            # Replace record_data_dir with a temporary data directory for the
-            # wrapper to write their files to. (Only if the host is remote)
-            temp_record_data_dir = record_data_dir
-            if not self.platform.comm.is_local:
-                temp_record_data_dir = self._temp_record_data_dir(record_data_dir)
-                self.platform.comm.makedirs(temp_record_data_dir, True)
+            if not warmed_up:
+                self._run_warmup(record_parameters=record_parameters, barrier=barrier)
+                warmed_up = True
+
+            if adaptive is None or not record_lines:
+                # adaptive records are journaled at once, under their first repetition
+                journal_execution = execution_parameters
+                if self._journal is not None:
+                    self._journal.record_started(execution=journal_execution)
+            # the metric of adaptive records is needed before the next repetition
+            defer_hooks = adaptive is None and self._post_processing is not None
+            try:
+                experiment_results_lines = self._execute_gated_run(
+                    record_parameters=record_parameters,
+                    experiment_results=experiment_results,
+                    record_data_dir=record_data_dir,
+                    barrier=barrier,
+                    defer_hooks=defer_hooks,
+                )
+            except BaseException as err:
+                if self._journal is not None:
+                    self._journal.record_failed(execution=journal_execution, error=repr(err))
+                raise
+
+            if adaptive is None:
+                with self._results_lock:
+                    self._nb_runs_done += 1
+                    self._pending_run_done(record_parameters=record_parameters)
+                if defer_hooks:
+                    future = self._post_processing.submit(
+                        self._run_deferred_hooks,
+                        record_parameters=record_parameters,
+                        execution=journal_execution,
+                        experiment_results_lines=experiment_results_lines,
+                        record_data_dir=record_data_dir,
+                    )
+                    with self._results_lock:
+                        self._post_processing_futures.append(future)
+                else:
+                    self._record_run_results(
+                        record_parameters=record_parameters,
+                        execution=journal_execution,
+                        experiment_results_lines=experiment_results_lines,
+                    )
+                continue
+
+            with self._results_lock:
+                self._nb_runs_done += 1
+                self._pending_run_done(record_parameters=record_parameters)
+            record_lines.extend(experiment_results_lines)
+            metric_values.append(
+                self._metric_value(
+                    metric=adaptive.metric,
+                    experiment_results_lines=experiment_results_lines,
+                )
+            )
+            if adaptive.is_done(values=metric_values):
+                break
+
+        with self._results_lock:
+            # e.g. adaptive records stopping before their maximum number of repetitions
+            self._pending_run_done(record_parameters=record_parameters, all_runs=True)
+
+        if record_lines:
+            nb_reps = len(metric_values)
+            print(f"[INFO] Record done after {nb_reps} repetitions.")
+            for line in record_lines:
+                line["nb_reps"] = nb_reps
+            with self._results_lock:
+                self._journal_done(execution=journal_execution, results_lines=record_lines)
+                self._write_results_lines(experiment_results_lines=record_lines)
+                self._record_results(
+                    record_parameters=record_parameters,
+                    results_lines=record_lines,
+                )
+
+    def _execute_run(
+        self,
+        record_parameters: RecordParameters,
+        experiment_results: RecordResult,
+        record_data_dir: Optional[pathlib.Path],
+        barrier: Optional[Barrier],
+        warmup_run: bool = False,
+        defer_hooks: bool = False,
+    ) -> List[RecordResult]:
+        """
+        Execute a single run of the benchmark with the given record parameters, with the hooks,
+        wrappers and attachments, and store its results in the record data directory.
+
+        Args:
+            record_parameters (RecordParameters):
+                input parameters for the current record run.
+            experiment_results (RecordResult):
+                columns shared by all the result lines of the run.
+            record_data_dir (Optional[pathlib.Path]):
+                data directory of the run, if enabled.
+            barrier (Optional[Barrier]):
+                if applicable, the barrier for the benchmark to wait.
+            warmup_run (bool, optional):
+                whether the run is a warmup repetition, whose duration is not representative of
+                the record. Defaults to False.
+            defer_hooks (bool, optional):
+                whether the deferrable post-run hooks are left to `_run_deferred_hooks`, in which
+                case the results are not stored in the record data directory yet.
+                Defaults to False.
+
+        Returns:
+            List[RecordResult]: the result lines of the run.
+        """
+        (
+            build_variables,
+            run_variables,
+            _,  # tilt_variables, TODO remove tilt
+            other_variables,
+        ) = self._group_record_parameters(record_parameters=record_parameters)
 
-            for pre_run_hook in self._pre_run_hooks:
+        # a record may override the duration of the benchmark (e.g. in search campaigns)
+        record_duration_seconds = record_parameters.get(
+            "benchmark_duration_seconds",
+            self._benchmark_duration_seconds,
+        )
+
+        # Replace record_data_dir with a temporary data directory for the
+        # wrapper to write their files to. (Only if the host is remote)
+        temp_record_data_dir = record_data_dir
+        temp_record_prefix = None
+        if not self.platform.comm.is_local:
+            temp_record_prefix = self._temp_record_prefix()
+            temp_record_data_dir = self._temp_record_data_dir(
+                record_data_dir=record_data_dir,
+                temp_record_prefix=temp_record_prefix,
+            )
+            self.platform.comm.makedirs(temp_record_data_dir, True)
+
+        gate = None if warmup_run else self._quiescence
+        if gate is not None:
+            gate_cpus = self._quiescence_cpus()
+            with trace_span(name="wait_quiet", category="quiescence"):
+                quiescence_wait_seconds, quiescence_noise = gate.wait_quiet(
+                    platform=self.platform,
+                    cpus=gate_cpus,
+                )
+
+        for pre_run_hook in self._pre_run_hooks:
+            with trace_span(name=callable_name(pre_run_hook), category="pre_run_hook"):
                 pre_run_hook(
                     build_variables=build_variables,
                     run_variables=run_variables,
@@ -1045,123 +2255,384 @@ class Benchmark:
                     record_data_dir=temp_record_data_dir,
                 )
 
-            if barrier is not None:
-                barrier_ret = barrier.wait()
-                if barrier_ret == 0:
-                    barrier.reset()
+        if barrier is not None:
+            barrier_ret = barrier.wait()
+            if barrier_ret == 0:
+                barrier.reset()
+
+        pipeline_kwargs = {}
+        if self._current_build_dir is not None:
+            pipeline_kwargs = {"build_dir": self._current_build_dir}
 
+        self._worker_local.default_timeout = self._default_timeout(
+            record_parameters=record_parameters,
+        )
+        if gate is not None:
+            with trace_span(name="snapshot", category="quiescence"):
+                snapshot_before = SystemSnapshot.take(platform=self.platform)
+        run_start = time.monotonic()
+        with trace_span(name="single_run", category=CATEGORY_RUN, args=record_parameters):
             single_run_return = self.single_run(
                 platform=self.platform,
-                benchmark_duration_seconds=self._benchmark_duration_seconds,
+                benchmark_duration_seconds=record_duration_seconds,
                 constants=self._constants,
                 build_variables=build_variables,
                 record_data_dir=temp_record_data_dir,
                 other_variables=other_variables,
+                **pipeline_kwargs,
                 **run_variables,
             )
 
             if self._command_is_async():
                 single_run_process: AsyncProcess = single_run_return
-                for attachment in self._command_attachments:
-                    attachment(
-                        process=single_run_process,
-                        record_data_dir=record_data_dir,
-                    )
-                single_run_output = single_run_process.output()
+                try:
+                    for attachment in self._command_attachments:
+                        with trace_span(name=callable_name(attachment), category="attachment"):
+                            attachment(
+                                process=single_run_process,
+                                record_data_dir=record_data_dir,
+                            )
+                    single_run_output = single_run_process.output()
+                finally:
+                    self._remove_async_output_dir()
             else:
                 single_run_output: str = single_run_return
+        if gate is not None:
+            with trace_span(name="snapshot", category="quiescence"):
+                snapshot_after = SystemSnapshot.take(platform=self.platform)
+        if not warmup_run:
+            self._duration_model.observe(
+                record=record_parameters,
+                duration_seconds=time.monotonic() - run_start,
+            )
 
-            # If the host was remote, all the wrappers generated files on the remote machine and
-            # these need to be copied back to the host machine.
-            if not self.platform.comm.is_local:
+        # If the host was remote, all the wrappers generated files on the remote machine and
+        # these need to be copied back to the host machine.
+        if not self.platform.comm.is_local:
+            with trace_span(name="copy_to_host", category="copy"):
                 self.platform.comm.copy_to_host(f"{temp_record_data_dir}/", f"{record_data_dir}/")
                 # Clean up nicely after ourselves
-                self.platform.comm.remove(self._temp_record_prefix(), recursive=True)
+                self.platform.comm.remove(temp_record_prefix, recursive=True)
 
+        with trace_span(name="parse_output_to_results", category="parse"):
             single_run_results = self.parse_output_to_results(
                 command_output=single_run_output,
                 build_variables=build_variables,
                 run_variables=run_variables,
-                benchmark_duration_seconds=self._benchmark_duration_seconds,
+                benchmark_duration_seconds=record_duration_seconds,
                 record_data_dir=record_data_dir,
             )
 
-            self._nb_runs_done += 1
-            experiment_results_header = experiment_results
+        experiment_results_header = experiment_results
 
-            if isinstance(single_run_results, list):
-                # multi-line output record
-                experiment_results_lines = []
-                for line in single_run_results:
-                    experiment_results_lines.append(dict_union(experiment_results_header, line))
-            else:
-                # single-line output record
-                record_params_results = dict_union(experiment_results_header, single_run_results)
-                experiment_results_lines = [record_params_results]
-
-            def wrdr(file_content: str, filename: PathType) -> None:
-                self._write_to_record_data_dir(
-                    file_content=file_content,
-                    filename=filename,
-                    record_data_dir=record_data_dir,
-                )
+        if isinstance(single_run_results, list):
+            # multi-line output record
+            experiment_results_lines = []
+            for line in single_run_results:
+                experiment_results_lines.append(dict_union(experiment_results_header, line))
+        else:
+            # single-line output record
+            record_params_results = dict_union(experiment_results_header, single_run_results)
+            experiment_results_lines = [record_params_results]
+
+        if gate is not None:
+            interference = gate.interference(
+                before=snapshot_before,
+                after=snapshot_after,
+                cpus=gate_cpus,
+                ignored_tids=own_tids(platform=self.platform),
+            )
+            for line in experiment_results_lines:
+                line["quiescence_wait_seconds"] = quiescence_wait_seconds
+                line["quiescence_noise"] = "; ".join(quiescence_noise)
+                line["interference"] = "; ".join(interference)
+
+        if self._warmup is not None and self._warmup.within_run:
+            experiment_results_lines = self._discard_warmup_lines(
+                experiment_results_lines=experiment_results_lines,
+                record_data_dir=record_data_dir,
+            )
 
-            for post_run_hook in self._post_run_hooks:
+        post_run_hooks = self._post_run_hooks
+        if defer_hooks:
+            post_run_hooks = [hook for hook in post_run_hooks if not is_deferrable(hook)]
+        self._run_post_run_hooks(
+            post_run_hooks=post_run_hooks,
+            experiment_results_lines=experiment_results_lines,
+            record_data_dir=record_data_dir,
+        )
+        if not defer_hooks:
+            self._write_to_record_data_dir(
+                file_content=json.dumps(experiment_results_lines) + "\n",
+                filename="experiment_results.json",
+                record_data_dir=record_data_dir,
+            )
+
+        return experiment_results_lines
+
+    def _execute_gated_run(
+        self,
+        record_parameters: RecordParameters,
+        experiment_results: RecordResult,
+        record_data_dir: Optional[pathlib.Path],
+        barrier: Optional[Barrier],
+        defer_hooks: bool,
+    ) -> List[RecordResult]:
+        """
+        Execute a single run of the benchmark (see `_execute_run`), and with a quiescence gate,
+        execute it again while there is interference during the run, up to the maximum number of
+        retries of the gate. The retried runs are kept in the record data directory, suffixed
+        with `-retry-<n>`. Runs synchronized with other campaigns by a barrier are not retried.
+
+        Args:
+            record_parameters (RecordParameters):
+                input parameters for the current record run.
+            experiment_results (RecordResult):
+                columns shared by all the result lines of the run.
+            record_data_dir (Optional[pathlib.Path]):
+                data directory of the run, if enabled.
+            barrier (Optional[Barrier]):
+                if applicable, the barrier for the benchmark to wait.
+            defer_hooks (bool):
+                whether the deferrable post-run hooks are left to `_run_deferred_hooks`.
+
+        Returns:
+            List[RecordResult]: the result lines of the last run.
+        """
+        gate = self._quiescence
+        nb_retries = 0
+        while True:
+            experiment_results_lines = self._execute_run(
+                record_parameters=record_parameters,
+                experiment_results=experiment_results,
+                record_data_dir=record_data_dir,
+                barrier=barrier,
+                defer_hooks=defer_hooks,
+            )
+            if gate is None:
+                return experiment_results_lines
+
+            interference = (
+                experiment_results_lines[0]["interference"] if experiment_results_lines else ""
+            )
+            if not interference or nb_retries >= gate.max_retries or barrier is not None:
+                break
+
+            nb_retries += 1
+            print(
+                f"[WARNING] Interference during the run ({interference}), "
+                f"retry {nb_retries}/{gate.max_retries}."
+            )
+            if record_data_dir is not None:
+                record_data_dir.rename(f"{record_data_dir}-retry-{nb_retries}")
+                os.makedirs(record_data_dir)
+
+        for line in experiment_results_lines:
+            line["nb_retries"] = nb_retries
+        return experiment_results_lines
+
+    def _quiescence_cpus(self) -> List[int]:
+        if self._quiescence.cpus is not None:
+            return self._quiescence.cpus
+        worker_cpus = getattr(self._worker_local, "cpus", None)
+        if worker_cpus is not None:
+            return list(worker_cpus)
+        return list(self._allocation_cpus())
+
+    def _run_post_run_hooks(
+        self,
+        post_run_hooks: Iterable[PostRunHook],
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: Optional[pathlib.Path],
+    ) -> None:
+        def wrdr(file_content: str, filename: PathType) -> None:
+            self._write_to_record_data_dir(
+                file_content=file_content,
+                filename=filename,
+                record_data_dir=record_data_dir,
+            )
+
+        for post_run_hook in post_run_hooks:
+            with trace_span(name=callable_name(post_run_hook), category="post_run_hook"):
                 hook_dict = post_run_hook(
                     experiment_results_lines=experiment_results_lines,
                     record_data_dir=record_data_dir,
                     write_record_file_fun=wrdr,
                 )
-                if hook_dict:
-                    for xrline in experiment_results_lines:
-                        xrline.update(hook_dict)
+            if hook_dict:
+                for xrline in experiment_results_lines:
+                    xrline.update(hook_dict)
+
+    def _run_deferred_hooks(
+        self,
+        record_parameters: RecordParameters,
+        execution: Dict[str, str],
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: Optional[pathlib.Path],
+    ) -> None:
+        """
+        Run the deferrable post-run hooks of a run in a background worker, then store and record
+        its results (with the columns added by the hooks).
 
-            wrdr(
-                file_content=json.dumps(experiment_results_lines, indent=4).strip() + "\n",
+        Args:
+            record_parameters (RecordParameters):
+                input parameters of the record of the run.
+            execution (Dict[str, str]):
+                the execution under which the run is journaled.
+            experiment_results_lines (List[RecordResult]):
+                the result lines of the run, updated by the hooks.
+            record_data_dir (Optional[pathlib.Path]):
+                data directory of the run, if enabled.
+        """
+        try:
+            self._run_post_run_hooks(
+                post_run_hooks=[hook for hook in self._post_run_hooks if is_deferrable(hook)],
+                experiment_results_lines=experiment_results_lines,
+                record_data_dir=record_data_dir,
+            )
+            self._write_to_record_data_dir(
+                file_content=json.dumps(experiment_results_lines) + "\n",
                 filename="experiment_results.json",
+                record_data_dir=record_data_dir,
             )
+        except BaseException as err:
+            if self._journal is not None:
+                self._journal.record_failed(execution=execution, error=repr(err))
+            raise
+
+        self._record_run_results(
+            record_parameters=record_parameters,
+            execution=execution,
+            experiment_results_lines=experiment_results_lines,
+        )
 
-            with open(self._csv_output_path, "a") as csv_output_file:
-                for experiment_results_line in experiment_results_lines:
-                    sep = CSV_SEPARATOR
-                    if not self._first_line_is_printed:
-                        header_list = list(experiment_results_line.keys())
-                        current_thread_columns = [
-                            int(c.split("thread_")[-1])
-                            for c in header_list
-                            if c.startswith("thread_")
-                        ]
-
-                        thread_list = []
-                        if len(current_thread_columns) > 0:
-                            current_max_thread = max(current_thread_columns)
-                            thread_list = [
-                                f"thread_{t}"
-                                for t in range(current_max_thread + 1, self._max_nb_threads())
-                            ]
-                        header_unsorted = header_list + thread_list
-                        header_left = [e for e in header_unsorted if not e.startswith("thread_")]
-                        header_right = [e for e in header_unsorted if e.startswith("thread_")]
-                        header = sep.join(header_left + header_right)
-
-                        teeprint(content=header, file=csv_output_file)
-                        self._first_line_is_printed = True
-                        self._first_line_list = header_list
-
-                    line_keys_left = [
-                        k for k in experiment_results_line.keys() if not k.startswith("thread_")
-                    ]
-                    line_keys_right = [
-                        k for k in experiment_results_line.keys() if k.startswith("thread_")
-                    ]
-                    line_keys = line_keys_left + line_keys_right
-                    current_line = sep.join(str(experiment_results_line[key]) for key in line_keys)
-                    teeprint(content=current_line, file=csv_output_file)
+    def _record_run_results(
+        self,
+        record_parameters: RecordParameters,
+        execution: Dict[str, str],
+        experiment_results_lines: List[RecordResult],
+    ) -> None:
+        with self._results_lock:
+            self._journal_done(execution=execution, results_lines=experiment_results_lines)
+            self._write_results_lines(experiment_results_lines=experiment_results_lines)
+            self._record_results(
+                record_parameters=record_parameters,
+                results_lines=experiment_results_lines,
+            )
+
+    def _run_warmup(
+        self,
+        record_parameters: RecordParameters,
+        barrier: Optional[Barrier],
+    ) -> None:
+        policy = self._warmup
+        values = []
+        while not policy.is_warm(values=values):
+            warmup_id = len(values) + 1
+            print(f"[INFO] Warmup run {warmup_id} of the record, its results are discarded.")
+            experiment_results = self._experiment_results(
+                record_parameters=record_parameters,
+                run_id=warmup_id,
+            )
+            experiment_results["warmup"] = True
+            experiment_results_lines = self._execute_run(
+                record_parameters=record_parameters,
+                experiment_results=experiment_results,
+                record_data_dir=self._record_data_dir(
+                    record_parameters=record_parameters,
+                    run_id=warmup_id,
+                    run_prefix="warmup",
+                ),
+                barrier=barrier,
+                warmup_run=True,
+            )
+            values.append(
+                self._metric_value(
+                    metric=policy.metric,
+                    experiment_results_lines=experiment_results_lines,
+                )
+                if policy.across_runs
+                else 0.0
+            )
+
+        if policy.across_runs and not policy.is_steady(values=values[-policy.window :]):
+            print(
+                f"[WARNING] No steady state of {policy.metric} after {len(values)} warmup runs, "
+                f"measuring anyway."
+            )
+
+    def _discard_warmup_lines(
+        self,
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: Optional[pathlib.Path],
+    ) -> List[RecordResult]:
+        metric = self._warmup.metric
+        if not all(metric in line for line in experiment_results_lines):
+            return experiment_results_lines
+
+        start = self._warmup.steady_state_start(
+            values=[float(line[metric]) for line in experiment_results_lines],
+        )
+        if start is None:
+            print(f"[WARNING] No steady state of {metric} within the run, keeping all the lines.")
+            return experiment_results_lines
+        if 0 == start:
+            return experiment_results_lines
+
+        warmup_lines = [dict(line, warmup=True) for line in experiment_results_lines[:start]]
+        self._write_to_record_data_dir(
+            file_content=json.dumps(warmup_lines) + "\n",
+            filename="warmup_results.json",
+            record_data_dir=record_data_dir,
+        )
+        return experiment_results_lines[start:]
+
+    def _record_results(
+        self,
+        record_parameters: RecordParameters,
+        results_lines: List[RecordResult],
+    ) -> None:
+        if isinstance(self._variables, ParameterSpace):
+            self._variables.record_results(
+                record_parameters=record_parameters,
+                results_lines=results_lines,
+            )
+
+    @staticmethod
+    def _metric_value(
+        metric: str,
+        experiment_results_lines: List[RecordResult],
+    ) -> float:
+        values = [float(line[metric]) for line in experiment_results_lines if metric in line]
+        if not values:
+            raise ValueError(f'Metric "{metric}" not found in the results')
+        # multi-line records contribute the mean of their lines
+        return sum(values) / len(values)
+
+    def _journal_done(
+        self,
+        execution: Dict[str, str],
+        results_lines: List[RecordResult],
+    ) -> None:
+        # journaled before being written to the sinks, which may buffer them
+        if self._journal is not None:
+            with trace_span(name="journal_done", category="io"):
+                self._journal.record_done(execution=execution, results_lines=results_lines)
+
+    def _write_results_lines(
+        self,
+        experiment_results_lines: List[RecordResult],
+    ) -> None:
+        with trace_span(name="write_results_lines", category="io"):
+            self._result_sink.write_lines(lines=experiment_results_lines)
+            if self._parquet_sink is not None:
+                self._parquet_sink.write_lines(lines=experiment_results_lines)
 
     def _record_data_dir(
         self,
         record_parameters: Dict[str, str | int | float],
         run_id: int,
+        run_prefix: str = "run",
     ) -> Optional[pathlib.Path]:
         if self._base_data_dir is None:
             return None
@@ -1171,7 +2642,9 @@ class Benchmark:
         max_nb_digits = len(str(total_nb_runs))
         nb_run_str = f"{run_id:0{max_nb_digits}}"
 
-        dirnames = [f"{k}-{v}" for k, v in record_parameters.items()] + [f"run-{nb_run_str}"]
+        dirnames = [f"{k}-{v}" for k, v in record_parameters.items()] + [
+            f"{run_prefix}-{nb_run_str}"
+        ]
         result = bdd.joinpath(*dirnames).resolve()
 
         if not result.is_dir():
@@ -1179,6 +2652,23 @@ class Benchmark:
 
         return result
 
+    def _log_adaptive_repetitions(
+        self,
+        output_file: IO,
+        expected_range_seconds: Tuple[int, int] | None,
+    ) -> None:
+        adaptive = self._adaptive_repetitions
+        print(f"# adaptive_repetitions_metric: {adaptive.metric}", file=output_file)
+        print(f"# adaptive_repetitions_criterion: {adaptive.criterion}", file=output_file)
+        print(f"# adaptive_repetitions_target: {adaptive.target}", file=output_file)
+        print(f"# adaptive_repetitions_confidence: {adaptive.confidence}", file=output_file)
+        print(f"# adaptive_repetitions_min_runs: {adaptive.min_runs}", file=output_file)
+        print(f"# adaptive_repetitions_max_runs: {adaptive.max_runs}", file=output_file)
+        if expected_range_seconds is not None:
+            min_seconds, max_seconds = expected_range_seconds
+            print(f"# expected_duration_min_seconds: {min_seconds}", file=output_file)
+            print(f"# expected_duration_max_seconds: {max_seconds}", file=output_file)
+
     def _log_headers(
         self,
         output_file,
@@ -1251,6 +2741,12 @@ class Benchmark:
             record_data_dir = pathlib.Path(kwargs["record_data_dir"])
             stdout_path = record_data_dir / "cmd_stdout.txt"
             stderr_path = record_data_dir / "cmd_stderr.txt"
+        elif self._nb_workers > 1:
+            # removed with _remove_async_output_dir once the output has been read
+            output_dir = pathlib.Path(tempfile.mkdtemp(prefix="benchkit_lastcmd-"))
+            self._worker_local.async_output_dir = output_dir
+            stdout_path = output_dir / "stdout.txt"
+            stderr_path = output_dir / "stderr.txt"
         else:
             stdout_path = "/tmp/benchkit_lastcmd_stdout.txt"
             stderr_path = "/tmp/benchkit_lastcmd_stderr.txt"
@@ -1266,6 +2762,12 @@ class Benchmark:
 
         return current_process
 
+    def _remove_async_output_dir(self) -> None:
+        output_dir = getattr(self._worker_local, "async_output_dir", None)
+        if output_dir is not None:
+            self._worker_local.async_output_dir = None
+            shutil.rmtree(output_dir, ignore_errors=True)
+
     def _get_run_variable_default(
         self,
         name: RecordKey,
@@ -14,9 +14,12 @@ import os.path
 import pathlib
 import shutil
 import sys
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from benchkit.benchmark import Benchmark
+from benchkit.distributed import WorkQueue, merge_host_results
+from benchkit.helpers.linux.quiescence import QuiescenceGate
 from benchkit.lwchart import (
     DataframeProcessor,
     generate_chart_from_multiple_csvs,
@@ -25,10 +28,15 @@ from benchkit.lwchart import (
     identical_dataframe,
 )
 from benchkit.platforms import Platform, get_current_platform
+from benchkit.results.adaptive import AdaptiveRepetitions
+from benchkit.results.sink import FlushPolicy
+from benchkit.results.warmup import WarmupPolicy
+from benchkit.scheduler import Allocation, ResourcePool, ResourceRequest, run_scheduled
 from benchkit.utils.dir import parentdir
-from benchkit.utils.misc import seconds2pretty
+from benchkit.utils.misc import TimeMeasure, seconds2pretty
+from benchkit.utils.search import SuccessiveHalvingSpace
 from benchkit.utils.types import Constants, PathType, Pretty
-from benchkit.utils.variables import cartesian_product
+from benchkit.utils.variables import CartesianProductSpace, ParameterSpace
 
 _BENCHKIT_CAMPAIGN_CMD_FILE = "/tmp/benchkit-campaign.sh"
 
@@ -76,6 +84,30 @@ class Campaign:
             pretty_variables=params.get("pretty"),
             debug=debug,
             gdb=gdb,
+            nb_workers=params.get("nb_workers", 1),
+            stop_on_first_finish=params.get("stop_on_first_finish", False),
+            build_cache_dir=params.get("build_cache_dir"),
+            pipelined_builds=params.get("pipelined_builds", False),
+            build_cpus=params.get("build_cpus"),
+            adaptive_repetitions=params.get("adaptive_repetitions"),
+            flush_policy=params.get("flush_policy"),
+            parquet_output_path=(
+                self.csv_output_abs_path().with_suffix(".parquet")
+                if params.get("parquet_output", False)
+                else None
+            ),
+            duration_model_path=params.get("duration_model_path"),
+            timeout_factor=params.get("timeout_factor"),
+            warmup=params.get("warmup"),
+            journal_path=(
+                self.csv_output_abs_path().with_suffix(".journal")
+                if params.get("journal", True)
+                else None
+            ),
+            trace=params.get("trace", False),
+            post_processing_workers=params.get("post_processing_workers", 1),
+            post_processing_cpus=params.get("post_processing_cpus"),
+            quiescence=params.get("quiescence"),
         )
 
     def csv_file(
@@ -213,6 +245,27 @@ class Campaign:
         """
         return self._benchmark.expected_total_duration_seconds()
 
+    def campaign_duration_range_seconds(self) -> Tuple[int, int] | None:
+        """
+        Return the range of the estimated time to execute the whole campaign of experiments, which
+        depends on the number of repetitions when they are adaptive.
+
+        Returns:
+            Tuple[int, int] | None:
+                the minimum and maximum estimated time to execute the whole campaign.
+        """
+        return self._benchmark.expected_total_duration_range_seconds()
+
+    def resource_request(self) -> ResourceRequest:
+        """
+        Return the resources needed by the campaign when it runs alongside other campaigns.
+
+        Returns:
+            ResourceRequest: the resources needed, the whole machine if none were declared.
+        """
+        resources = self.parameters.get("resources")
+        return resources if resources is not None else ResourceRequest()
+
     def campaign_nb_runs(self) -> int:
         """
         Return the total number of single experiment runs there is in this campaign.
@@ -280,6 +333,17 @@ class Campaign:
             shutil.move(_BENCHKIT_CAMPAIGN_CMD_FILE, dst_path)
 
 
+def _run_campaign_on_cpus(
+    campaign: Campaign,
+    cpus: List[int],
+) -> None:
+    # the CPUs of the allocation are the ones of the local machine, the processes of the campaign
+    # inherit the affinity
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    campaign.campaign_run(other_campaigns_seconds=0, barrier=None)
+
+
 class CampaignSuite:
     """
     Represent a sequential suite of campaigns.
@@ -316,13 +380,25 @@ class CampaignSuite:
     def run_suite(
         self,
         parallel: bool = False,
+        lockstep: bool = False,
     ) -> None:
         """
         Run the suite of campaign, running sequentially or in parallel each campaign in the suite.
 
+        In parallel, each campaign runs in its own process pinned to the CPUs allocated to it
+        according to its resource request (see `Campaign.resource_request`). Campaigns whose
+        requests fit together on the machine run concurrently on disjoint sets of CPUs, the others
+        wait for enough resources to be released. Campaigns that do not declare their resources
+        need the whole machine and therefore run alone. The longest campaigns (according to their
+        expected durations) are started first.
+
         Args:
             parallel (bool, optional):
                 whether to run campaigns in the suite in parallel. Defaults to False.
+            lockstep (bool, optional):
+                when running in parallel, whether to start all the campaigns at once regardless of
+                their resources, synchronizing their runs with a barrier (e.g. to measure the
+                interference between them). Defaults to False.
         """
         for campaign in self._campaigns:
             campaign._benchmark.check_dependencies()
@@ -334,13 +410,12 @@ class CampaignSuite:
         else:
             remaining = [sum(durations[i + 1 :]) for i in range(len(durations))]
 
-        process_list = []
-        barrier = multiprocessing.Barrier(len(self._campaigns))
-
         if not parallel:
             for campaign, remaining_seconds in zip(self._campaigns, remaining):
                 campaign.campaign_run(other_campaigns_seconds=remaining_seconds, barrier=None)
-        else:
+        elif lockstep:
+            process_list = []
+            barrier = multiprocessing.Barrier(len(self._campaigns))
             for campaign in self._campaigns:
                 p = multiprocessing.Process(
                     target=campaign.campaign_run,
@@ -349,8 +424,37 @@ class CampaignSuite:
                 process_list.append(p)
                 p.start()
 
-        for p in process_list:
-            p.join()
+            for p in process_list:
+                p.join()
+        else:
+            self._run_scheduled()
+
+    def _run_scheduled(self) -> None:
+        pool = ResourcePool.from_platform(platform=get_current_platform())
+
+        # longest campaigns first, shorter ones fill the remaining resources
+        durations = self.durations()
+        order = sorted(range(len(self._campaigns)), key=lambda i: -(durations[i] or 0))
+        requests = [self._campaigns[i].resource_request() for i in order]
+
+        def start(job_id: int, allocation: Allocation) -> multiprocessing.Process:
+            campaign_id = order[job_id]
+            campaign = self._campaigns[campaign_id]
+            print(
+                f"[INFO] Starting campaign {campaign_id + 1}/{len(self._campaigns)} "
+                f"on CPUs {allocation.cpus}"
+            )
+            p = multiprocessing.Process(
+                target=_run_campaign_on_cpus,
+                args=(campaign, allocation.cpus),
+            )
+            p.start()
+            return p
+
+        exit_codes = run_scheduled(requests=requests, pool=pool, start=start)
+        failed = sorted(order[i] + 1 for i, code in enumerate(exit_codes) if 0 != code)
+        if failed:
+            raise RuntimeError(f"Campaigns {failed} of the suite failed")
 
     def print_durations(self) -> None:
         """
@@ -454,6 +558,23 @@ class CampaignTemplate(Campaign):
         benchmark_duration_seconds: Optional[int] = None,
         results_dir: Optional[PathType] = None,
         pretty: Pretty | None = None,
+        nb_workers: int = 1,
+        stop_on_first_finish: bool = False,
+        build_cache_dir: Optional[PathType] = None,
+        pipelined_builds: bool = False,
+        build_cpus: Optional[List[int]] = None,
+        adaptive_repetitions: Optional[AdaptiveRepetitions] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        parquet_output: bool = False,
+        resources: Optional[ResourceRequest] = None,
+        duration_model_path: Optional[PathType] = None,
+        timeout_factor: Optional[float] = None,
+        warmup: Optional[WarmupPolicy] = None,
+        journal: bool = True,
+        trace: bool = False,
+        post_processing_workers: int = 1,
+        post_processing_cpus: Optional[List[int]] = None,
+        quiescence: Optional[QuiescenceGate] = None,
     ):
         csv_filename = self.csv_file(
             campaign_name="benchmark",
@@ -474,9 +595,13 @@ class CampaignTemplate(Campaign):
         if constants is not None:
             all_constants.update(constants)
 
-        list_variables = list(variables)
-
-        variable_names = {key for record in list_variables for key in record}
+        if isinstance(variables, ParameterSpace):
+            # kept lazy, records are generated while the campaign runs
+            list_variables = variables
+            variable_names = set(variables.names)
+        else:
+            list_variables = list(variables)
+            variable_names = {key for record in list_variables for key in record}
         constant_names = set(all_constants)
         common_names = constant_names.intersection(variable_names)
 
@@ -502,6 +627,45 @@ class CampaignTemplate(Campaign):
         if pretty is not None:
             self.parameters["pretty"] = pretty
 
+        self.parameters["nb_workers"] = nb_workers
+        self.parameters["stop_on_first_finish"] = stop_on_first_finish
+
+        if build_cache_dir is not None:
+            self.parameters["build_cache_dir"] = build_cache_dir
+
+        self.parameters["pipelined_builds"] = pipelined_builds
+        if build_cpus is not None:
+            self.parameters["build_cpus"] = build_cpus
+
+        if adaptive_repetitions is not None:
+            self.parameters["adaptive_repetitions"] = adaptive_repetitions
+
+        if flush_policy is not None:
+            self.parameters["flush_policy"] = flush_policy
+
+        self.parameters["parquet_output"] = parquet_output
+
+        if resources is not None:
+            self.parameters["resources"] = resources
+
+        if duration_model_path is not None:
+            self.parameters["duration_model_path"] = duration_model_path
+        if timeout_factor is not None:
+            self.parameters["timeout_factor"] = timeout_factor
+
+        if warmup is not None:
+            self.parameters["warmup"] = warmup
+
+        self.parameters["journal"] = journal
+        self.parameters["trace"] = trace
+
+        self.parameters["post_processing_workers"] = post_processing_workers
+        if post_processing_cpus is not None:
+            self.parameters["post_processing_cpus"] = post_processing_cpus
+
+        if quiescence is not None:
+            self.parameters["quiescence"] = quiescence
+
         super().__init__(
             debug=debug, gdb=gdb, enable_data_dir=enable_data_dir, continuing=continuing
         )
@@ -527,6 +691,23 @@ class CampaignIterateVariables(CampaignTemplate):
         benchmark_duration_seconds: Optional[int] = None,
         results_dir: Optional[PathType] = None,
         pretty: Pretty | None = None,
+        nb_workers: int = 1,
+        stop_on_first_finish: bool = False,
+        build_cache_dir: Optional[PathType] = None,
+        pipelined_builds: bool = False,
+        build_cpus: Optional[List[int]] = None,
+        adaptive_repetitions: Optional[AdaptiveRepetitions] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        parquet_output: bool = False,
+        resources: Optional[ResourceRequest] = None,
+        duration_model_path: Optional[PathType] = None,
+        timeout_factor: Optional[float] = None,
+        warmup: Optional[WarmupPolicy] = None,
+        journal: bool = True,
+        trace: bool = False,
+        post_processing_workers: int = 1,
+        post_processing_cpus: Optional[List[int]] = None,
+        quiescence: Optional[QuiescenceGate] = None,
     ):
         super().__init__(
             name=name,
@@ -541,6 +722,23 @@ class CampaignIterateVariables(CampaignTemplate):
             benchmark_duration_seconds=benchmark_duration_seconds,
             results_dir=results_dir,
             pretty=pretty,
+            nb_workers=nb_workers,
+            stop_on_first_finish=stop_on_first_finish,
+            build_cache_dir=build_cache_dir,
+            pipelined_builds=pipelined_builds,
+            build_cpus=build_cpus,
+            adaptive_repetitions=adaptive_repetitions,
+            flush_policy=flush_policy,
+            parquet_output=parquet_output,
+            resources=resources,
+            duration_model_path=duration_model_path,
+            timeout_factor=timeout_factor,
+            warmup=warmup,
+            journal=journal,
+            trace=trace,
+            post_processing_workers=post_processing_workers,
+            post_processing_cpus=post_processing_cpus,
+            quiescence=quiescence,
         )
 
 
@@ -565,19 +763,334 @@ class CampaignCartesianProduct(CampaignTemplate):
         benchmark_duration_seconds: Optional[int] = None,
         results_dir: Optional[PathType] = None,
         pretty: Pretty | None = None,
+        nb_workers: int = 1,
+        stop_on_first_finish: bool = False,
+        build_cache_dir: Optional[PathType] = None,
+        pipelined_builds: bool = False,
+        build_cpus: Optional[List[int]] = None,
+        adaptive_repetitions: Optional[AdaptiveRepetitions] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        parquet_output: bool = False,
+        resources: Optional[ResourceRequest] = None,
+        duration_model_path: Optional[PathType] = None,
+        timeout_factor: Optional[float] = None,
+        warmup: Optional[WarmupPolicy] = None,
+        journal: bool = True,
+        trace: bool = False,
+        post_processing_workers: int = 1,
+        post_processing_cpus: Optional[List[int]] = None,
+        quiescence: Optional[QuiescenceGate] = None,
     ):
-        records_gen = cartesian_product(variables)
+        records_space = CartesianProductSpace(variables)
+        super().__init__(
+            name=name,
+            benchmark=benchmark,
+            nb_runs=nb_runs,
+            variables=records_space,
+            constants=constants,
+            debug=debug,
+            gdb=gdb,
+            enable_data_dir=enable_data_dir,
+            continuing=continuing,
+            benchmark_duration_seconds=benchmark_duration_seconds,
+            results_dir=results_dir,
+            pretty=pretty,
+            nb_workers=nb_workers,
+            stop_on_first_finish=stop_on_first_finish,
+            build_cache_dir=build_cache_dir,
+            pipelined_builds=pipelined_builds,
+            build_cpus=build_cpus,
+            adaptive_repetitions=adaptive_repetitions,
+            flush_policy=flush_policy,
+            parquet_output=parquet_output,
+            resources=resources,
+            duration_model_path=duration_model_path,
+            timeout_factor=timeout_factor,
+            warmup=warmup,
+            journal=journal,
+            trace=trace,
+            post_processing_workers=post_processing_workers,
+            post_processing_cpus=post_processing_cpus,
+            quiescence=quiescence,
+        )
+
+
+class CampaignSearch(CampaignTemplate):
+    """
+    Campaign searching for the best values of the variables according to an objective, instead of
+    trying all their combinations.
+    Configurations are sampled at random from the cartesian product of the variables and evaluated
+    with successive halving: all of them first run with a short benchmark duration, then only the
+    best ones run again with longer durations (see `SuccessiveHalvingSpace`). All the tried points
+    are recorded in the CSV output and data directory, with their `search_round` and
+    `benchmark_duration_seconds`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        benchmark: Benchmark,
+        nb_runs: int,
+        variables: Dict[str, Iterable[Any]],
+        objective: str,
+        min_duration_seconds: int,
+        max_duration_seconds: int,
+        constants: Constants,
+        debug: bool,
+        gdb: bool,
+        enable_data_dir: bool,
+        maximize: bool = True,
+        eta: int = 3,
+        nb_samples: Optional[int] = None,
+        budget_seconds: Optional[int] = None,
+        seed: int = 0,
+        continuing: bool = False,
+        results_dir: Optional[PathType] = None,
+        pretty: Pretty | None = None,
+        nb_workers: int = 1,
+        build_cache_dir: Optional[PathType] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        parquet_output: bool = False,
+        resources: Optional[ResourceRequest] = None,
+        duration_model_path: Optional[PathType] = None,
+        timeout_factor: Optional[float] = None,
+        warmup: Optional[WarmupPolicy] = None,
+        journal: bool = True,
+        trace: bool = False,
+        post_processing_workers: int = 1,
+        post_processing_cpus: Optional[List[int]] = None,
+        quiescence: Optional[QuiescenceGate] = None,
+    ):
+        self._search_space = SuccessiveHalvingSpace(
+            variables=variables,
+            objective=objective,
+            min_duration_seconds=min_duration_seconds,
+            max_duration_seconds=max_duration_seconds,
+            maximize=maximize,
+            eta=eta,
+            nb_samples=nb_samples,
+            budget_seconds=budget_seconds,
+            nb_runs=nb_runs,
+            seed=seed,
+        )
         super().__init__(
             name=name,
             benchmark=benchmark,
             nb_runs=nb_runs,
-            variables=records_gen,
+            variables=self._search_space,
             constants=constants,
             debug=debug,
             gdb=gdb,
             enable_data_dir=enable_data_dir,
             continuing=continuing,
+            benchmark_duration_seconds=max_duration_seconds,
+            results_dir=results_dir,
+            pretty=pretty,
+            nb_workers=nb_workers,
+            build_cache_dir=build_cache_dir,
+            flush_policy=flush_policy,
+            parquet_output=parquet_output,
+            resources=resources,
+            duration_model_path=duration_model_path,
+            timeout_factor=timeout_factor,
+            warmup=warmup,
+            journal=journal,
+            trace=trace,
+            post_processing_workers=post_processing_workers,
+            post_processing_cpus=post_processing_cpus,
+            quiescence=quiescence,
+        )
+
+    def best_record(self) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Return the best configuration found by the search.
+
+        Returns:
+            Optional[Tuple[Dict[str, Any], float]]:
+                the values of the variables of the best configuration and its mean objective, or
+                None if no result has been recorded yet.
+        """
+        return self._search_space.best()
+
+    def campaign_run(
+        self,
+        other_campaigns_seconds: int,
+        barrier: Optional[multiprocessing.Barrier],
+    ) -> None:
+        super().campaign_run(other_campaigns_seconds=other_campaigns_seconds, barrier=barrier)
+
+        best = self.best_record()
+        if best is not None:
+            best_record, best_objective = best
+            print(f"[INFO] Best configuration found: {best_record} (objective: {best_objective})")
+
+
+class CampaignDistributed(CampaignTemplate):
+    """
+    Campaign whose records are distributed over a pool of identical hosts.
+    Each host runs its own instance of the benchmark, created by the benchmark factory for the
+    platform of the host (typically a remote platform obtained with `get_remote_platform`). The
+    build groups of the campaign are pulled by the hosts from a shared work queue, and the group
+    of a host that fails is run again by another host (see `WorkQueue`). The results of all the
+    hosts are merged in a single CSV file with their `hostname` column, and share the same data
+    directory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        benchmark_factory: Callable[[Platform], Benchmark],
+        platforms: Iterable[Platform],
+        nb_runs: int,
+        variables: Iterable[Dict[str, Any]],
+        constants: Constants,
+        debug: bool,
+        gdb: bool,
+        enable_data_dir: bool,
+        benchmark_duration_seconds: Optional[int] = None,
+        results_dir: Optional[PathType] = None,
+        pretty: Pretty | None = None,
+        nb_workers: int = 1,
+        build_cache_dir: Optional[PathType] = None,
+        flush_policy: Optional[FlushPolicy] = None,
+        max_attempts: int = 2,
+        duration_model_path: Optional[PathType] = None,
+        timeout_factor: Optional[float] = None,
+        warmup: Optional[WarmupPolicy] = None,
+    ):
+        self._benchmark_factory = benchmark_factory
+        self._platforms = list(platforms)
+        if not self._platforms:
+            raise ValueError("Distributed campaign without any platform")
+        self._max_attempts = max_attempts
+
+        super().__init__(
+            name=name,
+            benchmark=benchmark_factory(self._platforms[0]),
+            nb_runs=nb_runs,
+            variables=list(variables),
+            constants=constants,
+            debug=debug,
+            gdb=gdb,
+            enable_data_dir=enable_data_dir,
+            continuing=False,
             benchmark_duration_seconds=benchmark_duration_seconds,
             results_dir=results_dir,
             pretty=pretty,
+            nb_workers=nb_workers,
+            build_cache_dir=build_cache_dir,
+            flush_policy=flush_policy,
+            duration_model_path=duration_model_path,
+            timeout_factor=timeout_factor,
+            warmup=warmup,
+            journal=False,
         )
+        self._debug = debug
+        self._gdb = gdb
+
+    def campaign_duration_seconds(self) -> int:
+        total_seconds = super().campaign_duration_seconds()
+        if total_seconds is None:
+            return None
+        return -(-total_seconds // len(self._platforms))
+
+    def campaign_run(
+        self,
+        other_campaigns_seconds: int,
+        barrier: Optional[multiprocessing.Barrier],
+    ) -> None:
+        if barrier is not None:
+            raise ValueError("Distributed campaigns cannot be synchronized with a barrier")
+
+        self._init_cmd_file()
+
+        csv_output_path = self.csv_output_abs_path()
+        os.makedirs(csv_output_path.parent, exist_ok=True)
+
+        params = self.parameters
+        work_queue = WorkQueue(
+            build_var_names=self._benchmark.get_build_var_names(),
+            records=params["variables"],
+            max_attempts=self._max_attempts,
+        )
+        host_csv_paths = {
+            host_id: csv_output_path.with_name(
+                f"{csv_output_path.stem}_host{host_id}-{platform.hostname}.csv"
+            )
+            for host_id, platform in enumerate(self._platforms)
+        }
+        failed_hosts = []
+
+        def run_host(host_id: int, platform: Platform) -> None:
+            try:
+                benchmark = self._benchmark_factory(platform)
+                benchmark.configure_variables(
+                    experiment_name=params["experiment_name"],
+                    benchmark_name=params["benchmark_name"],
+                    csv_output_path=host_csv_paths[host_id],
+                    base_data_dir=self.base_data_dir(),
+                    benchmark_duration_seconds=params.get("benchmark_duration_seconds"),
+                    nb_runs=params["nb_runs"],
+                    constants=dict(params["constants"], hostname=platform.hostname),
+                    variables=work_queue.host_space(host_id=host_id),
+                    pretty_variables=params.get("pretty"),
+                    debug=self._debug,
+                    gdb=self._gdb,
+                    nb_workers=params.get("nb_workers", 1),
+                    build_cache_dir=params.get("build_cache_dir"),
+                    flush_policy=params.get("flush_policy"),
+                    duration_model_path=params.get("duration_model_path"),
+                    timeout_factor=params.get("timeout_factor"),
+                    warmup=params.get("warmup"),
+                )
+                benchmark.check_dependencies()
+                benchmark.run(
+                    other_campaigns_seconds=other_campaigns_seconds,
+                    barrier=None,
+                    continuing=False,
+                )
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                failed_hosts.append(platform.hostname)
+                group = work_queue.host_failed(host_id=host_id)
+                group_str = "" if group is None else f" while running build group {group[0]}"
+                print(
+                    f'[WARNING] Host "{platform.hostname}" failed{group_str}: {err}',
+                    file=sys.stderr,
+                )
+            else:
+                work_queue.host_finished(host_id=host_id)
+
+        with TimeMeasure() as run_duration:
+            threads = [
+                threading.Thread(target=run_host, args=(host_id, platform))
+                for host_id, platform in enumerate(self._platforms)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        hostnames = ",".join(p.hostname for p in self._platforms)
+        nb_rows = merge_host_results(
+            work_queue=work_queue,
+            host_csv_paths=host_csv_paths,
+            output_path=csv_output_path,
+            extra_comments=[
+                f"distributed_hosts: {hostnames}",
+                f"distributed_failed_hosts: {','.join(failed_hosts)}",
+                f"total_duration_seconds: {run_duration.duration_seconds}",
+            ],
+        )
+        for host_csv_path in host_csv_paths.values():
+            if host_csv_path.is_file():
+                host_csv_path.unlink()
+
+        dropped_groups = work_queue.dropped_groups
+        if dropped_groups:
+            nb_dropped = sum(len(records) for _, records in dropped_groups)
+            print(
+                f"[WARNING] {nb_dropped} records could not be run on any host.",
+                file=sys.stderr,
+            )
+        print(f'[INFO] Distributed campaign done, {nb_rows} results merged in "{csv_output_path}"')
+        self._move_cmd_file()
@@ -4,6 +4,7 @@
 Functions to get dataframe from CSV file and compute useful values (like the fairness factor).
 """
 
+import pathlib
 from typing import Any, Dict
 
 import pandas as pd
@@ -31,6 +32,7 @@ def fairness_factor(row: Dict[str, Any]) -> float:
 
 def get_dataframe(csv_path: PathType) -> pd.DataFrame:
     """Get dataframe from CSV file, filtering the comment and assuming the "comma" is a ";".
+    Parquet result files are also supported.
 
     Args:
         csv_path (PathType): path to the CSV file containing the results.
@@ -38,12 +40,15 @@ def get_dataframe(csv_path: PathType) -> pd.DataFrame:
     Returns:
         pd.DataFrame: dataframe holding the results.
     """
-    df = pd.read_csv(
-        f"{csv_path}",
-        sep=";",
-        comment="#",
-        engine="python",
-    )
+    if ".parquet" == pathlib.Path(csv_path).suffix:
+        df = pd.read_parquet(csv_path)
+    else:
+        df = pd.read_csv(
+            f"{csv_path}",
+            sep=";",
+            comment="#",
+            engine="python",
+        )
     if "global_count" in df.columns and "duration" in df.columns:
         df["throughput"] = df["global_count"] / df["duration"]
 
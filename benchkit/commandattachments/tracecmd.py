@@ -4,7 +4,7 @@
 import pathlib
 from typing import List
 
-from benchkit.benchmark import RecordResult, WriteRecordFileFunction
+from benchkit.benchmark import RecordResult, WriteRecordFileFunction, deferrable
 from benchkit.platforms import Platform, get_current_platform
 from benchkit.shell.shellasync import AsyncProcess
 from benchkit.utils.types import PathType
@@ -25,6 +25,7 @@ class TraceCmd:
         self._process = None
         self._files_pid = []
         self._pre_run_hook = False
+        self._pids = {}
 
     def pre_run_hook(
         self,
@@ -97,7 +98,28 @@ class TraceCmd:
         record_data_dir: PathType,
         write_record_file_fun: WriteRecordFileFunction,
     ) -> None:
-        assert experiment_results_lines
+        self.post_run_hook_stop(
+            experiment_results_lines=experiment_results_lines,
+            record_data_dir=record_data_dir,
+            write_record_file_fun=write_record_file_fun,
+        )
+        self.post_run_hook_report(
+            experiment_results_lines=experiment_results_lines,
+            record_data_dir=record_data_dir,
+            write_record_file_fun=write_record_file_fun,
+        )
+
+    def post_run_hook_stop(
+        self,
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: PathType,
+        write_record_file_fun: WriteRecordFileFunction,
+    ) -> None:
+        """
+        Stop tracing, to use with `post_run_hook_report` instead of `post_run_hook` such that the
+        report is generated in the background.
+        """
+        assert experiment_results_lines and write_record_file_fun
 
         rdd = pathlib.Path(record_data_dir)
         print(rdd)
@@ -106,9 +128,25 @@ class TraceCmd:
             self._process.stop()
         else:
             self._process.wait()
+        self._pids[rdd] = self.pid
+
+    @deferrable
+    def post_run_hook_report(
+        self,
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: PathType,
+        write_record_file_fun: WriteRecordFileFunction,
+    ) -> None:
+        """
+        Generate the report of the trace of the record, after `post_run_hook_stop`.
+        """
+        assert experiment_results_lines
+
+        rdd = pathlib.Path(record_data_dir)
+        pid = self._pids.pop(rdd, self.pid)
 
         command = [f"{_tracecmd_prefix}trace-cmd", "report", "trace.dat"]
 
         output = self._platform.comm.shell(command=command, current_dir=rdd, print_output=False)
         write_record_file_fun(output, "generate-graph.out")
-        self._files_pid.append((rdd / "generate-graph.out", self.pid))
+        self._files_pid.append((rdd / "generate-graph.out", pid))
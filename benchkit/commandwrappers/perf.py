@@ -17,7 +17,7 @@ import time
 from functools import cache
 from typing import Callable, Dict, List, Optional, Tuple
 
-from benchkit.benchmark import RecordResult, WriteRecordFileFunction
+from benchkit.benchmark import RecordResult, WriteRecordFileFunction, deferrable
 from benchkit.commandwrappers import CommandWrapper, PackageDependency
 from benchkit.communication import CommunicationLayer
 from benchkit.helpers.linux import ps, sysctl
@@ -721,7 +721,7 @@ class PerfReportWrap(CommandWrapper):
         """
         assert experiment_results_lines and record_data_dir
 
-        perf_data_pathname = self.latest_perf_path
+        perf_data_pathname = os.path.join(record_data_dir, "perf.data")
         self._chown(pathname=perf_data_pathname)
 
         command = self._perf_report_command(perf_data_pathname=perf_data_pathname)
@@ -735,6 +735,7 @@ class PerfReportWrap(CommandWrapper):
         if self._report_interactive:
             shell_interactive(command=command, ignore_ret_codes=(-13,))  # ignore broken pipe error
 
+    @deferrable
     def post_run_hook_flamegraph(
         self,
         experiment_results_lines: List[RecordResult],
@@ -748,6 +749,7 @@ class PerfReportWrap(CommandWrapper):
         flamegraph_minwidth: float | None = None,
     ) -> None:
         """Post run hook to generate flamegraph into data directory of the record.
+        The hook is deferrable, it can run in the background while the next records run.
 
         Raises:
             PerfWrapError: when flamegraph path has not been given at wrapper creation.
@@ -763,8 +765,9 @@ class PerfReportWrap(CommandWrapper):
                 )
             )
 
-        perf_data_pathname = self.latest_perf_path
-        perf_data_dirname = pathlib.Path(self.latest_perf_path).parent.resolve()
+        # the perf data of this record, latest_perf_path may already be the one of the next record
+        perf_data_dirname = pathlib.Path(record_data_dir).resolve()
+        perf_data_pathname = perf_data_dirname / "perf.data"
         perf_folded_pathname = perf_data_dirname / "perf.folded"
 
         self._chown(pathname=perf_data_pathname)
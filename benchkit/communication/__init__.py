@@ -9,19 +9,70 @@ The right instance of `CommunicationLayer` will transparently execute the machin
 while the client code can remain the same for any scenario.
 """
 
+import asyncio
+import atexit
 import getpass
 import os
 import os.path
 import pathlib
+import shlex
+import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
 from functools import lru_cache
 from shutil import which
 from typing import Dict, Iterable, List, Optional
 
+from benchkit.communication.agent import (
+    AgentClient,
+    AgentError,
+    agent_command,
+    agent_sources,
+)
 from benchkit.communication.utils import command_with_env, remote_shell_command
 from benchkit.shell.shell import pipe_shell_out, shell_out
+from benchkit.shell.shellaio import create_process, shell_out_aio
+from benchkit.shell.utils import get_args
 from benchkit.utils.types import Command, Environment, PathType, SplitCommand
 
+_CONTROL_MASTER_TIMEOUT_SECONDS = 30.0
+_CONTROL_MASTER_OPTIONS = [
+    "-oControlMaster=yes",
+    "-oControlPersist=no",
+    # the master exits when the server stops responding, it is then restarted
+    "-oServerAliveInterval=10",
+    "-oServerAliveCountMax=3",
+]
+
+_STAT_TESTS = (("-e", "e"), ("-f", "f"), ("-d", "d"), ("-L", "l"))
+
+
+class PathStatus:
+    """Status of a path on the target host, as returned by `CommunicationLayer.stat_many`."""
+
+    def __init__(
+        self,
+        exists: bool,
+        is_file: bool = False,
+        is_dir: bool = False,
+        is_link: bool = False,
+    ) -> None:
+        self.exists = exists
+        self.is_file = is_file
+        self.is_dir = is_dir
+        self.is_link = is_link
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PathStatus) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        flags = ", ".join(f"{k}={v}" for k, v in vars(self).items())
+        return f"PathStatus({flags})"
+
 
 class CommunicationLayer:
     """Base class for any communication layer."""
@@ -195,6 +246,7 @@ class CommunicationLayer:
         cwd: PathType | None,
         env: dict | None,
         establish_new_connection: bool = False,
+        stdin: int | None = None,
     ) -> subprocess.Popen:
         """Start a background process with the provided command.
 
@@ -211,6 +263,9 @@ class CommunicationLayer:
                 environment variables to pass to the command to run.
             establish_new_connection (bool, optional):
                 whether to establish a new connection to the background process.
+            stdin (int | None, optional):
+                standard input of the background process, e.g. `subprocess.PIPE` to write to it.
+                Defaults to None (inherited).
 
         Returns:
             subprocess.Popen: the process handle from the subprocess module.
@@ -350,6 +405,160 @@ class CommunicationLayer:
         """
         raise NotImplementedError("Copy to host is not implemented for this communication layer")
 
+    def close(self) -> None:
+        """Release the resources of the communication layer (e.g. persistent connections).
+        The communication layer remains usable, the resources are acquired again if needed.
+        """
+
+    def stdio_channel_command(self, command: str) -> SplitCommand:
+        """Get the command running the given shell command on the target host, with its standard
+        input and output connected to the local process (without terminal), e.g. to talk to an
+        agent.
+
+        Args:
+            command (str): shell command to run on the target host.
+
+        Returns:
+            SplitCommand: the local command to start.
+        """
+        raise NotImplementedError(
+            "Standard I/O channels are not implemented for this communication layer"
+        )
+
+    def start_agent(self, python_path: str = "python3") -> AgentClient:
+        """Start a benchkit agent on the target host, serving file, process and `/proc` operations
+        as pipelined calls over a single channel (see `benchkit.communication.agent`).
+
+        Args:
+            python_path (str, optional): Python interpreter of the target host.
+                                         Defaults to "python3".
+
+        Raises:
+            AgentError: if the agent does not start.
+
+        Returns:
+            AgentClient: client of the started agent, to close when done.
+        """
+        channel = self.stdio_channel_command(command=agent_command(python_path=python_path))
+        return AgentClient(channel=channel, sources=agent_sources())
+
+    async def shell_aio(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        output_is_log: bool = False,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> str:
+        """Run a shell command on the target host, as a coroutine.
+        Asynchronous equivalent of `shell`, with the same arguments. Communication layers without
+        a native implementation run `shell` in a thread.
+
+        Returns:
+            str: the output of the command.
+        """
+        return await asyncio.to_thread(
+            self.shell,
+            command=command,
+            std_input=std_input,
+            current_dir=current_dir,
+            environment=environment,
+            shell=shell,
+            print_input=print_input,
+            print_output=print_output,
+            print_curdir=print_curdir,
+            timeout=timeout,
+            output_is_log=output_is_log,
+            ignore_ret_codes=ignore_ret_codes,
+            ignore_any_error_code=ignore_any_error_code,
+        )
+
+    async def background_subprocess_aio(
+        self,
+        command: Command,
+        stdout: PathType,
+        stderr: PathType,
+        cwd: PathType | None,
+        env: dict | None,
+        establish_new_connection: bool = False,
+        stdin: int | None = None,
+    ) -> asyncio.subprocess.Process:
+        """Start a background process with the provided command, as a coroutine.
+        Asynchronous equivalent of `background_subprocess`, with the same arguments.
+
+        Returns:
+            asyncio.subprocess.Process: the process handle from the asyncio module.
+        """
+        raise NotImplementedError(
+            "Asynchronous background processes are not implemented for this communication layer"
+        )
+
+    async def read_file_aio(self, path: PathType) -> str:
+        """Read content of given filename on target host, as a coroutine.
+        Asynchronous equivalent of `read_file`.
+
+        Args:
+            path (PathType): path of the file to read on the target host.
+
+        Returns:
+            str: content of the file.
+        """
+        return await asyncio.to_thread(self.read_file, path=path)
+
+    async def copy_to_host_aio(self, source: PathType, destination: PathType) -> None:
+        """Copy a file to the host from the target machine, as a coroutine.
+        Asynchronous equivalent of `copy_to_host`.
+
+        Args:
+            source (PathType): The source path where the file or folder is stored on the remote.
+            destination: (PathType): The destination path where the file has to be
+                                     copied to on the host.
+        """
+        await asyncio.to_thread(self.copy_to_host, source=source, destination=destination)
+
+    async def signal_aio(self, pid: int, signal_code: int) -> None:
+        """Send a signal to the given process, as a coroutine.
+        Asynchronous equivalent of `signal`.
+
+        Args:
+            pid (int): pid of the process to send the signal to.
+            signal_code (int): code of the signal to send.
+        """
+        await self.shell_aio(command=f"kill -{signal_code} {pid}")
+
+    @staticmethod
+    async def wait_aio(
+        process: asyncio.subprocess.Process | subprocess.Popen,
+        timeout: float | None = None,
+    ) -> int:
+        """Wait for a process started by `background_subprocess_aio` or `background_subprocess`,
+        as a coroutine.
+
+        Args:
+            process (asyncio.subprocess.Process | subprocess.Popen): process to wait for.
+            timeout (float | None, optional): maximum number of seconds to wait, or None for no
+                                              timeout. Defaults to None.
+
+        Raises:
+            subprocess.TimeoutExpired: if the process did not complete within the timeout.
+
+        Returns:
+            int: the return code of the process.
+        """
+        if isinstance(process, subprocess.Popen):
+            return await asyncio.to_thread(process.wait, timeout=timeout)
+        try:
+            return await asyncio.wait_for(process.wait(), timeout=timeout)
+        except asyncio.TimeoutError as error:
+            raise subprocess.TimeoutExpired(cmd=str(process.pid), timeout=timeout) from error
+
     def hostname(self) -> str:
         """Get hostname of the target host.
 
@@ -479,6 +688,95 @@ class CommunicationLayer:
         result = pathlib.Path(path)
         return result
 
+    def stat_many(self, paths: Iterable[PathType]) -> List[PathStatus]:
+        """Get the status of several paths on the target host, in a single round trip.
+        Batched equivalent of `path_exists`, `isfile` and `isdir`.
+
+        Args:
+            paths (Iterable[PathType]): paths to check.
+
+        Returns:
+            List[PathStatus]: the status of each path, in the order of the given paths.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        # one line per path, with a letter per successful test
+        script = "; ".join(
+            "{ "
+            + "".join(
+                f"[ {opt} {shlex.quote(str(p))} ] && printf {letter}; "
+                for opt, letter in _STAT_TESTS
+            )
+            + "echo; }"
+            for p in paths
+        )
+        lines = self._shell_script(script=script).splitlines()
+        return [
+            PathStatus(
+                exists="e" in line,
+                is_file="f" in line,
+                is_dir="d" in line,
+                is_link="l" in line,
+            )
+            for line in lines
+        ]
+
+    def read_many(self, paths: Iterable[PathType]) -> List[str | None]:
+        """Read the content of several files on the target host, in a single round trip.
+        Batched equivalent of `read_file`.
+
+        Args:
+            paths (Iterable[PathType]): paths of the files to read.
+
+        Returns:
+            List[str | None]: the content of each file (None for the ones that cannot be read),
+                              in the order of the given paths.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        # each content is followed by a separator line, that the files cannot contain by chance,
+        # with the status of the read
+        separator = f"benchkit-{uuid.uuid4().hex}"
+        script = "; ".join(
+            f"if cat {shlex.quote(str(p))} 2>/dev/null; then s=0; else s=1; fi; "
+            f"printf '\\n%s %s\\n' {separator} $s"
+            for p in paths
+        )
+        parts = self._shell_script(script=script).split(f"\n{separator} ")
+        contents = parts[:1] + [part.split("\n", maxsplit=1)[1] for part in parts[1:-1]]
+        statuses = [part.split("\n", maxsplit=1)[0] for part in parts[1:]]
+        return [c if "0" == s else None for c, s in zip(contents, statuses)]
+
+    def which_many(self, cmds: Iterable[str]) -> List[pathlib.Path | None]:
+        """Find several executables in the path of the target host, in a single round trip.
+        Batched equivalent of `which`.
+
+        Args:
+            cmds (Iterable[str]): the executable commands to find.
+
+        Returns:
+            List[pathlib.Path | None]: the absolute path of each command (None if not found), in
+                                       the order of the given commands.
+        """
+        cmds = list(cmds)
+        if not cmds:
+            return []
+        script = "; ".join(
+            f'echo "$(which {shlex.quote(c)} 2>/dev/null | head -n 1)"' for c in cmds
+        )
+        lines = self._shell_script(script=script).splitlines()
+        return [pathlib.Path(line) if line else None for line in lines]
+
+    def _shell_script(self, script: str) -> str:
+        # run by sh, whatever the login shell of the target host
+        return self.shell(
+            command=f"sh -c {shlex.quote(script)}",
+            print_input=False,
+            print_output=False,
+        )
+
     def _bracket_test(
         self,
         path: PathType,
@@ -574,11 +872,13 @@ class LocalCommLayer(CommunicationLayer):
         cwd: PathType | None,
         env: dict | None,
         establish_new_connection: bool = False,
+        stdin: int | None = None,
     ) -> subprocess.Popen:
         # Create background process in its own group id using os.setsid
         # This allows to easily kill all children of this background process
         return subprocess.Popen(
             command,
+            stdin=stdin,
             stdout=stdout,
             stderr=stderr,
             cwd=cwd,
@@ -667,6 +967,63 @@ class LocalCommLayer(CommunicationLayer):
     ) -> None:
         self.shell(["rsync", "-azPv", str(source), str(destination)])
 
+    async def shell_aio(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        output_is_log: bool = False,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> str:
+        return await shell_out_aio(
+            command=command,
+            std_input=std_input,
+            current_dir=current_dir,
+            environment=environment,
+            shell=shell,
+            print_input=print_input,
+            print_output=print_output,
+            print_curdir=print_curdir,
+            timeout=timeout,
+            output_is_log=output_is_log,
+            ignore_ret_codes=ignore_ret_codes,
+            ignore_any_error_code=ignore_any_error_code,
+        )
+
+    async def background_subprocess_aio(
+        self,
+        command: Command,
+        stdout: PathType,
+        stderr: PathType,
+        cwd: PathType | None,
+        env: dict | None,
+        establish_new_connection: bool = False,
+        stdin: int | None = None,
+    ) -> asyncio.subprocess.Process:
+        # in its own session, like background_subprocess, to easily kill all its children
+        return await create_process(
+            arguments=get_args(command),
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            cwd=cwd,
+            env=env,
+            start_new_session=True,
+        )
+
+    async def signal_aio(self, pid: int, signal_code: int) -> None:
+        os.kill(pid, signal_code)
+
+    async def copy_to_host_aio(self, source: PathType, destination: PathType) -> None:
+        await self.shell_aio(["rsync", "-azPv", str(source), str(destination)])
+
     def current_user(self) -> str:
         return getpass.getuser()
 
@@ -694,14 +1051,59 @@ class LocalCommLayer(CommunicationLayer):
 
         return pathlib.Path(result)
 
+    def stat_many(self, paths: Iterable[PathType]) -> List[PathStatus]:
+        return [
+            PathStatus(
+                exists=os.path.exists(p),
+                is_file=os.path.isfile(p),
+                is_dir=os.path.isdir(p),
+                is_link=os.path.islink(p),
+            )
+            for p in paths
+        ]
+
+    def read_many(self, paths: Iterable[PathType]) -> List[str | None]:
+        contents = []
+        for path in paths:
+            try:
+                contents.append(self.read_file(path=path))
+            except OSError:
+                contents.append(None)
+        return contents
+
+    def which_many(self, cmds: Iterable[str]) -> List[pathlib.Path | None]:
+        return [self.which(cmd=c) for c in cmds]
+
+    def stdio_channel_command(self, command: str) -> SplitCommand:
+        return ["sh", "-c", command]
+
+    def start_agent(self, python_path: str = sys.executable) -> AgentClient:
+        return super().start_agent(python_path=python_path)
+
 
 class SSHCommLayer(CommunicationLayer):
-    """Communication layer to handle a remote host over SSH."""
+    """Communication layer to handle a remote host over SSH.
+
+    The commands are multiplexed on a persistent connection to the host (an ssh ControlMaster
+    owned by the communication layer), such that they do not pay for the TCP connection and the
+    key exchange. The master connection is started on the first command, restarted when it dies
+    and stopped by `close` (or at exit). Commands fall back to their own connection when the
+    master connection is not available.
+
+    Optionally, the file and process operations (stats, reads, writes, directories, signals) are
+    served by a benchkit agent running on the host (see `benchkit.communication.agent`), over a
+    single session of the master connection, instead of running a remote command each. The
+    operations fall back to remote commands when the agent cannot be started (e.g. no Python
+    interpreter on the host) and for privileged writes.
+    """
 
     def __init__(
         self,
         host: str,
         environment: Environment,
+        control_master: bool = True,
+        agent: bool = False,
+        python_path: str = "python3",
     ):
         super().__init__()
         self._host = host
@@ -710,6 +1112,18 @@ class SSHCommLayer(CommunicationLayer):
         self._ssh_host_info = self._get_ssh_info(host=host)
         self._in_ssh_config = self._is_in_ssh_config(host=host)
 
+        self._control_master = control_master
+        self._control_dir = None
+        self._master = None
+        self._master_pid = None
+        self._master_lock = threading.Lock()
+
+        self._use_agent = agent
+        self._python_path = python_path
+        self._agent = None
+        self._agent_pid = None
+        self._agent_lock = threading.Lock()
+
     @property
     def remote_host(self) -> str | None:
         return self._host
@@ -727,6 +1141,150 @@ class SSHCommLayer(CommunicationLayer):
         )
         return ip_ret.split()[2]
 
+    @property
+    def control_path(self) -> str | None:
+        """Get the path of the socket of the master connection to the host.
+
+        Returns:
+            str | None: the path of the socket, None if the commands are not multiplexed.
+        """
+        if not self._control_master:
+            return None
+        if self._control_dir is None:
+            self._control_dir = tempfile.mkdtemp(prefix="benchkit-ssh-")
+        # sockets paths are limited to ~100 characters, keep it short
+        return os.path.join(self._control_dir, "master")
+
+    def _master_alive(self) -> bool:
+        return (
+            self._master is not None
+            and self._master.poll() is None
+            and os.path.exists(self.control_path)
+        )
+
+    def _ensure_master(self) -> None:
+        if not self._control_master:
+            return
+        with self._master_lock:
+            if self._master_pid is not None and self._master_pid != os.getpid():
+                # forked process: the master connection belongs to the parent process
+                return
+            if self._master_alive():
+                return
+
+            if self._master is not None:
+                print(f"[WARNING] Connection to {self._host} lost, reconnecting.")
+                self._stop_master()
+            control_path = self.control_path
+            if os.path.exists(control_path):
+                os.remove(control_path)  # stale socket of a dead master
+            self._master = subprocess.Popen(
+                ["ssh", "-N", f"-oControlPath={control_path}"]
+                + _CONTROL_MASTER_OPTIONS
+                + [self._host],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            self._master_pid = os.getpid()
+            atexit.register(self.close)
+
+            deadline = time.monotonic() + _CONTROL_MASTER_TIMEOUT_SECONDS
+            while not os.path.exists(control_path):
+                if self._master.poll() is not None or time.monotonic() > deadline:
+                    print(
+                        f"[WARNING] Could not open a persistent connection to {self._host}, "
+                        "commands open their own connection."
+                    )
+                    self._stop_master()
+                    self._control_master = False
+                    return
+                time.sleep(0.01)
+
+    async def _ensure_master_aio(self) -> None:
+        # starting the master connection blocks, keep it out of the event loop
+        if self._control_master and not self._master_alive():
+            await asyncio.to_thread(self._ensure_master)
+
+    def _stop_master(self) -> None:
+        master, self._master = self._master, None
+        if master is None:
+            return
+        if master.poll() is None:
+            master.terminate()
+            try:
+                master.wait(timeout=_CONTROL_MASTER_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                master.kill()
+                master.wait()
+
+    @property
+    def agent(self) -> AgentClient | None:
+        """Get the agent serving the operations on the host, started on first use.
+
+        Returns:
+            AgentClient | None: the agent, None if the communication layer does not use an agent
+                                or if it could not be started.
+        """
+        if not self._use_agent:
+            return None
+        with self._agent_lock:
+            if self._agent_pid is not None and self._agent_pid != os.getpid():
+                # forked process: the agent belongs to the parent process
+                return None
+            if self._agent is not None and self._agent.alive:
+                return self._agent
+            if self._agent is not None:
+                print(f"[WARNING] Agent on {self._host} lost, restarting it.")
+                self._agent.close()
+            try:
+                self._agent = self.start_agent(python_path=self._python_path)
+            except AgentError as error:
+                print(
+                    f"[WARNING] Could not start the agent on {self._host} ({error}), "
+                    "operations run remote commands."
+                )
+                self._agent = None
+                self._use_agent = False
+                return None
+            self._agent_pid = os.getpid()
+            atexit.register(self.close)
+            return self._agent
+
+    def _close_agent(self) -> None:
+        with self._agent_lock:
+            if self._agent_pid is not None and self._agent_pid != os.getpid():
+                return
+            agent, self._agent = self._agent, None
+            self._agent_pid = None
+            if agent is not None:
+                agent.close()
+
+    def close(self) -> None:
+        self._close_agent()
+        with self._master_lock:
+            if self._master_pid is not None and self._master_pid != os.getpid():
+                return
+            self._stop_master()
+            self._master_pid = None
+            if self._control_dir is not None:
+                shutil.rmtree(self._control_dir, ignore_errors=True)
+                self._control_dir = None
+        atexit.unregister(self.close)
+
+    def _ssh_options(self, establish_new_connection: bool = False) -> List[str]:
+        if establish_new_connection:
+            return ["-oControlPath=none"]
+        if not self._control_master:
+            return []
+        self._ensure_master()
+        if not self._control_master:
+            return []
+        return ["-oControlMaster=no", f"-oControlPath={self.control_path}"]
+
+    def stdio_channel_command(self, command: str) -> SplitCommand:
+        return ["ssh"] + self._ssh_options() + ["-T", self._host, command]
+
     def background_subprocess(
         self,
         command: Command,
@@ -735,6 +1293,7 @@ class SSHCommLayer(CommunicationLayer):
         cwd: PathType | None,
         env: dict | None,
         establish_new_connection: bool = False,
+        stdin: int | None = None,
     ) -> subprocess.Popen:
         full_command = self._remote_shell_command(
             remote_command=command,
@@ -746,12 +1305,39 @@ class SSHCommLayer(CommunicationLayer):
         # This allows to easily kill all children of this background process
         return subprocess.Popen(
             full_command,
+            stdin=stdin,
             stdout=stdout,
             stderr=stderr,
             env=env,
             preexec_fn=os.setsid,
         )
 
+    async def background_subprocess_aio(
+        self,
+        command: Command,
+        stdout: PathType,
+        stderr: PathType,
+        cwd: PathType | None,
+        env: dict | None,
+        establish_new_connection: bool = False,
+        stdin: int | None = None,
+    ) -> asyncio.subprocess.Process:
+        if not establish_new_connection:
+            await self._ensure_master_aio()
+        full_command = self._remote_shell_command(
+            remote_command=command,
+            remote_current_dir=cwd,
+            establish_new_connection=establish_new_connection,
+        )
+        return await create_process(
+            arguments=full_command,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            env=env,
+            start_new_session=True,
+        )
+
     def pipe_shell(
         self,
         command: Command,
@@ -806,18 +1392,12 @@ class SSHCommLayer(CommunicationLayer):
         ignore_ret_codes: Iterable[int] = (),
         ignore_any_error_code: bool = False,
     ) -> str:
-        env_command = command_with_env(
-            command=command,
-            environment=environment,
-            additional_environment=self._additional_environment,
-        )
-        full_command = self._remote_shell_command(
-            remote_command=env_command,
-            remote_current_dir=current_dir,
-        )
-
         output = shell_out(
-            command=full_command,
+            command=self._shell_command(
+                command=command,
+                current_dir=current_dir,
+                environment=environment,
+            ),
             std_input=std_input,
             current_dir=None,
             print_input=print_input,
@@ -830,6 +1410,54 @@ class SSHCommLayer(CommunicationLayer):
 
         return output
 
+    async def shell_aio(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        output_is_log: bool = False,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> str:
+        await self._ensure_master_aio()
+        return await shell_out_aio(
+            command=self._shell_command(
+                command=command,
+                current_dir=current_dir,
+                environment=environment,
+            ),
+            std_input=std_input,
+            current_dir=None,
+            print_input=print_input,
+            print_output=print_output,
+            timeout=timeout,
+            output_is_log=output_is_log,
+            ignore_ret_codes=ignore_ret_codes,
+            ignore_any_error_code=ignore_any_error_code,
+        )
+
+    def _shell_command(
+        self,
+        command: Command,
+        current_dir: PathType | None,
+        environment: Environment,
+    ) -> SplitCommand:
+        env_command = command_with_env(
+            command=command,
+            environment=environment,
+            additional_environment=self._additional_environment,
+        )
+        return self._remote_shell_command(
+            remote_command=env_command,
+            remote_current_dir=current_dir,
+        )
+
     def get_process_nb_threads(self, process_handle: subprocess.Popen) -> int:
         raise NotImplementedError("TODO")
 
@@ -849,7 +1477,24 @@ class SSHCommLayer(CommunicationLayer):
         )
         return status.strip()
 
+    def signal(self, pid: int, signal_code: int) -> None:
+        agent = self.agent
+        if agent is None:
+            super().signal(pid=pid, signal_code=signal_code)
+            return
+        agent.signal(pid=pid, signal_code=signal_code)
+
+    async def signal_aio(self, pid: int, signal_code: int) -> None:
+        agent = self.agent
+        if agent is None:
+            await super().signal_aio(pid=pid, signal_code=signal_code)
+            return
+        await asyncio.wrap_future(agent.submit("signal", pid=pid, signal_code=signal_code))
+
     def path_exists(self, path: PathType) -> bool:
+        agent = self.agent
+        if agent is not None:
+            return agent.stat(path=path) is not None
         try:
             self.shell(command=f"[ -e {path} ]", print_input=False, print_output=False)
         except subprocess.CalledProcessError as cpe:
@@ -859,18 +1504,35 @@ class SSHCommLayer(CommunicationLayer):
         return True
 
     def read_file(self, path: PathType) -> str:
+        agent = self.agent
+        if agent is not None:
+            return agent.read_file(path=path)
         return self.shell(
             command=f"cat {path}",
             print_input=False,
             print_output=False,
         )
 
+    async def read_file_aio(self, path: PathType) -> str:
+        agent = self.agent
+        if agent is not None:
+            return await asyncio.wrap_future(agent.submit("read_file", path=str(path)))
+        return await self.shell_aio(
+            command=f"cat {path}",
+            print_input=False,
+            print_output=False,
+        )
+
     def write_content_to_file(
         self,
         content: str,
         output_filename: PathType,
         privileged: bool = False,
     ):
+        agent = None if privileged else self.agent
+        if agent is not None:
+            agent.write_file(path=output_filename, content=content)
+            return
         prefix = "sudo " if privileged else ""
         self.shell(
             command=f"{prefix}tee {output_filename}",
@@ -883,49 +1545,144 @@ class SSHCommLayer(CommunicationLayer):
         output_filename: PathType,
         privileged: bool = False,
     ) -> None:
+        agent = None if privileged else self.agent
+        if agent is not None:
+            agent.write_file(path=output_filename, content=line + "\n", append=True)
+            return
         prefix = "sudo " if privileged else ""
         self.shell(
             command=f"{prefix}tee -a {output_filename}",
             std_input=line + "\n",
         )
 
+    def realpath(self, path: PathType) -> pathlib.Path:
+        agent = self.agent
+        if agent is None:
+            return super().realpath(path=path)
+        return pathlib.Path(agent.realpath(path=path))
+
+    def isfile(self, path: PathType) -> bool:
+        agent = self.agent
+        if agent is None:
+            return super().isfile(path=path)
+        status = agent.stat(path=path)
+        return status is not None and status["is_file"]
+
+    def isdir(self, path: PathType) -> bool:
+        agent = self.agent
+        if agent is None:
+            return super().isdir(path=path)
+        status = agent.stat(path=path)
+        return status is not None and status["is_dir"]
+
+    def makedirs(self, path: PathType, exist_ok: bool) -> None:
+        agent = self.agent
+        if agent is None:
+            super().makedirs(path=path, exist_ok=exist_ok)
+            return
+        agent.makedirs(path=path, exist_ok=exist_ok)
+
+    def remove(self, path: PathType, recursive: bool) -> None:
+        agent = self.agent
+        if agent is None:
+            super().remove(path=path, recursive=recursive)
+            return
+        agent.remove(path=path, recursive=recursive)
+
+    def which(self, cmd: str) -> pathlib.Path | None:
+        agent = self.agent
+        if agent is None:
+            return super().which(cmd=cmd)
+        path = agent.which(cmd=cmd)
+        return None if path is None else pathlib.Path(path)
+
+    def stat_many(self, paths: Iterable[PathType]) -> List[PathStatus]:
+        agent = self.agent
+        if agent is None:
+            return super().stat_many(paths=paths)
+        # the calls are pipelined: a single round trip for all the paths
+        futures = [
+            (
+                agent.submit("stat", path=str(p)),
+                agent.submit("stat", path=str(p), follow_symlinks=False),
+            )
+            for p in paths
+        ]
+        statuses = []
+        for status_future, link_status_future in futures:
+            status, link_status = status_future.result(), link_status_future.result()
+            statuses.append(
+                PathStatus(
+                    exists=status is not None,
+                    is_file=status is not None and status["is_file"],
+                    is_dir=status is not None and status["is_dir"],
+                    is_link=link_status is not None and link_status["is_link"],
+                )
+            )
+        return statuses
+
+    def read_many(self, paths: Iterable[PathType]) -> List[str | None]:
+        agent = self.agent
+        if agent is None:
+            return super().read_many(paths=paths)
+        return agent.read_files(paths=list(paths))
+
+    def which_many(self, cmds: Iterable[str]) -> List[pathlib.Path | None]:
+        agent = self.agent
+        if agent is None:
+            return super().which_many(cmds=cmds)
+        futures = [agent.submit("which", cmd=c) for c in cmds]
+        return [None if (p := f.result()) is None else pathlib.Path(p) for f in futures]
+
+    def _rsync_shell(self, port: str | None = None) -> List[str]:
+        ssh_command = ["ssh"] + self._ssh_options() + ([] if port is None else ["-p", port])
+        return ["-e", " ".join(ssh_command)]
+
     def copy_from_host(self, source: PathType, destination: PathType) -> None:
         if self._in_ssh_config:
-            command = ["rsync", "-azPv", str(source), f"{self._host}:{destination}"]
+            command = (
+                ["rsync", "-azPv"]
+                + self._rsync_shell()
+                + [str(source), f"{self._host}:{destination}"]
+            )
         else:
             user = self._ssh_host_info["user"]
             hostname = self._ssh_host_info["hostname"]
             port = self._ssh_host_info["port"]
-            command = [
-                "rsync",
-                "-av",
-                "--progress",
-                "-e",
-                f"ssh -p {port}",
-                str(source),
-                f"{user}@{hostname}:{destination}",
-            ]
+            command = (
+                ["rsync", "-av", "--progress"]
+                + self._rsync_shell(port=port)
+                + [str(source), f"{user}@{hostname}:{destination}"]
+            )
 
         shell_out(command=command)
 
     def copy_to_host(self, source: PathType, destination: PathType) -> None:
+        shell_out(command=self._copy_to_host_command(source=source, destination=destination))
+
+    async def copy_to_host_aio(self, source: PathType, destination: PathType) -> None:
+        await self._ensure_master_aio()
+        await shell_out_aio(
+            command=self._copy_to_host_command(source=source, destination=destination)
+        )
+
+    def _copy_to_host_command(self, source: PathType, destination: PathType) -> SplitCommand:
         if self._in_ssh_config:
-            command = ["rsync", "-azPv", f"{self._host}:{source}", str(destination)]
+            command = (
+                ["rsync", "-azPv"]
+                + self._rsync_shell()
+                + [f"{self._host}:{source}", str(destination)]
+            )
         else:
             user = self._ssh_host_info["user"]
             hostname = self._ssh_host_info["hostname"]
             port = self._ssh_host_info["port"]
-            command = [
-                "rsync",
-                "-a",
-                "--progress",
-                "-e",
-                f"ssh -p {port}",
-                f"{user}@{hostname}:{source}",
-                str(destination),
-            ]
-
-        shell_out(command=command)
+            command = (
+                ["rsync", "-a", "--progress"]
+                + self._rsync_shell(port=port)
+                + [f"{user}@{hostname}:{source}", str(destination)]
+            )
+        return command
 
     def _remote_shell_command(
         self,
@@ -938,7 +1695,9 @@ class SSHCommLayer(CommunicationLayer):
             remote_current_dir=remote_current_dir,
         )
 
-        full_command = ["ssh"] + (["-oControlPath=none"] if establish_new_connection else [])
+        full_command = ["ssh"] + self._ssh_options(
+            establish_new_connection=establish_new_connection,
+        )
 
         full_command = full_command + [
             "-t",
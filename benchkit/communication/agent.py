@@ -0,0 +1,429 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Client of the benchkit agent (see `benchkit.communication.agent_server`), a lightweight process
+shipped to the target host that serves file, process and `/proc` operations as JSON-RPC calls over
+one long-lived channel.
+
+Compared to running a command per operation (an ssh process, a remote shell and a text output to
+parse), a call is a message round trip on an already open channel, and calls can be pipelined:
+`submit` returns a future without waiting for the previous calls to complete.
+
+Usage:
+    agent = comm.start_agent()
+    if agent.stat("/tmp/results") is None:
+        agent.makedirs("/tmp/results")
+    futures = [agent.submit("read_file", path=p) for p in paths]
+    contents = [f.result() for f in futures]
+    agent.close()
+"""
+
+import itertools
+import json
+import pathlib
+import shlex
+import subprocess
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List
+
+from benchkit.helpers.linux import procfs
+from benchkit.utils.types import PathType, SplitCommand
+
+_AGENT_SERVER_PATH = pathlib.Path(__file__).with_name("agent_server.py")
+_START_TIMEOUT_SECONDS = 30.0
+_CALL_TIMEOUT_SECONDS = 60.0
+
+# reads the sources of procfs then of the agent from the standard input, each preceded by its size
+_BOOTSTRAP = (
+    "import sys,types;"
+    "r=sys.stdin.buffer;"
+    "s=lambda:r.read(int(r.readline()));"
+    'm=types.ModuleType("benchkit_procfs");'
+    "exec(s(),m.__dict__);"
+    'sys.modules["benchkit_procfs"]=m;'
+    "exec(s())"
+)
+
+
+class AgentError(Exception):
+    """
+    Error raised by a call to the agent, or when the agent is not reachable.
+    """
+
+    def __init__(self, message: str, error_type: str | None = None) -> None:
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def agent_command(python_path: str = "python3") -> str:
+    """
+    Get the shell command starting the agent on a host with the given Python interpreter.
+    The command is a small bootstrap reading the sources of the agent from its standard input
+    (see `agent_sources`), nothing needs to be installed on the host.
+
+    Args:
+        python_path (str, optional): Python interpreter of the host. Defaults to "python3".
+
+    Returns:
+        str: the shell command starting the agent.
+    """
+    return f"{python_path} -u -c {shlex.quote(_BOOTSTRAP)}"
+
+
+def agent_sources() -> bytes:
+    """
+    Get the sources of the agent, to send on the standard input of the command returned by
+    `agent_command` before the calls.
+
+    Returns:
+        bytes: the sources of the agent, each preceded by its size on its own line.
+    """
+    sources = b""
+    for path in (procfs.__file__, _AGENT_SERVER_PATH):
+        source = pathlib.Path(path).read_bytes()
+        sources += f"{len(source)}\n".encode() + source
+    return sources
+
+
+def _exception(error: Dict) -> Exception:
+    message = error.get("message", "")
+    data = error.get("data") or {}
+    if data.get("errno") is not None:
+        # e.g. FileNotFoundError, PermissionError, as raised by the local equivalent
+        return OSError(data["errno"], message, data.get("filename"))
+    return AgentError(message=message, error_type=data.get("type"))
+
+
+class AgentClient:
+    """
+    Client of an agent running on a host, through the standard input and output of a channel
+    process (e.g. `ssh host python3 ...`, see `CommunicationLayer.start_agent`).
+    Thread-safe: the calls of several threads are pipelined on the same channel.
+    """
+
+    def __init__(self, channel: SplitCommand, sources: bytes = b"") -> None:
+        """
+        Start the agent and check that it answers.
+
+        Args:
+            channel (SplitCommand): command running the agent with its standard input and output
+                                    connected to the started process.
+            sources (bytes, optional): sources of the agent, sent first on the standard input of
+                                       the channel (see `agent_command`). Defaults to b"" (the
+                                       channel runs the agent by itself).
+
+        Raises:
+            AgentError: if the agent does not start.
+        """
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            channel,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,
+        )
+        self._ids = itertools.count()
+        self._pending = {}
+        self._exited = False
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader = threading.Thread(
+            target=self._read_responses,
+            name="benchkit-agent",
+            daemon=True,
+        )
+        self._reader.start()
+
+        try:
+            with self._write_lock:
+                self._process.stdin.write(sources)
+            self.info = self.submit("hello").result(timeout=_START_TIMEOUT_SECONDS)
+        except Exception as error:
+            self.close()
+            raise AgentError(f"The agent did not start: {error}") from error
+
+    @property
+    def alive(self) -> bool:
+        """Whether the agent is running.
+
+        Returns:
+            bool: whether the agent is running.
+        """
+        return self._process is not None and self._process.poll() is None
+
+    def _read_responses(self) -> None:
+        try:
+            for raw_line in self._process.stdout:
+                if not raw_line.startswith(b"{"):
+                    continue  # e.g. messages of ssh
+                try:
+                    response = json.loads(raw_line)
+                    request_id = response.get("id")
+                except (ValueError, AttributeError):
+                    print(f"[WARNING] Invalid response of the agent: {raw_line!r}")
+                    continue
+                with self._pending_lock:
+                    future = self._pending.pop(request_id, None)
+                # the future of a call that timed out is cancelled
+                if future is None or not future.set_running_or_notify_cancel():
+                    continue
+                if "error" in response:
+                    future.set_exception(_exception(response["error"]))
+                else:
+                    future.set_result(response.get("result"))
+        finally:
+            with self._pending_lock:
+                self._exited = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(AgentError("The agent exited."))
+
+    def submit(self, method: str, **params) -> Future:
+        """
+        Send a call to the agent, without waiting for its result.
+
+        Args:
+            method (str): method of the agent to call.
+            **params: named parameters of the method.
+
+        Returns:
+            Future: the future result of the call.
+
+        Raises:
+            AgentError: if the agent is not running.
+        """
+        response = Future()
+        request_id = next(self._ids)
+        line = json.dumps(
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params},
+            separators=(",", ":"),
+        )
+        with self._pending_lock:
+            if self._exited:
+                raise AgentError("The agent is not running.")
+            self._pending[request_id] = response
+        try:
+            with self._write_lock:
+                self._process.stdin.write(line.encode() + b"\n")
+                self._process.stdin.flush()
+        except (BrokenPipeError, ValueError) as error:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise AgentError("The agent is not running.") from error
+
+        return response
+
+    def call(
+        self,
+        method: str,
+        timeout_seconds: float | None = _CALL_TIMEOUT_SECONDS,
+        **params,
+    ) -> Any:
+        """
+        Call a method of the agent and wait for its result.
+
+        Args:
+            method (str): method of the agent to call.
+            timeout_seconds (float | None, optional): maximum time to wait for the result, None to
+                                                      wait as long as the agent runs.
+                                                      Defaults to 60 seconds.
+            **params: named parameters of the method.
+
+        Returns:
+            Any: the result of the call.
+
+        Raises:
+            OSError: if the operation failed on the host with a system error.
+            AgentError: if the call failed otherwise, or did not complete in time.
+        """
+        response = self.submit(method, **params)
+        try:
+            return response.result(timeout=timeout_seconds)
+        except FutureTimeoutError as error:
+            response.cancel()
+            raise AgentError(
+                f"The agent did not answer {method} within {timeout_seconds} seconds."
+            ) from error
+
+    def stat(self, path: PathType) -> Dict | None:
+        """Get the status of a path (mode, size, mtime, uid, gid, is_file, is_dir, is_link).
+
+        Args:
+            path (PathType): path on the host.
+
+        Returns:
+            Dict | None: the status of the path, None if it does not exist.
+        """
+        return self.call("stat", path=str(path))
+
+    def read_file(self, path: PathType) -> str:
+        """Read the content of a file.
+
+        Args:
+            path (PathType): path of the file on the host.
+
+        Returns:
+            str: content of the file.
+        """
+        return self.call("read_file", path=str(path))
+
+    def read_files(self, paths: List[PathType]) -> List[str | None]:
+        """Read the content of several files in one call (e.g. counters of `/proc`).
+
+        Args:
+            paths (List[PathType]): paths of the files on the host.
+
+        Returns:
+            List[str | None]: contents of the files, None for the ones that cannot be read.
+        """
+        return self.call("read_files", paths=[str(p) for p in paths])
+
+    def write_file(self, path: PathType, content: str, append: bool = False) -> None:
+        """Write content to a file.
+
+        Args:
+            path (PathType): path of the file on the host.
+            content (str): content to write.
+            append (bool, optional): whether to append to the file. Defaults to False.
+        """
+        self.call("write_file", path=str(path), content=content, append=append)
+
+    def listdir(self, path: PathType) -> List[str]:
+        """List the entries of a directory.
+
+        Args:
+            path (PathType): path of the directory on the host.
+
+        Returns:
+            List[str]: sorted names of the entries.
+        """
+        return self.call("listdir", path=str(path))
+
+    def makedirs(self, path: PathType, exist_ok: bool = True) -> None:
+        """Create a directory and its parents.
+
+        Args:
+            path (PathType): path of the directory on the host.
+            exist_ok (bool, optional): whether the directory may already exist. Defaults to True.
+        """
+        self.call("makedirs", path=str(path), exist_ok=exist_ok)
+
+    def remove(self, path: PathType, recursive: bool = False) -> None:
+        """Remove a file or a directory.
+
+        Args:
+            path (PathType): path of the file or directory on the host.
+            recursive (bool, optional): whether to remove a directory with all its content.
+                                        Defaults to False.
+        """
+        self.call("remove", path=str(path), recursive=recursive)
+
+    def realpath(self, path: PathType) -> str:
+        """Get the absolute path of a path, following the symbolic links.
+
+        Args:
+            path (PathType): path on the host.
+
+        Returns:
+            str: the real path.
+        """
+        return self.call("realpath", path=str(path))
+
+    def which(self, cmd: str) -> str | None:
+        """Find an executable in the PATH of the agent.
+
+        Args:
+            cmd (str): name of the executable.
+
+        Returns:
+            str | None: absolute path of the executable, None if not found.
+        """
+        return self.call("which", cmd=cmd)
+
+    def spawn(
+        self,
+        command: List[str] | str,
+        cwd: PathType | None = None,
+        env: Dict[str, str] | None = None,
+        stdout: PathType | None = None,
+        stderr: PathType | None = None,
+    ) -> int:
+        """Start a process on the host, in its own session.
+
+        Args:
+            command (List[str] | str): the command, run by the shell if it is a string.
+            cwd (PathType | None, optional): working directory. Defaults to None.
+            env (Dict[str, str] | None, optional): additional environment. Defaults to None.
+            stdout (PathType | None, optional): file where to append the standard output.
+                                                Defaults to None (discarded).
+            stderr (PathType | None, optional): file where to append the standard error.
+                                                Defaults to None (discarded).
+
+        Returns:
+            int: pid of the process on the host.
+        """
+        return self.call(
+            "spawn",
+            command=command,
+            shell=isinstance(command, str),
+            cwd=None if cwd is None else str(cwd),
+            env=env,
+            stdout=None if stdout is None else str(stdout),
+            stderr=None if stderr is None else str(stderr),
+        )
+
+    def wait(self, pid: int, timeout: float | None = None) -> int | None:
+        """Wait for a process started with `spawn`.
+
+        Args:
+            pid (int): pid of the process on the host.
+            timeout (float | None, optional): maximum time to wait in seconds. Defaults to None.
+
+        Returns:
+            int | None: return code of the process, None if it is still running at the timeout.
+        """
+        return self.call(
+            "wait",
+            timeout_seconds=None if timeout is None else timeout + _CALL_TIMEOUT_SECONDS,
+            pid=pid,
+            timeout=timeout,
+        )
+
+    def signal(self, pid: int, signal_code: int, group: bool = False) -> None:
+        """Send a signal to a process of the host.
+
+        Args:
+            pid (int): pid of the process on the host.
+            signal_code (int): code of the signal to send.
+            group (bool, optional): whether to signal the whole process group. Defaults to False.
+        """
+        self.call("signal", pid=pid, signal_code=signal_code, group=group)
+
+    def sample(self) -> Dict:
+        """Sample the system-wide resource usage counters of `/proc` on the host.
+
+        Returns:
+            Dict: the sample, as read by `benchkit.helpers.linux.procfs.read_sample`.
+        """
+        return self.call("sample")
+
+    def close(self) -> None:
+        """
+        Stop the agent, by closing its channel.
+        """
+        process = self._process
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            process.wait(timeout=_START_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        self._reader.join()
+        self._process = None
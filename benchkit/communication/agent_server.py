@@ -0,0 +1,363 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Lightweight benchkit agent, serving the operations of the communication layers as JSON-RPC 2.0
+calls over its standard input and output.
+
+This module only depends on the standard library: its source is shipped as-is to the target
+host by `benchkit.communication.agent.AgentClient` and run by its Python interpreter over a single
+long-lived channel (e.g. an ssh session). Each request and each response is a JSON object on its
+own line. The requests can be pipelined: the cheap operations (stats, reads, writes, signals...)
+are served in order by the main loop, the blocking ones (`run`, `wait`) by their own thread, such
+that the responses are matched to the requests by their id, not by their order.
+"""
+
+import base64
+import json
+import os
+import shutil
+import signal as signal_module
+import stat
+import subprocess
+import sys
+import threading
+from typing import Dict, List
+
+PROTOCOL_VERSION = 1
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+def _path(path: str) -> str:
+    return os.path.expanduser(path)
+
+
+def _decode(content: bytes, binary: bool) -> str:
+    if binary:
+        return base64.b64encode(content).decode()
+    # undecodable bytes are kept as lone surrogates, escaped by json and restored on the other side
+    return content.decode(errors="surrogateescape")
+
+
+def _encode(content: str, binary: bool) -> bytes:
+    if binary:
+        return base64.b64decode(content)
+    return content.encode(errors="surrogateescape")
+
+
+def _environment(env: Dict[str, str] | None) -> Dict[str, str] | None:
+    if not env:
+        return None
+    return dict(os.environ, **env)
+
+
+class Agent:
+    """
+    Server of the agent: the methods of the protocol are the `rpc_` methods.
+    """
+
+    # methods that may block for long, served by their own thread
+    BLOCKING_METHODS = ("run", "wait")
+
+    def __init__(self, output) -> None:
+        self._output = output
+        self._output_lock = threading.Lock()
+        self._processes = {}
+
+    def respond(self, request_id, result=None, error: Dict | None = None) -> None:
+        """
+        Write the response to a request.
+
+        Args:
+            request_id: id of the request.
+            result: result of the request, if it succeeded.
+            error (Dict | None): JSON-RPC error object, if it failed.
+        """
+        response = {"jsonrpc": "2.0", "id": request_id}
+        if error is None:
+            response["result"] = result
+        else:
+            response["error"] = error
+        line = (json.dumps(response, separators=(",", ":")) + "\n").encode()
+        with self._output_lock:
+            self._output.write(line)
+            self._output.flush()
+
+    def dispatch(self, request_id, method: str, params: Dict) -> None:
+        """
+        Serve a request and write its response.
+
+        Args:
+            request_id: id of the request.
+            method (str): name of the method to call.
+            params (Dict): named parameters of the method.
+        """
+        function = getattr(self, f"rpc_{method}", None)
+        if function is None:
+            self.respond(
+                request_id,
+                error={"code": METHOD_NOT_FOUND, "message": f"Unknown method: {method}"},
+            )
+            return
+        try:
+            result = function(**params)
+        except TypeError as error:
+            self.respond(request_id, error={"code": INVALID_PARAMS, "message": str(error)})
+        except OSError as error:
+            self.respond(
+                request_id,
+                error={
+                    "code": SERVER_ERROR,
+                    "message": error.strerror or str(error),
+                    "data": {
+                        "type": type(error).__name__,
+                        "errno": error.errno,
+                        "filename": error.filename,
+                    },
+                },
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.respond(
+                request_id,
+                error={
+                    "code": SERVER_ERROR,
+                    "message": str(error),
+                    "data": {"type": type(error).__name__},
+                },
+            )
+        else:
+            self.respond(request_id, result=result)
+
+    def serve(self, requests) -> None:
+        """
+        Serve the requests until the end of their stream.
+
+        Args:
+            requests: binary stream of the requests, one JSON object per line.
+        """
+        for line in requests:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                method = request["method"]
+                params = request.get("params", {})
+            except (ValueError, KeyError, AttributeError) as error:
+                self.respond(None, error={"code": PARSE_ERROR, "message": str(error)})
+                continue
+            if not isinstance(params, dict):
+                self.respond(
+                    request_id,
+                    error={"code": INVALID_REQUEST, "message": "Parameters must be named."},
+                )
+                continue
+
+            if method in self.BLOCKING_METHODS:
+                threading.Thread(
+                    target=self.dispatch,
+                    args=(request_id, method, params),
+                    daemon=True,
+                ).start()
+            else:
+                self.dispatch(request_id, method, params)
+
+        # the channel is closed: do not leave the spawned processes behind
+        for process in list(self._processes.values()):
+            if process.poll() is None:
+                process.terminate()
+
+    def rpc_hello(self) -> Dict:
+        """Version of the protocol and pid of the agent."""
+        return {
+            "version": PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "python": ".".join(str(v) for v in sys.version_info[:3]),
+        }
+
+    def rpc_ping(self) -> None:
+        """Empty round trip."""
+
+    def rpc_stat(self, path: str, follow_symlinks: bool = True) -> Dict | None:
+        """Status of a path, None if it does not exist."""
+        try:
+            status = os.stat(_path(path), follow_symlinks=follow_symlinks)
+        except FileNotFoundError:
+            return None
+        return {
+            "mode": status.st_mode,
+            "size": status.st_size,
+            "mtime": status.st_mtime,
+            "uid": status.st_uid,
+            "gid": status.st_gid,
+            "is_file": stat.S_ISREG(status.st_mode),
+            "is_dir": stat.S_ISDIR(status.st_mode),
+            "is_link": stat.S_ISLNK(status.st_mode),
+        }
+
+    def rpc_realpath(self, path: str) -> str:
+        """Absolute path, following the symbolic links."""
+        return os.path.realpath(_path(path))
+
+    def rpc_read_file(self, path: str, binary: bool = False) -> str:
+        """Content of a file."""
+        with open(_path(path), "rb") as file:
+            return _decode(file.read(), binary=binary)
+
+    def rpc_read_files(self, paths: List[str], binary: bool = False) -> List[str | None]:
+        """Contents of several files (e.g. of `/proc`), None for the ones that cannot be read."""
+        contents = []
+        for path in paths:
+            try:
+                contents.append(self.rpc_read_file(path=path, binary=binary))
+            except OSError:
+                contents.append(None)
+        return contents
+
+    def rpc_write_file(
+        self,
+        path: str,
+        content: str,
+        append: bool = False,
+        binary: bool = False,
+    ) -> int:
+        """Write (or append) content to a file, return the number of bytes written."""
+        with open(_path(path), "ab" if append else "wb") as file:
+            return file.write(_encode(content, binary=binary))
+
+    def rpc_listdir(self, path: str) -> List[str]:
+        """Sorted names of the entries of a directory."""
+        return sorted(os.listdir(_path(path)))
+
+    def rpc_makedirs(self, path: str, exist_ok: bool = True) -> None:
+        """Create a directory and its parents."""
+        os.makedirs(_path(path), exist_ok=exist_ok)
+
+    def rpc_remove(self, path: str, recursive: bool = False) -> None:
+        """Remove a file, or a directory with all its content if recursive."""
+        path = _path(path)
+        if recursive and os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+    def rpc_which(self, cmd: str) -> str | None:
+        """Absolute path of an executable of the PATH, None if not found."""
+        return shutil.which(cmd)
+
+    def rpc_run(
+        self,
+        command: List[str] | str,
+        shell: bool = False,
+        cwd: str | None = None,
+        env: Dict[str, str] | None = None,
+        input: str | None = None,  # pylint: disable=redefined-builtin
+        timeout: float | None = None,
+    ) -> Dict:
+        """Run a command to completion, return its return code and outputs."""
+        completed = subprocess.run(
+            command,
+            shell=shell,
+            cwd=None if cwd is None else _path(cwd),
+            env=_environment(env),
+            input=None if input is None else _encode(input, binary=False),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=None if input is not None else subprocess.DEVNULL,
+            timeout=timeout,
+            check=False,
+        )
+        return {
+            "returncode": completed.returncode,
+            "stdout": _decode(completed.stdout, binary=False),
+            "stderr": _decode(completed.stderr, binary=False),
+        }
+
+    def rpc_spawn(
+        self,
+        command: List[str] | str,
+        shell: bool = False,
+        cwd: str | None = None,
+        env: Dict[str, str] | None = None,
+        stdout: str | None = None,
+        stderr: str | None = None,
+    ) -> int:
+        """Start a process in its own session, return its pid."""
+        outputs = [
+            # pylint: disable-next=consider-using-with
+            open(_path(p), "ab") if p is not None else subprocess.DEVNULL
+            for p in (stdout, stderr)
+        ]
+        try:
+            process = subprocess.Popen(  # pylint: disable=consider-using-with
+                command,
+                shell=shell,
+                cwd=None if cwd is None else _path(cwd),
+                env=_environment(env),
+                stdin=subprocess.DEVNULL,
+                stdout=outputs[0],
+                stderr=outputs[1],
+                start_new_session=True,
+            )
+        finally:
+            for output in outputs:
+                if output is not subprocess.DEVNULL:
+                    output.close()
+        self._processes[process.pid] = process
+        return process.pid
+
+    def _process(self, pid: int) -> subprocess.Popen:
+        try:
+            return self._processes[pid]
+        except KeyError as error:
+            raise ProcessLookupError(f"No process spawned with pid {pid}") from error
+
+    def rpc_poll(self, pid: int) -> int | None:
+        """Return code of a spawned process, None if it is still running."""
+        return self._process(pid).poll()
+
+    def rpc_wait(self, pid: int, timeout: float | None = None) -> int | None:
+        """Wait for a spawned process, return its return code, None on timeout."""
+        process = self._process(pid)
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+        self._processes.pop(pid, None)
+        return returncode
+
+    def rpc_signal(self, pid: int, signal_code: int, group: bool = False) -> None:
+        """Send a signal to a process, or to its process group."""
+        if group:
+            os.killpg(pid, signal_code)
+        else:
+            os.kill(pid, signal_code)
+
+    def rpc_sample(self) -> Dict:
+        """Sample of the system-wide resource usage counters of `/proc`."""
+        try:
+            import benchkit_procfs as procfs  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            from benchkit.helpers.linux import (  # pylint: disable=import-outside-toplevel
+                procfs,
+            )
+        return procfs.read_sample()
+
+
+def main() -> None:
+    """
+    Serve the requests of the standard input until it is closed.
+    """
+    # the protocol owns the standard output, keep the prints of the methods out of it
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    signal_module.signal(signal_module.SIGPIPE, signal_module.SIG_DFL)
+    Agent(output=output).serve(requests=sys.stdin.buffer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,469 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Communication layer fanning out the same operations to several hosts concurrently.
+
+Multi-node experiments need to run identical setup commands (governor, sysctl, dependencies...)
+on every host. With a cluster communication layer, these run on all the hosts at the same time, such
+that the setup takes as long as the slowest host rather than the sum of all of them:
+
+    cluster = ClusterCommLayer(comm_layers=[p.comm for p in platforms], max_failures=1)
+    results = cluster.shell_hosts(command="sudo cpupower frequency-set -g performance")
+    failed_hosts = [h for h, r in results.items() if not r.succeeded]
+"""
+
+import asyncio
+import subprocess
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+from benchkit.communication import CommunicationLayer
+from benchkit.shell.shellaio import run_sync
+from benchkit.utils.types import Command, Environment, PathType
+
+
+class HostResult:
+    """
+    Result of an operation on one host of a cluster.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        output: Any = None,
+        returncode: int | None = 0,
+        error: Exception | None = None,
+    ) -> None:
+        """
+        Create the result of an operation on a host.
+
+        Args:
+            host (str): name of the host in the cluster.
+            output (Any, optional): output of the operation (e.g. of the shell command, also when
+                                    it failed). Defaults to None.
+            returncode (int | None, optional): return code of the shell command, None if it did
+                                               not complete. Defaults to 0.
+            error (Exception | None, optional): error raised by the operation, None if it
+                                                succeeded. Defaults to None.
+        """
+        self.host = host
+        self.output = output
+        self.returncode = returncode
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the operation succeeded on the host.
+
+        Returns:
+            bool: whether the operation succeeded on the host.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (
+            f"HostResult(host={self.host!r}, returncode={self.returncode!r}, "
+            f"error={self.error!r})"
+        )
+
+
+class ClusterError(Exception):
+    """
+    Error raised when an operation failed on more hosts of a cluster than tolerated.
+    """
+
+    def __init__(self, results: Dict[str, HostResult]) -> None:
+        self.results = results
+        self.failed = {h: r for h, r in results.items() if not r.succeeded}
+        details = "; ".join(f"{h}: {r.error}" for h, r in self.failed.items())
+        super().__init__(f"Failed on {len(self.failed)}/{len(results)} hosts ({details})")
+
+
+class ClusterCommLayer:
+    """
+    Communication layer running each operation on all the hosts of a cluster concurrently.
+    It is not a `CommunicationLayer` of its own: it only provides the operations that make sense
+    on several hosts at once (shell commands, filesystem setup). The operations specific to one
+    host (reading a file, handling a process...) are run with the communication layer of that
+    host (see `comm_layers`), or on every host with `run_on_hosts` to get the result of each host.
+
+    Partial failures are handled with `max_failures`: an operation raises a `ClusterError` when it
+    failed on more hosts than that (after all hosts completed), otherwise the failures are
+    reported as warnings and in the per-host results.
+    """
+
+    def __init__(
+        self,
+        comm_layers: Dict[str, CommunicationLayer] | Iterable[CommunicationLayer],
+        max_failures: int | None = 0,
+    ) -> None:
+        """
+        Create the cluster communication layer.
+
+        Args:
+            comm_layers (Dict[str, CommunicationLayer] | Iterable[CommunicationLayer]):
+                communication layers of the hosts, by host name or in a collection (the hosts are
+                then named by their `remote_host`, "localhost" for a local one).
+            max_failures (int | None, optional):
+                maximum number of hosts on which an operation may fail without raising, None to
+                never raise. Defaults to 0.
+
+        Raises:
+            ValueError: if there is no host or if the maximum number of failures is invalid.
+        """
+        if not isinstance(comm_layers, dict):
+            comm_layers = self._named(comm_layers=comm_layers)
+        if not comm_layers:
+            raise ValueError("A cluster needs at least one host")
+        if max_failures is not None and max_failures < 0:
+            raise ValueError(f"Invalid maximum number of failures: {max_failures}")
+        self._comm_layers = dict(comm_layers)
+        self._max_failures = max_failures
+
+    @staticmethod
+    def _named(comm_layers: Iterable[CommunicationLayer]) -> Dict[str, CommunicationLayer]:
+        named = {}
+        for comm_layer in comm_layers:
+            name = comm_layer.remote_host or "localhost"
+            if name in named:
+                name = f"{name}#{len(named)}"
+            named[name] = comm_layer
+        return named
+
+    @property
+    def comm_layers(self) -> Dict[str, CommunicationLayer]:
+        """Get the communication layers of the hosts of the cluster.
+
+        Returns:
+            Dict[str, CommunicationLayer]: the communication layers, by host name.
+        """
+        return dict(self._comm_layers)
+
+    @property
+    def hosts(self) -> List[str]:
+        """Get the names of the hosts of the cluster.
+
+        Returns:
+            List[str]: the names of the hosts.
+        """
+        return list(self._comm_layers)
+
+    @property
+    def is_local(self) -> bool:
+        """Get whether all the hosts of the cluster are the local host.
+
+        Returns:
+            bool: whether all the hosts of the cluster are the local host.
+        """
+        return all(c.is_local for c in self._comm_layers.values())
+
+    async def shell_hosts_aio(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> Dict[str, HostResult]:
+        """
+        Run a shell command on all the hosts concurrently, as a coroutine.
+        The arguments are the ones of `shell`, the outputs of the hosts are printed once all of
+        them completed (they are not interleaved, hence no `output_is_log`).
+
+        Raises:
+            ClusterError: if the command failed on more hosts than tolerated.
+
+        Returns:
+            Dict[str, HostResult]: the output and return code of the command, by host name.
+        """
+        ignore_ret_codes = tuple(ignore_ret_codes)
+
+        async def run(comm_layer: CommunicationLayer) -> str:
+            return await comm_layer.shell_aio(
+                command=command,
+                std_input=std_input,
+                current_dir=current_dir,
+                environment=environment,
+                shell=shell,
+                print_input=print_input,
+                print_output=False,
+                print_curdir=print_curdir,
+                timeout=timeout,
+                ignore_ret_codes=ignore_ret_codes,
+                ignore_any_error_code=ignore_any_error_code,
+            )
+
+        results = await self._gather(operation=run)
+
+        if print_output:
+            for host, result in results.items():
+                if result.output is not None and "" != result.output.strip():
+                    print(f"[OUT] {host}")
+                    print(result.output.strip())
+        return results
+
+    def shell_hosts(self, command: Command, **kwargs) -> Dict[str, HostResult]:
+        """
+        Run a shell command on all the hosts concurrently.
+        Blocking equivalent of `shell_hosts_aio`, with the same arguments.
+
+        Args:
+            command (Command): the command to run.
+            **kwargs: other arguments of `shell_hosts_aio`.
+
+        Raises:
+            ClusterError: if the command failed on more hosts than tolerated.
+
+        Returns:
+            Dict[str, HostResult]: the output and return code of the command, by host name.
+        """
+        return run_sync(self.shell_hosts_aio(command=command, **kwargs))
+
+    def shell(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> str:
+        """Run a shell command on all the hosts concurrently.
+        The arguments are the ones of `shell_hosts_aio`, see `shell_hosts` for the outputs and
+        return codes of each host.
+
+        Raises:
+            ClusterError: if the command failed on more hosts than tolerated.
+
+        Returns:
+            str: the output of the hosts, each line prefixed by the name of its host.
+        """
+        results = self.shell_hosts(
+            command=command,
+            std_input=std_input,
+            current_dir=current_dir,
+            environment=environment,
+            shell=shell,
+            print_input=print_input,
+            print_output=print_output,
+            print_curdir=print_curdir,
+            timeout=timeout,
+            ignore_ret_codes=ignore_ret_codes,
+            ignore_any_error_code=ignore_any_error_code,
+        )
+        # like parallel shells (e.g. pdsh), each line of output is prefixed by its host
+        return "".join(
+            f"{host}: {line}\n"
+            for host, result in results.items()
+            if result.output is not None
+            for line in result.output.splitlines()
+        )
+
+    def shell_succeed(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        ignore_ret_codes: Iterable[int] = (),
+    ) -> bool:
+        """Run a shell command on all the hosts concurrently, and return whether it succeeded on
+        all of them.
+
+        Returns:
+            bool: whether the command succeeded without error on all the hosts.
+        """
+        try:
+            results = self.shell_hosts(
+                command=command,
+                std_input=std_input,
+                current_dir=current_dir,
+                environment=environment,
+                shell=shell,
+                print_input=print_input,
+                print_output=print_output,
+                print_curdir=print_curdir,
+                timeout=timeout,
+                ignore_ret_codes=ignore_ret_codes,
+            )
+        except ClusterError:
+            return False
+        return all(r.succeeded for r in results.values())
+
+    def path_exists(self, path: PathType) -> bool:
+        """Check whether the given path exists on all the hosts.
+
+        Args:
+            path (PathType): path to check.
+
+        Returns:
+            bool: whether the path exists on all the hosts.
+        """
+        results = self.run_on_hosts(lambda c: c.path_exists(path=path))
+        return all(r.output for r in results.values())
+
+    def isfile(self, path: PathType) -> bool:
+        """Check whether the given path is a file on all the hosts.
+
+        Args:
+            path (PathType): path to check.
+
+        Returns:
+            bool: whether the path is a file on all the hosts.
+        """
+        results = self.run_on_hosts(lambda c: c.isfile(path=path))
+        return all(r.output for r in results.values())
+
+    def isdir(self, path: PathType) -> bool:
+        """Check whether the given path is a directory on all the hosts.
+
+        Args:
+            path (PathType): path to check.
+
+        Returns:
+            bool: whether the path is a directory on all the hosts.
+        """
+        results = self.run_on_hosts(lambda c: c.isdir(path=path))
+        return all(r.output for r in results.values())
+
+    def write_content_to_file(
+        self,
+        content: str,
+        output_filename: PathType,
+        privileged: bool = False,
+    ) -> None:
+        """Write the given content to a file on all the hosts.
+
+        Args:
+            content (str): content to write.
+            output_filename (PathType): path of the file to write.
+            privileged (bool, optional): whether to write the file as root. Defaults to False.
+        """
+        self.run_on_hosts(
+            lambda c: c.write_content_to_file(
+                content=content,
+                output_filename=output_filename,
+                privileged=privileged,
+            )
+        )
+
+    def append_line_to_file(
+        self,
+        line: str,
+        output_filename: PathType,
+        privileged: bool = False,
+    ) -> None:
+        """Append a line to a file on all the hosts.
+
+        Args:
+            line (str): line to append.
+            output_filename (PathType): path of the file to append to.
+            privileged (bool, optional): whether to write the file as root. Defaults to False.
+        """
+        self.run_on_hosts(
+            lambda c: c.append_line_to_file(
+                line=line,
+                output_filename=output_filename,
+                privileged=privileged,
+            )
+        )
+
+    def makedirs(self, path: PathType, exist_ok: bool) -> None:
+        """Create a directory (and its parents) on all the hosts.
+
+        Args:
+            path (PathType): path of the directory to create.
+            exist_ok (bool): whether an existing directory is an error.
+        """
+        self.run_on_hosts(lambda c: c.makedirs(path=path, exist_ok=exist_ok))
+
+    def remove(self, path: PathType, recursive: bool) -> None:
+        """Remove a file or directory on all the hosts.
+
+        Args:
+            path (PathType): path to remove.
+            recursive (bool): whether to remove the content of a directory too.
+        """
+        self.run_on_hosts(lambda c: c.remove(path=path, recursive=recursive))
+
+    def copy_from_host(self, source: PathType, destination: PathType) -> None:
+        """Copy a file or directory of the local host to all the hosts.
+
+        Args:
+            source (PathType): local path to copy.
+            destination (PathType): path of the copy on the hosts.
+        """
+        self.run_on_hosts(lambda c: c.copy_from_host(source=source, destination=destination))
+
+    def close(self) -> None:
+        """Close the communication layers of all the hosts."""
+        for comm_layer in self._comm_layers.values():
+            comm_layer.close()
+
+    def run_on_hosts(
+        self,
+        function: Callable[[CommunicationLayer], Any],
+    ) -> Dict[str, HostResult]:
+        """
+        Run an operation with the communication layer of each host concurrently, e.g. the
+        operations specific to one host:
+
+            results = cluster.run_on_hosts(lambda c: c.read_file(path="/etc/hostname"))
+
+        Args:
+            function (Callable[[CommunicationLayer], Any]):
+                operation to run, called with the communication layer of each host.
+
+        Raises:
+            ClusterError: if the operation failed on more hosts than tolerated.
+
+        Returns:
+            Dict[str, HostResult]: the value returned by the operation, by host name.
+        """
+
+        async def run(comm_layer: CommunicationLayer) -> Any:
+            return await asyncio.to_thread(function, comm_layer)
+
+        return run_sync(self._gather(operation=run))
+
+    async def _gather(
+        self,
+        operation: Callable[[CommunicationLayer], Awaitable[Any]],
+    ) -> Dict[str, HostResult]:
+        async def on_host(host: str, comm_layer: CommunicationLayer) -> HostResult:
+            try:
+                return HostResult(host=host, output=await operation(comm_layer))
+            except subprocess.CalledProcessError as cpe:
+                return HostResult(
+                    host=host,
+                    output=cpe.output,
+                    returncode=cpe.returncode,
+                    error=cpe,
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                return HostResult(host=host, returncode=None, error=error)
+
+        results = await asyncio.gather(*(on_host(h, c) for h, c in self._comm_layers.items()))
+        results = {r.host: r for r in results}
+
+        failed = [r for r in results.values() if not r.succeeded]
+        if self._max_failures is not None and len(failed) > self._max_failures:
+            raise ClusterError(results=results)
+        for result in failed:
+            print(f"[WARNING] Failed on {result.host}: {result.error}")
+        return results
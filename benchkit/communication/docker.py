@@ -10,6 +10,7 @@ from pythainer.runners import ConcreteDockerRunner
 from benchkit.communication import CommunicationLayer
 from benchkit.communication.utils import command_with_env, remote_shell_command
 from benchkit.shell.shell import shell_out
+from benchkit.shell.shellaio import shell_out_aio
 from benchkit.utils.types import Command, Environment, PathType, SplitCommand
 
 
@@ -39,6 +40,14 @@ class DockerCommLayer(CommunicationLayer):
             self._command_prefix = self._docker_runner.get_command()[:-1]
         return self._command_prefix
 
+    def stdio_channel_command(self, command: str) -> SplitCommand:
+        # keep the standard input open, without terminal (that would mangle the streams)
+        prefix = [a for a in self._get_command_prefix() if a not in ("-t", "--tty")]
+        prefix = ["-i" if a in ("-it", "-ti") else a for a in prefix]
+        if "-i" not in prefix and "--interactive" not in prefix:
+            prefix.insert(2, "-i")  # after "docker <subcommand>"
+        return prefix + ["sh", "-c", command]
+
     def background_subprocess(
         self,
         command: Command,
@@ -47,6 +56,7 @@ class DockerCommLayer(CommunicationLayer):
         cwd: PathType | None,
         env: dict | None,
         establish_new_connection: bool = False,
+        stdin: int | None = None,
     ) -> subprocess.Popen:
         # TODO This is a solution that's a bit dangerous, as the user would commonly expect the
         # background process to run inside the docker container. We should keep this use case
@@ -65,6 +75,7 @@ class DockerCommLayer(CommunicationLayer):
 
         return subprocess.Popen(
             full_command,
+            stdin=stdin,
             stdout=stdout,
             stderr=stderr,
             env=env,
@@ -86,18 +97,12 @@ class DockerCommLayer(CommunicationLayer):
         ignore_ret_codes: Iterable[int] = (),
         ignore_any_error_code: bool = False,
     ) -> str:
-        env_command = command_with_env(
-            command=command,
-            environment=environment,
-            additional_environment=self._additional_environment,
-        )
-        full_command = self._remote_shell_command(
-            remote_command=env_command,
-            remote_current_dir=current_dir,
-        )
-
         output = shell_out(
-            command=full_command,
+            command=self._shell_command(
+                command=command,
+                current_dir=current_dir,
+                environment=environment,
+            ),
             std_input=std_input,
             current_dir=None,
             print_input=print_input,
@@ -109,6 +114,59 @@ class DockerCommLayer(CommunicationLayer):
 
         return output
 
+    async def shell_aio(
+        self,
+        command: Command,
+        std_input: str | None = None,
+        current_dir: PathType | None = None,
+        environment: Environment = None,
+        shell: bool = False,
+        print_input: bool = True,
+        print_output: bool = True,
+        print_curdir: bool = True,
+        timeout: int | None = None,
+        output_is_log: bool = False,
+        ignore_ret_codes: Iterable[int] = (),
+        ignore_any_error_code: bool = False,
+    ) -> str:
+        return await shell_out_aio(
+            command=self._shell_command(
+                command=command,
+                current_dir=current_dir,
+                environment=environment,
+            ),
+            std_input=std_input,
+            current_dir=None,
+            print_input=print_input,
+            print_output=print_output,
+            timeout=timeout,
+            output_is_log=output_is_log,
+            ignore_ret_codes=ignore_ret_codes,
+        )
+
+    async def read_file_aio(self, path: PathType) -> str:
+        return await self.shell_aio(
+            command=f"cat {path}",
+            print_input=False,
+            print_output=False,
+        )
+
+    def _shell_command(
+        self,
+        command: Command,
+        current_dir: PathType | None,
+        environment: Environment,
+    ) -> SplitCommand:
+        env_command = command_with_env(
+            command=command,
+            environment=environment,
+            additional_environment=self._additional_environment,
+        )
+        return self._remote_shell_command(
+            remote_command=env_command,
+            remote_current_dir=current_dir,
+        )
+
     def get_process_nb_threads(self, process_handle: subprocess.Popen) -> int:
         raise NotImplementedError("TODO")
 
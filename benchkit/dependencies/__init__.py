@@ -12,7 +12,9 @@ import sys
 from typing import Iterable, List
 
 from benchkit.dependencies.dependency import Dependency
+from benchkit.dependencies.executables import ExecutableDependency, resolve_executables
 from benchkit.dependencies.packagemanagers import get_package_manager
+from benchkit.dependencies.packages import PackageDependency
 from benchkit.platforms import Platform
 
 
@@ -40,20 +42,36 @@ def check_dependencies(
     """
     Check that all the given dependencies are met on the given platform.
     If they are not, exit with an error message telling how to install the missing dependencies.
+    The dependencies that were not created for a specific platform are checked on the given
+    platform, and the executables are looked up with a single round trip to each platform.
 
     Args:
-        all_dependencies (Iterable[Dependency]): _description_
-        platform (Platform): _description_
+        all_dependencies (Iterable[Dependency]): dependencies to check.
+        platform (Platform): platform on which to check the dependencies.
     """
     if "Linux" != sys_platform.system():
         return
 
+    all_dependencies = list(all_dependencies)
+    for dependency in all_dependencies:
+        dependency.bind_platform(platform=platform)
+    flattened = list(itertools.chain.from_iterable(d.flatten() for d in all_dependencies))
+    resolve_executables(dependencies=[d for d in flattened if isinstance(d, ExecutableDependency)])
+
+    package_dependencies = [
+        d for d in flattened if isinstance(d, PackageDependency) and d.platform is platform
+    ]
+    package_mgr = get_package_manager(platform=platform) if package_dependencies else None
+    for dependency in package_dependencies:
+        dependency.package_manager = package_mgr
+
     absent_dependencies = all_absents(all_dependencies=all_dependencies)
 
     if not absent_dependencies:
         return
 
-    package_mgr = get_package_manager(platform=platform)
+    if package_mgr is None:
+        package_mgr = get_package_manager(platform=platform)
 
     missing_packages = [
         missing_package
@@ -25,6 +25,7 @@ class Dependency:
     ) -> None:
         self.dependencies = dependencies if dependencies is not None else []
         self.platform = platform if platform is not None else get_current_platform()
+        self._default_platform = platform is None
 
     @property
     def name(self) -> str:
@@ -51,6 +52,30 @@ class Dependency:
         """
         raise NotImplementedError()
 
+    def bind_platform(self, platform: Platform) -> None:
+        """
+        Check the dependency, and its dependencies (recursively), on the given platform when they
+        were not created for a specific platform.
+
+        Args:
+            platform (Platform): platform on which to check the dependencies.
+        """
+        if self._default_platform:
+            self.platform = platform
+        for dependency in self.dependencies:
+            dependency.bind_platform(platform=platform)
+
+    def flatten(self) -> Iterable["Dependency"]:
+        """
+        Return the dependency and all its dependencies (recursively).
+
+        Returns:
+            Iterable[Dependency]: the dependency and all its dependencies (recursively).
+        """
+        yield self
+        for dependency in self.dependencies:
+            yield from dependency.flatten()
+
     def present(self) -> bool:
         """
         Return whether the dependency is present on the given system.
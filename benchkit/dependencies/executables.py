@@ -5,6 +5,7 @@ Dependencies that represent executable programs (to be find in the path wich "wh
 """
 
 import pathlib
+from typing import Iterable
 
 from benchkit.dependencies.dependency import Dependencies, Dependency
 from benchkit.dependencies.packagemanagers import PackageManager
@@ -29,6 +30,8 @@ class ExecutableDependency(Dependency):
         )
 
         self._executable = executable
+        self._resolved = False
+        self._path = None
 
     @property
     def name(self) -> str:
@@ -44,6 +47,8 @@ class ExecutableDependency(Dependency):
         return self._resolvable()
 
     def _executable_path(self) -> pathlib.Path | None:
+        if self._resolved:
+            return self._path
         exec_path = self.platform.comm.which(cmd=self._executable)
         return exec_path
 
@@ -52,6 +57,24 @@ class ExecutableDependency(Dependency):
         return result
 
 
+def resolve_executables(dependencies: Iterable[ExecutableDependency]) -> None:
+    """Resolve the paths of the given executable dependencies, with a single round trip to each
+    platform, such that checking their presence does not query the platforms anymore.
+
+    Args:
+        dependencies (Iterable[ExecutableDependency]): executable dependencies to resolve.
+    """
+    by_platform = {}
+    for dependency in dependencies:
+        by_platform.setdefault(id(dependency.platform), []).append(dependency)
+    for platform_dependencies in by_platform.values():
+        comm = platform_dependencies[0].platform.comm
+        paths = comm.which_many(cmds=[d.name for d in platform_dependencies])
+        for dependency, path in zip(platform_dependencies, paths):
+            dependency._path = path  # pylint: disable=protected-access
+            dependency._resolved = True  # pylint: disable=protected-access
+
+
 def executable_is_installed(
     name: str,
     platform: Platform,
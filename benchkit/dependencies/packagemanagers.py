@@ -242,15 +242,13 @@ def get_package_manager(platform: Platform) -> PackageManager:
     Returns:
         PackageManager: _description_
     """
-    apt = platform.comm.which(cmd="apt")
+    apt, dnf, pacman = platform.comm.which_many(cmds=["apt", "dnf", "pacman"])
     if apt is not None:
         return Apt()
 
-    dnf = platform.comm.which(cmd="dnf")
     if dnf is not None:
         return Dnf()
 
-    pacman = platform.comm.which(cmd="pacman")
     if pacman is not None:
         return Pacman()
 
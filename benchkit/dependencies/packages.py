@@ -52,6 +52,10 @@ class PackageDependency(Dependency):
             self._package_manager = get_package_manager(platform=self.platform)
         return self._package_manager
 
+    @package_manager.setter
+    def package_manager(self, package_manager: PackageManager) -> None:
+        self._package_manager = package_manager
+
     def package_name(
         self,
         package_manager: PackageManager,
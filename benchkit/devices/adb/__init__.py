@@ -528,6 +528,10 @@ class AndroidCommLayer(CommunicationLayer):
         ] + command_args
         return remote_command
 
+    def stdio_channel_command(self, command: str) -> SplitCommand:
+        # "-T" disables the terminal, that would mangle the streams
+        return ["adb", "-s", f"{self._bridge.identifier}", "shell", "-T", command]
+
     def shell(
         self,
         command: Command,
@@ -0,0 +1,325 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Distribution of the records of a campaign over a pool of hosts.
+
+The build groups of the campaign (records sharing the same build variables) are put in a shared
+work queue. Each host pulls the next group as soon as it is done with the previous one, such that
+faster hosts run more groups. When a host fails, the group it was running is put back in the queue
+for another host, and the results that the failed host produced for that group are discarded when
+the per-host results are merged.
+"""
+
+import collections
+import pathlib
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from benchkit.utils.misc import CSV_SEPARATOR
+from benchkit.utils.types import PathType
+from benchkit.utils.variables import ParameterSpace, list_groupby
+
+BuildGroup = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
+
+def _record_key(record: Dict[str, Any]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    names = tuple(sorted(record))
+    return names, tuple(str(record[name]) for name in names)
+
+
+class WorkQueue:
+    """
+    Queue of build groups shared by the hosts of a distributed campaign.
+
+    A group handed out to a host stays "in flight" until the host asks for the next group (the
+    host runs its groups one after the other) or finishes. Hosts waiting for a group block while
+    other hosts still have groups in flight, as these may be put back in the queue if their host
+    fails.
+    """
+
+    def __init__(
+        self,
+        build_var_names: Iterable[str],
+        records: Iterable[Dict[str, Any]],
+        max_attempts: int = 2,
+    ) -> None:
+        """
+        Create the work queue.
+
+        Args:
+            build_var_names (Iterable[str]):
+                names of the build variables, used to group the records.
+            records (Iterable[Dict[str, Any]]):
+                all the records of the campaign.
+            max_attempts (int, optional):
+                maximum number of hosts that try to run a group, a group whose host failed
+                `max_attempts` times is dropped. Defaults to 2.
+
+        Raises:
+            ValueError: if the maximum number of attempts is invalid.
+        """
+        if max_attempts < 1:
+            raise ValueError(f"Invalid maximum number of attempts: {max_attempts}")
+
+        self._build_var_names = list(build_var_names)
+        self._records = list(records)
+        self._max_attempts = max_attempts
+
+        groups = list_groupby(variables_names=self._build_var_names, bench_variables=self._records)
+        self._pending = collections.deque(
+            (group_id, (dict(bv), list(brv))) for group_id, (bv, brv) in enumerate(groups)
+        )
+        self._attempts = collections.Counter()
+        self._in_flight: Dict[int, Tuple[int, BuildGroup]] = {}
+        self._discarded: Dict[int, Set[Tuple[Tuple[str, ...], Tuple[str, ...]]]] = {}
+        self._dropped: List[BuildGroup] = []
+        self._condition = threading.Condition()
+
+    @property
+    def build_var_names(self) -> List[str]:
+        """
+        Get the names of the build variables used to group the records.
+
+        Returns:
+            List[str]: the names of the build variables.
+        """
+        return list(self._build_var_names)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Get all the records of the campaign.
+
+        Returns:
+            List[Dict[str, Any]]: all the records of the campaign.
+        """
+        return self._records
+
+    @property
+    def dropped_groups(self) -> List[BuildGroup]:
+        """
+        Get the groups that could not be run, because every host that tried them failed or no
+        host was left to run them.
+
+        Returns:
+            List[BuildGroup]: the build variables and records of the groups not run.
+        """
+        with self._condition:
+            return self._dropped + [group for _, group in self._pending]
+
+    def next_group(self, host_id: int) -> BuildGroup | None:
+        """
+        Get the next group to run on the given host, the previous group of the host is done.
+        Blocks while the queue is empty but groups are still in flight on other hosts.
+
+        Args:
+            host_id (int): identifier of the host.
+
+        Returns:
+            BuildGroup | None: the next group, or None when all the groups are done.
+        """
+        with self._condition:
+            if self._in_flight.pop(host_id, None) is not None:
+                self._condition.notify_all()
+            while True:
+                if self._pending:
+                    group_id, group = self._pending.popleft()
+                    self._attempts[group_id] += 1
+                    self._in_flight[host_id] = (group_id, group)
+                    return group
+                if not self._in_flight:
+                    return None
+                self._condition.wait()
+
+    def host_finished(self, host_id: int) -> None:
+        """
+        Notify that the given host has run all its groups successfully.
+
+        Args:
+            host_id (int): identifier of the host.
+        """
+        with self._condition:
+            self._in_flight.pop(host_id, None)
+            self._condition.notify_all()
+
+    def host_failed(self, host_id: int) -> BuildGroup | None:
+        """
+        Notify that the given host failed, its group in flight is put back in the queue.
+
+        Args:
+            host_id (int): identifier of the host.
+
+        Returns:
+            BuildGroup | None: the group the host was running, if any.
+        """
+        with self._condition:
+            in_flight = self._in_flight.pop(host_id, None)
+            if in_flight is None:
+                self._condition.notify_all()
+                return None
+
+            group_id, group = in_flight
+            _, records = group
+            self._discarded.setdefault(host_id, set()).update(_record_key(r) for r in records)
+            if self._attempts[group_id] < self._max_attempts:
+                self._pending.appendleft(in_flight)
+            else:
+                self._dropped.append(group)
+            self._condition.notify_all()
+            return group
+
+    def is_discarded(self, host_id: int, row: Dict[str, str]) -> bool:
+        """
+        Return whether a result row produced by the given host belongs to a group that failed on
+        that host, and must therefore be discarded.
+
+        Args:
+            host_id (int): identifier of the host.
+            row (Dict[str, str]): result row, mapping the column names to their values.
+
+        Returns:
+            bool: whether the row must be discarded.
+        """
+        discarded = self._discarded.get(host_id)
+        if not discarded:
+            return False
+        names_set = {names for names, _ in discarded}
+        for names in names_set:
+            if all(name in row for name in names):
+                values = tuple(str(row[name]) for name in names)
+                if (names, values) in discarded:
+                    return True
+        return False
+
+    def host_space(self, host_id: int) -> "HostSpace":
+        """
+        Get the parameter space through which the given host pulls its groups.
+
+        Args:
+            host_id (int): identifier of the host.
+
+        Returns:
+            HostSpace: the parameter space of the host.
+        """
+        return HostSpace(work_queue=self, host_id=host_id)
+
+
+class HostSpace(ParameterSpace):
+    """
+    Parameter space of one host of a distributed campaign.
+    Iterating over the space goes through all the records of the campaign (e.g. to validate them or
+    estimate durations), while grouping by the build variables pulls the groups from the shared
+    work queue.
+    """
+
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        host_id: int,
+    ) -> None:
+        self._work_queue = work_queue
+        self._host_id = host_id
+
+    @property
+    def names(self) -> List[str]:
+        return list(dict.fromkeys(k for record in self._work_queue.records for k in record))
+
+    @property
+    def depends_on_results(self) -> bool:
+        # the next group is only pulled once the previous one has run (no lookahead)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._work_queue.records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._work_queue.records)
+
+    def groupby(
+        self,
+        variables_names: Iterable[str],
+    ) -> Iterator[Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]]:
+        vn = list(variables_names)
+        if vn != self._work_queue.build_var_names:
+            # other groupings (e.g. tilt) do not consume the queue
+            yield from list_groupby(variables_names=vn, bench_variables=self._work_queue.records)
+            return
+
+        while (group := self._work_queue.next_group(host_id=self._host_id)) is not None:
+            yield group
+
+
+def _read_csv_results(csv_path: PathType) -> Tuple[List[str], List[str], List[List[str]]]:
+    comments = []
+    header = None
+    rows = []
+    with open(csv_path, "r") as csv_file:
+        for line in csv_file:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            if line.startswith("#"):
+                if header is None:
+                    comments.append(line)
+            elif header is None:
+                header = line.split(CSV_SEPARATOR)
+            else:
+                rows.append(line.split(CSV_SEPARATOR))
+    return comments, header if header is not None else [], rows
+
+
+def merge_host_results(
+    work_queue: WorkQueue,
+    host_csv_paths: Dict[int, PathType],
+    output_path: PathType,
+    extra_comments: List[str],
+) -> int:
+    """
+    Merge the CSV results produced by each host into a single CSV file.
+    The comment header of the first host with results is kept, followed by the extra comments. The
+    rows of the groups that failed on a host are discarded.
+
+    Args:
+        work_queue (WorkQueue):
+            work queue shared by the hosts.
+        host_csv_paths (Dict[int, PathType]):
+            path to the CSV results of each host, by host identifier.
+        output_path (PathType):
+            path to the merged CSV file.
+        extra_comments (List[str]):
+            comments added to the header, without the leading "# ".
+
+    Returns:
+        int: the number of merged result rows.
+    """
+    comments = []
+    header: List[str] = []
+    merged_rows = []
+    for host_id, csv_path in sorted(host_csv_paths.items()):
+        if not pathlib.Path(csv_path).is_file():
+            continue
+        host_comments, host_header, host_rows = _read_csv_results(csv_path=csv_path)
+        if not comments:
+            comments = host_comments
+        header.extend(c for c in host_header if c not in header)
+        for row in host_rows:
+            row_dict = dict(zip(host_header, row))
+            if not work_queue.is_discarded(host_id=host_id, row=row_dict):
+                merged_rows.append(row_dict)
+
+    with open(output_path, "w") as output_file:
+        for comment in comments:
+            print(comment, file=output_file)
+        for comment in extra_comments:
+            print(f"# {comment}", file=output_file)
+        if header:
+            print(CSV_SEPARATOR.join(header), file=output_file)
+        for row_dict in merged_rows:
+            # as in the host files, missing trailing columns are left out
+            nb_columns = max((i for i, c in enumerate(header, start=1) if c in row_dict), default=0)
+            print(
+                CSV_SEPARATOR.join(row_dict.get(c, "") for c in header[:nb_columns]),
+                file=output_file,
+            )
+
+    return len(merged_rows)
@@ -0,0 +1,316 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Parsers of the system-wide resource usage counters exposed in `/proc`: CPU time, memory, load,
+disk and network I/O, and pressure stall information (PSI).
+
+This module only depends on the standard library: its source is also run as-is by the
+long-lived reader process of the resource sampler (see `benchkit.helpers.linux.sampler`),
+possibly on a remote host, where it periodically prints a sample of the counters as a JSON line.
+"""
+
+import json
+import os
+import select
+import sys
+import time
+from typing import Dict, List, Tuple
+
+SECTOR_SIZE = 512
+
+# unit of the CPU times of /proc, fixed to 100 by the kernel ABI on all the common architectures
+USER_HZ = 100
+
+STEAL_INDEX = 7
+
+PSI_RESOURCES = ("cpu", "memory", "io")
+PSI_STALLS = (
+    ("cpu", "some"),
+    ("memory", "some"),
+    ("memory", "full"),
+    ("io", "some"),
+    ("io", "full"),
+)
+
+_VIRTUAL_BLOCK_DEVICE_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr")
+
+
+def parse_stat(content: str) -> List[int]:
+    """
+    Parse the aggregated CPU times of `/proc/stat`.
+
+    Args:
+        content (str): content of `/proc/stat`.
+
+    Returns:
+        List[int]: the CPU times in clock ticks (user, nice, system, idle, iowait, irq, softirq,
+                   steal), summed over all the CPUs.
+
+    Raises:
+        ValueError: if the content has no aggregated CPU line.
+    """
+    for line in content.splitlines():
+        if line.startswith("cpu "):
+            return [int(v) for v in line.split()[1:9]]
+    raise ValueError("No aggregated cpu line in /proc/stat")
+
+
+def parse_stat_per_cpu(content: str) -> Dict[int, List[int]]:
+    """
+    Parse the CPU times of each CPU in `/proc/stat`.
+
+    Args:
+        content (str): content of `/proc/stat`.
+
+    Returns:
+        Dict[int, List[int]]: the CPU times of each CPU, in the order of `parse_stat`.
+    """
+    result = {}
+    for line in content.splitlines():
+        if line.startswith("cpu") and not line.startswith("cpu "):
+            name, *times = line.split()
+            result[int(name[3:])] = [int(v) for v in times[:8]]
+    return result
+
+
+def cpu_busy_idle(cpu_times: List[int]) -> Tuple[int, int]:
+    """
+    Split the CPU times parsed from `/proc/stat` into busy and idle time.
+
+    Args:
+        cpu_times (List[int]): the CPU times, as returned by `parse_stat`.
+
+    Returns:
+        Tuple[int, int]: the busy and idle (including iowait) times, in clock ticks.
+    """
+    idle = cpu_times[3] + cpu_times[4]
+    return sum(cpu_times) - idle, idle
+
+
+def parse_meminfo(content: str) -> Dict[str, int]:
+    """
+    Parse `/proc/meminfo`.
+
+    Args:
+        content (str): content of `/proc/meminfo`.
+
+    Returns:
+        Dict[str, int]: the value of each field, in bytes for the fields given in kB.
+    """
+    result = {}
+    for line in content.splitlines():
+        name, _, value = line.partition(":")
+        fields = value.split()
+        if not fields:
+            continue
+        result[name.strip()] = int(fields[0]) * (1024 if "kB" == fields[-1] else 1)
+    return result
+
+
+def parse_loadavg(content: str) -> Tuple[float, float, float]:
+    """
+    Parse `/proc/loadavg`.
+
+    Args:
+        content (str): content of `/proc/loadavg`.
+
+    Returns:
+        Tuple[float, float, float]: the load averages over 1, 5 and 15 minutes.
+    """
+    load1, load5, load15 = content.split()[:3]
+    return float(load1), float(load5), float(load15)
+
+
+def parse_diskstats(content: str) -> Tuple[int, int]:
+    """
+    Parse `/proc/diskstats`, summing the I/O of the physical disks (partitions and virtual devices
+    such as loop or device-mapper devices are skipped, their I/O is counted by their disk).
+
+    Args:
+        content (str): content of `/proc/diskstats`.
+
+    Returns:
+        Tuple[int, int]: the number of bytes read and written.
+    """
+    devices = {}
+    for line in content.splitlines():
+        fields = line.split()
+        if len(fields) < 10:
+            continue
+        devices[fields[2]] = (int(fields[5]), int(fields[9]))
+
+    read_sectors = 0
+    written_sectors = 0
+    for name, (read, written) in devices.items():
+        if name.startswith(_VIRTUAL_BLOCK_DEVICE_PREFIXES):
+            continue
+        if any(name != other and name.startswith(other) for other in devices):
+            continue  # partition of a disk, e.g. sda1 or nvme0n1p1
+        read_sectors += read
+        written_sectors += written
+    return read_sectors * SECTOR_SIZE, written_sectors * SECTOR_SIZE
+
+
+def parse_net_dev(content: str) -> Tuple[int, int]:
+    """
+    Parse `/proc/net/dev`, summing the traffic of all the interfaces but the loopback.
+
+    Args:
+        content (str): content of `/proc/net/dev`.
+
+    Returns:
+        Tuple[int, int]: the number of bytes received and transmitted.
+    """
+    received = 0
+    transmitted = 0
+    for line in content.splitlines()[2:]:
+        interface, _, counters = line.partition(":")
+        fields = counters.split()
+        if "lo" == interface.strip() or len(fields) < 9:
+            continue
+        received += int(fields[0])
+        transmitted += int(fields[8])
+    return received, transmitted
+
+
+def parse_pressure(content: str) -> Dict[str, int]:
+    """
+    Parse a pressure stall information file (`/proc/pressure/<resource>`).
+
+    Args:
+        content (str): content of the file.
+
+    Returns:
+        Dict[str, int]: the total stall time (in microseconds) of each line ("some", "full").
+    """
+    result = {}
+    for line in content.splitlines():
+        kind, *fields = line.split()
+        for field in fields:
+            name, _, value = field.partition("=")
+            if "total" == name:
+                result[kind] = int(value)
+    return result
+
+
+def parse_interrupts(content: str) -> Dict[int, int]:
+    """
+    Parse `/proc/interrupts`, summing the interrupts received by each CPU.
+
+    Args:
+        content (str): content of `/proc/interrupts`.
+
+    Returns:
+        Dict[int, int]: the number of interrupts received by each CPU.
+    """
+    lines = content.splitlines()
+    if not lines:
+        return {}
+    cpus = [int(name[3:]) for name in lines[0].split()]
+    totals = dict.fromkeys(cpus, 0)
+    for line in lines[1:]:
+        counts = line.partition(":")[2].split()[: len(cpus)]
+        for cpu, count in zip(cpus, counts):
+            if not count.isdigit():
+                break  # e.g. "ERR" and "MIS" lines, with a single system-wide count
+            totals[cpu] += int(count)
+    return totals
+
+
+def parse_task_stat(content: str) -> Tuple[int, str, str, int, int]:
+    """
+    Parse the `/proc/<pid>/task/<tid>/stat` line of a thread.
+
+    Args:
+        content (str): the stat line of the thread.
+
+    Returns:
+        Tuple[int, str, str, int, int]: the thread id, command name, state (e.g. "R" when
+                                        runnable), CPU it last ran on and consumed CPU time (user
+                                        and system, in clock ticks).
+    """
+    # the command name (in parentheses) may contain spaces, the fields after it cannot
+    tid, _, rest = content.partition(" (")
+    comm, _, rest = rest.rpartition(") ")
+    fields = rest.split()
+    return int(tid), comm, fields[0], int(fields[36]), int(fields[11]) + int(fields[12])
+
+
+def _read(path: str) -> str | None:
+    try:
+        with open(path, "r") as proc_file:
+            return proc_file.read()
+    except OSError:
+        return None
+
+
+def read_sample() -> Dict:
+    """
+    Read the current values of the counters of the local host.
+
+    Returns:
+        Dict: the sample, with the timestamp ("t", monotonic seconds), the CPU times ("cpu"),
+              the total and available memory ("mem"), the load averages ("load"), the disk and
+              network bytes ("disk", "net"), the stall times ("psi", when available) and the CPU
+              time consumed by the reader itself ("self", in seconds).
+    """
+    meminfo = parse_meminfo(_read("/proc/meminfo"))
+    sample = {
+        "t": time.monotonic(),
+        "cpu": parse_stat(_read("/proc/stat")),
+        "mem": [meminfo.get("MemTotal", 0), meminfo.get("MemAvailable", meminfo.get("MemFree", 0))],
+        "load": parse_loadavg(_read("/proc/loadavg")),
+        "self": time.process_time(),
+    }
+    diskstats = _read("/proc/diskstats")
+    if diskstats is not None:
+        sample["disk"] = parse_diskstats(diskstats)
+    net_dev = _read("/proc/net/dev")
+    if net_dev is not None:
+        sample["net"] = parse_net_dev(net_dev)
+    psi = {}
+    for resource in PSI_RESOURCES:
+        pressure = _read(f"/proc/pressure/{resource}")
+        if pressure is not None:
+            psi[resource] = parse_pressure(pressure)
+    if psi:
+        sample["psi"] = psi
+    return sample
+
+
+def reader_main(interval_seconds: float) -> None:
+    """
+    Loop of the reader process: print a sample every `interval_seconds`, and an additional one,
+    tagged with the given mark, for each line "<mark>" read on the standard input.
+    The reader exits when its standard input or output is closed.
+
+    Args:
+        interval_seconds (float): period between two samples.
+    """
+    stdin_fd = sys.stdin.fileno()
+    pending_input = b""
+    deadline = time.monotonic()
+    while True:
+        timeout = max(deadline - time.monotonic(), 0.0)
+        readable, _, _ = select.select([stdin_fd], [], [], timeout)
+        samples = []
+        if readable:
+            # unbuffered read, such that select sees all the marks not processed yet
+            data = os.read(stdin_fd, 4096)
+            if not data:
+                return
+            *marks, pending_input = (pending_input + data).split(b"\n")
+            for mark in marks:
+                samples.append(read_sample() | {"mark": mark.decode().strip()})
+        else:
+            deadline = max(deadline + interval_seconds, time.monotonic())
+            samples.append(read_sample())
+        try:
+            for sample in samples:
+                print(json.dumps(sample), flush=True)
+        except BrokenPipeError:
+            return
+
+
+if __name__ == "__main__":
+    reader_main(interval_seconds=float(sys.argv[1]))
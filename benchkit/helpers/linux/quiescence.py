@@ -0,0 +1,411 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Quiescence gate of the runs of a campaign.
+
+On shared machines, cron jobs, other users or a lingering previous run produce outliers. While
+`PredLinux` checks the static configuration of the host, the gate checks its dynamic state:
+before each repetition, it waits (with a bound) until the CPUs of the benchmark are quiet, and
+after it, it detects interference during the run (CPU steal, foreign threads running on the
+CPUs of the benchmark), in which case the repetition is run again.
+"""
+
+import os
+import shlex
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from benchkit.helpers.linux import procfs
+from benchkit.platforms import Platform
+
+# a single round trip reads all the counters; "exec" makes the shell the cat reading the threads,
+# such that it can exclude itself from the runnable threads
+_SNAPSHOT_SCRIPT = (
+    "cd /proc && "
+    "for f in loadavg stat interrupts pressure/memory; do "
+    'echo "==> $f"; cat $f 2>/dev/null; '
+    "done; "
+    'echo "==> tasks $$"; '
+    "exec cat [0-9]*/task/[0-9]*/stat 2>/dev/null"
+)
+
+
+class SystemSnapshot:
+    """
+    Snapshot of the dynamic state of a host: load, CPU times, interrupts, memory pressure and
+    threads.
+    """
+
+    def __init__(
+        self,
+        timestamp: float,
+        load1: float,
+        cpu_times: Dict[int, List[int]],
+        interrupts: Dict[int, int],
+        memory_pressure_us: int | None,
+        tasks: Dict[int, Tuple[str, str, int, int]],
+    ) -> None:
+        """
+        Create a snapshot.
+
+        Args:
+            timestamp (float): time of the snapshot (monotonic, on the host running benchkit).
+            load1 (float): load average over 1 minute.
+            cpu_times (Dict[int, List[int]]): CPU times of each CPU (see `parse_stat_per_cpu`).
+            interrupts (Dict[int, int]): number of interrupts received by each CPU.
+            memory_pressure_us (int | None):
+                total "some" memory stall time in microseconds, None without PSI.
+            tasks (Dict[int, Tuple[str, str, int, int]]):
+                command name, state, last CPU and CPU ticks of each thread, by thread id.
+        """
+        self.timestamp = timestamp
+        self.load1 = load1
+        self.cpu_times = cpu_times
+        self.interrupts = interrupts
+        self.memory_pressure_us = memory_pressure_us
+        self.tasks = tasks
+
+    @staticmethod
+    def parse(content: str, timestamp: float) -> "SystemSnapshot":
+        """
+        Parse the output of the snapshot command.
+
+        Args:
+            content (str): output of the snapshot command.
+            timestamp (float): time of the snapshot.
+
+        Returns:
+            SystemSnapshot: the snapshot.
+        """
+        sections = {}
+        name = None
+        for line in content.splitlines():
+            if line.startswith("==> "):
+                name = line[4:].strip()
+                sections[name] = []
+            elif name is not None:
+                sections[name].append(line)
+
+        snapshot_pids = set()
+        task_lines = []
+        for name, lines in sections.items():
+            if name.startswith("tasks"):
+                snapshot_pids = {int(pid) for pid in name.split()[1:]}
+                task_lines = lines
+        tasks = {}
+        for line in task_lines:
+            if line.strip():
+                tid, comm, state, processor, ticks = procfs.parse_task_stat(line)
+                if tid not in snapshot_pids:
+                    tasks[tid] = (comm, state, processor, ticks)
+
+        pressure = procfs.parse_pressure("\n".join(sections.get("pressure/memory", [])))
+        return SystemSnapshot(
+            timestamp=timestamp,
+            load1=procfs.parse_loadavg("\n".join(sections["loadavg"]))[0],
+            cpu_times=procfs.parse_stat_per_cpu("\n".join(sections["stat"])),
+            interrupts=procfs.parse_interrupts("\n".join(sections.get("interrupts", []))),
+            memory_pressure_us=pressure.get("some"),
+            tasks=tasks,
+        )
+
+    @staticmethod
+    def take(platform: Platform) -> "SystemSnapshot":
+        """
+        Take a snapshot of the given platform.
+
+        Args:
+            platform (Platform): the platform.
+
+        Returns:
+            SystemSnapshot: the snapshot.
+        """
+        if platform.comm.is_local:
+            command = ["sh", "-c", _SNAPSHOT_SCRIPT]
+        else:
+            # a string is run as-is by the remote shell, that may not be a POSIX one
+            command = f"sh -c {shlex.quote(_SNAPSHOT_SCRIPT)}"
+        output = platform.comm.shell(
+            command=command,
+            print_input=False,
+            print_output=False,
+            print_curdir=False,
+            ignore_ret_codes=(1,),  # threads exiting while they are read
+        )
+        return SystemSnapshot.parse(content=output, timestamp=time.monotonic())
+
+
+class QuiescenceGate:
+    """
+    Gate of the repetitions of the records of a campaign on the dynamic state of the host.
+
+    Before each repetition, the gate waits until the host is quiet: load average, runnable
+    threads on the CPUs of the benchmark, interrupt rate of these CPUs and memory pressure below
+    their thresholds (a None threshold disables its check). It waits at most `max_wait_seconds`,
+    after which the repetition runs anyway. After each repetition, it checks for interference on
+    the CPUs of the benchmark during the run: CPU steal (e.g. from the hypervisor) and CPU time
+    consumed by foreign threads, i.e. threads that existed before the run. Repetitions with
+    interference are retried up to `max_retries` times.
+    """
+
+    def __init__(
+        self,
+        cpus: Iterable[int] | None = None,
+        max_load: float | None = None,
+        max_runnable_tasks: int | None = 0,
+        max_irq_rate: float | None = None,
+        max_memory_pressure: float | None = 1.0,
+        max_steal: float | None = 1.0,
+        max_foreign_cpu: float | None = 1.0,
+        sample_interval_seconds: float = 0.2,
+        max_wait_seconds: float = 30.0,
+        max_retries: int = 2,
+        ignored_commands: Iterable[str] = (),
+    ) -> None:
+        """
+        Create the quiescence gate.
+
+        Args:
+            cpus (Iterable[int] | None, optional):
+                CPUs of the benchmark, the CPUs of the worker running the record (or all the
+                CPUs) if None. Defaults to None.
+            max_load (float | None, optional):
+                maximum load average over 1 minute. As it decays slowly after a run, it is best
+                kept for long pauses between records. Defaults to None.
+            max_runnable_tasks (int | None, optional):
+                maximum number of runnable threads on the CPUs of the benchmark. Defaults to 0.
+            max_irq_rate (float | None, optional):
+                maximum number of interrupts per second on any CPU of the benchmark (the
+                timer tick alone counts for up to CONFIG_HZ). Defaults to None.
+            max_memory_pressure (float | None, optional):
+                maximum percentage of time some thread stalls on memory. Defaults to 1.0.
+            max_steal (float | None, optional):
+                maximum percentage of the time of the CPUs of the benchmark stolen by the
+                hypervisor during a run. Defaults to 1.0.
+            max_foreign_cpu (float | None, optional):
+                maximum percentage of the time of the CPUs of the benchmark consumed by foreign
+                threads during a run. Defaults to 1.0.
+            sample_interval_seconds (float, optional):
+                interval over which the rates are measured before a repetition. Defaults to 0.2.
+            max_wait_seconds (float, optional):
+                maximum time to wait for the host to be quiet. Defaults to 30.0.
+            max_retries (int, optional):
+                maximum number of retries of a repetition with interference. Defaults to 2.
+            ignored_commands (Iterable[str], optional):
+                command names of the threads never considered as noise nor interference (e.g. a
+                server the benchmark started before its runs). Defaults to ().
+
+        Raises:
+            ValueError: if the parameters are inconsistent.
+        """
+        thresholds = [
+            max_load,
+            max_runnable_tasks,
+            max_irq_rate,
+            max_memory_pressure,
+            max_steal,
+            max_foreign_cpu,
+        ]
+        if all(t is None for t in thresholds):
+            raise ValueError("Quiescence gate without any threshold")
+        if any(t is not None and t < 0 for t in thresholds):
+            raise ValueError("Invalid negative threshold of the quiescence gate")
+        if sample_interval_seconds <= 0:
+            raise ValueError(f"Invalid sample interval: {sample_interval_seconds}")
+        if max_retries < 0:
+            raise ValueError(f"Invalid number of retries: {max_retries}")
+
+        self.cpus = None if cpus is None else sorted(cpus)
+        self.max_load = max_load
+        self.max_runnable_tasks = max_runnable_tasks
+        self.max_irq_rate = max_irq_rate
+        self.max_memory_pressure = max_memory_pressure
+        self.max_steal = max_steal
+        self.max_foreign_cpu = max_foreign_cpu
+        self.sample_interval_seconds = sample_interval_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.max_retries = max_retries
+        self.ignored_commands = set(ignored_commands)
+
+    def _foreign_tasks(
+        self,
+        snapshot: SystemSnapshot,
+        ignored_tids: Iterable[int],
+    ) -> Dict[int, Tuple[str, str, int, int]]:
+        ignored_tids = set(ignored_tids)
+        return {
+            tid: task
+            for tid, task in snapshot.tasks.items()
+            if tid not in ignored_tids and task[0] not in self.ignored_commands
+        }
+
+    def noise(
+        self,
+        before: SystemSnapshot,
+        after: SystemSnapshot,
+        cpus: List[int],
+        ignored_tids: Iterable[int] = (),
+    ) -> List[str]:
+        """
+        Return the noise on the host between two snapshots, i.e. the thresholds exceeded.
+
+        Args:
+            before (SystemSnapshot): first snapshot.
+            after (SystemSnapshot): second snapshot.
+            cpus (List[int]): CPUs of the benchmark.
+            ignored_tids (Iterable[int], optional):
+                threads of benchkit itself, not counted as noise. Defaults to ().
+
+        Returns:
+            List[str]: the description of each exceeded threshold, empty if the host is quiet.
+        """
+        result = []
+        seconds = after.timestamp - before.timestamp
+
+        if self.max_load is not None and after.load1 > self.max_load:
+            result.append(f"load {after.load1:.2f}")
+
+        if self.max_runnable_tasks is not None:
+            runnable = sorted(
+                f"{comm}/{tid}"
+                for tid, (comm, state, processor, _) in self._foreign_tasks(
+                    snapshot=after,
+                    ignored_tids=ignored_tids,
+                ).items()
+                if "R" == state and processor in cpus
+            )
+            if len(runnable) > self.max_runnable_tasks:
+                result.append(f"runnable {','.join(runnable)}")
+
+        if self.max_irq_rate is not None and seconds > 0:
+            irq_rate = max(
+                (after.interrupts.get(cpu, 0) - before.interrupts.get(cpu, 0)) / seconds
+                for cpu in cpus
+            )
+            if irq_rate > self.max_irq_rate:
+                result.append(f"irq {irq_rate:.0f}/s")
+
+        if (
+            self.max_memory_pressure is not None
+            and after.memory_pressure_us is not None
+            and before.memory_pressure_us is not None
+            and seconds > 0
+        ):
+            stall_us = after.memory_pressure_us - before.memory_pressure_us
+            pressure = 100.0 * stall_us / (1e6 * seconds)
+            if pressure > self.max_memory_pressure:
+                result.append(f"memory pressure {pressure:.1f}%")
+
+        return result
+
+    def interference(
+        self,
+        before: SystemSnapshot,
+        after: SystemSnapshot,
+        cpus: List[int],
+        ignored_tids: Iterable[int] = (),
+    ) -> List[str]:
+        """
+        Return the interference during a run, between the snapshots taken before and after it.
+
+        The threads that existed before the run are foreign to it (the threads of the benchmark
+        are started by the run). A foreign thread is attributed to the CPU it last ran on.
+
+        Args:
+            before (SystemSnapshot): snapshot taken before the run.
+            after (SystemSnapshot): snapshot taken after the run.
+            cpus (List[int]): CPUs of the benchmark.
+            ignored_tids (Iterable[int], optional):
+                threads of benchkit itself, not counted as interference. Defaults to ().
+
+        Returns:
+            List[str]: the description of each interference, empty if there is none.
+        """
+        result = []
+        seconds = after.timestamp - before.timestamp
+        if seconds <= 0:
+            return result
+
+        if self.max_steal is not None:
+            stolen = 0
+            total = 0
+            for cpu in cpus:
+                if cpu in before.cpu_times and cpu in after.cpu_times:
+                    deltas = [a - b for a, b in zip(after.cpu_times[cpu], before.cpu_times[cpu])]
+                    stolen += deltas[procfs.STEAL_INDEX]
+                    total += sum(deltas)
+            steal = 100.0 * stolen / total if total > 0 else 0.0
+            if steal > self.max_steal:
+                result.append(f"steal {steal:.1f}%")
+
+        if self.max_foreign_cpu is not None:
+            foreign_ticks = {}
+            before_tasks = self._foreign_tasks(snapshot=before, ignored_tids=ignored_tids)
+            for tid, (comm, _, processor, ticks) in after.tasks.items():
+                if tid in before_tasks and processor in cpus:
+                    consumed = ticks - before_tasks[tid][3]
+                    if consumed > 0:
+                        foreign_ticks[f"{comm}/{tid}"] = consumed
+            foreign = 100.0 * sum(foreign_ticks.values()) / procfs.USER_HZ / (seconds * len(cpus))
+            if foreign > self.max_foreign_cpu:
+                top = sorted(foreign_ticks, key=foreign_ticks.get, reverse=True)[:3]
+                result.append(f"foreign threads {foreign:.1f}% ({','.join(top)})")
+
+        return result
+
+    def wait_quiet(
+        self,
+        platform: Platform,
+        cpus: List[int],
+    ) -> Tuple[float, List[str]]:
+        """
+        Wait until the given platform is quiet, at most `max_wait_seconds`.
+
+        Args:
+            platform (Platform): the platform.
+            cpus (List[int]): CPUs of the benchmark.
+
+        Returns:
+            Tuple[float, List[str]]: the time waited, in seconds, and the remaining noise (empty
+                                     if the platform became quiet).
+        """
+        start = time.monotonic()
+        before = SystemSnapshot.take(platform=platform)
+        logged = False
+        while True:
+            time.sleep(self.sample_interval_seconds)
+            after = SystemSnapshot.take(platform=platform)
+            noise = self.noise(
+                before=before,
+                after=after,
+                cpus=cpus,
+                ignored_tids=own_tids(platform=platform),
+            )
+            waited_seconds = after.timestamp - start
+            if not noise:
+                return waited_seconds, noise
+            if waited_seconds >= self.max_wait_seconds:
+                print(
+                    f"[WARNING] The system is still noisy after {waited_seconds:.1f}s "
+                    f"({'; '.join(noise)}), running anyway."
+                )
+                return waited_seconds, noise
+            if not logged:
+                print(f"[INFO] Waiting for the system to be quiet ({'; '.join(noise)}).")
+                logged = True
+            before = after
+
+
+def own_tids(platform: Platform) -> List[int]:
+    """
+    Get the threads of benchkit itself on the given platform (none when it is remote).
+
+    Args:
+        platform (Platform): the platform.
+
+    Returns:
+        List[int]: the thread ids.
+    """
+    if not platform.comm.is_local:
+        return []
+    return [int(tid) for tid in os.listdir("/proc/self/task")]
@@ -0,0 +1,356 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Low-overhead sampler of the system resource usage during the runs of a campaign.
+
+A single long-lived reader process (the `benchkit.helpers.linux.procfs` module, run with the
+Python interpreter of the target host, locally or through the communication layer, e.g. ssh)
+samples the counters of `/proc` periodically, and on request at the start and end of each run.
+For each record, the samples of the run are stored as a compact binary time series in the record
+data directory, and a summary is added to the result columns.
+
+Usage:
+    sampler = ResourceSampler(platform=platform)
+    benchmark = MyBench(
+        ...,
+        pre_run_hooks=[sampler.pre_run_hook],
+        post_run_hooks=[sampler.post_run_hook],
+    )
+"""
+
+import array
+import atexit
+import base64
+import itertools
+import json
+import math
+import pathlib
+import shlex
+import subprocess
+import sys
+import threading
+from typing import Dict, List
+
+from benchkit.benchmark import RecordResult, WriteRecordFileFunction
+from benchkit.helpers.linux import procfs
+from benchkit.platforms import Platform, get_current_platform
+from benchkit.utils.types import PathType
+
+SERIES_FILENAME = "resources.bin"
+SERIES_METADATA_FILENAME = "resources.json"
+
+SERIES_COLUMNS = [
+    "time_seconds",
+    "cpu_util_percent",
+    "mem_used_bytes",
+    "load1",
+    "disk_read_bytes_per_second",
+    "disk_written_bytes_per_second",
+    "net_rx_bytes_per_second",
+    "net_tx_bytes_per_second",
+] + [f"psi_{resource}_{kind}_percent" for resource, kind in procfs.PSI_STALLS]
+
+MAX_OVERHEAD_PERCENT = 1.0
+
+_MARK_TIMEOUT_SECONDS = 10.0
+
+
+def _delta(first: Dict, last: Dict, key: str, index: int) -> float:
+    if key not in first or key not in last:
+        return math.nan
+    return last[key][index] - first[key][index]
+
+
+def _psi_delta(first: Dict, last: Dict, resource: str, kind: str) -> float:
+    try:
+        return last["psi"][resource][kind] - first["psi"][resource][kind]
+    except KeyError:
+        return math.nan
+
+
+def _cpu_util_percent(first: Dict, last: Dict) -> float:
+    first_busy, first_idle = procfs.cpu_busy_idle(first["cpu"])
+    last_busy, last_idle = procfs.cpu_busy_idle(last["cpu"])
+    total = (last_busy - first_busy) + (last_idle - first_idle)
+    return 100.0 * (last_busy - first_busy) / total if total > 0 else math.nan
+
+
+def time_series(samples: List[Dict]) -> List[List[float]]:
+    """
+    Compute the time series of the resource usage between consecutive samples.
+
+    Args:
+        samples (List[Dict]): the samples of a run, as read by `procfs.read_sample`.
+
+    Returns:
+        List[List[float]]: one row per interval between two samples, with the values of
+                           `SERIES_COLUMNS` (NaN when the counters are not available).
+    """
+    rows = []
+    for first, last in zip(samples, samples[1:]):
+        seconds = last["t"] - first["t"]
+        if seconds <= 0:
+            continue
+        mem_total, mem_available = last["mem"]
+        rows.append(
+            [
+                last["t"] - samples[0]["t"],
+                _cpu_util_percent(first=first, last=last),
+                mem_total - mem_available,
+                last["load"][0],
+                _delta(first, last, "disk", 0) / seconds,
+                _delta(first, last, "disk", 1) / seconds,
+                _delta(first, last, "net", 0) / seconds,
+                _delta(first, last, "net", 1) / seconds,
+            ]
+            + [
+                100.0 * _psi_delta(first, last, resource, kind) / (1e6 * seconds)
+                for resource, kind in procfs.PSI_STALLS
+            ]
+        )
+    return rows
+
+
+def summarize(samples: List[Dict]) -> Dict[str, float]:
+    """
+    Summarize the resource usage over the samples of a run.
+
+    Args:
+        samples (List[Dict]): the samples of a run, as read by `procfs.read_sample`.
+
+    Returns:
+        Dict[str, float]: the summary columns: average CPU utilization (percentage of all the
+                          CPUs), peak used memory, maximum load, disk and network bytes, stall
+                          percentages and CPU overhead of the sampler (percentage of one CPU).
+    """
+    first, last = samples[0], samples[-1]
+    seconds = last["t"] - first["t"]
+    if seconds <= 0:
+        return {}
+
+    result = {
+        "cpu_util_avg": _cpu_util_percent(first=first, last=last),
+        "mem_used_peak": max(s["mem"][0] - s["mem"][1] for s in samples),
+        "load1_max": max(s["load"][0] for s in samples),
+        "disk_read_bytes": _delta(first, last, "disk", 0),
+        "disk_written_bytes": _delta(first, last, "disk", 1),
+        "net_rx_bytes": _delta(first, last, "net", 0),
+        "net_tx_bytes": _delta(first, last, "net", 1),
+    }
+    for resource, kind in procfs.PSI_STALLS:
+        stall = _psi_delta(first, last, resource, kind)
+        if not math.isnan(stall):
+            result[f"psi_{resource}_{kind}"] = 100.0 * stall / (1e6 * seconds)
+    result["sampler_overhead"] = 100.0 * (last["self"] - first["self"]) / seconds
+    return {f"resources/{k}": v for k, v in result.items()}
+
+
+class ResourceSampler:
+    """
+    Sampler of the system resource usage (CPU, memory, load, disk, network, pressure stalls)
+    during each run, to attach to a benchmark with its pre-run and post-run hooks.
+    """
+
+    def __init__(
+        self,
+        platform: Platform | None = None,
+        interval_seconds: float = 0.25,
+        python_path: str = "python3",
+    ) -> None:
+        """
+        Create a resource sampler.
+
+        Args:
+            platform (Platform | None, optional):
+                platform to sample, the current platform if None. Defaults to None.
+            interval_seconds (float, optional):
+                period of the samples. Defaults to 0.25.
+            python_path (str, optional):
+                Python interpreter of the remote host (a local platform uses the current
+                interpreter). Defaults to "python3".
+        """
+        self._platform = platform if platform is not None else get_current_platform()
+        self._interval_seconds = interval_seconds
+        self._python_path = python_path
+        self._process = None
+        self._reader = None
+        self._samples = []
+        self._marks = {}
+        self._pending = {}
+        self._mark_ids = itertools.count()
+        self._condition = threading.Condition()
+
+    def _reader_command(self) -> List[str] | str:
+        source = pathlib.Path(procfs.__file__).read_text()
+        if self._platform.comm.is_local:
+            return [sys.executable, "-u", "-c", source, str(self._interval_seconds)]
+        encoded = base64.b64encode(source.encode()).decode()
+        code = f'import base64;exec(base64.b64decode("{encoded}").decode())'
+        return f"{self._python_path} -u -c {shlex.quote(code)} {self._interval_seconds}"
+
+    def _start(self) -> None:
+        self._process = self._platform.comm.background_subprocess(
+            command=self._reader_command(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=None,
+            env=None,
+            stdin=subprocess.PIPE,
+        )
+        self._reader = threading.Thread(
+            target=self._read_samples,
+            name="resource-sampler",
+            daemon=True,
+        )
+        self._reader.start()
+        atexit.register(self.close)
+
+    def _read_samples(self) -> None:
+        for raw_line in self._process.stdout:
+            line = raw_line.decode().strip()
+            if not line.startswith("{"):
+                continue  # e.g. messages of ssh
+            sample = json.loads(line)
+            with self._condition:
+                self._samples.append(sample)
+                if "mark" in sample:
+                    self._marks[sample["mark"]] = sample
+                self._condition.notify_all()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _request_mark(self) -> str | None:
+        if self._process is None:
+            self._start()
+        if self._process.poll() is not None:
+            return None
+        mark = str(next(self._mark_ids))
+        try:
+            self._process.stdin.write(f"{mark}\n".encode())
+            self._process.stdin.flush()
+        except BrokenPipeError:
+            return None
+        return mark
+
+    def _wait_mark(self, mark: str) -> Dict | None:
+        process = self._process
+        with self._condition:
+            self._condition.wait_for(
+                lambda: mark in self._marks or process.poll() is not None,
+                timeout=_MARK_TIMEOUT_SECONDS,
+            )
+            return self._marks.pop(mark, None)
+
+    def _run_samples(self, start: Dict, end: Dict) -> List[Dict]:
+        with self._condition:
+            samples = self._samples
+            begin = next(i for i, s in enumerate(samples) if s is start)
+            finish = next(i for i, s in enumerate(samples) if s is end)
+            run_samples = samples[begin : finish + 1]
+
+            # drop the samples that no pending run covers anymore
+            pending_marks = set(self._pending.values())
+            keep = next(
+                (i for i, s in enumerate(samples) if s.get("mark") in pending_marks),
+                len(samples),
+            )
+            del samples[:keep]
+        return run_samples
+
+    def pre_run_hook(
+        self,
+        build_variables,
+        run_variables,
+        other_variables,
+        record_data_dir: PathType,
+    ) -> None:
+        """
+        Pre-run hook marking the start of the run.
+
+        Args:
+            build_variables: build variables of the record.
+            run_variables: run variables of the record.
+            other_variables: other variables of the record.
+            record_data_dir (PathType): data directory of the record.
+        """
+        mark = self._request_mark()
+        if mark is None:
+            print("[WARNING] The resource sampler is not running, resources are not sampled.")
+            return
+        with self._condition:
+            self._pending[pathlib.Path(record_data_dir)] = mark
+
+    def post_run_hook(
+        self,
+        experiment_results_lines: List[RecordResult],
+        record_data_dir: PathType,
+        write_record_file_fun: WriteRecordFileFunction,
+    ) -> RecordResult:
+        """
+        Post-run hook marking the end of the run, writing the time series of the resource usage
+        during the run to the record data directory and returning its summary.
+
+        Args:
+            experiment_results_lines (List[RecordResult]): results of the run.
+            record_data_dir (PathType): data directory of the record.
+            write_record_file_fun (WriteRecordFileFunction): callback to write a record file.
+
+        Returns:
+            RecordResult: the summary columns of the resource usage.
+        """
+        assert experiment_results_lines
+
+        rdd = pathlib.Path(record_data_dir)
+        with self._condition:
+            start_mark = self._pending.pop(rdd, None)
+        if start_mark is None:
+            return {}
+        end_mark = self._request_mark()
+        start = self._wait_mark(mark=start_mark)
+        end = self._wait_mark(mark=end_mark) if end_mark is not None else None
+        if start is None or end is None:
+            return {}
+
+        samples = self._run_samples(start=start, end=end)
+        rows = time_series(samples=samples)
+        series = array.array("d", itertools.chain.from_iterable(rows))
+        (rdd / SERIES_FILENAME).write_bytes(series.tobytes())
+        write_record_file_fun(
+            file_content=json.dumps(
+                {
+                    "columns": SERIES_COLUMNS,
+                    "dtype": "<f8" if "little" == sys.byteorder else ">f8",
+                    "nb_rows": len(rows),
+                    "interval_seconds": self._interval_seconds,
+                },
+                indent=2,
+            ),
+            filename=SERIES_METADATA_FILENAME,
+        )
+
+        summary = summarize(samples=samples)
+        overhead = summary.get("resources/sampler_overhead", 0.0)
+        if overhead > MAX_OVERHEAD_PERCENT:
+            print(
+                f"[WARNING] The resource sampler used {overhead:.2f}% of a CPU during the run, "
+                "consider increasing its interval."
+            )
+        return summary
+
+    def close(self) -> None:
+        """
+        Stop the reader process.
+        """
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            process.wait(timeout=_MARK_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        self._reader.join()
+        atexit.unregister(self.close)
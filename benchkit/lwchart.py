@@ -178,13 +178,31 @@ def _read_csv(
     csv_pathname: PathType,
     nan_replace: bool,
 ):
-    result = pd.read_csv(
-        csv_pathname,
-        sep=";",
-        comment="#",
-        engine="python",
-        keep_default_na=nan_replace,  # when True, input values "None" are interpreted as "NaN"
-    )
+    if ".parquet" == pathlib.Path(csv_pathname).suffix:
+        return _read_parquet(parquet_pathname=csv_pathname, nan_replace=nan_replace)
+
+    read_kwargs = {
+        "sep": ";",
+        "comment": "#",
+        "keep_default_na": nan_replace,  # when True, input values "None" are interpreted as "NaN"
+    }
+    try:
+        result = pd.read_csv(csv_pathname, engine="c", **read_kwargs)
+    except pd.errors.ParserError:
+        # the python engine is slower but more tolerant to irregular lines
+        result = pd.read_csv(csv_pathname, engine="python", **read_kwargs)
+    return result
+
+
+def _read_parquet(
+    parquet_pathname: PathType,
+    nan_replace: bool,
+):
+    result = pd.read_parquet(parquet_pathname)
+    if not nan_replace:
+        # as for the CSV files read without NaN replacement, missing strings are empty strings
+        object_columns = result.select_dtypes(include="object").columns
+        result[object_columns] = result[object_columns].fillna("")
     return result
 
 
@@ -201,7 +219,7 @@ def generate_chart_from_single_csv(
 
     Args:
         csv_pathname (PathType):
-            path to the CSV file.
+            path to the CSV file (or to the Parquet file).
         plot_name (str | List[str]):
             name of the (Seaborn) plot to generate.
         output_dir (PathType, optional):
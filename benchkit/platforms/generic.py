@@ -4,14 +4,15 @@
 Module for the representation of generic platforms that can be derived into actual platforms.
 """
 
-from typing import List
+from typing import Dict, List, Set
 
 from benchkit.communication import CommunicationLayer
 from benchkit.platforms import evenorder
 from benchkit.platforms.utils import (
-    get_nb_cpus_active,
-    get_nb_cpus_isolated,
+    get_cpus_isolated,
+    get_memory_total_bytes,
     get_nb_cpus_total,
+    get_numa_nodes_cpus,
 )
 from benchkit.utils import lscpu
 
@@ -30,6 +31,10 @@ class Platform:
         self._architecture = None
         self._lscpu = None
         self._nb_hyperthreads_per_core = None
+        self._nb_cpus_total = None
+        self._isolated_cpus = None
+        self._numa_nodes_cpus = None
+        self._memory_total_bytes = None
 
     @property
     def comm(self) -> CommunicationLayer:
@@ -42,11 +47,46 @@ class Platform:
         """
         return self._comm_layer
 
+    def close(self) -> None:
+        """
+        Release the resources held by the platform (e.g. the persistent connection to a remote
+        host). The platform remains usable, the resources are acquired again if needed.
+        """
+        self._comm_layer.close()
+
     def _get_lscpu(self) -> lscpu.LsCpu:
         if self._lscpu is None:
             self._lscpu = lscpu.LsCpu(comm_layer=self.comm)
         return self._lscpu
 
+    def _get_nb_cpus_total(self) -> int:
+        if self._nb_cpus_total is None:
+            self._nb_cpus_total = get_nb_cpus_total(comm_layer=self.comm)
+        return self._nb_cpus_total
+
+    def _get_isolated_cpus(self) -> Set[int]:
+        if self._isolated_cpus is None:
+            self._isolated_cpus = get_cpus_isolated(comm_layer=self.comm)
+        return self._isolated_cpus
+
+    def _get_numa_nodes_cpus(self) -> Dict[int, List[int]]:
+        if self._numa_nodes_cpus is None:
+            self._numa_nodes_cpus = get_numa_nodes_cpus(comm_layer=self.comm)
+        return self._numa_nodes_cpus
+
+    def invalidate_topology(self) -> None:
+        """
+        Drop the snapshot of the platform topology (number of CPUs, isolated CPUs, lscpu output).
+        The topology is queried once on the host and then reused by all the calls, this function
+        must be called when it may have changed, e.g. after a CPU hotplug or a reboot of the host.
+        """
+        self._lscpu = None
+        self._nb_hyperthreads_per_core = None
+        self._nb_cpus_total = None
+        self._isolated_cpus = None
+        self._numa_nodes_cpus = None
+        self._memory_total_bytes = None
+
     def nb_cpus_per_cache_partition(self) -> int:
         """
         Get the number of CPUs in one cache partition (or cache group).
@@ -119,7 +159,7 @@ class Platform:
         Returns:
             int: the total number of CPUs of the platform.
         """
-        result = get_nb_cpus_total(comm_layer=self.comm)
+        result = self._get_nb_cpus_total()
         return result
 
     def nb_active_cpus(self) -> int:
@@ -130,7 +170,7 @@ class Platform:
             int: the number of CPUs of the platform that are active (not isolated).
         """
         # does not count the isolated CPUs in the count
-        result = get_nb_cpus_active(comm_layer=self.comm)
+        result = self._get_nb_cpus_total() - len(self._get_isolated_cpus())
         return result
 
     def nb_isolated_cpus(self) -> int:
@@ -141,7 +181,17 @@ class Platform:
             int: the number of CPUs of the platform that are isolated (not active).
         """
         # does *only* count the isolated CPUs in the count
-        result = get_nb_cpus_isolated(comm_layer=self.comm)
+        result = len(self._get_isolated_cpus())
+        return result
+
+    def isolated_cpus(self) -> List[int]:
+        """
+        Get the identifiers of the CPUs of the platform that are isolated (not active).
+
+        Returns:
+            List[int]: the sorted identifiers of the isolated CPUs of the platform.
+        """
+        result = sorted(self._get_isolated_cpus())
         return result
 
     def nb_hyperthreaded_cores(self) -> int:
@@ -176,6 +226,32 @@ class Platform:
         """
         return self._get_lscpu().numa_nodes()
 
+    def numa_nodes_cpus(self) -> Dict[int, List[int]]:
+        """
+        Get the CPUs of each NUMA node of the platform.
+        When the operating system does not provide this information, all the CPUs are considered
+        to belong to a single NUMA node.
+
+        Returns:
+            Dict[int, List[int]]:
+                the sorted identifiers of the CPUs of each NUMA node, by NUMA node identifier.
+        """
+        result = self._get_numa_nodes_cpus()
+        if not result:
+            result = {0: list(range(self.nb_cpus()))}
+        return {node: list(cpus) for node, cpus in result.items()}
+
+    def memory_total_bytes(self) -> int | None:
+        """
+        Get the total amount of memory of the platform.
+
+        Returns:
+            int | None: the total amount of memory in bytes, None if it is unknown.
+        """
+        if self._memory_total_bytes is None:
+            self._memory_total_bytes = get_memory_total_bytes(comm_layer=self.comm)
+        return self._memory_total_bytes
+
     def nb_packages(self) -> int:
         """
         Get the total number of packages (or sockets) of the platform.
@@ -5,7 +5,9 @@ Utilities related to platform modules.
 """
 
 import os
-from typing import Set
+import re
+from subprocess import CalledProcessError
+from typing import Dict, List, Set
 
 from benchkit.communication import CommunicationLayer
 
@@ -79,23 +81,92 @@ def get_nb_cpus_total(comm_layer: CommunicationLayer) -> int:
     return result1
 
 
-def get_nb_cpus_isolated(comm_layer: CommunicationLayer) -> int:
-    """Get the number of CPUs that are currently isolated on the provided host.
+def get_cpus_isolated(comm_layer: CommunicationLayer) -> Set[int]:
+    """Get the set of CPUs that are currently isolated on the provided host.
 
     Args:
         comm_layer (CommunicationLayer): communication layer of the provided host.
 
     Returns:
-        int: the number of CPUs that are currently isolated on the provided host.
+        Set[int]: the identifiers of the CPUs that are currently isolated on the provided host.
     """
     # Some operating systems might not provide this information
     try:
         isolated_str = comm_layer.read_file("/sys/devices/system/cpu/isolated").strip()
     except FileNotFoundError:
-        return 0
+        return set()
 
     isolated_cpus = _parse_list_ranges(list_ranges=isolated_str)
 
+    return isolated_cpus
+
+
+def get_numa_nodes_cpus(comm_layer: CommunicationLayer) -> Dict[int, List[int]]:
+    """Get the CPUs of each NUMA node of the provided host.
+
+    Args:
+        comm_layer (CommunicationLayer): communication layer of the provided host.
+
+    Returns:
+        Dict[int, List[int]]:
+            the sorted identifiers of the CPUs of each NUMA node, by NUMA node identifier.
+            An empty dictionary if the operating system does not provide this information.
+    """
+    try:
+        output = comm_layer.shell(
+            command="grep -H . /sys/devices/system/node/node*/cpulist",
+            shell=True,
+            print_input=False,
+            print_output=False,
+        )
+    except (CalledProcessError, FileNotFoundError):
+        return {}
+
+    result = {}
+    for line in output.splitlines():
+        match = re.match(r".*/node(\d+)/cpulist:(.*)", line.strip())
+        if match is not None:
+            node_cpus = _parse_list_ranges(list_ranges=match.group(2).strip())
+            if node_cpus:  # memory-only nodes have no CPU
+                result[int(match.group(1))] = sorted(node_cpus)
+
+    return result
+
+
+def get_memory_total_bytes(comm_layer: CommunicationLayer) -> int | None:
+    """Get the total amount of memory of the provided host.
+
+    Args:
+        comm_layer (CommunicationLayer): communication layer of the provided host.
+
+    Returns:
+        int | None:
+            the total amount of memory, in bytes, or None if the operating system does not
+            provide this information.
+    """
+    try:
+        meminfo = comm_layer.read_file("/proc/meminfo")
+    except FileNotFoundError:
+        return None
+
+    match = re.search(r"^MemTotal:\s+(\d+) kB", meminfo, flags=re.MULTILINE)
+    if match is None:
+        return None
+
+    return int(match.group(1)) * 1024
+
+
+def get_nb_cpus_isolated(comm_layer: CommunicationLayer) -> int:
+    """Get the number of CPUs that are currently isolated on the provided host.
+
+    Args:
+        comm_layer (CommunicationLayer): communication layer of the provided host.
+
+    Returns:
+        int: the number of CPUs that are currently isolated on the provided host.
+    """
+    isolated_cpus = get_cpus_isolated(comm_layer=comm_layer)
+
     return len(isolated_cpus)
 
 
@@ -113,3 +184,36 @@ def get_nb_cpus_active(comm_layer: CommunicationLayer) -> int:
     nb_cpus_active = nb_cpus_total - nb_cpus_isolated
 
     return nb_cpus_active
+
+
+def partition_cpus(
+    cpus: List[int],
+    nb_partitions: int,
+) -> List[List[int]]:
+    """
+    Split the given list of CPUs into disjoint partitions of equal size.
+    Remaining CPUs (when the number of CPUs is not a multiple of the number of partitions) are left
+    out, such that all the partitions have the same capacity.
+
+    Args:
+        cpus (List[int]): identifiers of the CPUs to split.
+        nb_partitions (int): number of partitions to create.
+
+    Raises:
+        ValueError: if there are not enough CPUs to create the requested number of partitions.
+
+    Returns:
+        List[List[int]]: the list of disjoint partitions.
+    """
+    if nb_partitions < 1:
+        raise ValueError(f"Invalid number of CPU partitions: {nb_partitions}")
+
+    nb_cpus_per_partition = len(cpus) // nb_partitions
+    if nb_cpus_per_partition < 1:
+        raise ValueError(f"Cannot split {len(cpus)} CPUs into {nb_partitions} disjoint partitions.")
+
+    result = [
+        cpus[i * nb_cpus_per_partition : (i + 1) * nb_cpus_per_partition]
+        for i in range(nb_partitions)
+    ]
+    return result
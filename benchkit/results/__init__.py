@@ -0,0 +1,5 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Handling of the results produced by the benchmarks of a campaign.
+"""
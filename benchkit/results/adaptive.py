@@ -0,0 +1,152 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Adaptive number of repetitions of the records of a campaign.
+A record is repeated until the chosen metric is known with enough precision, measured either as the
+relative half-width of its confidence interval or as its coefficient of variation.
+"""
+
+import math
+import statistics
+from typing import List
+
+# Two-sided quantiles of the Student t-distribution, by confidence level and degrees of freedom
+# (1 to 30). Above 30 degrees of freedom, the normal distribution quantile is used.
+_T_QUANTILES = {
+    0.90: [
+        6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812,
+        1.796, 1.782, 1.771, 1.761, 1.753, 1.746, 1.740, 1.734, 1.729, 1.725,
+        1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697,
+    ],  # fmt: skip
+    0.95: [
+        12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+    ],  # fmt: skip
+    0.99: [
+        63.657, 9.925, 5.841, 4.604, 4.032, 3.707, 3.499, 3.355, 3.250, 3.169,
+        3.106, 3.055, 3.012, 2.977, 2.947, 2.921, 2.898, 2.878, 2.861, 2.845,
+        2.831, 2.819, 2.807, 2.797, 2.787, 2.779, 2.771, 2.763, 2.756, 2.750,
+    ],  # fmt: skip
+}
+_Z_QUANTILES = {0.90: 1.645, 0.95: 1.960, 0.99: 2.576}
+
+
+def t_quantile(confidence: float, degrees_of_freedom: int) -> float:
+    """
+    Get the two-sided quantile of the Student t-distribution.
+
+    Args:
+        confidence (float): confidence level, one of 0.90, 0.95 or 0.99.
+        degrees_of_freedom (int): degrees of freedom of the distribution (at least 1).
+
+    Raises:
+        ValueError: if the confidence level is not supported.
+
+    Returns:
+        float: the quantile of the distribution.
+    """
+    if confidence not in _T_QUANTILES:
+        supported_str = ", ".join(map(str, _T_QUANTILES))
+        raise ValueError(f"Unsupported confidence level {confidence}, use one of: {supported_str}")
+
+    quantiles = _T_QUANTILES[confidence]
+    if degrees_of_freedom <= len(quantiles):
+        return quantiles[degrees_of_freedom - 1]
+    return _Z_QUANTILES[confidence]
+
+
+class AdaptiveRepetitions:
+    """
+    Policy deciding how many times a record is repeated.
+    A record is repeated at least `min_runs` times and at most `max_runs` times, and stops as soon
+    as the precision of the metric reaches the target.
+    """
+
+    CRITERIA = ("ci", "cv")
+
+    def __init__(
+        self,
+        metric: str,
+        target: float = 0.05,
+        criterion: str = "ci",
+        min_runs: int = 3,
+        max_runs: int = 30,
+        confidence: float = 0.95,
+    ) -> None:
+        """
+        Create the adaptive repetition policy.
+
+        Args:
+            metric (str):
+                name of the result column used to decide when to stop.
+            target (float, optional):
+                precision to reach, as a fraction of the mean (e.g. 0.05 for 5%).
+                Defaults to 0.05.
+            criterion (str, optional):
+                "ci" to use the relative half-width of the confidence interval of the mean, or
+                "cv" to use the coefficient of variation. Defaults to "ci".
+            min_runs (int, optional):
+                minimum number of repetitions of each record (at least 2). Defaults to 3.
+            max_runs (int, optional):
+                maximum number of repetitions of each record. Defaults to 30.
+            confidence (float, optional):
+                confidence level of the interval (0.90, 0.95 or 0.99). Defaults to 0.95.
+
+        Raises:
+            ValueError: if the parameters are inconsistent.
+        """
+        if criterion not in self.CRITERIA:
+            raise ValueError(f"Unknown criterion {criterion}, use one of: {self.CRITERIA}")
+        if min_runs < 2:
+            raise ValueError("At least 2 runs are required to estimate the variability")
+        if max_runs < min_runs:
+            raise ValueError(f"max_runs ({max_runs}) is smaller than min_runs ({min_runs})")
+        if target <= 0:
+            raise ValueError(f"Invalid target precision: {target}")
+        t_quantile(confidence=confidence, degrees_of_freedom=1)  # check the confidence level
+
+        self.metric = metric
+        self.target = target
+        self.criterion = criterion
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+        self.confidence = confidence
+
+    def precision(self, values: List[float]) -> float:
+        """
+        Compute the current precision of the metric, relative to its mean.
+
+        Args:
+            values (List[float]): values of the metric measured so far (at least 2).
+
+        Returns:
+            float: the relative precision, infinite if the mean is zero.
+        """
+        mean = statistics.fmean(values)
+        stdev = statistics.stdev(values)
+        if 0 == mean:
+            return 0.0 if 0 == stdev else math.inf
+
+        if "cv" == self.criterion:
+            return stdev / abs(mean)
+
+        quantile = t_quantile(confidence=self.confidence, degrees_of_freedom=len(values) - 1)
+        half_width = quantile * stdev / math.sqrt(len(values))
+        return half_width / abs(mean)
+
+    def is_done(self, values: List[float]) -> bool:
+        """
+        Return whether the record has been repeated enough.
+
+        Args:
+            values (List[float]): values of the metric measured so far.
+
+        Returns:
+            bool: whether the record has been repeated enough.
+        """
+        if len(values) >= self.max_runs:
+            return True
+        if len(values) < self.min_runs:
+            return False
+        return self.precision(values) <= self.target
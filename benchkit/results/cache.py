@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Index of the results already recorded in the CSV output of a campaign.
+It enables to skip the executions that have already been done when a campaign is continued.
+"""
+
+import pathlib
+from typing import Any, Dict, FrozenSet, List, Mapping, Tuple
+
+from benchkit.utils.misc import CSV_SEPARATOR
+
+ResultCacheKey = Tuple[str, ...]
+
+
+class ResultCache:
+    """
+    Hash index over the rows of a campaign CSV output.
+
+    A record to run is cached if there is a row whose values are equal to the ones of the record
+    for all the columns shared by the record and the CSV header. An index is built once for each
+    distinct set of shared columns (usually a single one per campaign), such that each lookup is
+    then done in constant time.
+    """
+
+    def __init__(
+        self,
+        header: List[str],
+        rows: List[List[str]],
+    ) -> None:
+        nb_columns = len(header)
+        self._header = header
+        self._header_set = frozenset(header)
+        self._column_index = {column: i for i, column in enumerate(header)}
+        # Rows with missing values cannot be hashed on all the columns,
+        # a missing value matches any value, as done by the linear scan.
+        self._rows = [row[:nb_columns] for row in rows if len(row) >= nb_columns]
+        self._partial_rows = [dict(zip(header, row)) for row in rows if len(row) < nb_columns]
+        self._indexes: Dict[FrozenSet[str], Dict[ResultCacheKey, int]] = {}
+
+    @classmethod
+    def empty(cls) -> "ResultCache":
+        """
+        Create a result cache that contains no record.
+
+        Returns:
+            ResultCache: an empty result cache.
+        """
+        return cls(header=[], rows=[])
+
+    @classmethod
+    def from_csv(cls, csv_path: pathlib.Path) -> "ResultCache":
+        """
+        Build the result cache from the given campaign CSV output.
+        Comment lines (starting with '#') are ignored, the first remaining line is the header.
+        A last line without end of line (half-written when the campaign crashed) is ignored.
+
+        Args:
+            csv_path (pathlib.Path): path to the CSV output of the campaign.
+
+        Returns:
+            ResultCache: the result cache with the rows of the given file.
+        """
+        with open(csv_path, "r") as csv_file:
+            all_lines = csv_file.readlines()
+        if all_lines and not all_lines[-1].endswith("\n"):
+            all_lines.pop()
+        lines = [line.strip() for line in all_lines if not line.strip().startswith("#")]
+
+        if not lines:
+            return cls.empty()
+
+        header = lines[0].split(CSV_SEPARATOR)
+        rows = [line.split(CSV_SEPARATOR) for line in lines[1:]]
+        return cls(header=header, rows=rows)
+
+    @classmethod
+    def from_lines(cls, lines: List[Dict[str, Any]]) -> "ResultCache":
+        """
+        Build the result cache from result lines, e.g. the ones recorded in a campaign journal.
+
+        Args:
+            lines (List[Dict[str, Any]]): the result lines, mapping the columns to their values.
+
+        Returns:
+            ResultCache: the result cache with the given lines.
+        """
+        header = list(dict.fromkeys(column for line in lines for column in line))
+        result = cls(header=header, rows=[])
+        for line in lines:
+            if len(line) == len(header):
+                result._rows.append([str(line[column]) for column in header])
+            else:
+                # as for truncated CSV rows, the missing values match any value
+                result._partial_rows.append({k: str(v) for k, v in line.items()})
+        return result
+
+    @property
+    def header(self) -> List[str]:
+        """
+        Get the columns of the CSV output the cache is built from.
+
+        Returns:
+            List[str]: the columns of the CSV output, empty if there is no header.
+        """
+        return self._header
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._partial_rows)
+
+    def __contains__(self, record: Mapping[str, str]) -> bool:
+        return self.lookup(record=record) is not None
+
+    def lookup(self, record: Mapping[str, str]) -> Dict[str, str] | None:
+        """
+        Get the row matching the given record, if any.
+
+        Args:
+            record (Mapping[str, str]): the record to look for, with its values stringified.
+
+        Returns:
+            Dict[str, str] | None: the matching row (column to value), None if there is none.
+        """
+        columns = self._header_set.intersection(record.keys())
+        key = self._key(columns=columns, record=record)
+        row_id = self._index(columns=columns).get(key)
+        if row_id is not None:
+            return dict(zip(self._header, self._rows[row_id]))
+
+        for row in self._partial_rows:
+            if all(row[k] == record[k] for k in columns if k in row):
+                return dict(row)
+        return None
+
+    def _index(self, columns: FrozenSet[str]) -> Dict[ResultCacheKey, int]:
+        if columns not in self._indexes:
+            positions = [self._column_index[column] for column in sorted(columns)]
+            index = {}
+            for row_id, row in enumerate(self._rows):
+                index.setdefault(tuple(row[p] for p in positions), row_id)
+            self._indexes[columns] = index
+        return self._indexes[columns]
+
+    @staticmethod
+    def _key(
+        columns: FrozenSet[str],
+        record: Mapping[str, str],
+    ) -> ResultCacheKey:
+        return tuple(record[column] for column in sorted(columns))
@@ -0,0 +1,256 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Model of the wall time of the runs of a campaign, learned from the measured runs.
+
+The duration of a run is predicted from the parameters of its record: records already measured
+get the mean of their durations, the others get the prediction of a power-law model fitted by
+least squares in log space (log duration as a linear function of the log of each numeric
+parameter, e.g. the problem size or the number of threads, and of an indicator for each value of
+the other parameters). The measured durations can be stored in a JSON lines file, such that the
+model is reused by the next executions of the campaign.
+"""
+
+import json
+import math
+import pathlib
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+from benchkit.utils.types import PathType
+
+# small ridge regularization, keeps the fit defined when parameters are collinear
+_RIDGE_LAMBDA = 1e-6
+_MAX_LOG_SECONDS = 50.0
+
+RecordKey = Tuple[Tuple[str, str], ...]
+
+
+def record_key(record: Dict[str, Any]) -> RecordKey:
+    """
+    Get the key identifying the given record, independently of the order and type of its values.
+
+    Args:
+        record (Dict[str, Any]): parameters of the record.
+
+    Returns:
+        RecordKey: the key of the record.
+    """
+    return tuple(sorted((name, str(value)) for name, value in record.items()))
+
+
+def _is_numeric(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    # Gaussian elimination with partial pivoting, the matrix is small and positive definite
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(size)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_value = rows[col][col]
+        if 0 == pivot_value:
+            continue
+        for r in range(col + 1, size):
+            factor = rows[r][col] / pivot_value
+            if factor:
+                for c in range(col, size + 1):
+                    rows[r][c] -= factor * rows[col][c]
+
+    solution = [0.0] * size
+    for row in reversed(range(size)):
+        if 0 == rows[row][row]:
+            continue
+        remainder = rows[row][size] - sum(rows[row][c] * solution[c] for c in range(row + 1, size))
+        solution[row] = remainder / rows[row][row]
+    return solution
+
+
+class RunDurationModel:
+    """
+    Model of the wall time (in seconds) of a single run of a record, learned from the durations
+    observed so far. The model is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        model_path: PathType | None = None,
+    ) -> None:
+        """
+        Create the run duration model, loading the durations already stored in the model file.
+
+        Args:
+            model_path (PathType | None, optional):
+                path to the JSON lines file where the measured durations are stored, to reuse them
+                in the next executions. The model is only kept in memory if None.
+                Defaults to None.
+        """
+        self._model_path = pathlib.Path(model_path) if model_path is not None else None
+        self._lock = threading.Lock()
+        self._nb_observations = 0
+        self._total_seconds = 0.0
+        self._durations_by_key: Dict[RecordKey, List[float]] = {}
+        self._values_by_name: Dict[str, Set[str]] = {}
+        # sums of the normal equations of the least squares fit, updated with each observation
+        self._gram: Dict[Tuple[str, str], float] = {}
+        self._moments: Dict[str, float] = {}
+        self._coefficients: Dict[str, float] | None = None
+        self._predictions: Dict[RecordKey, float | None] = {}
+
+        if self._model_path is not None and self._model_path.is_file():
+            with open(self._model_path, "r") as model_file:
+                for line in model_file:
+                    if not line.strip():
+                        continue
+                    try:
+                        observation = json.loads(line)
+                        record = observation["record"]
+                        duration_seconds = float(observation["duration_seconds"])
+                    except (ValueError, KeyError, TypeError):
+                        # e.g. a line truncated by an interrupted execution
+                        continue
+                    self._add(record=record, duration_seconds=duration_seconds)
+
+    @property
+    def nb_observations(self) -> int:
+        """
+        Get the number of durations observed so far.
+
+        Returns:
+            int: the number of durations observed so far.
+        """
+        with self._lock:
+            return self._nb_observations
+
+    @property
+    def mean_seconds(self) -> float | None:
+        """
+        Get the mean of the durations observed so far, over all the records.
+
+        Returns:
+            float | None: the mean duration in seconds, None if nothing was observed yet.
+        """
+        with self._lock:
+            if 0 == self._nb_observations:
+                return None
+            return self._total_seconds / self._nb_observations
+
+    def observe(
+        self,
+        record: Dict[str, Any],
+        duration_seconds: float,
+    ) -> None:
+        """
+        Add the measured duration of a run of the given record to the model.
+
+        Args:
+            record (Dict[str, Any]): parameters of the record.
+            duration_seconds (float): measured wall time of the run, in seconds.
+        """
+        with self._lock:
+            self._add(record=record, duration_seconds=duration_seconds)
+            if self._model_path is not None:
+                with open(self._model_path, "a") as model_file:
+                    observation = {"record": record, "duration_seconds": duration_seconds}
+                    model_file.write(json.dumps(observation, default=str) + "\n")
+
+    def predict(self, record: Dict[str, Any]) -> float | None:
+        """
+        Predict the duration of a single run of the given record.
+
+        Args:
+            record (Dict[str, Any]): parameters of the record.
+
+        Returns:
+            float | None: the predicted duration in seconds, None if nothing was observed yet.
+        """
+        key = record_key(record)
+        with self._lock:
+            if key not in self._predictions:
+                self._predictions[key] = self._predict(key=key, record=record)
+            return self._predictions[key]
+
+    def knows(self, record: Dict[str, Any]) -> bool:
+        """
+        Return whether the prediction for the given record relies on measured durations of that
+        record, or on a fitted model that does not extrapolate along a parameter never seen varying:
+        each parameter must have been observed with the value of the record, or, if numeric, with
+        at least two different values.
+
+        Args:
+            record (Dict[str, Any]): parameters of the record.
+
+        Returns:
+            bool: whether the prediction is specific to the record.
+        """
+        with self._lock:
+            if record_key(record) in self._durations_by_key:
+                return True
+            for name, value in record.items():
+                values = self._values_by_name.get(name, set())
+                if str(value) not in values and not (_is_numeric(value) and len(values) > 1):
+                    return False
+            return len(self._durations_by_key) > 1
+
+    def _add(self, record: Dict[str, Any], duration_seconds: float) -> None:
+        duration_seconds = max(duration_seconds, 1e-6)
+        self._nb_observations += 1
+        self._total_seconds += duration_seconds
+        self._durations_by_key.setdefault(record_key(record), []).append(duration_seconds)
+        for name, value in record.items():
+            self._values_by_name.setdefault(name, set()).add(str(value))
+
+        features = self._features(record)
+        log_seconds = math.log(duration_seconds)
+        for name_i, value_i in features.items():
+            self._moments[name_i] = self._moments.get(name_i, 0.0) + value_i * log_seconds
+            for name_j, value_j in features.items():
+                self._gram[name_i, name_j] = (
+                    self._gram.get((name_i, name_j), 0.0) + value_i * value_j
+                )
+        self._coefficients = None
+        self._predictions = {}
+
+    def _predict(self, key: RecordKey, record: Dict[str, Any]) -> float | None:
+        if 0 == self._nb_observations:
+            return None
+
+        durations = self._durations_by_key.get(key)
+        if durations:
+            return sum(durations) / len(durations)
+
+        if len(self._durations_by_key) < 2:
+            return self._total_seconds / self._nb_observations
+
+        if self._coefficients is None:
+            self._coefficients = self._fit()
+        features = self._features(record)
+        log_seconds = sum(
+            coefficient * features.get(name, 0.0)
+            for name, coefficient in self._coefficients.items()
+        )
+        return math.exp(min(log_seconds, _MAX_LOG_SECONDS))
+
+    @staticmethod
+    def _features(record: Dict[str, Any]) -> Dict[str, float]:
+        features = {"": 1.0}  # intercept
+        for name, value in record.items():
+            if _is_numeric(value):
+                features[name] = math.log1p(value)
+            else:
+                features[f"{name}={value}"] = 1.0
+        return features
+
+    def _fit(self) -> Dict[str, float]:
+        # the cost only depends on the number of features, not on the number of observations
+        names = list(self._moments)
+        size = len(names)
+
+        matrix = [[self._gram.get((name_i, name_j), 0.0) for name_j in names] for name_i in names]
+        vector = [self._moments[name] for name in names]
+        for i in range(size):
+            matrix[i][i] += _RIDGE_LAMBDA
+
+        return dict(zip(names, _solve(matrix=matrix, vector=vector)))
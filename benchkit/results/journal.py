@@ -0,0 +1,315 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Append-only journal of the executions of a campaign.
+
+Each entry of the journal is a single line "<length>:<crc32>:<json payload>". An entry is only
+valid if its payload has the announced length and checksum, such that an entry half-written when
+the campaign crashed is detected and dropped (with everything after it) when the journal is
+reopened. The journal records when each execution starts, completes (with its result lines) or
+fails, and the comments of the CSV output. It is the source of truth to resume a campaign: the
+executions that completed are known without parsing the CSV output, the executions that started
+but did not complete are run again, and the CSV output can be regenerated from the journal.
+"""
+
+import json
+import os
+import pathlib
+import threading
+import zlib
+from typing import Any, Dict, List, Tuple
+
+from benchkit.results.cache import ResultCache
+from benchkit.results.sink import CsvResultSink, FlushPolicy
+from benchkit.utils.types import PathType
+
+_ENTRY_HEADER = "header"
+_ENTRY_COMMENT = "comment"
+_ENTRY_START = "start"
+_ENTRY_DONE = "done"
+_ENTRY_FAILED = "failed"
+
+ExecutionKey = Tuple[Tuple[str, str], ...]
+
+
+def _execution_key(execution: Dict[str, str]) -> ExecutionKey:
+    return tuple(sorted((k, str(v)) for k, v in execution.items()))
+
+
+def _encode(entry: Dict[str, Any]) -> bytes:
+    payload = json.dumps(entry, default=str).encode()
+    return f"{len(payload)}:{zlib.crc32(payload):08x}:".encode() + payload + b"\n"
+
+
+def _decode(raw: bytes) -> Dict[str, Any] | None:
+    if not raw.endswith(b"\n"):
+        return None
+    try:
+        length_str, crc_str, payload = raw[:-1].split(b":", 2)
+        if int(length_str) != len(payload) or int(crc_str, 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+class CampaignJournal:
+    """
+    Append-only, checksummed journal of the executions of a campaign.
+    The journal is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        journal_path: PathType,
+        fsync: bool = True,
+    ) -> None:
+        """
+        Create the journal, the file is only opened by `open()`.
+
+        Args:
+            journal_path (PathType):
+                path to the journal file.
+            fsync (bool, optional):
+                whether to synchronize the file to the storage device each time an execution
+                completes or fails. Defaults to True.
+        """
+        self._journal_path = pathlib.Path(journal_path)
+        self._fsync = fsync
+        self._file = None
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = []
+        self._status: Dict[ExecutionKey, Tuple[str, Dict[str, str]]] = {}
+        self._nb_dropped_bytes = 0
+
+    @property
+    def is_new(self) -> bool:
+        """
+        Get whether the journal has no valid entry.
+
+        Returns:
+            bool: whether the journal is empty.
+        """
+        return not self._entries
+
+    @property
+    def nb_dropped_bytes(self) -> int:
+        """
+        Get the size of the invalid tail (e.g. a half-written entry) dropped when opening.
+
+        Returns:
+            int: the number of dropped bytes.
+        """
+        return self._nb_dropped_bytes
+
+    def open(self, reset: bool = False) -> "CampaignJournal":
+        """
+        Open the journal for appending, after loading its valid entries.
+
+        Args:
+            reset (bool, optional):
+                whether to discard the existing entries. Defaults to False.
+
+        Returns:
+            CampaignJournal: the journal itself.
+        """
+        self._entries = []
+        self._status = {}
+        self._nb_dropped_bytes = 0
+        valid_size = 0
+        if self._journal_path.is_file() and not reset:
+            with open(self._journal_path, "rb") as journal_file:
+                for raw in journal_file:
+                    entry = _decode(raw)
+                    if entry is None:
+                        break
+                    self._replay(entry)
+                    valid_size += len(raw)
+            self._nb_dropped_bytes = self._journal_path.stat().st_size - valid_size
+
+        self._file = open(self._journal_path, "ab")
+        # the invalid tail is dropped, new entries are appended after the last valid one
+        self._file.truncate(valid_size)
+        return self
+
+    def close(self) -> None:
+        """
+        Synchronize and close the journal.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "CampaignJournal":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write_header(self, header: str, max_nb_threads: int) -> None:
+        """
+        Record the comment header of the CSV output.
+
+        Args:
+            header (str): the comment lines of the header.
+            max_nb_threads (int): number of `thread_<i>` columns of the CSV output.
+        """
+        self._append(
+            {
+                "type": _ENTRY_HEADER,
+                "comments": self._comments(text=header),
+                "max_nb_threads": max_nb_threads,
+            }
+        )
+
+    def write_comments(self, text: str) -> None:
+        """
+        Record comment lines of the CSV output (e.g. its footer).
+
+        Args:
+            text (str): the comment lines.
+        """
+        self._append({"type": _ENTRY_COMMENT, "comments": self._comments(text=text)})
+
+    def record_started(self, execution: Dict[str, str]) -> None:
+        """
+        Record that an execution starts.
+
+        Args:
+            execution (Dict[str, str]): the parameters of the execution, stringified.
+        """
+        self._append({"type": _ENTRY_START, "execution": execution})
+
+    def record_done(self, execution: Dict[str, str], results_lines: List[Dict[str, Any]]) -> None:
+        """
+        Record that an execution completed, with its result lines.
+
+        Args:
+            execution (Dict[str, str]): the parameters of the execution, stringified.
+            results_lines (List[Dict[str, Any]]): the result lines of the execution.
+        """
+        self._append(
+            {"type": _ENTRY_DONE, "execution": execution, "lines": results_lines},
+            sync=self._fsync,
+        )
+
+    def record_failed(self, execution: Dict[str, str], error: str) -> None:
+        """
+        Record that an execution failed, it is run again when the campaign is resumed.
+
+        Args:
+            execution (Dict[str, str]): the parameters of the execution, stringified.
+            error (str): description of the error.
+        """
+        self._append(
+            {"type": _ENTRY_FAILED, "execution": execution, "error": error},
+            sync=self._fsync,
+        )
+
+    def interrupted(self) -> List[Dict[str, str]]:
+        """
+        Get the executions that started but neither completed nor failed, e.g. because the
+        campaign crashed while running them.
+
+        Returns:
+            List[Dict[str, str]]: the parameters of the interrupted executions.
+        """
+        with self._lock:
+            return [e for status, e in self._status.values() if _ENTRY_START == status]
+
+    def failed(self) -> List[Dict[str, str]]:
+        """
+        Get the executions whose last attempt failed.
+
+        Returns:
+            List[Dict[str, str]]: the parameters of the failed executions.
+        """
+        with self._lock:
+            return [e for status, e in self._status.values() if _ENTRY_FAILED == status]
+
+    def results_lines(self) -> List[Dict[str, Any]]:
+        """
+        Get the result lines of all the completed executions, in order of completion.
+
+        Returns:
+            List[Dict[str, Any]]: the result lines.
+        """
+        with self._lock:
+            return [
+                line
+                for entry in self._entries
+                if _ENTRY_DONE == entry["type"]
+                for line in entry["lines"]
+            ]
+
+    def result_cache(self) -> ResultCache:
+        """
+        Build the index of the completed executions, to skip them when resuming the campaign.
+
+        Returns:
+            ResultCache: the index of the result lines of the completed executions.
+        """
+        return ResultCache.from_lines(lines=self.results_lines())
+
+    def regenerate_csv(self, csv_path: PathType) -> int:
+        """
+        Write the CSV output of the campaign from the journal, replacing the given file.
+
+        Args:
+            csv_path (PathType): path to the CSV output to write.
+
+        Returns:
+            int: the number of result lines written.
+        """
+        with self._lock:
+            entries = list(self._entries)
+
+        max_nb_threads = next(
+            (e["max_nb_threads"] for e in entries if _ENTRY_HEADER == e["type"]),
+            0,
+        )
+        temp_path = pathlib.Path(csv_path).with_name(f".{pathlib.Path(csv_path).name}.tmp")
+        temp_path.unlink(missing_ok=True)
+
+        nb_lines = 0
+        sink = CsvResultSink(
+            csv_path=temp_path,
+            max_nb_threads=max_nb_threads,
+            flush_policy=FlushPolicy(max_buffered_lines=1024, max_delay_seconds=60),
+            echo=False,
+        )
+        with sink:
+            for entry in entries:
+                if entry["type"] in (_ENTRY_HEADER, _ENTRY_COMMENT):
+                    for comment in entry["comments"]:
+                        sink.write_comment(comment)
+                elif _ENTRY_DONE == entry["type"]:
+                    sink.write_lines(lines=entry["lines"])
+                    nb_lines += len(entry["lines"])
+        os.replace(temp_path, csv_path)
+        return nb_lines
+
+    @staticmethod
+    def _comments(text: str) -> List[str]:
+        return [line[1:].strip() for line in text.splitlines() if line.startswith("#")]
+
+    def _append(self, entry: Dict[str, Any], sync: bool = False) -> None:
+        with self._lock:
+            self._file.write(_encode(entry))
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+            self._replay(entry)
+
+    def _replay(self, entry: Dict[str, Any]) -> None:
+        if entry["type"] in (_ENTRY_START, _ENTRY_DONE, _ENTRY_FAILED):
+            execution = entry["execution"]
+            self._status[_execution_key(execution)] = (entry["type"], execution)
+            if _ENTRY_START == entry["type"]:
+                # only the completions are needed to resume, starts are not kept in memory
+                return
+        self._entries.append(entry)
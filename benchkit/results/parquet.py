@@ -0,0 +1,320 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Columnar result sink writing the results of a campaign to a Parquet file.
+
+Each column of the schema carries its role in the field metadata: constant, build variable, run
+variable or metric (observed output), such that inputs and outputs can be told apart without
+knowing the benchmark. The information of the CSV comment header is stored in the key-value
+metadata of the file.
+
+This sink requires the optional `pyarrow` dependency.
+"""
+
+import importlib.util
+import os
+import pathlib
+from typing import Any, Callable, Dict, List
+
+from benchkit.results.sink import FlushPolicy, ResultSink
+from benchkit.utils.types import PathType
+
+if importlib.util.find_spec("pyarrow") is None:
+    _PYARROW_ENABLED = False
+else:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _PYARROW_ENABLED = True
+
+ROLE_METADATA_KEY = "role"
+ROLE_CONSTANT = "constant"
+ROLE_BUILD_VARIABLE = "build_variable"
+ROLE_RUN_VARIABLE = "run_variable"
+ROLE_METRIC = "metric"
+
+
+def parquet_enabled() -> bool:
+    """
+    Return whether the Parquet sink can be used in the current environment.
+
+    Returns:
+        bool: whether the optional `pyarrow` dependency is installed.
+    """
+    return _PYARROW_ENABLED
+
+
+def header_metadata(header: str) -> Dict[str, str]:
+    """
+    Convert the comment header of a CSV result file to key-value metadata.
+
+    Args:
+        header (str): the comment lines, formatted as "# key: value".
+
+    Returns:
+        Dict[str, str]: the metadata, mapping the keys to the values.
+    """
+    result = {}
+    for line in header.splitlines():
+        content = line.lstrip("#").strip()
+        if ": " in content:
+            key, value = content.split(": ", 1)
+            result[key] = value
+    return result
+
+
+def _nullable(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def converter(value: Any) -> Any:
+        if value is None:
+            return None
+        return convert(value)
+
+    return converter
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "1", "false", "0"):
+        return value.strip().lower() in ("true", "1")
+    raise ValueError(f"Not a boolean: {value}")
+
+
+def _to_int(value: Any) -> int:
+    float_value = float(value)
+    if not float_value.is_integer():
+        raise ValueError(f"Not an integer: {value}")
+    return int(float_value)
+
+
+class ParquetResultSink(ResultSink):
+    """
+    Result sink writing the result lines to a Parquet file, one row group per flush.
+
+    The schema is inferred from the first lines written: integer, floating-point and boolean
+    values keep their type, any other value is stored as a string. Integer metrics are stored as
+    floating-point numbers, as their later values may not be integers. When later lines have new
+    columns or values that do not fit the type of their column, the schema evolves: the new
+    columns are added (empty in the previous rows) and the column types are widened (to
+    floating-point numbers, or to strings). A Parquet file has a single schema: the rows of each
+    schema are written to their own temporary file, and the files are unified to the final schema
+    once, when the sink is closed.
+
+    Parquet files cannot be appended to: the rows of an existing file (e.g. when continuing a
+    campaign) are copied to a new file, that replaces the existing one when the sink is closed.
+    """
+
+    def __init__(
+        self,
+        parquet_path: PathType,
+        column_roles: Dict[str, str],
+        metadata: Dict[str, str] | None = None,
+        flush_policy: FlushPolicy | None = None,
+    ) -> None:
+        """
+        Create the Parquet result sink, the file is only opened by `open()`.
+
+        Args:
+            parquet_path (PathType):
+                path to the Parquet file.
+            column_roles (Dict[str, str]):
+                role of the input columns (constants, build and run variables). The columns
+                that are not listed are metrics.
+            metadata (Dict[str, str] | None, optional):
+                key-value metadata stored in the file (e.g. the campaign header).
+                Defaults to None.
+            flush_policy (FlushPolicy | None, optional):
+                when to write the buffered lines as a row group, the default policy if None.
+                Defaults to None.
+
+        Raises:
+            ValueError: if pyarrow is not installed.
+        """
+        if not _PYARROW_ENABLED:
+            raise ValueError("The Parquet result sink requires pyarrow (pip install pyarrow)")
+
+        super().__init__(flush_policy=flush_policy)
+        self._parquet_path = pathlib.Path(parquet_path)
+        self._temp_path = self._parquet_path.with_name(f".{self._parquet_path.name}.tmp")
+        self._column_roles = dict(column_roles)
+        self._metadata = dict(metadata) if metadata is not None else {}
+        self._previous_table = None
+        self._schema = None
+        self._converters: Dict[str, Callable[[Any], Any]] = {}
+        self._segment_paths: List[pathlib.Path] = []
+        self._writer = None
+
+    def add_metadata(self, metadata: Dict[str, str]) -> None:
+        """
+        Add key-value metadata to the file, e.g. the total duration of the campaign.
+
+        Args:
+            metadata (Dict[str, str]): metadata to add, written when the sink is closed.
+        """
+        with self._lock:
+            self._metadata.update(metadata)
+
+    def _open_output(self) -> None:
+        if self._parquet_path.is_file():
+            self._previous_table = pq.read_table(self._parquet_path)
+
+    def _close_output(self) -> None:
+        if self._writer is None:
+            return
+        output_path = self._segment_paths[-1]
+        if len(self._segment_paths) > 1:
+            self._writer.close()
+            self._writer = pq.ParquetWriter(self._temp_path, self._schema)
+            for segment_path in self._segment_paths:
+                with pq.ParquetFile(segment_path) as segment:
+                    for i in range(segment.num_row_groups):
+                        self._writer.write_table(self._unified(segment.read_row_group(i)))
+            output_path = self._temp_path
+        if hasattr(self._writer, "add_key_value_metadata"):
+            self._writer.add_key_value_metadata(self._metadata)
+        self._writer.close()
+        self._writer = None
+        os.replace(output_path, self._parquet_path)
+        for segment_path in self._segment_paths:
+            segment_path.unlink(missing_ok=True)
+        self._segment_paths = []
+
+    def _append_line(self, line: Dict[str, Any]) -> None:
+        self._append(line)
+
+    def _write_pending(self, pending: List[Dict[str, Any]], fsync: bool) -> None:
+        if not pending:
+            return
+
+        if self._writer is None:
+            self._start_writer(first_lines=pending)
+        else:
+            self._evolve_schema(lines=pending)
+
+        columns = {
+            field.name: [self._converters[field.name](line.get(field.name)) for line in pending]
+            for field in self._schema
+        }
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=self._schema))
+        if fsync:
+            with open(self._segment_paths[-1], "rb") as temp_file:
+                os.fsync(temp_file.fileno())
+
+    def _start_writer(self, first_lines: List[Dict[str, Any]]) -> None:
+        if self._previous_table is not None:
+            self._schema = self._previous_table.schema
+        else:
+            self._schema = self._infer_schema(first_lines=first_lines)
+
+        schema_metadata = dict(self._schema.metadata or {})
+        schema_metadata.update({k.encode(): str(v).encode() for k, v in self._metadata.items()})
+        self._schema = self._schema.with_metadata(schema_metadata)
+
+        self._set_converters()
+
+        self._open_segment()
+        if self._previous_table is not None:
+            self._writer.write_table(self._previous_table.replace_schema_metadata(schema_metadata))
+            self._previous_table = None
+        self._evolve_schema(lines=first_lines)
+
+    def _set_converters(self) -> None:
+        self._converters = {
+            field.name: self._converter(arrow_type=field.type) for field in self._schema
+        }
+
+    def _open_segment(self) -> None:
+        segment_path = self._parquet_path.with_name(
+            f".{self._parquet_path.name}.{len(self._segment_paths)}.tmp"
+        )
+        self._segment_paths.append(segment_path)
+        self._writer = pq.ParquetWriter(segment_path, self._schema)
+
+    def _evolve_schema(self, lines: List[Dict[str, Any]]) -> None:
+        fields = []
+        for field in self._schema:
+            values = [line[field.name] for line in lines if line.get(field.name) is not None]
+            if self._fits(values=values, convert=self._converters[field.name]):
+                fields.append(field)
+            else:
+                role = self._column_roles.get(field.name, ROLE_METRIC)
+                arrow_type = self._widen(field.type, self._infer_type(values=values, role=role))
+                fields.append(field.with_type(arrow_type))
+        known_names = set(self._schema.names)
+        new_fields = self._infer_schema(
+            first_lines=[{k: v for k, v in line.items() if k not in known_names} for line in lines]
+        )
+        schema = pa.schema(list(fields) + list(new_fields), metadata=self._schema.metadata)
+        if schema.equals(self._schema, check_metadata=True):
+            return
+
+        # the rows written so far keep their schema in their file, they are converted at close
+        self._writer.close()
+        self._schema = schema
+        self._set_converters()
+        self._open_segment()
+
+    def _unified(self, table: "pa.Table") -> "pa.Table":
+        columns = {}
+        for field in self._schema:
+            if field.name not in table.column_names:
+                columns[field.name] = pa.nulls(table.num_rows, type=field.type)
+            elif field.type == table.schema.field(field.name).type:
+                columns[field.name] = table[field.name]
+            else:
+                convert = self._converters[field.name]
+                values = [convert(v) for v in table[field.name].to_pylist()]
+                columns[field.name] = pa.array(values, type=field.type)
+        return pa.Table.from_pydict(columns, schema=self._schema)
+
+    @staticmethod
+    def _fits(values: List[Any], convert: Callable[[Any], Any]) -> bool:
+        try:
+            for value in values:
+                convert(value)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def _widen(arrow_type: "pa.DataType", other_type: "pa.DataType") -> "pa.DataType":
+        numeric_types = (pa.int64(), pa.float64())
+        if arrow_type in numeric_types and other_type in numeric_types:
+            return pa.float64()
+        return pa.string()
+
+    def _infer_schema(self, first_lines: List[Dict[str, Any]]) -> "pa.Schema":
+        names = list(dict.fromkeys(name for line in first_lines for name in line))
+        fields = []
+        for name in names:
+            values = [line[name] for line in first_lines if line.get(name) is not None]
+            role = self._column_roles.get(name, ROLE_METRIC)
+            fields.append(
+                pa.field(
+                    name,
+                    self._infer_type(values=values, role=role),
+                    metadata={ROLE_METADATA_KEY: role},
+                )
+            )
+        return pa.schema(fields)
+
+    @staticmethod
+    def _infer_type(values: List[Any], role: str) -> "pa.DataType":
+        if values and all(isinstance(v, bool) for v in values):
+            return pa.bool_()
+        numbers = [v for v in values if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if values and len(numbers) == len(values):
+            if ROLE_METRIC != role and all(isinstance(v, int) for v in numbers):
+                return pa.int64()
+            return pa.float64()
+        return pa.string()
+
+    @staticmethod
+    def _converter(arrow_type: "pa.DataType") -> Callable[[Any], Any]:
+        if pa.types.is_boolean(arrow_type):
+            return _nullable(_to_bool)
+        if pa.types.is_integer(arrow_type):
+            return _nullable(_to_int)
+        if pa.types.is_floating(arrow_type):
+            return _nullable(float)
+        return _nullable(str)
@@ -0,0 +1,348 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Sinks where the result lines of a campaign are written.
+A sink keeps its output file open for the whole campaign and writes the lines through a bounded
+buffer, flushed according to a flush policy, at the end of each build group, on exit and when the
+process is terminated by a signal.
+"""
+
+import atexit
+import os
+import pathlib
+import signal
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from benchkit.utils.misc import CSV_SEPARATOR
+from benchkit.utils.types import PathType
+
+_FLUSH_SIGNALS = (signal.SIGTERM, signal.SIGHUP)
+
+
+class FlushPolicy:
+    """
+    Policy deciding when the buffered result lines are written to the disk.
+    The buffer is flushed as soon as it holds `max_buffered_lines` lines or its oldest line has
+    waited for `max_delay_seconds`, whichever comes first. The delay is enforced by a timer, such
+    that the lines are written also when no other line follows them (e.g. during a long run).
+    """
+
+    def __init__(
+        self,
+        max_buffered_lines: int = 64,
+        max_delay_seconds: float = 1.0,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Create the flush policy.
+
+        Args:
+            max_buffered_lines (int, optional):
+                maximum number of lines kept in the buffer (1 writes every line immediately).
+                Defaults to 64.
+            max_delay_seconds (float, optional):
+                maximum time a line is kept in the buffer. Defaults to 1.0.
+            fsync (bool, optional):
+                whether to also synchronize the file to the storage device on each flush (it is
+                always synchronized when the sink is closed). Defaults to False.
+
+        Raises:
+            ValueError: if the parameters are inconsistent.
+        """
+        if max_buffered_lines < 1:
+            raise ValueError(f"Invalid maximum number of buffered lines: {max_buffered_lines}")
+        if max_delay_seconds < 0:
+            raise ValueError(f"Invalid maximum delay: {max_delay_seconds}")
+
+        self.max_buffered_lines = max_buffered_lines
+        self.max_delay_seconds = max_delay_seconds
+        self.fsync = fsync
+
+
+class ResultSink:
+    """
+    Base class of the result sinks.
+    Subclasses convert the result lines to their buffered form and write the pending buffer to
+    their output file.
+    """
+
+    def __init__(
+        self,
+        flush_policy: FlushPolicy | None = None,
+    ) -> None:
+        """
+        Create the result sink, the output file is only opened by `open()`.
+
+        Args:
+            flush_policy (FlushPolicy | None, optional):
+                when to write the buffered lines, the default policy if None. Defaults to None.
+        """
+        self._flush_policy = FlushPolicy() if flush_policy is None else flush_policy
+        self._is_open = False
+        self._buffer: List[Any] = []
+        self._buffer_start = 0.0
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        self._previous_handlers = {}
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Get whether the sink is open.
+
+        Returns:
+            bool: whether the sink is open.
+        """
+        return self._is_open
+
+    def open(self) -> "ResultSink":
+        """
+        Open the output file and register the flush on exit and on termination signals.
+
+        Returns:
+            ResultSink: the sink itself.
+        """
+        self._open_output()
+        self._is_open = True
+        atexit.register(self.close)
+        if threading.current_thread() is threading.main_thread():
+            for signum in _FLUSH_SIGNALS:
+                self._previous_handlers[signum] = signal.signal(signum, self._on_signal)
+        return self
+
+    def close(self) -> None:
+        """
+        Flush the remaining lines, synchronize and close the output file.
+        """
+        with self._lock:
+            if not self._is_open:
+                return
+            self._flush(fsync=True)
+            self._close_output()
+            self._is_open = False
+
+        atexit.unregister(self.close)
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
+        self._previous_handlers = {}
+
+    def __enter__(self) -> "ResultSink":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write_lines(self, lines: List[Dict[str, Any]]) -> None:
+        """
+        Write result lines, each of them mapping the column names to their values.
+
+        Args:
+            lines (List[Dict[str, Any]]): the result lines to write.
+        """
+        with self._lock:
+            for line in lines:
+                self._append_line(line)
+            self._flush_if_needed()
+
+    def flush(self) -> None:
+        """
+        Write the buffered lines to the output file, e.g. at the end of a group of records.
+        """
+        with self._lock:
+            self._flush(fsync=self._flush_policy.fsync)
+
+    def _open_output(self) -> None:
+        raise NotImplementedError
+
+    def _close_output(self) -> None:
+        raise NotImplementedError
+
+    def _append_line(self, line: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _write_pending(self, pending: List[Any], fsync: bool) -> None:
+        raise NotImplementedError
+
+    def _append(self, item: Any) -> None:
+        if not self._buffer:
+            self._buffer_start = time.monotonic()
+            self._start_flush_timer()
+        self._buffer.append(item)
+
+    def _start_flush_timer(self) -> None:
+        # cancelled by the flush of the buffer, e.g. when it is full before the delay
+        self._flush_timer = threading.Timer(
+            interval=self._flush_policy.max_delay_seconds,
+            function=self._on_flush_timer,
+        )
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _on_flush_timer(self) -> None:
+        with self._lock:
+            # the timer may have fired while the buffer was flushed and filled again
+            if (
+                self._buffer
+                and time.monotonic() - self._buffer_start >= self._flush_policy.max_delay_seconds
+            ):
+                self._flush(fsync=self._flush_policy.fsync)
+
+    def _flush_if_needed(self) -> None:
+        policy = self._flush_policy
+        if (
+            len(self._buffer) >= policy.max_buffered_lines
+            or time.monotonic() - self._buffer_start >= policy.max_delay_seconds
+        ):
+            self._flush(fsync=policy.fsync)
+
+    def _flush(self, fsync: bool) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._is_open:
+            return
+        # swap first, a signal handler flushing in the middle must not write lines twice
+        pending, self._buffer = self._buffer, []
+        self._write_pending(pending=pending, fsync=fsync)
+
+    def _on_signal(self, signum, frame) -> None:
+        previous_handler = self._previous_handlers.get(signum, signal.SIG_DFL)
+        self.close()
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+        elif signal.SIG_DFL == previous_handler:
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+
+class CsvResultSink(ResultSink):
+    """
+    Result sink appending the result lines to a CSV file.
+
+    The header is derived from the first line written: its columns, followed by the padding
+    `thread_<i>` columns up to `max_nb_threads`, with all the `thread_` columns moved to the end.
+    The column order of each distinct set of keys is computed once and reused for the next lines.
+    """
+
+    def __init__(
+        self,
+        csv_path: PathType,
+        max_nb_threads: int,
+        flush_policy: FlushPolicy | None = None,
+        echo: bool = True,
+    ) -> None:
+        """
+        Create the CSV result sink, the file is only opened by `open()`.
+
+        Args:
+            csv_path (PathType):
+                path to the CSV file, the lines are appended to it.
+            max_nb_threads (int):
+                number of `thread_<i>` columns in the header when the lines have such columns.
+            flush_policy (FlushPolicy | None, optional):
+                when to write the buffered lines, the default policy if None. Defaults to None.
+            echo (bool, optional):
+                whether to also print the lines on the standard output. Defaults to True.
+        """
+        super().__init__(flush_policy=flush_policy)
+        self._csv_path = pathlib.Path(csv_path)
+        self._max_nb_threads = max_nb_threads
+        self._echo = echo
+        self._header_pending = True
+        self._file = None
+        self._columns: Dict[Tuple[str, ...], List[str]] = {}
+
+    @property
+    def header_pending(self) -> bool:
+        """
+        Get whether the header will be printed before the next line.
+
+        Returns:
+            bool: whether the header has not been printed yet.
+        """
+        return self._header_pending
+
+    def skip_header(self) -> None:
+        """
+        Do not print the header, e.g. when the lines are appended to the results of a previous
+        execution of the campaign.
+        """
+        self._header_pending = False
+
+    def write_comment(self, comment: str) -> None:
+        """
+        Write a comment line, it is ignored when the results are read back.
+
+        Args:
+            comment (str): the comment, without the leading "# ".
+        """
+        with self._lock:
+            self._append_text(f"# {comment}")
+            self._flush_if_needed()
+
+    def _open_output(self) -> None:
+        self._drop_partial_line()
+        self._file = open(self._csv_path, "a")
+
+    def _drop_partial_line(self) -> None:
+        # a line half-written when a previous execution crashed would be merged with the next one
+        if not self._csv_path.is_file():
+            return
+        with open(self._csv_path, "rb+") as csv_file:
+            size = csv_file.seek(0, os.SEEK_END)
+            if 0 == size:
+                return
+            csv_file.seek(size - 1)
+            if b"\n" == csv_file.read(1):
+                return
+            csv_file.seek(0)
+            content = csv_file.read()
+            csv_file.truncate(content.rfind(b"\n") + 1)
+
+    def _close_output(self) -> None:
+        self._file.close()
+        self._file = None
+
+    def _append_line(self, line: Dict[str, Any]) -> None:
+        if self._header_pending:
+            self._append_text(self._header(line))
+            self._header_pending = False
+        keys = tuple(line)
+        columns = self._columns.get(keys)
+        if columns is None:
+            columns = self._split_thread_columns(keys)
+            self._columns[keys] = columns
+        self._append_text(CSV_SEPARATOR.join(str(line[key]) for key in columns))
+
+    def _append_text(self, content: str) -> None:
+        if self._echo:
+            print(content)
+        self._append(content)
+
+    def _write_pending(self, pending: List[str], fsync: bool) -> None:
+        if pending:
+            self._file.write("\n".join(pending) + "\n")
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def _header(self, first_line: Dict[str, Any]) -> str:
+        header_list = list(first_line)
+        current_thread_columns = [
+            int(c.split("thread_")[-1]) for c in header_list if c.startswith("thread_")
+        ]
+        thread_list = []
+        if current_thread_columns:
+            current_max_thread = max(current_thread_columns)
+            thread_list = [
+                f"thread_{t}" for t in range(current_max_thread + 1, self._max_nb_threads)
+            ]
+        return CSV_SEPARATOR.join(self._split_thread_columns(header_list + thread_list))
+
+    @staticmethod
+    def _split_thread_columns(keys: Tuple[str, ...] | List[str]) -> List[str]:
+        left = [k for k in keys if not k.startswith("thread_")]
+        right = [k for k in keys if k.startswith("thread_")]
+        return left + right
@@ -0,0 +1,158 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Warmup of the records of a campaign.
+Caches, JIT compilers, page cache or buffer pools make the first repetitions of a record slower
+than the next ones. A warmup policy discards these repetitions, either a fixed number of them or
+until the chosen metric reaches a steady state. For tools reporting the metric periodically within
+a single run (one result line per interval), the lines before the steady state can also be
+discarded.
+"""
+
+from typing import List
+
+
+def is_stable(values: List[float], tolerance: float) -> bool:
+    """
+    Return whether the given values are stable, i.e. all of them are within the relative
+    tolerance of their mean.
+
+    Args:
+        values (List[float]): the values to check.
+        tolerance (float): maximum relative deviation from the mean.
+
+    Returns:
+        bool: whether the values are stable.
+    """
+    if not values:
+        return False
+    mean = sum(values) / len(values)
+    if 0 == mean:
+        return all(0 == v for v in values)
+    return all(abs(v - mean) <= tolerance * abs(mean) for v in values)
+
+
+class WarmupPolicy:
+    """
+    Policy deciding which repetitions of a record (and which result lines of a run) are warmup,
+    and are therefore not part of the results.
+
+    Without metric, the first `nb_runs` repetitions of each record are warmup. With a metric, the
+    warmup repetitions go on until the metric of the last `window` repetitions is stable (and at
+    least `nb_runs` of them ran), with at most `max_runs` warmup repetitions. With `within_run`,
+    the steady state is instead detected within the result lines of each run, the lines before
+    the first stable window of `window` lines are discarded; `nb_runs` warmup repetitions still
+    run before.
+    """
+
+    def __init__(
+        self,
+        nb_runs: int = 0,
+        metric: str | None = None,
+        window: int = 3,
+        tolerance: float = 0.05,
+        max_runs: int = 10,
+        within_run: bool = False,
+    ) -> None:
+        """
+        Create the warmup policy.
+
+        Args:
+            nb_runs (int, optional):
+                number of warmup repetitions of each record, the minimum number of them when
+                the steady state is detected across repetitions. Defaults to 0.
+            metric (str | None, optional):
+                name of the result column on which the steady state is detected. Defaults to None
+                (fixed number of warmup repetitions).
+            window (int, optional):
+                number of consecutive values that must be stable. Defaults to 3.
+            tolerance (float, optional):
+                maximum relative deviation of the values of a stable window from their mean.
+                Defaults to 0.05.
+            max_runs (int, optional):
+                maximum number of warmup repetitions when the steady state is detected across
+                repetitions. Defaults to 10.
+            within_run (bool, optional):
+                whether to detect the steady state within the result lines of each run instead of
+                across repetitions. Defaults to False.
+
+        Raises:
+            ValueError: if the parameters are inconsistent.
+        """
+        if nb_runs < 0:
+            raise ValueError(f"Invalid number of warmup runs: {nb_runs}")
+        if metric is None and within_run:
+            raise ValueError("Steady-state detection within runs requires a metric")
+        if metric is None and 0 == nb_runs:
+            raise ValueError("Warmup policy without warmup runs nor metric")
+        if window < 2:
+            raise ValueError(f"Invalid window: {window} (must be at least 2)")
+        if tolerance <= 0:
+            raise ValueError(f"Invalid tolerance: {tolerance}")
+        if max_runs < nb_runs:
+            raise ValueError(f"Invalid bounds: max_runs ({max_runs}) < nb_runs ({nb_runs})")
+
+        self.nb_runs = nb_runs
+        self.metric = metric
+        self.window = window
+        self.tolerance = tolerance
+        self.max_runs = max_runs
+        self.within_run = within_run
+
+    @property
+    def across_runs(self) -> bool:
+        """
+        Get whether the steady state is detected across the repetitions of a record.
+
+        Returns:
+            bool: whether the steady state is detected across repetitions.
+        """
+        return self.metric is not None and not self.within_run
+
+    def is_warm(self, values: List[float]) -> bool:
+        """
+        Return whether the warmup of a record is over.
+
+        Args:
+            values (List[float]):
+                the metric values of the warmup repetitions so far, in order (any value when the
+                steady state is not detected across repetitions).
+
+        Returns:
+            bool: whether the warmup of the record is over.
+        """
+        if len(values) < self.nb_runs:
+            return False
+        if not self.across_runs:
+            return True
+        if len(values) >= self.max_runs:
+            return True
+        return len(values) >= self.window and self.is_steady(values=values[-self.window :])
+
+    def is_steady(self, values: List[float]) -> bool:
+        """
+        Return whether the given consecutive values are in a steady state.
+
+        Args:
+            values (List[float]): consecutive values of the metric.
+
+        Returns:
+            bool: whether the values are stable.
+        """
+        return is_stable(values=values, tolerance=self.tolerance)
+
+    def steady_state_start(self, values: List[float]) -> int | None:
+        """
+        Get the index where the steady state begins in a series of values (e.g. the values of the
+        metric in the result lines of a single run).
+
+        Args:
+            values (List[float]): the series of values.
+
+        Returns:
+            int | None: index of the first value of the first stable window, None if there is none.
+        """
+        for start in range(len(values) - self.window + 1):
+            if self.is_steady(values=values[start : start + self.window]):
+                return start
+        return None
@@ -0,0 +1,320 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Resource-aware scheduling of the campaigns of a suite.
+
+Each campaign declares the resources it needs (number of CPUs, NUMA nodes, memory, exclusive access
+to the machine). Campaigns whose requests fit together run concurrently on disjoint sets of CPUs,
+the others wait until enough resources are released by the running ones.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import sys
+from typing import Callable, Dict, List, Tuple
+
+from benchkit.platforms import Platform
+
+
+class ResourceRequest:
+    """
+    Resources needed by a campaign.
+    A request without any CPU or NUMA node count asks for the whole machine.
+    """
+
+    def __init__(
+        self,
+        nb_cpus: int | None = None,
+        nb_numa_nodes: int | None = None,
+        memory_bytes: int | None = None,
+        exclusive: bool = False,
+    ) -> None:
+        """
+        Create the resource request.
+
+        Args:
+            nb_cpus (int | None, optional):
+                number of CPUs needed. When NUMA nodes are also requested, the CPUs are taken from
+                these nodes only. Defaults to None.
+            nb_numa_nodes (int | None, optional):
+                number of whole NUMA nodes needed, no other campaign runs on their CPUs.
+                Defaults to None.
+            memory_bytes (int | None, optional):
+                amount of memory needed, in bytes. Defaults to None.
+            exclusive (bool, optional):
+                whether the campaign must run alone on the machine. Defaults to False.
+
+        Raises:
+            ValueError: if the request is inconsistent.
+        """
+        if nb_cpus is not None and nb_cpus < 1:
+            raise ValueError(f"Invalid number of CPUs: {nb_cpus}")
+        if nb_numa_nodes is not None and nb_numa_nodes < 1:
+            raise ValueError(f"Invalid number of NUMA nodes: {nb_numa_nodes}")
+        if memory_bytes is not None and memory_bytes < 0:
+            raise ValueError(f"Invalid amount of memory: {memory_bytes}")
+
+        self.nb_cpus = nb_cpus
+        self.nb_numa_nodes = nb_numa_nodes
+        self.memory_bytes = memory_bytes
+        self.exclusive = exclusive or (nb_cpus is None and nb_numa_nodes is None)
+
+    def __repr__(self) -> str:
+        return (
+            f"ResourceRequest(nb_cpus={self.nb_cpus}, nb_numa_nodes={self.nb_numa_nodes}, "
+            f"memory_bytes={self.memory_bytes}, exclusive={self.exclusive})"
+        )
+
+
+class Allocation:
+    """
+    Resources allocated to a campaign.
+    """
+
+    def __init__(
+        self,
+        cpus: List[int],
+        numa_nodes: List[int],
+        memory_bytes: int,
+        exclusive: bool,
+    ) -> None:
+        self.cpus = cpus
+        self.numa_nodes = numa_nodes
+        self.memory_bytes = memory_bytes
+        self.exclusive = exclusive
+
+
+class ResourcePool:
+    """
+    Resources of the machine shared by the campaigns, with the ones currently allocated.
+
+    CPUs are allocated preferably within a single NUMA node (the one with the fewest free CPUs that
+    still fits the request), otherwise spanning the NUMA nodes with the most free CPUs first.
+    """
+
+    def __init__(
+        self,
+        numa_nodes_cpus: Dict[int, List[int]],
+        memory_bytes: int | None = None,
+    ) -> None:
+        """
+        Create the resource pool.
+
+        Args:
+            numa_nodes_cpus (Dict[int, List[int]]):
+                CPUs of each NUMA node of the machine.
+            memory_bytes (int | None, optional):
+                total amount of memory of the machine, memory requests are not checked if None.
+                Defaults to None.
+        """
+        self._numa_nodes_cpus = {node: sorted(cpus) for node, cpus in numa_nodes_cpus.items()}
+        self._memory_bytes = memory_bytes
+        self._free_cpus = {node: set(cpus) for node, cpus in self._numa_nodes_cpus.items()}
+        self._free_memory_bytes = memory_bytes
+        self._nb_allocations = 0
+        self._exclusive_allocated = False
+
+    @classmethod
+    def from_platform(cls, platform: Platform) -> "ResourcePool":
+        """
+        Create the resource pool of the given platform.
+
+        Args:
+            platform (Platform): the platform whose resources are shared.
+
+        Returns:
+            ResourcePool: the resource pool of the platform.
+        """
+        return cls(
+            numa_nodes_cpus=platform.numa_nodes_cpus(),
+            memory_bytes=platform.memory_total_bytes(),
+        )
+
+    @property
+    def nb_cpus(self) -> int:
+        """
+        Get the total number of CPUs of the pool.
+
+        Returns:
+            int: the total number of CPUs of the pool.
+        """
+        return sum(len(cpus) for cpus in self._numa_nodes_cpus.values())
+
+    def check(self, request: ResourceRequest) -> None:
+        """
+        Check that the request can be satisfied when nothing else is running.
+
+        Args:
+            request (ResourceRequest): the request to check.
+
+        Raises:
+            ValueError: if the machine does not have enough resources for the request.
+        """
+        if request.nb_numa_nodes is not None:
+            if request.nb_numa_nodes > len(self._numa_nodes_cpus):
+                raise ValueError(
+                    f"{request} needs more NUMA nodes than available ({len(self._numa_nodes_cpus)})"
+                )
+            largest_nodes = sorted((len(c) for c in self._numa_nodes_cpus.values()), reverse=True)
+            max_nb_cpus = sum(largest_nodes[: request.nb_numa_nodes])
+        else:
+            max_nb_cpus = self.nb_cpus
+        if request.nb_cpus is not None and request.nb_cpus > max_nb_cpus:
+            raise ValueError(f"{request} needs more CPUs than available ({max_nb_cpus})")
+        if (
+            request.memory_bytes is not None
+            and self._memory_bytes is not None
+            and request.memory_bytes > self._memory_bytes
+        ):
+            raise ValueError(f"{request} needs more memory than available ({self._memory_bytes})")
+
+    def allocate(self, request: ResourceRequest) -> Allocation | None:
+        """
+        Allocate the resources of the request, if they are currently available.
+
+        Args:
+            request (ResourceRequest): the resources to allocate.
+
+        Returns:
+            Allocation | None: the allocated resources, None if they are not available now.
+        """
+        if self._exclusive_allocated:
+            return None
+        if request.exclusive and self._nb_allocations > 0:
+            return None
+
+        memory_bytes = request.memory_bytes if request.memory_bytes is not None else 0
+        if self._free_memory_bytes is not None and memory_bytes > self._free_memory_bytes:
+            return None
+
+        if request.exclusive and request.nb_cpus is None and request.nb_numa_nodes is None:
+            numa_nodes = sorted(self._numa_nodes_cpus)
+            cpus = sorted(c for node_cpus in self._numa_nodes_cpus.values() for c in node_cpus)
+        elif request.nb_numa_nodes is not None:
+            numa_nodes, cpus = self._select_whole_nodes(request=request)
+        else:
+            numa_nodes, cpus = self._select_cpus(nb_cpus=request.nb_cpus)
+        if not cpus:
+            return None
+
+        for node in numa_nodes:
+            self._free_cpus[node].difference_update(cpus)
+        if self._free_memory_bytes is not None:
+            self._free_memory_bytes -= memory_bytes
+        self._nb_allocations += 1
+        self._exclusive_allocated = request.exclusive
+
+        return Allocation(
+            cpus=cpus,
+            numa_nodes=numa_nodes,
+            memory_bytes=memory_bytes,
+            exclusive=request.exclusive,
+        )
+
+    def release(self, allocation: Allocation) -> None:
+        """
+        Release resources previously allocated.
+
+        Args:
+            allocation (Allocation): the resources to release.
+        """
+        cpus = set(allocation.cpus)
+        for node in allocation.numa_nodes:
+            self._free_cpus[node].update(cpus.intersection(self._numa_nodes_cpus[node]))
+        if self._free_memory_bytes is not None:
+            self._free_memory_bytes += allocation.memory_bytes
+        self._nb_allocations -= 1
+        if allocation.exclusive:
+            self._exclusive_allocated = False
+
+    def _select_whole_nodes(self, request: ResourceRequest) -> Tuple[List[int], List[int]]:
+        free_nodes = [
+            node
+            for node, cpus in self._numa_nodes_cpus.items()
+            if len(self._free_cpus[node]) == len(cpus)
+        ]
+        if len(free_nodes) < request.nb_numa_nodes:
+            return [], []
+
+        # smallest nodes still fitting the CPU request
+        free_nodes.sort(key=lambda node: (len(self._numa_nodes_cpus[node]), node))
+        for first in range(len(free_nodes) - request.nb_numa_nodes + 1):
+            nodes = free_nodes[first : first + request.nb_numa_nodes]
+            cpus = sorted(c for node in nodes for c in self._numa_nodes_cpus[node])
+            if request.nb_cpus is None or request.nb_cpus <= len(cpus):
+                return sorted(nodes), cpus
+        return [], []
+
+    def _select_cpus(self, nb_cpus: int) -> Tuple[List[int], List[int]]:
+        fitting_nodes = [node for node, free in self._free_cpus.items() if len(free) >= nb_cpus]
+        if fitting_nodes:
+            node = min(fitting_nodes, key=lambda n: (len(self._free_cpus[n]), n))
+            return [node], sorted(self._free_cpus[node])[:nb_cpus]
+
+        if sum(len(free) for free in self._free_cpus.values()) < nb_cpus:
+            return [], []
+
+        nodes = []
+        cpus = []
+        for node in sorted(self._free_cpus, key=lambda n: (-len(self._free_cpus[n]), n)):
+            nodes.append(node)
+            cpus.extend(sorted(self._free_cpus[node])[: nb_cpus - len(cpus)])
+            if len(cpus) == nb_cpus:
+                break
+        return sorted(nodes), sorted(cpus)
+
+
+def run_scheduled(
+    requests: List[ResourceRequest],
+    pool: ResourcePool,
+    start: Callable[[int, Allocation], multiprocessing.Process],
+) -> List[int]:
+    """
+    Run jobs as soon as their resources are available, in order of the requests. A job that does
+    not fit does not prevent the next ones from starting if they fit.
+
+    Args:
+        requests (List[ResourceRequest]):
+            resources needed by each job.
+        pool (ResourcePool):
+            resources shared by the jobs.
+        start (Callable[[int, Allocation], multiprocessing.Process]):
+            function starting the job of the given index with the given resources, returning
+            the started process.
+
+    Raises:
+        ValueError: if a request cannot be satisfied on the machine.
+
+    Returns:
+        List[int]: the exit codes of the jobs.
+    """
+    for request in requests:
+        pool.check(request=request)
+
+    exit_codes = [None] * len(requests)
+    pending = list(range(len(requests)))
+    running = {}
+    while pending or running:
+        for job_id in list(pending):
+            allocation = pool.allocate(request=requests[job_id])
+            if allocation is None:
+                continue
+            pending.remove(job_id)
+            process = start(job_id, allocation)
+            running[process.sentinel] = (job_id, process, allocation)
+
+        if not running:
+            raise ValueError(f"Cannot allocate resources for jobs {pending} on an idle machine")
+
+        for sentinel in multiprocessing.connection.wait(list(running)):
+            job_id, process, allocation = running.pop(sentinel)
+            process.join()
+            pool.release(allocation=allocation)
+            exit_codes[job_id] = process.exitcode
+            if 0 != process.exitcode:
+                print(
+                    f"[WARNING] Job {job_id} exited with code {process.exitcode}.",
+                    file=sys.stderr,
+                )
+
+    return exit_codes
@@ -5,10 +5,11 @@ Interactions with a shell.
 """
 
 import subprocess
-import sys
 from typing import Iterable, Optional
 
+from benchkit.shell.shellaio import run_sync, shell_out_aio
 from benchkit.shell.utils import get_args, print_header
+from benchkit.utils.tracing import traced
 from benchkit.utils.types import Command, Environment, PathType
 
 
@@ -65,6 +66,11 @@ def pipe_shell_out(
     return output
 
 
+def _shell_out_span_args(command: Command, *_, **__):
+    return {"command": command}
+
+
+@traced(category="shell", args=_shell_out_span_args)
 def shell_out(
     command: Command,
     std_input: Optional[str] = None,
@@ -84,6 +90,7 @@ def shell_out(
 ) -> str:
     """
     Run a shell command on the host system.
+    Blocking equivalent of the `benchkit.shell.shellaio.shell_out_aio` coroutine.
 
     Args:
         command (Command):
@@ -143,105 +150,26 @@ def shell_out(
     Returns:
         str: the output of the shell command that completed successfully.
     """
-    arguments = get_args(command)
-    print_header(
-        arguments=arguments,
-        current_dir=current_dir,
-        environment=environment,
-        print_input=print_input,
-        print_env=print_env,
-        print_curdir=print_curdir,
-        print_shell_cmd=print_shell_cmd,
-        print_file_shell_cmd=print_file_shell_cmd,
-        asynced=False,
-        remote_host=None,
+    return run_sync(
+        shell_out_aio(
+            command=command,
+            std_input=std_input,
+            current_dir=current_dir,
+            environment=environment,
+            shell=shell,
+            print_input=print_input,
+            print_output=print_output,
+            print_env=print_env,
+            print_curdir=print_curdir,
+            print_shell_cmd=print_shell_cmd,
+            print_file_shell_cmd=print_file_shell_cmd,
+            timeout=timeout,
+            output_is_log=output_is_log,
+            ignore_ret_codes=ignore_ret_codes,
+            ignore_any_error_code=ignore_any_error_code,
+        )
     )
 
-    if output_is_log:
-
-        def flush_outlines():
-            raw_outline = process.stdout.readline()
-            while raw_outline:
-                outline = raw_outline.decode()
-                print(outline, end="")
-                outlines.append(outline)
-                raw_outline = process.stdout.readline()
-
-        outlines = []
-        with (
-            subprocess.Popen(
-                arguments,
-                shell=shell,
-                cwd=current_dir,
-                env=environment,
-                stdout=subprocess.PIPE,
-            )
-            if std_input is None
-            else subprocess.Popen(
-                arguments,
-                shell=shell,
-                cwd=current_dir,
-                env=environment,
-                stdout=subprocess.PIPE,
-                stdin=std_input,
-                text=True,
-            )
-        ) as process:
-            retcode = process.poll()
-            while retcode is None:
-                flush_outlines()
-                retcode = process.poll()
-            flush_outlines()
-        output = "".join(outlines)
-
-        sys.stdout.flush()
-        sys.stderr.flush()
-
-        if retcode:
-            raise subprocess.CalledProcessError(
-                retcode,
-                process.args,
-            )
-    else:
-        try:
-            if std_input is not None:
-                output = subprocess.check_output(
-                    arguments,
-                    shell=shell,
-                    cwd=current_dir,
-                    env=environment,
-                    timeout=timeout,
-                    input=std_input,
-                    text=True,
-                )
-
-            else:
-                output = subprocess.check_output(
-                    arguments,
-                    shell=shell,
-                    cwd=current_dir,
-                    env=environment,
-                    timeout=timeout,
-                    text=True,
-                )
-        except subprocess.CalledProcessError as err:
-            retcode = err.returncode
-            if ignore_any_error_code:
-                pass
-            elif retcode in ignore_ret_codes:
-                pass
-            else:
-                raise err
-            output = err.output
-
-    if print_output and not output_is_log:
-        if "" != output.strip():
-            print("[OUT]")
-            print(output.strip())
-
-    assert isinstance(output, str)
-    return output
-
 
 def shell_interactive(
     command: Command,
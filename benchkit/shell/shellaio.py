@@ -0,0 +1,276 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Interactions with a shell as asyncio coroutines.
+
+The commands are run with `asyncio.create_subprocess_exec`, such that orchestration code can
+overlap many I/O-bound operations (commands on several hosts, attachments, ...) on one event loop,
+without a thread or a process per operation:
+
+    outputs = await asyncio.gather(*(p.comm.shell_aio(command="uname -r") for p in platforms))
+
+The blocking API (`benchkit.shell.shell.shell_out` and the `shell` of the communication layers) is
+layered on top of these coroutines: `run_sync` runs them on an event loop owned by a background
+thread, shared by all the blocking callers.
+"""
+
+import asyncio
+import codecs
+import concurrent.futures
+import locale
+import os
+import subprocess
+import threading
+from typing import Any, Coroutine, Iterable, Optional
+
+from benchkit.shell.utils import get_args, print_header
+from benchkit.utils.types import Command, Environment, PathType, SplitCommand
+
+# size of the chunks in which logged outputs are read, their lines may be of any length
+_READ_SIZE = 64 * 1024
+
+
+class _EventLoopThread:
+    """Event loop running in a daemon thread, to run coroutines from blocking code."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="benchkit-aio",
+            daemon=True,
+        )
+        self.thread.start()
+
+
+_event_loop_thread = None
+_event_loop_lock = threading.Lock()
+
+
+def _get_event_loop_thread() -> _EventLoopThread:
+    global _event_loop_thread  # pylint: disable=global-statement
+    with _event_loop_lock:
+        if _event_loop_thread is None or _event_loop_thread.pid != os.getpid():
+            # the thread of the loop does not survive a fork, the child process needs its own
+            _event_loop_thread = _EventLoopThread()
+        return _event_loop_thread
+
+
+def run_sync(coroutine: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from blocking code, on the shared event loop of benchkit.
+    This works whether or not the caller runs its own event loop.
+
+    Args:
+        coroutine (Coroutine): the coroutine to run.
+
+    Raises:
+        RuntimeError: if called from a coroutine of the shared event loop itself (it would never
+                      complete), the coroutine must be awaited instead.
+
+    Returns:
+        Any: the result of the coroutine.
+    """
+    event_loop_thread = _get_event_loop_thread()
+    if threading.current_thread() is event_loop_thread.thread:
+        coroutine.close()
+        raise RuntimeError("Blocking call from the benchkit event loop, await the coroutine.")
+    future = asyncio.run_coroutine_threadsafe(coroutine, event_loop_thread.loop)
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt: do not leave the command running
+        future.cancel()
+        try:
+            future.result(timeout=5)
+        except (concurrent.futures.CancelledError, Exception):  # pylint: disable=broad-except
+            pass
+        raise
+
+
+def _decode_text(output: bytes) -> str:
+    # like `text=True` of the subprocess module: locale encoding and universal newlines
+    text = output.decode(locale.getpreferredencoding(False))
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+async def create_process(
+    arguments: SplitCommand,
+    shell: bool = False,
+    **kwargs,
+) -> asyncio.subprocess.Process:
+    """
+    Create a process from split arguments, with the semantics of `subprocess.Popen`.
+
+    Args:
+        arguments (SplitCommand): arguments of the command.
+        shell (bool, optional): whether to run the arguments with the shell ("/bin/sh -c", as
+                                `subprocess.Popen` does). Defaults to False.
+        **kwargs: other arguments of `asyncio.create_subprocess_exec` (stdin, stdout, cwd...).
+
+    Returns:
+        asyncio.subprocess.Process: the created process.
+    """
+    if shell:
+        arguments = ["/bin/sh", "-c"] + list(arguments)
+    return await asyncio.create_subprocess_exec(*arguments, **kwargs)
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+async def shell_out_aio(
+    command: Command,
+    std_input: Optional[str] = None,
+    current_dir: Optional[PathType] = None,
+    environment: Environment = None,
+    shell: bool = False,
+    print_input: bool = True,
+    print_output: bool = True,
+    print_env: bool = True,
+    print_curdir: bool = True,
+    print_shell_cmd: bool = False,
+    print_file_shell_cmd: bool = True,
+    timeout: Optional[int] = None,
+    output_is_log: bool = False,
+    ignore_ret_codes: Iterable[int] = (),
+    ignore_any_error_code: bool = False,
+) -> str:
+    """
+    Run a shell command on the host system, as a coroutine.
+    Asynchronous equivalent of `benchkit.shell.shell.shell_out`, with the same arguments.
+
+    Args:
+        command (Command):
+            the command to run.
+        std_input (Optional[str], optional):
+            input to feed to the command.
+            Defaults to None.
+        current_dir (Optional[PathType], optional):
+            directory where to run the command. If None, the current directory is used.
+            Defaults to None.
+        environment (Environment, optional):
+            environment variables to pass to the command.
+            Defaults to None.
+        shell (bool, optional):
+            whether to run the command in a shell environment (like "bash") or as a real command
+            given to "exec".
+            Defaults to False.
+        print_input (bool, optional):
+            whether to print the command.
+            Defaults to True.
+        print_output (bool, optional):
+            whether to print the output.
+            Defaults to True.
+        print_env (bool, optional):
+            whether to print the environment variables when they are defined.
+            Defaults to True.
+        print_curdir (bool, optional):
+            whether to print the current directory if provided.
+            Defaults to True.
+        print_shell_cmd (bool, optional):
+            whether to print the complete shell command, ready to be copy-pasted in a terminal.
+            Defaults to False.
+        print_file_shell_cmd (bool, optional):
+            whether to print the shell command in a log file (`/tmp/benchkit.sh`).
+            Defaults to True.
+        timeout (Optional[int], optional):
+            if not None, the command will be stopped after `timeout` seconds if it did not stop
+            earlier.
+            Defaults to None.
+        output_is_log (bool, optional):
+            whether the output of this command is logging and should be outputted as such, line by
+            line (e.g. cmake or make command).
+            Defaults to False.
+        ignore_ret_codes (Iterable[int], optional):
+            collection of error return codes to ignore if they are triggered.
+            Defaults to ().
+        ignore_any_error_code (bool, optional):
+            whether to error any error code returned by the command.
+
+    Raises:
+        subprocess.CalledProcessError:
+            if the command exited with a non-zero exit code that is not ignored in
+            `ignore_ret_codes`.
+        subprocess.TimeoutExpired:
+            if the command did not complete within `timeout` seconds (it is then killed).
+
+    Returns:
+        str: the output of the shell command that completed successfully.
+    """
+    arguments = get_args(command)
+    print_header(
+        arguments=arguments,
+        current_dir=current_dir,
+        environment=environment,
+        print_input=print_input,
+        print_env=print_env,
+        print_curdir=print_curdir,
+        print_shell_cmd=print_shell_cmd,
+        print_file_shell_cmd=print_file_shell_cmd,
+        asynced=False,
+        remote_host=None,
+    )
+
+    process = await create_process(
+        arguments=arguments,
+        shell=shell,
+        stdin=None if std_input is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=current_dir,
+        env=environment,
+    )
+
+    async def collect_output() -> str:
+        if not output_is_log:
+            stdout, _ = await process.communicate(
+                input=None if std_input is None else std_input.encode()
+            )
+            return _decode_text(stdout)
+
+        if std_input is not None:
+            process.stdin.write(std_input.encode())
+            process.stdin.close()
+        # read in chunks rather than lines: a line longer than the limit of the stream reader
+        # (64 KiB) would raise
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        outputs = []
+        while True:
+            chunk = await process.stdout.read(_READ_SIZE)
+            output = decoder.decode(chunk, final=not chunk)
+            if output:
+                print(output, end="", flush=True)
+                outputs.append(output)
+            if not chunk:
+                break
+        await process.wait()
+        return "".join(outputs)
+
+    try:
+        output = await asyncio.wait_for(collect_output(), timeout=timeout)
+    except asyncio.TimeoutError as error:
+        await _kill(process)
+        raise subprocess.TimeoutExpired(cmd=arguments, timeout=timeout) from error
+    except BaseException:
+        # e.g. cancelled: do not leave the command running
+        await _kill(process)
+        raise
+
+    retcode = process.returncode
+    if retcode and not ignore_any_error_code and retcode not in ignore_ret_codes:
+        raise subprocess.CalledProcessError(retcode, arguments, output=output)
+
+    if print_output and not output_is_log:
+        if "" != output.strip():
+            print("[OUT]")
+            print(output.strip())
+
+    assert isinstance(output, str)
+    return output
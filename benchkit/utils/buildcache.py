@@ -0,0 +1,206 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Content-addressed cache of build artifacts.
+The artifacts produced by a build are stored on the platform under a key that identifies the
+build: build variables and the other build arguments (constants, benchmark duration), git sha of
+the sources, hash of their uncommitted changes and untracked files, and platform.
+A later build with the same key restores the artifacts instead of rebuilding them.
+"""
+
+import hashlib
+import json
+import pathlib
+from subprocess import CalledProcessError
+from typing import Any, Callable, Dict, Iterable, List
+
+from benchkit.platforms import Platform
+from benchkit.utils.types import Command, PathType
+
+_MANIFEST_FILENAME = "artifacts.json"
+
+
+def _sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class BuildCache:
+    """
+    Cache of build artifacts, stored in a directory of the platform where the builds happen.
+
+    Each entry is a directory named after the build key, containing one sub-directory per
+    artifact and a manifest listing the original paths of the artifacts. The manifest is written
+    last, such that an interrupted store is never restored.
+    """
+
+    def __init__(
+        self,
+        cache_dir: PathType,
+        platform: Platform,
+    ) -> None:
+        self._cache_dir = pathlib.Path(cache_dir)
+        self._platform = platform
+
+    def key(
+        self,
+        benchmark_name: str,
+        src_path: PathType,
+        build_variables: Dict[str, Any],
+        constants: Dict[str, Any] | None = None,
+        benchmark_duration_seconds: int | None = None,
+        artifacts: Iterable[PathType] = (),
+    ) -> str | None:
+        """
+        Compute the key identifying a build.
+
+        Args:
+            benchmark_name (str):
+                name of the benchmark being built.
+            src_path (PathType):
+                path to the source of the benchmark, must be in a git repository.
+            build_variables (Dict[str, Any]):
+                variables used to build the benchmark.
+            constants (Dict[str, Any] | None, optional):
+                constants of the campaign, also given to the build. Defaults to None.
+            benchmark_duration_seconds (int | None, optional):
+                duration of the runs, also given to the build. Defaults to None.
+            artifacts (Iterable[PathType], optional):
+                artifacts produced by the build, that are not part of its sources when they are
+                untracked files of the source directory. Defaults to () (no artifact).
+
+        Returns:
+            str | None:
+                the key of the build, or None if the sources are not versioned with git (in
+                which case the build cannot be identified and must not be cached).
+        """
+        comm = self._platform.comm
+        if not comm.path_exists(path=src_path):
+            return None
+
+        def git_command(command: Command) -> str:
+            return comm.shell(
+                command=command,
+                current_dir=src_path,
+                print_input=False,
+                print_output=False,
+            )
+
+        try:
+            git_sha = git_command("git rev-parse HEAD").strip()
+            git_diff = git_command("git diff HEAD")
+            git_status = git_command("git status --porcelain --untracked-files=no")
+            untracked = self._untracked_files(
+                git_command=git_command,
+                src_path=pathlib.Path(src_path),
+                artifacts=artifacts,
+            )
+        except CalledProcessError:
+            return None
+
+        identity = {
+            "benchmark_name": benchmark_name,
+            "build_variables": {k: str(v) for k, v in build_variables.items()},
+            "constants": {k: str(v) for k, v in (constants or {}).items()},
+            "benchmark_duration_seconds": str(benchmark_duration_seconds),
+            "git_sha": git_sha,
+            "git_diff_sha256": _sha256(git_diff),
+            "git_status_sha256": _sha256(git_status),
+            "untracked_files": untracked,
+            "hostname": self._platform.hostname,
+            "architecture": self._platform.architecture,
+        }
+        return _sha256(json.dumps(identity, sort_keys=True))
+
+    @staticmethod
+    def _untracked_files(
+        git_command: Callable[[Command], str],
+        src_path: pathlib.Path,
+        artifacts: Iterable[PathType],
+    ) -> Dict[str, str]:
+        # untracked (and not ignored) files may be sources too, the artifacts of the build are not
+        artifact_paths = [src_path / artifact for artifact in artifacts]
+        paths = [
+            path
+            for path in git_command("git ls-files -z --others --exclude-standard").split("\0")
+            if path
+            and not any(
+                src_path / path == a or a in (src_path / path).parents for a in artifact_paths
+            )
+        ]
+        if not paths:
+            return {}
+        hashes = git_command(["git", "hash-object", "--"] + paths)
+        return dict(zip(paths, hashes.split()))
+
+    def restore(
+        self,
+        key: str,
+        artifacts: List[PathType],
+    ) -> bool:
+        """
+        Restore the cached artifacts of the given build to their original location.
+
+        Args:
+            key (str):
+                key of the build.
+            artifacts (List[PathType]):
+                paths of the artifacts that the build is expected to produce.
+
+        Returns:
+            bool: whether the artifacts were in cache and have been restored.
+        """
+        comm = self._platform.comm
+        entry_dir = self._cache_dir / key
+        manifest_path = entry_dir / _MANIFEST_FILENAME
+        (manifest,) = comm.read_many(paths=[manifest_path])
+        if manifest is None:
+            return False
+
+        cached_artifacts = json.loads(manifest)
+        if cached_artifacts != [str(a) for a in artifacts]:
+            return False
+
+        artifact_statuses = comm.stat_many(paths=artifacts)
+        for i, (artifact, status) in enumerate(zip(artifacts, artifact_statuses)):
+            artifact = pathlib.Path(artifact)
+            if status.exists:
+                comm.remove(path=artifact, recursive=True)
+            comm.makedirs(path=artifact.parent, exist_ok=True)
+            comm.shell(
+                command=["cp", "-a", str(entry_dir / str(i) / artifact.name), str(artifact)],
+                print_output=False,
+            )
+
+        return True
+
+    def store(
+        self,
+        key: str,
+        artifacts: List[PathType],
+    ) -> None:
+        """
+        Store the artifacts of the given build in the cache.
+
+        Args:
+            key (str):
+                key of the build.
+            artifacts (List[PathType]):
+                paths of the artifacts produced by the build.
+        """
+        comm = self._platform.comm
+        entry_dir = self._cache_dir / key
+        if comm.path_exists(path=entry_dir):
+            comm.remove(path=entry_dir, recursive=True)
+
+        for i, artifact in enumerate(artifacts):
+            artifact_dir = entry_dir / str(i)
+            comm.makedirs(path=artifact_dir, exist_ok=True)
+            comm.shell(
+                command=["cp", "-a", str(artifact), f"{artifact_dir}/"],
+                print_output=False,
+            )
+
+        comm.write_content_to_file(
+            content=json.dumps([str(a) for a in artifacts]),
+            output_filename=entry_dir / _MANIFEST_FILENAME,
+        )
@@ -0,0 +1,223 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Parameter spaces that search for the best values of the variables instead of trying all of their
+combinations.
+"""
+
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from benchkit.utils.variables import CartesianProductSpace, ParameterSpace, list_groupby
+
+SEARCH_ROUND_NAME = "search_round"
+DURATION_NAME = "benchmark_duration_seconds"
+
+
+class SuccessiveHalvingSpace(ParameterSpace):
+    """
+    Successive halving over a random sample of the cartesian product of the variables.
+
+    All the sampled configurations first run with the shortest benchmark duration. After each
+    round, only the best `1/eta` fraction of the configurations (according to the objective) runs
+    in the next round, with a benchmark duration `eta` times longer, up to the longest duration.
+    Each record carries its round and its benchmark duration as variables.
+    """
+
+    def __init__(
+        self,
+        variables: Dict[str, Iterable[Any]],
+        objective: str,
+        min_duration_seconds: int,
+        max_duration_seconds: int,
+        maximize: bool = True,
+        eta: int = 3,
+        nb_samples: int | None = None,
+        budget_seconds: int | None = None,
+        nb_runs: int = 1,
+        seed: int = 0,
+    ) -> None:
+        """
+        Create the successive halving search space.
+
+        Args:
+            variables (Dict[str, Iterable[Any]]):
+                values of each variable, as for a cartesian product.
+            objective (str):
+                name of the result column to optimize.
+            min_duration_seconds (int):
+                benchmark duration of the first round.
+            max_duration_seconds (int):
+                benchmark duration of the last round.
+            maximize (bool, optional):
+                whether to maximize the objective (otherwise, it is minimized). Defaults to True.
+            eta (int, optional):
+                factor by which the number of configurations decreases (and the duration
+                increases) from one round to the next. Defaults to 3.
+            nb_samples (int | None, optional):
+                number of configurations sampled for the first round. If None, it is the largest
+                number fitting in the budget, or all the configurations if there is no budget.
+                Defaults to None.
+            budget_seconds (int | None, optional):
+                total benchmark time allowed for the search. Defaults to None.
+            nb_runs (int, optional):
+                number of runs of each record, to account for the budget. Defaults to 1.
+            seed (int, optional):
+                seed of the random sampling of the configurations. Defaults to 0.
+
+        Raises:
+            ValueError: if the parameters are inconsistent or the budget is too small.
+        """
+        if eta < 2:
+            raise ValueError(f"Invalid eta (must be at least 2): {eta}")
+        if not 0 < min_duration_seconds <= max_duration_seconds:
+            raise ValueError(
+                f"Invalid durations: min {min_duration_seconds}, max {max_duration_seconds}"
+            )
+
+        self._space = CartesianProductSpace(variables)
+        self._objective = objective
+        self._maximize = maximize
+        self._eta = eta
+
+        self._durations = []
+        duration = min_duration_seconds
+        while duration < max_duration_seconds:
+            self._durations.append(duration)
+            duration *= eta
+        self._durations.append(max_duration_seconds)
+
+        max_nb_samples = len(self._space)
+        if nb_samples is None:
+            nb_samples = max_nb_samples
+            if budget_seconds is not None:
+                nb_samples = self._max_nb_samples_in_budget(
+                    max_nb_samples=max_nb_samples,
+                    budget_seconds=budget_seconds,
+                    nb_runs=nb_runs,
+                )
+        self._nb_samples = min(nb_samples, max_nb_samples)
+
+        sampler = random.Random(seed)
+        sample = sampler.sample(range(max_nb_samples), self._nb_samples)
+        self._round_configs: List[List[int]] = [sample]
+        self._config_ids: Dict[Tuple[int, Tuple[str, ...]], int] = {}
+        self._scores: Dict[Tuple[int, int], List[float]] = {}
+
+    def _max_nb_samples_in_budget(
+        self,
+        max_nb_samples: int,
+        budget_seconds: int,
+        nb_runs: int,
+    ) -> int:
+        if self._cost(nb_samples=1, nb_runs=nb_runs) > budget_seconds:
+            raise ValueError(f"Budget of {budget_seconds} seconds is too small for a single sample")
+
+        # the cost grows with the number of samples, binary search of the largest one in budget
+        low, high = 1, max_nb_samples
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._cost(nb_samples=middle, nb_runs=nb_runs) <= budget_seconds:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _nb_configs(self, round_id: int, nb_samples: int | None = None) -> int:
+        if nb_samples is None:
+            nb_samples = self._nb_samples
+        return max(1, nb_samples // self._eta**round_id)
+
+    def _cost(self, nb_samples: int, nb_runs: int) -> int:
+        return nb_runs * sum(
+            self._nb_configs(round_id, nb_samples) * duration
+            for round_id, duration in enumerate(self._durations)
+        )
+
+    @property
+    def names(self) -> List[str]:
+        return self._space.names + [SEARCH_ROUND_NAME, DURATION_NAME]
+
+    @property
+    def depends_on_results(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        # upper bound given by the schedule, invalid configurations may end the rounds earlier
+        return sum(self._nb_configs(round_id) for round_id in range(len(self._durations)))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # only the rounds decided so far: the next ones depend on results that do not exist yet
+        for round_id in range(len(self._round_configs)):
+            yield from self._round_records(round_id=round_id)
+
+    def groupby(
+        self,
+        variables_names: Iterable[str],
+    ) -> Iterator[Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]]:
+        # each round is generated once the previous one has run
+        vn = list(variables_names)
+        for round_id in range(len(self._durations)):
+            yield from list_groupby(vn, self._round_records(round_id=round_id))
+
+    def record_results(
+        self,
+        record_parameters: Dict[str, Any],
+        results_lines: List[Dict[str, Any]],
+    ) -> None:
+        round_id = int(record_parameters[SEARCH_ROUND_NAME])
+        config_id = self._config_ids.get((round_id, self._config_key(record_parameters)))
+        if config_id is None:
+            return
+
+        scores = self._scores.setdefault((round_id, config_id), [])
+        for line in results_lines:
+            if self._objective in line:
+                scores.append(float(line[self._objective]))
+
+    def expected_duration_seconds(self, benchmark_duration_seconds: int | None) -> int | None:
+        return self._cost(nb_samples=self._nb_samples, nb_runs=1)
+
+    def best(self) -> Tuple[Dict[str, Any], float] | None:
+        """
+        Get the best configuration found so far, from the latest round with results.
+
+        Returns:
+            Tuple[Dict[str, Any], float] | None:
+                the values of the variables of the best configuration and its mean objective, or
+                None if no result has been recorded.
+        """
+        for round_id in reversed(range(len(self._round_configs))):
+            ranking = self._ranking(round_id=round_id)
+            if ranking:
+                config_id, score = ranking[0]
+                return self._space[config_id], score
+        return None
+
+    def _round_records(self, round_id: int) -> List[Dict[str, Any]]:
+        while len(self._round_configs) <= round_id:
+            previous_round = len(self._round_configs) - 1
+            nb_survivors = self._nb_configs(round_id=previous_round + 1)
+            ranking = self._ranking(round_id=previous_round)
+            self._round_configs.append([config_id for config_id, _ in ranking[:nb_survivors]])
+
+        records = []
+        for config_id in self._round_configs[round_id]:
+            record = self._space[config_id]
+            self._config_ids[(round_id, self._config_key(record))] = config_id
+            record[SEARCH_ROUND_NAME] = round_id
+            record[DURATION_NAME] = self._durations[round_id]
+            records.append(record)
+        return records
+
+    def _ranking(self, round_id: int) -> List[Tuple[int, float]]:
+        # configurations without result (e.g. invalid ones) are not ranked
+        means = []
+        for config_id in self._round_configs[round_id]:
+            scores = self._scores.get((round_id, config_id))
+            if scores:
+                means.append((config_id, sum(scores) / len(scores)))
+        return sorted(means, key=lambda cs: cs[1], reverse=self._maximize)
+
+    def _config_key(self, record_parameters: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(record_parameters.get(name)) for name in self._space.names)
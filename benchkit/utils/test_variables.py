@@ -5,7 +5,11 @@
 import unittest
 from typing import Any, Iterable, List
 
-from benchkit.utils.variables import cartesian_product, list_groupby
+from benchkit.utils.variables import (
+    CartesianProductSpace,
+    cartesian_product,
+    list_groupby,
+)
 from benchkit.utils.variables import (
     list_groupby_from_multi_index_groupby as list_from_migb,
 )
@@ -155,6 +159,37 @@ class TestVariables(unittest.TestCase):
         }
         self.assertEqual(multi_index_groupby(["b", "c", "a"], cart), migb_bca)
 
+    def test_cartesian_product_space(self):
+        """Test the lazy cartesian product space against the materialized product."""
+        d = {"a": [1, 2, 3], "b": [], "c": [5, 6], "d": ["x", "y"]}
+        space = CartesianProductSpace(d)
+        cart = list(cartesian_product(d))
+
+        self.assertEqual(len(space), len(cart))
+        self.assertEqual(space.names, ["a", "c", "d"])
+        self.assert_gen_equal(space, cart)
+        self.assertEqual([space[i] for i in range(len(space))], cart)
+        self.assertEqual(space[-1], cart[-1])
+        with self.assertRaises(IndexError):
+            space[len(cart)]
+
+        self.assertEqual(len(CartesianProductSpace({})), 1)
+
+    def test_cartesian_product_space_groupby(self):
+        """Test grouping a lazy space gives the same groups as the list groupby."""
+        d = {"a": [1, 2, 1], "b": [4], "c": [5, 6]}
+        space = CartesianProductSpace(d)
+        cart = list(cartesian_product(d))
+
+        for variables_names in [[], ["a"], ["c"], ["c", "a"], ["b", "z"]]:
+            expected = list(list_groupby(variables_names, cart))
+            actual = [(group, list(records)) for group, records in space.groupby(variables_names)]
+            self.assertEqual(actual, expected)
+            self.assertEqual(
+                [list(group) for group, _ in space.groupby(variables_names)],
+                [list(group) for group, _ in expected],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,295 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Self-instrumentation of benchkit: timing of its own phases (builds, hooks, wrappers, shell
+commands, copies, parsing, result writes) as spans, exported as a Chrome trace-event JSON file that
+can be opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+Tracing is disabled by default and costs a single check per instrumented call in that case.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List
+
+from benchkit.utils.types import PathType
+
+CATEGORY_RUN = "run"
+
+_ARG_MAX_LENGTH = 256
+
+_tracer: "Tracer | None" = None
+_tracer_lock = threading.Lock()
+
+
+def _arg_str(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        value = " ".join(map(str, value))
+    value_str = str(value)
+    if len(value_str) > _ARG_MAX_LENGTH:
+        value_str = value_str[: _ARG_MAX_LENGTH - 3] + "..."
+    return value_str
+
+
+def callable_name(function: Callable) -> str:
+    """
+    Get a readable name of a callable (function, method, partial function or callable object),
+    e.g. to name the span of a hook.
+
+    Args:
+        function (Callable): the callable.
+
+    Returns:
+        str: the name of the callable.
+    """
+    function = getattr(function, "func", function)  # functools.partial
+    name = getattr(function, "__qualname__", None)
+    if name is None:
+        name = type(function).__qualname__
+    return name
+
+
+class Tracer:
+    """
+    Recorder of the spans of the phases of a campaign.
+    Spans of a category `CATEGORY_RUN` are the benchmark itself, the other ones are overhead of
+    the framework.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        Get the trace events recorded so far.
+
+        Returns:
+            List[Dict[str, Any]]: the trace events, in the Chrome trace-event format.
+        """
+        with self._lock:
+            return list(self._events)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        args: Dict[str, Any] | None = None,
+    ) -> Iterator[None]:
+        """
+        Record the time spent in the scope of the context manager as a span.
+
+        Args:
+            name (str): name of the span.
+            category (str): category of the span (e.g. "build", "hook", "shell").
+            args (Dict[str, Any] | None, optional): arguments shown with the span. Defaults to None.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(
+                name=name,
+                category=category,
+                start=start,
+                end=time.perf_counter(),
+                args=args,
+            )
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record a span measured with `time.perf_counter()`.
+
+        Args:
+            name (str): name of the span.
+            category (str): category of the span.
+            start (float): start time of the span.
+            end (float): end time of the span.
+            args (Dict[str, Any] | None, optional): arguments shown with the span. Defaults to None.
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": self._pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = {k: _arg_str(v) for k, v in args.items()}
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def write_chrome_trace(self, trace_path: PathType) -> None:
+        """
+        Write the recorded spans as a Chrome trace-event JSON file.
+
+        Args:
+            trace_path (PathType): path to the trace file.
+        """
+        with self._lock:
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+                for tid, thread_name in self._thread_names.items()
+            ]
+            trace = {"traceEvents": metadata + self._events, "displayTimeUnit": "ms"}
+        with open(trace_path, "w") as trace_file:
+            json.dump(trace, trace_file)
+
+    def summary(self, total_seconds: float) -> str:
+        """
+        Summarize the time spent in each kind of span, and the overhead of the framework, i.e.
+        the part of the total time not spent running the benchmark.
+        Nested spans are counted in each of their enclosing spans, and the spans of parallel
+        workers are summed, so the shares may exceed 100%.
+
+        Args:
+            total_seconds (float): total wall time of the campaign.
+
+        Returns:
+            str: the summary table.
+        """
+        totals: Dict[tuple, List[float]] = {}
+        for event in self.events:
+            if "X" != event["ph"]:
+                continue
+            entry = totals.setdefault((event["cat"], event["name"]), [0, 0.0])
+            entry[0] += 1
+            entry[1] += event["dur"] / 1e6
+
+        lines = [f"{'category':<12} {'span':<36} {'count':>8} {'total (s)':>12} {'share':>8}"]
+        for (category, name), (count, seconds) in sorted(totals.items(), key=lambda t: -t[1][1]):
+            share = 100 * seconds / total_seconds if total_seconds > 0 else 0.0
+            lines.append(
+                f"{category:<12} {name[:36]:<36} {count:>8} {seconds:>12.3f} {share:>7.1f}%"
+            )
+
+        run_seconds = sum(s for (category, _), (_, s) in totals.items() if CATEGORY_RUN == category)
+        overhead_seconds = max(total_seconds - run_seconds, 0.0)
+        overhead_share = 100 * overhead_seconds / total_seconds if total_seconds > 0 else 0.0
+        lines.append("-" * 80)
+        lines.append(f"Benchmark time:     {run_seconds:12.3f} s")
+        lines.append(f"Framework overhead: {overhead_seconds:12.3f} s ({overhead_share:.1f}%)")
+        lines.append(f"Total:              {total_seconds:12.3f} s")
+        return "\n".join(lines)
+
+
+def start_tracing() -> Tracer:
+    """
+    Start recording the spans of the current process.
+    The spans of all the threads (e.g. parallel workers) are recorded by the same tracer, hence a
+    single campaign of the process can be traced at a time.
+
+    Raises:
+        ValueError: if a tracer is already recording the spans of the process.
+
+    Returns:
+        Tracer: the tracer recording the spans.
+    """
+    global _tracer  # pylint: disable=global-statement
+    with _tracer_lock:
+        if _tracer is not None:
+            raise ValueError(
+                "Tracing is already active in this process, campaigns run concurrently (e.g. "
+                "the hosts of a distributed campaign) cannot be traced"
+            )
+        _tracer = Tracer()
+        return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """
+    Stop recording the spans of the current process.
+
+    Returns:
+        Tracer | None: the tracer that was recording the spans, if any.
+    """
+    global _tracer  # pylint: disable=global-statement
+    with _tracer_lock:
+        tracer, _tracer = _tracer, None
+    return tracer
+
+
+def trace_span(
+    name: str,
+    category: str,
+    args: Dict[str, Any] | None = None,
+) -> contextlib.AbstractContextManager:
+    """
+    Record the scope of the returned context manager as a span, if tracing is enabled.
+
+    Args:
+        name (str): name of the span.
+        category (str): category of the span.
+        args (Dict[str, Any] | None, optional): arguments shown with the span. Defaults to None.
+
+    Returns:
+        contextlib.AbstractContextManager: the context manager delimiting the span.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.span(name=name, category=category, args=args)
+
+
+def traced(
+    category: str,
+    name: str | None = None,
+    args: Callable[..., Dict[str, Any]] | None = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call of the decorated function as a span, if tracing is enabled.
+
+    Args:
+        category (str):
+            category of the spans.
+        name (str | None, optional):
+            name of the spans, the name of the function if None. Defaults to None.
+        args (Callable[..., Dict[str, Any]] | None, optional):
+            function computing the arguments of the span from the arguments of the call.
+            Defaults to None.
+
+    Returns:
+        Callable[[Callable], Callable]: the decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        span_name = function.__name__ if name is None else name
+
+        @functools.wraps(function)
+        def wrapper(*f_args, **f_kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return function(*f_args, **f_kwargs)
+            span_args = args(*f_args, **f_kwargs) if args is not None else None
+            with tracer.span(name=span_name, category=category, args=span_args):
+                return function(*f_args, **f_kwargs)
+
+        return wrapper
+
+    return decorator
@@ -3,9 +3,12 @@
 """
 Multi-index-group-by data structure to convert list of records with common (build or run) variables
 into a hierarchical structure.
+Also provides lazy parameter spaces, to iterate over large cartesian products of variables without
+materializing them.
 """
 
 import itertools
+import math
 from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 MultiIndexGroupby = Dict[str, Any] | List[Dict[str, Any]]
@@ -33,6 +36,183 @@ def cartesian_product(variables: Dict[str, Iterable[Any]]) -> Iterator[Dict[str,
     return product_gen
 
 
+class ParameterSpace:
+    """
+    Lazy collection of the records of a campaign.
+    Records are generated while the campaign runs instead of being materialized beforehand.
+    """
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get the names of the variables of the records of the space.
+
+        Returns:
+            List[str]: the names of the variables of the space.
+        """
+        raise NotImplementedError
+
+    @property
+    def depends_on_results(self) -> bool:
+        """
+        Whether the records of the space depend on the results of the previous records, in which
+        case a group of records is only generated once the previous groups have run.
+
+        Returns:
+            bool: whether the records of the space depend on the results of the previous records.
+        """
+        return False
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def groupby(
+        self,
+        variables_names: Iterable[str],
+    ) -> Iterator[Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]]:
+        """
+        Group the records of the space by the values of the given variables, in the same order as
+        `list_groupby`.
+
+        Args:
+            variables_names (Iterable[str]): names of the variables to group by.
+
+        Yields:
+            Iterator[Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]]:
+                the values of the grouping variables and the records of the group.
+        """
+        raise NotImplementedError
+
+    def record_results(
+        self,
+        record_parameters: Dict[str, Any],
+        results_lines: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Feedback of the results of a run of one of the records of the space.
+        By default, the results are ignored.
+
+        Args:
+            record_parameters (Dict[str, Any]):
+                parameters of the record that ran.
+            results_lines (List[Dict[str, Any]]):
+                result lines of the run, as written in the CSV output.
+        """
+
+    def expected_duration_seconds(self, benchmark_duration_seconds: int | None) -> int | None:
+        """
+        Compute the expected duration of one run of all the records of the space.
+
+        Args:
+            benchmark_duration_seconds (int | None):
+                duration of one run of a record, None if unknown.
+
+        Returns:
+            int | None: the expected duration in seconds, None if unknown.
+        """
+        if benchmark_duration_seconds is None:
+            return None
+        return len(self) * benchmark_duration_seconds
+
+
+class CartesianProductSpace(ParameterSpace):
+    """
+    Lazy cartesian product of variables.
+    Only the values of each dimension are stored, records are generated on demand, in the same
+    order as `cartesian_product` (the last variable varies the fastest). Its size is computed from
+    the cardinalities of the dimensions and any record can be accessed by its index.
+    """
+
+    def __init__(self, variables: Dict[str, Iterable[Any]]) -> None:
+        all_variables = {k: list(v) for k, v in variables.items()}
+        self._dimensions = {k: v for k, v in all_variables.items() if v}
+        self._names = list(self._dimensions.keys())
+        self._cardinalities = [len(v) for v in self._dimensions.values()]
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get the names of the variables (dimensions) of the space.
+
+        Returns:
+            List[str]: the names of the variables of the space.
+        """
+        return list(self._names)
+
+    @property
+    def dimensions(self) -> Dict[str, List[Any]]:
+        """
+        Get the values of each variable (dimension) of the space.
+
+        Returns:
+            Dict[str, List[Any]]: the values of each variable of the space.
+        """
+        return {k: list(v) for k, v in self._dimensions.items()}
+
+    def __len__(self) -> int:
+        return math.prod(self._cardinalities)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for record in itertools.product(*self._dimensions.values()):
+            yield dict(zip(self._names, record))
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Index {index} out of range for a space of {size} records")
+
+        # mixed-radix decomposition of the index, the last dimension being the least significant:
+        values = []
+        for name, cardinality in zip(reversed(self._names), reversed(self._cardinalities)):
+            index, position = divmod(index, cardinality)
+            values.append((name, self._dimensions[name][position]))
+        return dict(reversed(values))
+
+    def groupby(
+        self,
+        variables_names: Iterable[str],
+    ) -> Iterator[Tuple[Dict[str, Any], "CartesianProductSpace"]]:
+        """
+        Group the records of the space by the values of the given variables.
+        The grouping variables are iterated as the outermost dimensions, so the groups come in the
+        same order as with `list_groupby` and each group is itself a lazy space where the grouping
+        variables have a single value. Variables that are not dimensions of the space are grouped
+        with the None value.
+
+        Args:
+            variables_names (Iterable[str]): names of the variables to group by.
+
+        Yields:
+            Iterator[Tuple[Dict[str, Any], CartesianProductSpace]]:
+                the values of the grouping variables and the space of the records of the group.
+        """
+
+        def unique(values: List[Any]) -> List[Any]:
+            # values may not be hashable (e.g. lists), keep the first occurrence of each value
+            result = []
+            for value in values:
+                if value not in result:
+                    result.append(value)
+            return result
+
+        vn = list(variables_names)
+        group_dimensions = [unique(self._dimensions.get(name, [None])) for name in vn]
+        for group_values in itertools.product(*group_dimensions):
+            group = dict(zip(vn, group_values))
+            group_space = CartesianProductSpace(
+                {
+                    name: [v for v in values if v == group[name]] if name in group else values
+                    for name, values in self._dimensions.items()
+                }
+            )
+            yield group, group_space
+
+
 def multi_index_groupby(
     variables_names: Iterable[str],
     bench_variables: Iterable[Dict[str, Any]],
@@ -123,5 +303,7 @@ def list_groupby(
         ListGroupby: the list groupby from the benchmark variables.
     """
     vn = list(variables_names)
+    if isinstance(bench_variables, ParameterSpace):
+        return bench_variables.groupby(vn)
     migb = multi_index_groupby(vn, bench_variables)
     return list_groupby_from_multi_index_groupby(migb, vn)
@@ -51,8 +51,11 @@ class CloudsuiteBench(Benchmark):
         bench_src_path = pathlib.Path(src_dir)
         dockerfile_path = bench_src_path / "benchmarks/web-serving/db_server/Dockerfile"
 
-        dir_is_present = self.platform.comm.isdir(bench_src_path)
-        dockerfile_is_present = self.platform.comm.isfile(dockerfile_path)
+        dir_status, dockerfile_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, dockerfile_path]
+        )
+        dir_is_present = dir_status.is_dir
+        dockerfile_is_present = dockerfile_status.is_file
 
         if not (dir_is_present and dockerfile_is_present):
             raise ValueError(
@@ -42,9 +42,10 @@ class LevelDBBench(Benchmark):
             self.platform = platform  # TODO Warning! overriding upper class platform
 
         bench_src_path = pathlib.Path(src_dir)
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(
-            bench_src_path / "benchmarks/db_bench.cc"
-        ):
+        src_status, bench_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, bench_src_path / "benchmarks/db_bench.cc"]
+        )
+        if not src_status.is_dir and bench_status.is_file:
             raise ValueError(
                 f"Invalid LevelDB source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
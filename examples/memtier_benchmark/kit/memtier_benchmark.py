@@ -49,8 +49,11 @@ class MemtierBench(Benchmark):
         server_bench_src_path = pathlib.Path(server_src_dir)
         server_makefile_path = server_bench_src_path / "Makefile"
 
-        server_dir_exists = self.server_platform.comm.isdir(server_bench_src_path)
-        server_mkf_exists = self.server_platform.comm.isfile(server_makefile_path)
+        server_dir_status, server_mkf_status = self.server_platform.comm.stat_many(
+            paths=[server_bench_src_path, server_makefile_path]
+        )
+        server_dir_exists = server_dir_status.is_dir
+        server_mkf_exists = server_mkf_status.is_file
         if not (server_dir_exists and server_mkf_exists):
             raise ValueError(
                 f"Invalid Redis source path: {server_bench_src_path}\n"
@@ -65,8 +68,11 @@ class MemtierBench(Benchmark):
         client_bench_src_path = pathlib.Path(client_src_dir)
         client_bench_hdr_path = client_bench_src_path / "memtier_benchmark.h"
 
-        client_dir_exists = self.client_platform.comm.isdir(client_bench_src_path)
-        client_hdr_exists = self.client_platform.comm.isfile(client_bench_hdr_path)
+        client_dir_status, client_hdr_status = self.client_platform.comm.stat_many(
+            paths=[client_bench_src_path, client_bench_hdr_path]
+        )
+        client_dir_exists = client_dir_status.is_dir
+        client_hdr_exists = client_hdr_status.is_file
 
         if not (client_dir_exists and client_hdr_exists):
             raise ValueError(
@@ -649,5 +649,5 @@ class MySQLServer(DBMS):
         )
 
         paths_executables = [bin_dir / e for e in self._executables]
-        result = all(self.platform.comm.isfile(p) for p in paths_executables)
+        result = all(s.is_file for s in self.platform.comm.stat_many(paths=paths_executables))
         return result
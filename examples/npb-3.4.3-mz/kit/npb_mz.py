@@ -41,9 +41,10 @@ class NPBMZBench(Benchmark):
 
         # TODO duplication with LevelDB & perhaps many more in the future.
         bench_src_path = pathlib.Path(src_dir)
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(
-            bench_src_path / "NPB3.4-MZ-SER.README"
-        ):
+        src_status, readme_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, bench_src_path / "NPB3.4-MZ-SER.README"]
+        )
+        if not src_status.is_dir and readme_status.is_file:
             raise ValueError(
                 f"Invalid NAS parallel benchmark MZ source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
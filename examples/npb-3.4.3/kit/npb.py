@@ -42,12 +42,10 @@ class NPBBench(Benchmark):
 
         bench_src_path = pathlib.Path(src_dir)
         readme_file = bench_src_path / "README"
-        if not all(
-            [
-                self.platform.comm.isdir(bench_src_path),
-                self.platform.comm.isfile(readme_file),
-            ]
-        ):
+        src_status, readme_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, readme_file]
+        )
+        if not (src_status.is_dir and readme_status.is_file):
             raise ValueError(
                 f"Invalid NAS parallel benchmark source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
@@ -46,9 +46,10 @@ class RedisBench(Benchmark):
 
         # TODO duplication with LevelDB & perhaps many more in the future.
         bench_src_path = pathlib.Path(src_dir)
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(
-            bench_src_path / "Makefile"
-        ):
+        src_status, file_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, bench_src_path / "Makefile"]
+        )
+        if not src_status.is_dir and file_status.is_file:
             raise ValueError(
                 f"Invalid Redis source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
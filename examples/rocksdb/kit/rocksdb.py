@@ -51,7 +51,8 @@ class RocksDBBench(Benchmark):
 
         bench_src_path = pathlib.Path(src_dir)
         a_file = bench_src_path / "Makefile"
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(a_file):
+        src_status, file_status = self.platform.comm.stat_many(paths=[bench_src_path, a_file])
+        if not src_status.is_dir and file_status.is_file:
             raise ValueError(
                 f"Invalid RocksDB source path: {bench_src_path}\n"
                 "src_dir argument must be defined manually."
@@ -6,7 +6,7 @@ See: https://github.com/jeffhammond/STREAM.git
 """
 
 import pathlib
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 from benchkit.benchmark import Benchmark, CommandAttachment, PostRunHook, PreRunHook
 from benchkit.campaign import CampaignCartesianProduct, Constants
@@ -42,9 +42,10 @@ class StreamBench(Benchmark):
             self.platform = platform  # TODO Warning! overriding upper class platform
 
         bench_src_path = pathlib.Path(src_dir)
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(
-            bench_src_path / "stream.c"
-        ):
+        src_status, file_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, bench_src_path / "stream.c"]
+        )
+        if not src_status.is_dir and file_status.is_file:
             raise ValueError(
                 f"Invalid STREAM source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
@@ -87,15 +88,30 @@ class StreamBench(Benchmark):
     def prebuild_bench(self, **_kwargs):
         pass
 
+    def pipelined_build_base_dir(self) -> PathType | None:
+        return self._build_dir
+
+    def build_artifacts(  # pylint: disable=arguments-differ
+        self,
+        build_dir: PathType | None = None,
+        **_kwargs,
+    ) -> List[PathType]:
+        return [self._build_dir if build_dir is None else build_dir]
+
     def build_bench(  # pylint: disable=arguments-differ
         self,
         array_size: int,
+        build_dir: PathType | None = None,
+        build_cpus: List[int] | None = None,
         **_kwargs,
     ):
-        build_dir = self._build_dir
+        if build_dir is None:
+            build_dir = self._build_dir
 
+        # pipelined builds run next to the benchmark, on the CPUs they are given
+        taskset = "" if build_cpus is None else f"taskset -c {','.join(map(str, build_cpus))} "
         self.platform.comm.shell(
-            command=f"make N={array_size} BUILD={build_dir}",
+            command=f"{taskset}make N={array_size} BUILD={build_dir}",
             current_dir=self._bench_src_path,
         )
 
@@ -111,6 +127,7 @@ class StreamBench(Benchmark):
         self,
         master_thread_core: Optional[int],
         nb_threads: int,
+        build_dir: PathType | None = None,
         **_kwargs,
     ):
         environment = self._preload_env(master_thread_core=master_thread_core)
@@ -131,7 +148,7 @@ class StreamBench(Benchmark):
         output = self.run_bench_command(
             run_command=run_command,
             wrapped_run_command=wrapped_run_command,
-            current_dir=self._build_dir,
+            current_dir=self._build_dir if build_dir is None else build_dir,
             environment=environment,
             wrapped_environment=wrapped_environment,
             print_output=False,
@@ -183,6 +200,9 @@ def stream_campaign(
     gdb: bool = False,
     enable_data_dir: bool = False,
     continuing: bool = False,
+    pipelined_builds: bool = False,
+    build_cpus: Optional[List[int]] = None,
+    build_cache_dir: Optional[PathType] = None,
 ) -> CampaignCartesianProduct:
     """Return a cartesian product campaign configured for the STREAM benchmark."""
     variables = {
@@ -218,4 +238,7 @@ def stream_campaign(
         continuing=continuing,
         benchmark_duration_seconds=0,
         results_dir=results_dir,
+        pipelined_builds=pipelined_builds,
+        build_cpus=build_cpus,
+        build_cache_dir=build_cache_dir,
     )
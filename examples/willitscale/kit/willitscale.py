@@ -45,9 +45,10 @@ class WillItScaleBench(Benchmark):
 
         # TODO duplication with LevelDB & perhaps many more in the future.
         bench_src_path = pathlib.Path(src_dir)
-        if not self.platform.comm.isdir(bench_src_path) and self.platform.comm.isfile(
-            bench_src_path / "main.c"
-        ):
+        src_status, file_status = self.platform.comm.stat_many(
+            paths=[bench_src_path, bench_src_path / "main.c"]
+        )
+        if not src_status.is_dir and file_status.is_file:
             raise ValueError(
                 f"Invalid Will-it-Scale source path: {bench_src_path}\n"
                 "src_dir argument can be defined manually."
@@ -0,0 +1,5 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Benchmarks of benchkit itself, tracking the overhead of the framework over time.
+"""
@@ -0,0 +1,71 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Benchmark doing nothing, run in-process, such that a campaign of it only measures the time spent
+in the campaign loop of benchkit.
+The unit tests that run campaigns in-process subclass it, overriding the runs and the variables.
+"""
+
+import pathlib
+from typing import Any, Dict, Iterable, List
+
+from benchkit.benchmark import Benchmark, CommandAttachment, PostRunHook
+
+
+class NoopBench(Benchmark):
+    """
+    Benchmark whose runs return immediately, without starting any process.
+    """
+
+    def __init__(
+        self,
+        command_attachments: Iterable[CommandAttachment] = (),
+        post_run_hooks: Iterable[PostRunHook] = (),
+    ) -> None:
+        super().__init__(
+            command_wrappers=(),
+            command_attachments=command_attachments,
+            shared_libs=(),
+            pre_run_hooks=(),
+            post_run_hooks=post_run_hooks,
+        )
+
+    @property
+    def bench_src_path(self) -> pathlib.Path:
+        return pathlib.Path(__file__).resolve().parent
+
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return ["build_id"]
+
+    @staticmethod
+    def get_run_var_names() -> List[str]:
+        return ["record_id"]
+
+    def clean_bench(self) -> None:
+        pass
+
+    def prebuild_bench(
+        self,
+        **kwargs,
+    ) -> int:
+        return 0
+
+    def build_bench(
+        self,
+        **kwargs,
+    ) -> None:
+        pass
+
+    def single_run(
+        self,
+        **kwargs,
+    ) -> str:
+        return "0"
+
+    def parse_output_to_results(  # pylint: disable=arguments-differ
+        self,
+        command_output: str,
+        **_kwargs,
+    ) -> Dict[str, Any]:
+        return {"value": int(command_output)}
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""
+Microbenchmarks of the overhead of benchkit itself.
+
+Each "helper" measures one hot path of the framework on synthetic campaigns of an increasing
+number of records: the whole campaign loop (`Benchmark.run` with a benchmark doing nothing) and the
+helpers it relies on (parameter space iteration, grouping of the records, lookup of the results
+already recorded, CSV writes, command splitting and logging). The measures are themselves run as
+a benchkit campaign, such that the results are stored in the usual CSV format and can be compared
+across versions of benchkit.
+
+Usage (from the root of the repository):
+    python -m tests.overhead.overhead
+    python -m tests.overhead.overhead --helpers run_loop csv_write --sizes 1000 10000 --nb-runs 5
+"""
+
+import argparse
+import contextlib
+import os
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchkit.benchmark import Benchmark
+from benchkit.campaign import CampaignCartesianProduct
+from benchkit.results.cache import ResultCache
+from benchkit.results.sink import CsvResultSink
+from benchkit.shell.utils import get_args, print_header
+from benchkit.utils.variables import (
+    cartesian_product,
+    list_groupby,
+    multi_index_groupby,
+)
+from tests.overhead.noop import NoopBench
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6]
+
+_NB_BUILDS = 10
+_COMMAND = "numactl --cpunodebind=0 ./bench --threads 8 --duration 10 --output results.txt"
+
+
+def _variables(nb_records: int) -> Dict[str, range]:
+    return {
+        "build_id": range(_NB_BUILDS),
+        "record_id": range(max(nb_records // _NB_BUILDS, 1)),
+    }
+
+
+def _records(nb_records: int) -> List[Dict[str, Any]]:
+    return list(cartesian_product(_variables(nb_records=nb_records)))
+
+
+def _results_lines(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"experiment_name": "noop", "rep": 1, "value": 0} | {k: str(v) for k, v in r.items()}
+        for r in records
+    ]
+
+
+def _noop_campaign(nb_records: int, results_dir: pathlib.Path) -> CampaignCartesianProduct:
+    return CampaignCartesianProduct(
+        name="noop",
+        benchmark=NoopBench(),
+        nb_runs=1,
+        variables=_variables(nb_records=nb_records),
+        constants=None,
+        debug=False,
+        gdb=False,
+        enable_data_dir=False,
+        results_dir=results_dir,
+        journal=False,
+    )
+
+
+def time_run_loop(nb_records: int) -> float:
+    """
+    Time a whole campaign of a benchmark doing nothing, i.e. the campaign loop of benchkit with
+    its logging, result caching and CSV output.
+
+    Args:
+        nb_records (int): number of records of the campaign.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    with tempfile.TemporaryDirectory() as results_dir:
+        campaign = _noop_campaign(nb_records=nb_records, results_dir=pathlib.Path(results_dir))
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            campaign.parameters["benchmark"].run(
+                other_campaigns_seconds=0,
+                barrier=None,
+                continuing=False,
+            )
+            return time.perf_counter() - start
+
+
+def time_cartesian_product(nb_records: int) -> float:
+    """
+    Time the generation of the records of a cartesian product.
+
+    Args:
+        nb_records (int): number of records to generate.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    variables = _variables(nb_records=nb_records)
+    start = time.perf_counter()
+    for _ in cartesian_product(variables):
+        pass
+    return time.perf_counter() - start
+
+
+def time_list_groupby(nb_records: int) -> float:
+    """
+    Time the grouping of the records by build variables.
+
+    Args:
+        nb_records (int): number of records to group.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    records = _records(nb_records=nb_records)
+    start = time.perf_counter()
+    for _ in list_groupby(variables_names=["build_id"], bench_variables=records):
+        pass
+    return time.perf_counter() - start
+
+
+def time_multi_index_groupby(nb_records: int) -> float:
+    """
+    Time the construction of the multi-index groupby tree of the records.
+
+    Args:
+        nb_records (int): number of records to group.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    records = _records(nb_records=nb_records)
+    start = time.perf_counter()
+    multi_index_groupby(variables_names=["build_id", "record_id"], bench_variables=records)
+    return time.perf_counter() - start
+
+
+def time_result_cache(nb_records: int) -> float:
+    """
+    Time the indexing of the recorded results of a campaign and the lookup of each record in it,
+    as done when a campaign is continued.
+
+    Args:
+        nb_records (int): number of recorded results.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    lines = _results_lines(records=_records(nb_records=nb_records))
+    executions = [{k: v for k, v in line.items() if "value" != k} for line in lines]
+    start = time.perf_counter()
+    result_cache = ResultCache.from_lines(lines=lines)
+    for execution in executions:
+        result_cache.lookup(record=execution)
+    return time.perf_counter() - start
+
+
+def time_csv_write(nb_records: int) -> float:
+    """
+    Time the writing of one result line per record to a CSV output.
+
+    Args:
+        nb_records (int): number of lines to write.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    lines = _results_lines(records=_records(nb_records=nb_records))
+    with tempfile.TemporaryDirectory() as results_dir:
+        sink = CsvResultSink(
+            csv_path=pathlib.Path(results_dir) / "results.csv",
+            max_nb_threads=0,
+            echo=False,
+        )
+        start = time.perf_counter()
+        with sink:
+            for line in lines:
+                sink.write_lines(lines=[line])
+        return time.perf_counter() - start
+
+
+def time_get_args(nb_records: int) -> float:
+    """
+    Time the splitting of one command per record.
+
+    Args:
+        nb_records (int): number of commands to split.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(nb_records):
+        get_args(_COMMAND)
+    return time.perf_counter() - start
+
+
+def time_print_header(nb_records: int) -> float:
+    """
+    Time the logging of one command per record.
+
+    Args:
+        nb_records (int): number of commands to log.
+
+    Returns:
+        float: the duration, in seconds.
+    """
+    arguments = get_args(_COMMAND)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(nb_records):
+            print_header(
+                arguments=arguments,
+                current_dir="/tmp",
+                environment={"OMP_NUM_THREADS": "8"},
+                print_input=True,
+                print_env=True,
+                print_curdir=True,
+                print_shell_cmd=True,
+                print_file_shell_cmd=False,
+                asynced=False,
+                remote_host=None,
+            )
+        return time.perf_counter() - start
+
+
+HELPERS: Dict[str, Callable[[int], float]] = {
+    "run_loop": time_run_loop,
+    "cartesian_product": time_cartesian_product,
+    "list_groupby": time_list_groupby,
+    "multi_index_groupby": time_multi_index_groupby,
+    "result_cache": time_result_cache,
+    "csv_write": time_csv_write,
+    "get_args": time_get_args,
+    "print_header": time_print_header,
+}
+
+
+class OverheadBench(Benchmark):
+    """
+    Benchmark measuring the overhead of benchkit, each run times one helper on a given number of
+    records, in-process.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            command_wrappers=(),
+            command_attachments=(),
+            shared_libs=(),
+            pre_run_hooks=(),
+            post_run_hooks=(),
+        )
+
+    @property
+    def bench_src_path(self) -> pathlib.Path:
+        return pathlib.Path(__file__).resolve().parent
+
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return []
+
+    @staticmethod
+    def get_run_var_names() -> List[str]:
+        return ["helper", "nb_records"]
+
+    def clean_bench(self) -> None:
+        pass
+
+    def prebuild_bench(
+        self,
+        **kwargs,
+    ) -> int:
+        return 0
+
+    def build_bench(
+        self,
+        **kwargs,
+    ) -> None:
+        pass
+
+    def single_run(  # pylint: disable=arguments-differ
+        self,
+        helper: str,
+        nb_records: int,
+        **kwargs,
+    ) -> str:
+        duration_seconds = HELPERS[helper](nb_records)
+        return f"{duration_seconds} {nb_records}"
+
+    def parse_output_to_results(  # pylint: disable=arguments-differ
+        self,
+        command_output: str,
+        **_kwargs,
+    ) -> Dict[str, Any]:
+        duration_str, nb_records_str = command_output.split()
+        duration_seconds = float(duration_str)
+        return {
+            "duration_seconds": duration_seconds,
+            "per_record_us": 1e6 * duration_seconds / int(nb_records_str),
+        }
+
+
+def overhead_campaign(
+    helpers: List[str],
+    sizes: List[int],
+    nb_runs: int,
+    results_dir: pathlib.Path | None = None,
+) -> CampaignCartesianProduct:
+    """
+    Create the campaign measuring the overhead of benchkit.
+
+    Args:
+        helpers (List[str]): names of the helpers to time (keys of `HELPERS`).
+        sizes (List[int]): numbers of records of the synthetic campaigns.
+        nb_runs (int): number of repetitions of each measure.
+        results_dir (pathlib.Path | None, optional):
+            where to store the results, "results/" if None. Defaults to None.
+
+    Returns:
+        CampaignCartesianProduct: the campaign.
+    """
+    return CampaignCartesianProduct(
+        name="overhead",
+        benchmark=OverheadBench(),
+        nb_runs=nb_runs,
+        variables={"helper": helpers, "nb_records": sizes},
+        constants=None,
+        debug=False,
+        gdb=False,
+        enable_data_dir=False,
+        results_dir=results_dir,
+        journal=False,
+    )
+
+
+def main() -> None:
+    """Main function of the overhead benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--helpers", nargs="+", choices=list(HELPERS), default=list(HELPERS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--nb-runs", type=int, default=3)
+    parser.add_argument("--results-dir", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    campaign = overhead_campaign(
+        helpers=args.helpers,
+        sizes=args.sizes,
+        nb_runs=args.nb_runs,
+        results_dir=args.results_dir,
+    )
+    campaign.run()
+
+
+if __name__ == "__main__":
+    main()
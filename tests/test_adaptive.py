@@ -0,0 +1,52 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the adaptive number of repetitions."""
+
+import unittest
+
+from benchkit.results.adaptive import AdaptiveRepetitions, t_quantile
+
+
+class TestAdaptiveRepetitions(unittest.TestCase):
+    """
+    Unit tests for the adaptive number of repetitions.
+    """
+
+    def test_t_quantile(self):
+        """Student quantiles come from the table, then from the normal distribution."""
+        self.assertEqual(12.706, t_quantile(confidence=0.95, degrees_of_freedom=1))
+        self.assertEqual(2.042, t_quantile(confidence=0.95, degrees_of_freedom=30))
+        self.assertEqual(1.960, t_quantile(confidence=0.95, degrees_of_freedom=100))
+        with self.assertRaises(ValueError):
+            t_quantile(confidence=0.5, degrees_of_freedom=1)
+
+    def test_bounds(self):
+        """The number of repetitions stays within the bounds of the policy."""
+        policy = AdaptiveRepetitions(metric="throughput", min_runs=3, max_runs=5)
+        self.assertFalse(policy.is_done([100.0, 100.0]))
+        self.assertTrue(policy.is_done([100.0, 100.0, 100.0]))
+        self.assertFalse(policy.is_done([10.0, 100.0, 1000.0, 1.0]))
+        self.assertTrue(policy.is_done([10.0, 100.0, 1000.0, 1.0, 50.0]))
+
+    def test_criteria(self):
+        """The confidence interval is wider than the coefficient of variation with few runs."""
+        values = [98.0, 100.0, 102.0]
+        ci_policy = AdaptiveRepetitions(metric="m", target=0.03, criterion="ci")
+        cv_policy = AdaptiveRepetitions(metric="m", target=0.03, criterion="cv")
+        self.assertAlmostEqual(0.02, cv_policy.precision(values))
+        self.assertAlmostEqual(4.303 * 2 / 3**0.5 / 100, ci_policy.precision(values))
+        self.assertTrue(cv_policy.is_done(values))
+        self.assertFalse(ci_policy.is_done(values))
+
+    def test_invalid(self):
+        """Inconsistent policies are rejected."""
+        with self.assertRaises(ValueError):
+            AdaptiveRepetitions(metric="m", min_runs=1)
+        with self.assertRaises(ValueError):
+            AdaptiveRepetitions(metric="m", min_runs=5, max_runs=4)
+        with self.assertRaises(ValueError):
+            AdaptiveRepetitions(metric="m", criterion="iqr")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the benchkit agent."""
+
+import os
+import pathlib
+import signal
+import sys
+import tempfile
+import unittest
+
+from benchkit.communication import LocalCommLayer
+from benchkit.communication.agent import AgentClient, AgentError, agent_command
+
+# answers each call after an invalid line, never answers "ignored" and exits on "exit"
+_FAULTY_AGENT = """
+import json, sys
+for line in sys.stdin:
+    request = json.loads(line)
+    if "exit" == request["method"]:
+        sys.exit(0)
+    if "ignored" != request["method"]:
+        print("{invalid", flush=True)
+        print(json.dumps({"id": request["id"], "result": request["method"]}), flush=True)
+"""
+
+
+class TestAgent(unittest.TestCase):
+    """
+    Unit tests for the benchkit agent.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = pathlib.Path(self._tmp_dir.name)
+        self.agent = LocalCommLayer().start_agent()
+
+    def tearDown(self):
+        self.agent.close()
+        self._tmp_dir.cleanup()
+
+    def test_hello(self):
+        """The agent answers with the version of its protocol."""
+        self.assertEqual(1, self.agent.info["version"])
+        self.assertNotEqual(os.getpid(), self.agent.info["pid"])
+        self.assertTrue(self.agent.alive)
+
+    def test_files(self):
+        """Files are written, appended, read, listed and stated on the host."""
+        path = self.tmp_path / "dir" / "file.txt"
+        self.agent.makedirs(path.parent)
+        self.agent.write_file(path, content="a\n")
+        self.agent.write_file(path, content="b\xe9\n", append=True)
+        self.assertEqual("a\nb\xe9\n", self.agent.read_file(path))
+        self.assertEqual(["file.txt"], self.agent.listdir(path.parent))
+
+        status = self.agent.stat(path)
+        self.assertTrue(status["is_file"])
+        self.assertEqual(path.stat().st_size, status["size"])
+        self.assertIsNone(self.agent.stat(self.tmp_path / "missing"))
+
+        self.agent.remove(path.parent, recursive=True)
+        self.assertFalse(path.parent.exists())
+
+    def test_errors(self):
+        """System errors are raised as their local equivalent, other errors as agent errors."""
+        with self.assertRaises(FileNotFoundError):
+            self.agent.read_file(self.tmp_path / "missing")
+        self.assertEqual([None, ""], self.agent.read_files([self.tmp_path / "missing", os.devnull]))
+        with self.assertRaises(AgentError):
+            self.agent.call("unknown")
+        with self.assertRaises(AgentError):
+            self.agent.wait(pid=1)
+
+    def test_processes(self):
+        """Processes are spawned, waited, and signaled."""
+        output = self.tmp_path / "output.txt"
+        pid = self.agent.spawn(command="echo spawned; exit 3", stdout=output)
+        self.assertEqual(3, self.agent.wait(pid))
+        self.assertEqual("spawned\n", output.read_text())
+
+        pid = self.agent.spawn(command=["sleep", "30"])
+        self.assertIsNone(self.agent.wait(pid, timeout=0.01))
+        self.agent.signal(pid=pid, signal_code=signal.SIGTERM)
+        self.assertEqual(-signal.SIGTERM, self.agent.wait(pid))
+
+        completed = self.agent.call("run", command=["sh", "-c", "echo out; exit 2"])
+        self.assertEqual({"returncode": 2, "stdout": "out\n", "stderr": ""}, completed)
+
+    def test_pipelining(self):
+        """Calls are pipelined, a blocking call does not delay the next ones."""
+        blocking = self.agent.submit("run", command=["sleep", "1"])
+        futures = [self.agent.submit("stat", path=os.devnull) for _ in range(100)]
+        self.assertTrue(all(f.result(timeout=0.5) is not None for f in futures))
+        self.assertFalse(blocking.done())
+        self.assertEqual(0, blocking.result()["returncode"])
+
+    def test_sample(self):
+        """The counters of /proc are sampled by the agent."""
+        sample = self.agent.sample()
+        self.assertEqual(2, len(sample["mem"]))
+        self.assertGreater(sample["mem"][0], 0)
+
+    def test_bootstrap(self):
+        """The command starting the agent does not embed its sources."""
+        self.assertLess(len(agent_command()), 1000)
+
+    def test_faulty_agent(self):
+        """Invalid responses are skipped, unanswered calls time out or fail when the agent exits."""
+        agent = AgentClient(channel=[sys.executable, "-c", _FAULTY_AGENT])
+        try:
+            self.assertEqual("ping", agent.call("ping"))
+            with self.assertRaises(AgentError):
+                agent.call("ignored", timeout_seconds=0.1)
+            unanswered = agent.submit("ignored")
+            agent.submit("exit")
+            with self.assertRaises(AgentError):
+                unanswered.result(timeout=5)
+        finally:
+            agent.close()
+
+    def test_close(self):
+        """Closing stops the agent, calls then fail."""
+        self.agent.close()
+        self.assertFalse(self.agent.alive)
+        with self.assertRaises(AgentError):
+            self.agent.call("ping")
+
+
+if __name__ == "__main__":
+    unittest.main()
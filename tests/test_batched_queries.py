@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the batched filesystem queries of the communication layers."""
+
+import os
+import pathlib
+import subprocess
+import tempfile
+import unittest
+
+from benchkit.communication import CommunicationLayer, LocalCommLayer, PathStatus
+from benchkit.dependencies.executables import ExecutableDependency, resolve_executables
+from benchkit.platforms import Platform
+
+
+class _ShellCommLayer(CommunicationLayer):
+    """Communication layer running the commands with a local shell, like a remote host would."""
+
+    def __init__(self):
+        super().__init__()
+        self.nb_commands = 0
+
+    def shell(self, command, **kwargs) -> str:  # pylint: disable=arguments-differ
+        self.nb_commands += 1
+        return subprocess.run(
+            command,
+            shell=True,
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        ).stdout
+
+
+class TestBatchedQueries(unittest.TestCase):
+    """
+    Unit tests for the batched filesystem queries of the communication layers.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = pathlib.Path(self._tmp_dir.name)
+        (self.tmp_path / "dir").mkdir()
+        (self.tmp_path / "file.txt").write_text("line 1\nno trailing newline")
+        (self.tmp_path / "it's empty").write_text("")
+        os.symlink(self.tmp_path / "nowhere", self.tmp_path / "dangling")
+        self.shell_comm = _ShellCommLayer()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_stat_many(self):
+        """Paths are checked in one command, with the same results as locally."""
+        paths = [self.tmp_path / n for n in ("dir", "file.txt", "it's empty", "dangling", "none")]
+        statuses = self.shell_comm.stat_many(paths=paths)
+        self.assertEqual(1, self.shell_comm.nb_commands)
+        self.assertEqual(
+            [
+                PathStatus(exists=True, is_dir=True),
+                PathStatus(exists=True, is_file=True),
+                PathStatus(exists=True, is_file=True),
+                PathStatus(exists=False, is_link=True),
+                PathStatus(exists=False),
+            ],
+            statuses,
+        )
+        self.assertEqual(statuses, LocalCommLayer().stat_many(paths=paths))
+        self.assertEqual([], self.shell_comm.stat_many(paths=[]))
+
+    def test_read_many(self):
+        """Files are read in one command, None for the ones that cannot be read."""
+        paths = [self.tmp_path / n for n in ("file.txt", "none", "it's empty", "dir")]
+        contents = self.shell_comm.read_many(paths=paths)
+        self.assertEqual(1, self.shell_comm.nb_commands)
+        self.assertEqual(["line 1\nno trailing newline", None, "", None], contents)
+        self.assertEqual(contents, LocalCommLayer().read_many(paths=paths))
+
+    def test_which_many(self):
+        """Executables are looked up in one command."""
+        cmds = ["sh", "benchkit-not-a-command", "ls"]
+        paths = self.shell_comm.which_many(cmds=cmds)
+        self.assertEqual(1, self.shell_comm.nb_commands)
+        self.assertEqual(LocalCommLayer().which_many(cmds=cmds), paths)
+        self.assertIsNone(paths[1])
+
+    def test_resolve_executables(self):
+        """The executable dependencies of a platform are resolved in one command."""
+        platform = Platform(self.shell_comm)
+        dependencies = [
+            ExecutableDependency(executable="sh", platform=platform),
+            ExecutableDependency(executable="benchkit-not-a-command", platform=platform),
+        ]
+        nb_commands = self.shell_comm.nb_commands
+        resolve_executables(dependencies=dependencies)
+        self.assertEqual([True, False], [d.present() for d in dependencies])
+        self.assertEqual(nb_commands + 1, self.shell_comm.nb_commands)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the cache of build artifacts."""
+
+import pathlib
+import subprocess
+import tempfile
+import unittest
+
+from benchkit.platforms import get_current_platform
+from benchkit.utils.buildcache import BuildCache
+
+
+class TestBuildCache(unittest.TestCase):
+    """
+    Unit tests for the cache of build artifacts.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = pathlib.Path(self.tmp_dir.name)
+        self.src = self.root / "src"
+        self.src.mkdir()
+        (self.src / "main.c").write_text("int main() { return 0; }\n")
+        for command in [
+            ["git", "init", "-q"],
+            ["git", "add", "main.c"],
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init"],
+        ]:
+            subprocess.run(command, cwd=self.src, check=True)
+        self.cache = BuildCache(cache_dir=self.root / "cache", platform=get_current_platform())
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _key(self, opt, **kwargs):
+        return self.cache.key(
+            benchmark_name="bench",
+            src_path=self.src,
+            build_variables={"opt": opt},
+            **kwargs,
+        )
+
+    def test_key(self):
+        """The key depends on the build variables and on the uncommitted changes."""
+        key = self._key(opt="O2")
+        self.assertEqual(key, self._key(opt="O2"))
+        self.assertNotEqual(key, self._key(opt="O3"))
+
+        (self.src / "main.c").write_text("int main() { return 1; }\n")
+        self.assertNotEqual(key, self._key(opt="O2"))
+
+    def test_key_build_arguments(self):
+        """The key depends on the other arguments of the build and on the untracked sources."""
+        key = self._key(opt="O2")
+        self.assertNotEqual(key, self._key(opt="O2", constants={"cc": "clang"}))
+        self.assertNotEqual(key, self._key(opt="O2", benchmark_duration_seconds=10))
+
+        # the artifacts of the build are not sources
+        build_dir = self.src / "build"
+        build_dir.mkdir()
+        (build_dir / "main").write_text("binary")
+        self.assertEqual(key, self._key(opt="O2", artifacts=[build_dir]))
+
+        (self.src / "util.h").write_text("#define N 1\n")
+        untracked_key = self._key(opt="O2", artifacts=[build_dir])
+        self.assertNotEqual(key, untracked_key)
+        (self.src / "util.h").write_text("#define N 2\n")
+        self.assertNotEqual(untracked_key, self._key(opt="O2", artifacts=[build_dir]))
+
+    def test_no_git(self):
+        """Sources outside of a git repository cannot be cached."""
+        self.assertIsNone(
+            self.cache.key(benchmark_name="bench", src_path=self.root, build_variables={})
+        )
+
+    def test_store_restore(self):
+        """Stored artifacts are restored at their original location."""
+        binary = self.src / "build" / "main"
+        binary.parent.mkdir()
+        binary.write_text("binary")
+        key = self._key(opt="O2")
+
+        self.assertFalse(self.cache.restore(key=key, artifacts=[binary]))
+        self.cache.store(key=key, artifacts=[binary])
+
+        binary.write_text("other binary")
+        self.assertTrue(self.cache.restore(key=key, artifacts=[binary]))
+        self.assertEqual("binary", binary.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
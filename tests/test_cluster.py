@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the cluster communication layer."""
+
+import pathlib
+import subprocess
+import tempfile
+import time
+import unittest
+
+from benchkit.communication import CommunicationLayer, LocalCommLayer
+from benchkit.communication.cluster import ClusterCommLayer, ClusterError
+
+
+class _BrokenCommLayer(LocalCommLayer):
+    """Local communication layer of a host on which every command fails."""
+
+    async def shell_aio(self, command, **kwargs) -> str:  # pylint: disable=arguments-differ
+        raise subprocess.CalledProcessError(returncode=2, cmd=command, output="broken\n")
+
+    def makedirs(self, path, exist_ok) -> None:
+        raise PermissionError(path)
+
+
+class TestClusterCommLayer(unittest.TestCase):
+    """
+    Unit tests for the cluster communication layer.
+    """
+
+    def _shell_hosts(self, cluster, command):
+        return cluster.shell_hosts(command=command, print_input=False, print_output=False)
+
+    def test_shell(self):
+        """Commands run on every host, their outputs are aggregated per host."""
+        cluster = ClusterCommLayer(comm_layers={"a": LocalCommLayer(), "b": LocalCommLayer()})
+        results = self._shell_hosts(cluster=cluster, command="echo hi")
+        self.assertEqual(["a", "b"], list(results))
+        self.assertTrue(all(r.succeeded and 0 == r.returncode for r in results.values()))
+        self.assertEqual(["hi\n", "hi\n"], [r.output for r in results.values()])
+        output = cluster.shell(command="echo hi", print_input=False, print_output=False)
+        self.assertEqual("a: hi\nb: hi\n", output)
+
+        self.assertEqual(
+            ["localhost", "localhost#1"], ClusterCommLayer([LocalCommLayer()] * 2).hosts
+        )
+
+    def test_concurrent(self):
+        """The hosts run the command at the same time."""
+        cluster = ClusterCommLayer(comm_layers=[LocalCommLayer() for _ in range(6)])
+        start = time.monotonic()
+        self._shell_hosts(cluster=cluster, command="sleep 0.5")
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_partial_failure(self):
+        """Failures are reported per host, and raise beyond the tolerated number of hosts."""
+        comm_layers = {"ok": LocalCommLayer(), "broken": _BrokenCommLayer()}
+        with self.assertRaises(ClusterError) as context:
+            self._shell_hosts(cluster=ClusterCommLayer(comm_layers=comm_layers), command="true")
+        self.assertEqual(["broken"], list(context.exception.failed))
+
+        cluster = ClusterCommLayer(comm_layers=comm_layers, max_failures=1)
+        results = self._shell_hosts(cluster=cluster, command="echo ok")
+        self.assertEqual("ok\n", results["ok"].output)
+        self.assertFalse(results["broken"].succeeded)
+        self.assertEqual((2, "broken\n"), (results["broken"].returncode, results["broken"].output))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "dir"
+            cluster.makedirs(path=path, exist_ok=True)
+            self.assertTrue(path.is_dir())
+            self.assertFalse(cluster.isfile(path=path))
+
+    def test_host_specific(self):
+        """Operations specific to one host are not aggregated, they run per host on request."""
+        cluster = ClusterCommLayer(comm_layers={"a": LocalCommLayer(), "b": LocalCommLayer()})
+        self.assertNotIsInstance(cluster, CommunicationLayer)
+        for operation in ("hostname", "read_file", "which", "stat_many", "signal", "shell_aio"):
+            self.assertFalse(hasattr(cluster, operation))
+
+        results = cluster.run_on_hosts(lambda c: c.hostname())
+        self.assertEqual(["a", "b"], list(results))
+        self.assertEqual({LocalCommLayer().hostname()}, {r.output for r in results.values()})
+
+        self.assertTrue(cluster.shell_succeed(command="true", print_input=False))
+        comm_layers = {"ok": LocalCommLayer(), "broken": _BrokenCommLayer()}
+        for max_failures in (0, 1):
+            cluster = ClusterCommLayer(comm_layers=comm_layers, max_failures=max_failures)
+            self.assertFalse(cluster.shell_succeed(command="true", print_input=False))
+
+    def test_invalid(self):
+        """A cluster needs hosts and a valid failure policy."""
+        with self.assertRaises(ValueError):
+            ClusterCommLayer(comm_layers=[])
+        with self.assertRaises(ValueError):
+            ClusterCommLayer(comm_layers=[LocalCommLayer()], max_failures=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
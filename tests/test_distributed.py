@@ -0,0 +1,111 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the work queue of distributed campaigns."""
+
+import pathlib
+import tempfile
+import threading
+import unittest
+
+from benchkit.distributed import WorkQueue, merge_host_results
+from benchkit.utils.variables import list_groupby
+
+RECORDS = [{"opt": opt, "nb_threads": t} for opt in ("O1", "O2", "O3") for t in (1, 2)]
+
+
+class TestWorkQueue(unittest.TestCase):
+    """
+    Unit tests for the work queue of distributed campaigns.
+    """
+
+    def test_groups(self):
+        """Each build group is handed out once."""
+        work_queue = WorkQueue(build_var_names=["opt"], records=RECORDS)
+        groups = [work_queue.next_group(host_id=0), work_queue.next_group(host_id=1)]
+        groups.append(work_queue.next_group(host_id=0))
+        self.assertEqual(
+            [{"opt": "O1"}, {"opt": "O2"}, {"opt": "O3"}],
+            [build_variables for build_variables, _ in groups],
+        )
+        self.assertEqual(RECORDS, [r for _, records in groups for r in records])
+
+        work_queue.host_finished(host_id=1)
+        self.assertIsNone(work_queue.next_group(host_id=0))
+        self.assertEqual([], work_queue.dropped_groups)
+
+    def test_host_failure(self):
+        """The group of a failed host is run by another host, its rows are discarded."""
+        work_queue = WorkQueue(build_var_names=["opt"], records=RECORDS[:2], max_attempts=2)
+        group = work_queue.next_group(host_id=0)
+
+        # host 1 waits for the group in flight on host 0
+        received = []
+        waiting_host = threading.Thread(
+            target=lambda: received.append(work_queue.next_group(host_id=1))
+        )
+        waiting_host.start()
+        self.assertEqual(group, work_queue.host_failed(host_id=0))
+        waiting_host.join(timeout=5)
+        self.assertEqual([group], received)
+
+        self.assertTrue(work_queue.is_discarded(host_id=0, row={"opt": "O1", "nb_threads": "2"}))
+        self.assertFalse(work_queue.is_discarded(host_id=1, row={"opt": "O1", "nb_threads": "2"}))
+
+        # second failure of the same group: it is dropped
+        work_queue.host_failed(host_id=1)
+        self.assertIsNone(work_queue.next_group(host_id=2))
+        self.assertEqual([group], work_queue.dropped_groups)
+
+    def test_host_space(self):
+        """Grouping by the build variables pulls from the queue, other groupings do not."""
+        work_queue = WorkQueue(build_var_names=["opt"], records=RECORDS)
+        space = work_queue.host_space(host_id=0)
+        self.assertEqual(len(RECORDS), len(space))
+        self.assertEqual(["opt", "nb_threads"], space.names)
+
+        nb_threads_groups = list(
+            list_groupby(variables_names=["nb_threads"], bench_variables=space)
+        )
+        self.assertEqual(2, len(nb_threads_groups))
+
+        opt_groups = list(list_groupby(variables_names=["opt"], bench_variables=space))
+        self.assertEqual(3, len(opt_groups))
+        self.assertIsNone(work_queue.next_group(host_id=1))
+
+    def test_merge(self):
+        """Host results are merged, without the rows of the groups that failed on a host."""
+        work_queue = WorkQueue(build_var_names=["opt"], records=RECORDS[:4])
+        work_queue.next_group(host_id=0)
+        work_queue.host_failed(host_id=0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = pathlib.Path(tmp_dir)
+            (tmp_path / "h0.csv").write_text("# nb_runs: 1\nopt;nb_threads;hostname\nO1;1;h0\n")
+            (tmp_path / "h1.csv").write_text(
+                "# nb_runs: 1\nopt;hostname;nb_threads\nO1;h1;1\nO1;h1;2\n"
+                "# Continuing campaign execution\nO2;h1;1\n"
+            )
+            nb_rows = merge_host_results(
+                work_queue=work_queue,
+                host_csv_paths={0: tmp_path / "h0.csv", 1: tmp_path / "h1.csv"},
+                output_path=tmp_path / "merged.csv",
+                extra_comments=["distributed_hosts: h0,h1"],
+            )
+            merged = (tmp_path / "merged.csv").read_text().splitlines()
+
+        self.assertEqual(3, nb_rows)
+        self.assertEqual(
+            [
+                "# nb_runs: 1",
+                "# distributed_hosts: h0,h1",
+                "opt;nb_threads;hostname",
+                "O1;1;h1",
+                "O1;2;h1",
+                "O2;1;h1",
+            ],
+            merged,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
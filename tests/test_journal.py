@@ -0,0 +1,107 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the campaign journal."""
+
+import pathlib
+import tempfile
+import unittest
+
+from benchkit.results.journal import CampaignJournal
+
+HEADER = "# experiment_name: test\n# nb_runs: 1\n"
+
+
+class TestCampaignJournal(unittest.TestCase):
+    """
+    Unit tests for the campaign journal.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = pathlib.Path(self._tmp_dir.name) / "results.journal"
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_resume(self):
+        """Completed executions are cached, interrupted and failed ones are not."""
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            self.assertTrue(journal.is_new)
+            journal.write_header(header=HEADER, max_nb_threads=0)
+            for a in ("1", "2", "3"):
+                journal.record_started(execution={"a": a, "rep": "1"})
+            journal.record_done(execution={"a": "1", "rep": "1"}, results_lines=[{"a": 1, "m": 5}])
+            journal.record_failed(execution={"a": "2", "rep": "1"}, error="boom")
+
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            self.assertFalse(journal.is_new)
+            self.assertEqual([{"a": "3", "rep": "1"}], journal.interrupted())
+            self.assertEqual([{"a": "2", "rep": "1"}], journal.failed())
+            cache = journal.result_cache()
+            self.assertEqual({"a": "1", "m": "5"}, cache.lookup({"a": "1", "rep": "1"}))
+            self.assertIsNone(cache.lookup({"a": "2", "rep": "1"}))
+
+    def test_torn_entry(self):
+        """A half-written entry is dropped, the next entries are appended after the valid ones."""
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            journal.write_header(header=HEADER, max_nb_threads=0)
+            journal.record_done(execution={"a": "1"}, results_lines=[{"a": 1, "m": 5}])
+        valid_size = self.journal_path.stat().st_size
+        with open(self.journal_path, "ab") as journal_file:
+            journal_file.write(b'42:0badc0de:{"type": "done", "execu')
+
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            self.assertEqual(len(b'42:0badc0de:{"type": "done", "execu'), journal.nb_dropped_bytes)
+            journal.record_done(execution={"a": "2"}, results_lines=[{"a": 2, "m": 6}])
+        self.assertGreater(self.journal_path.stat().st_size, valid_size)
+
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            self.assertEqual(0, journal.nb_dropped_bytes)
+            self.assertEqual([{"a": 1, "m": 5}, {"a": 2, "m": 6}], journal.results_lines())
+
+    def test_corrupted_entry(self):
+        """An entry whose checksum does not match is invalid."""
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            journal.record_done(execution={"a": "1"}, results_lines=[{"a": 1, "m": 5}])
+        content = self.journal_path.read_bytes()
+        self.journal_path.write_bytes(content.replace(b'"m": 5', b'"m": 7'))
+
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            self.assertTrue(journal.is_new)
+            self.assertEqual(len(content), journal.nb_dropped_bytes)
+
+    def test_regenerate_csv(self):
+        """The CSV output is regenerated from the journal, with its comments."""
+        csv_path = pathlib.Path(self._tmp_dir.name) / "results.csv"
+        csv_path.write_text("# experiment_name: test\na;m\n1;5\n2;")
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            journal.write_header(header=HEADER, max_nb_threads=0)
+            journal.record_done(execution={"a": "1"}, results_lines=[{"a": 1, "m": 5}])
+            journal.record_done(execution={"a": "2"}, results_lines=[{"a": 2, "m": 6}])
+            journal.write_comments(text="# total_duration_seconds: 3\n")
+            self.assertEqual(2, journal.regenerate_csv(csv_path=csv_path))
+
+        self.assertEqual(
+            [
+                "# experiment_name: test",
+                "# nb_runs: 1",
+                "a;m",
+                "1;5",
+                "2;6",
+                "# total_duration_seconds: 3",
+            ],
+            csv_path.read_text().splitlines(),
+        )
+
+    def test_reset(self):
+        """Resetting the journal discards its entries."""
+        with CampaignJournal(journal_path=self.journal_path) as journal:
+            journal.record_done(execution={"a": "1"}, results_lines=[{"a": 1}])
+        journal = CampaignJournal(journal_path=self.journal_path).open(reset=True)
+        self.assertTrue(journal.is_new)
+        journal.close()
+        self.assertEqual(0, self.journal_path.stat().st_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the overhead benchmarks of benchkit."""
+
+import tempfile
+import unittest
+
+from benchkit.results.cache import ResultCache
+from tests.overhead.overhead import HELPERS, overhead_campaign
+
+
+class TestOverhead(unittest.TestCase):
+    """
+    Unit tests for the overhead benchmarks of benchkit.
+    """
+
+    def test_campaign(self):
+        """Every helper is timed, on small synthetic campaigns."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            campaign = overhead_campaign(
+                helpers=list(HELPERS),
+                sizes=[10, 100],
+                nb_runs=1,
+                results_dir=tmp_dir,
+            )
+            campaign.run()
+
+            result_cache = ResultCache.from_csv(csv_path=campaign.csv_output_abs_path())
+            for helper in HELPERS:
+                for nb_records in (10, 100):
+                    result = result_cache.lookup({"helper": helper, "nb_records": str(nb_records)})
+                    self.assertIsNotNone(result, msg=helper)
+                    self.assertGreaterEqual(float(result["duration_seconds"]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the Parquet result sink."""
+
+import pathlib
+import tempfile
+import unittest
+
+from benchkit.results.parquet import (
+    ROLE_BUILD_VARIABLE,
+    ROLE_CONSTANT,
+    ROLE_METRIC,
+    ROLE_RUN_VARIABLE,
+    ParquetResultSink,
+    header_metadata,
+    parquet_enabled,
+)
+
+if parquet_enabled():
+    import pyarrow.parquet as pq
+
+
+@unittest.skipUnless(parquet_enabled(), "pyarrow is not installed")
+class TestParquetResultSink(unittest.TestCase):
+    """
+    Unit tests for the Parquet result sink.
+    """
+
+    ROLES = {
+        "hostname": ROLE_CONSTANT,
+        "opt": ROLE_BUILD_VARIABLE,
+        "nb_threads": ROLE_RUN_VARIABLE,
+        "rep": ROLE_RUN_VARIABLE,
+    }
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.parquet_path = pathlib.Path(self._tmp_dir.name) / "results.parquet"
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def sink(self, **kwargs):
+        return ParquetResultSink(
+            parquet_path=self.parquet_path,
+            column_roles=self.ROLES,
+            **kwargs,
+        )
+
+    def test_schema(self):
+        """Columns carry their role and the header is stored in the metadata."""
+        with self.sink(metadata=header_metadata("# nb_runs: 3\n# git_sha: abc\n")) as sink:
+            sink.write_lines(
+                [
+                    {"hostname": "h", "opt": "O2", "nb_threads": 4, "rep": 1, "ops": 10},
+                    {"hostname": "h", "opt": "O2", "nb_threads": 8, "rep": 1, "ops": 12.5},
+                ]
+            )
+            sink.add_metadata({"total_duration_seconds": "1.5"})
+
+        schema = pq.read_schema(self.parquet_path)
+        roles = {field.name: field.metadata[b"role"].decode() for field in schema}
+        self.assertEqual(dict(self.ROLES, ops=ROLE_METRIC), roles)
+        self.assertEqual("int64", str(schema.field("nb_threads").type))
+        self.assertEqual("double", str(schema.field("ops").type))
+        self.assertEqual(b"3", schema.metadata[b"nb_runs"])
+        self.assertEqual(b"abc", schema.metadata[b"git_sha"])
+
+        footer_metadata = pq.read_metadata(self.parquet_path).metadata
+        self.assertEqual(b"1.5", footer_metadata[b"total_duration_seconds"])
+
+    def test_row_groups(self):
+        """Each flush writes a row group, existing rows are kept when reopening the file."""
+        with self.sink() as sink:
+            sink.write_lines([{"opt": "O2", "rep": 1, "ops": 1}])
+            sink.flush()
+            sink.write_lines([{"opt": "O3", "rep": 1, "ops": "N/A"}])
+        self.assertEqual(2, pq.ParquetFile(self.parquet_path).num_row_groups)
+
+        with self.sink() as sink:
+            sink.write_lines([{"opt": "O3", "rep": 2, "ops": 3, "extra": 0}])
+
+        table = pq.read_table(self.parquet_path)
+        self.assertEqual(
+            [
+                {"opt": "O2", "rep": 1, "ops": "1.0", "extra": None},
+                {"opt": "O3", "rep": 1, "ops": "N/A", "extra": None},
+                {"opt": "O3", "rep": 2, "ops": "3", "extra": 0.0},
+            ],
+            table.to_pylist(),
+        )
+
+    def test_schema_evolution(self):
+        """Late columns are added and types are widened, no value is dropped."""
+        with self.sink(metadata={"nb_runs": "1"}) as sink:
+            sink.write_lines([{"nb_threads": 1, "rep": 1, "thread_0": 5}])
+            sink.flush()
+            sink.write_lines([{"nb_threads": 2, "rep": 1.5, "thread_0": 6, "thread_1": 7}])
+            sink.flush()
+            sink.write_lines([{"nb_threads": "many", "rep": 2, "thread_0": 8}])
+
+        table = pq.read_table(self.parquet_path)
+        self.assertEqual(
+            [
+                {"nb_threads": "1", "rep": 1.0, "thread_0": 5.0, "thread_1": None},
+                {"nb_threads": "2", "rep": 1.5, "thread_0": 6.0, "thread_1": 7.0},
+                {"nb_threads": "many", "rep": 2.0, "thread_0": 8.0, "thread_1": None},
+            ],
+            table.to_pylist(),
+        )
+        # the rows are not rewritten at each evolution, only unified once
+        self.assertEqual(3, pq.ParquetFile(self.parquet_path).num_row_groups)
+        self.assertEqual([self.parquet_path], list(self.parquet_path.parent.iterdir()))
+        schema = table.schema
+        self.assertEqual(b"run_variable", schema.field("rep").metadata[b"role"])
+        self.assertEqual(b"metric", schema.field("thread_1").metadata[b"role"])
+        self.assertEqual(b"1", schema.metadata[b"nb_runs"])
+
+
+class TestHeaderMetadata(unittest.TestCase):
+    """
+    Unit tests for the conversion of the CSV header to metadata.
+    """
+
+    def test_header_metadata(self):
+        """Only "key: value" comment lines are kept."""
+        header = "# nb_runs: 3\n# date: 2025-01-01 10:00:00\n## other\n"
+        self.assertEqual(
+            {"nb_runs": "3", "date": "2025-01-01 10:00:00"},
+            header_metadata(header=header),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the pipelined builds of a campaign."""
+
+import pathlib
+import tempfile
+import threading
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+from benchkit.campaign import CampaignIterateVariables
+from benchkit.results.cache import ResultCache
+from tests.overhead.noop import NoopBench
+
+
+class _InProcessBench(NoopBench):
+    def __init__(self, base_dir: pathlib.Path) -> None:
+        super().__init__()
+        self._base_dir = base_dir
+        self.builds = []
+        self.built = {}
+
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return ["version"]
+
+    @staticmethod
+    def get_run_var_names() -> List[str]:
+        return []
+
+    def pipelined_build_base_dir(self) -> pathlib.Path:
+        return self._base_dir
+
+    def build_bench(  # pylint: disable=arguments-differ
+        self,
+        version: int,
+        build_dir: pathlib.Path | None = None,
+        build_cpus: List[int] | None = None,
+        **kwargs,
+    ) -> None:
+        self.builds.append((version, build_dir, build_cpus))
+        if build_dir is not None:
+            (build_dir / "version").write_text(str(version))
+        self.built.setdefault(version, threading.Event()).set()
+
+    def single_run(  # pylint: disable=arguments-differ
+        self,
+        build_variables: Dict[str, Any],
+        build_dir: pathlib.Path | None = None,
+        **kwargs,
+    ) -> str:
+        version = build_variables["version"]
+        # the next version is built while this one runs
+        next_built = self.built.setdefault(version + 1, threading.Event())
+        overlapped = version == 2 or next_built.wait(timeout=5)
+        built_version = None if build_dir is None else int((build_dir / "version").read_text())
+        return f"{overlapped} {built_version}"
+
+    def parse_output_to_results(  # pylint: disable=arguments-differ
+        self,
+        command_output: str,
+        **_kwargs,
+    ) -> Dict[str, Any]:
+        overlapped, built_version = command_output.split()
+        return {"overlapped": overlapped, "built_version": built_version}
+
+
+class TestPipelinedBuilds(unittest.TestCase):
+    """
+    Unit tests for the pipelined builds of a campaign.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = pathlib.Path(self._tmp_dir.name)
+        # the builds and runs are pinned to CPUs that may not exist on the machine running the tests
+        self._affinity = mock.patch("os.sched_setaffinity")
+        self.sched_setaffinity = self._affinity.start()
+        self._allocation = mock.patch("os.sched_getaffinity", return_value=set(range(8)))
+        self.sched_getaffinity = self._allocation.start()
+
+    def tearDown(self):
+        self._allocation.stop()
+        self._affinity.stop()
+        self._tmp_dir.cleanup()
+
+    def _run(self, benchmark: _InProcessBench, **kwargs) -> List[Dict]:
+        campaign = CampaignIterateVariables(
+            name="pipeline",
+            benchmark=benchmark,
+            nb_runs=1,
+            variables=[{"version": v} for v in range(3)],
+            constants=None,
+            debug=False,
+            gdb=False,
+            enable_data_dir=False,
+            results_dir=self.tmp_path / "results",
+            journal=False,
+            pipelined_builds=True,
+            **kwargs,
+        )
+        with (
+            mock.patch.object(benchmark.platform, "nb_cpus", return_value=4),
+            mock.patch.object(benchmark.platform, "isolated_cpus", return_value=[]),
+        ):
+            campaign.run()
+        result_cache = ResultCache.from_csv(csv_path=campaign.csv_output_abs_path())
+        return [result_cache.lookup({"version": str(v)}) for v in range(3)]
+
+    def test_pipelined(self):
+        """The next build overlaps with the current runs, in the other build directory."""
+        benchmark = _InProcessBench(base_dir=self.tmp_path / "builds")
+        records = self._run(benchmark=benchmark, build_cpus=[3])
+
+        self.assertEqual(["True"] * 3, [r["overlapped"] for r in records])
+        self.assertEqual(["0", "1", "2"], [r["built_version"] for r in records])
+        build_dirs = [build_dir.name for _, build_dir, _ in benchmark.builds]
+        self.assertEqual(["pipeline-0", "pipeline-1", "pipeline-0"], build_dirs)
+        self.assertTrue(all([3] == build_cpus for _, _, build_cpus in benchmark.builds))
+
+        # the runs are kept off the CPUs of the builds
+        pinned_cpus = [c.args[1] for c in self.sched_setaffinity.call_args_list]
+        self.assertIn([0, 1, 2], pinned_cpus)
+
+    def test_no_build_cpus(self):
+        """Without CPUs for the builds apart from the runs, the builds are sequential."""
+        benchmark = _InProcessBench(base_dir=self.tmp_path / "builds")
+        benchmark.built = {v: threading.Event() for v in range(4)}
+        for event in benchmark.built.values():
+            event.set()
+        records = self._run(benchmark=benchmark)
+
+        self.assertEqual(["None"] * 3, [r["built_version"] for r in records])
+        self.assertEqual([(v, None, None) for v in range(3)], benchmark.builds)
+
+
+if __name__ == "__main__":
+    unittest.main()
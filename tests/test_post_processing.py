@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the deferrable post-run hooks."""
+
+import functools
+import pathlib
+import tempfile
+import threading
+import unittest
+from typing import Dict, List
+
+from benchkit.benchmark import deferrable, is_deferrable
+from benchkit.campaign import CampaignIterateVariables
+from benchkit.results.cache import ResultCache
+from tests.overhead.noop import NoopBench
+
+
+class _InProcessBench(NoopBench):
+    def __init__(self, post_run_hooks) -> None:
+        super().__init__(post_run_hooks=post_run_hooks)
+        self.started = {}
+
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return []
+
+    def single_run(self, record_id: int, **kwargs) -> str:  # pylint: disable=arguments-differ
+        self.started.setdefault(record_id, threading.Event()).set()
+        return str(record_id)
+
+
+class TestPostProcessing(unittest.TestCase):
+    """
+    Unit tests for the deferrable post-run hooks.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _run(self, benchmark: _InProcessBench, post_processing_workers: int) -> List[Dict]:
+        campaign = CampaignIterateVariables(
+            name="post",
+            benchmark=benchmark,
+            nb_runs=1,
+            variables=[{"record_id": 1}, {"record_id": 2}],
+            constants=None,
+            debug=False,
+            gdb=False,
+            enable_data_dir=True,
+            results_dir=self._tmp_dir.name,
+            journal=False,
+            post_processing_workers=post_processing_workers,
+            post_processing_cpus=[0],
+        )
+        campaign.run()
+        csv_path = campaign.csv_output_abs_path()
+        result_cache = ResultCache.from_csv(csv_path=csv_path)
+        return [result_cache.lookup({"record_id": str(i)}) for i in (1, 2)]
+
+    def test_deferred(self):
+        """The next record starts before the deferred hooks finish, their columns are kept."""
+        benchmark = None
+
+        @deferrable
+        def hook(experiment_results_lines, record_data_dir, write_record_file_fun):
+            record_id = experiment_results_lines[0]["record_id"]
+            next_started = benchmark.started.setdefault(record_id + 1, threading.Event())
+            write_record_file_fun(file_content="done", filename="hook.txt")
+            # record 2 has no next record, it does not wait
+            return {"overlapped": 2 == record_id or next_started.wait(timeout=5)}
+
+        benchmark = _InProcessBench(post_run_hooks=[hook])
+        lines = self._run(benchmark=benchmark, post_processing_workers=1)
+        self.assertEqual(["True", "True"], [line["overlapped"] for line in lines])
+        self.assertEqual(2, len(list(pathlib.Path(self._tmp_dir.name).glob("**/hook.txt"))))
+        self.assertEqual(2, len(list(pathlib.Path(self._tmp_dir.name).glob("**/*_results.json"))))
+
+    def test_synchronous(self):
+        """Without background workers, deferrable hooks run before the next record."""
+        order = []
+
+        @deferrable
+        def deferred_hook(experiment_results_lines, **_kwargs):
+            order.append(("deferred", experiment_results_lines[0]["record_id"]))
+            return {"hooked": 1}
+
+        def hook(experiment_results_lines, **_kwargs):
+            order.append(("sync", experiment_results_lines[0]["record_id"]))
+
+        benchmark = _InProcessBench(post_run_hooks=[deferred_hook, hook])
+        lines = self._run(benchmark=benchmark, post_processing_workers=0)
+        self.assertEqual(["1", "1"], [line["hooked"] for line in lines])
+        self.assertEqual(
+            [("deferred", 1), ("sync", 1), ("deferred", 2), ("sync", 2)],
+            order,
+        )
+
+    def test_is_deferrable(self):
+        """Hooks are deferrable when decorated, also as methods and partial functions."""
+
+        class Hooks:
+            @deferrable
+            def deferred(self, **_kwargs):
+                pass
+
+            def synchronous(self, **_kwargs):
+                pass
+
+        hooks = Hooks()
+        self.assertTrue(is_deferrable(hooks.deferred))
+        self.assertTrue(is_deferrable(functools.partial(hooks.deferred)))
+        self.assertFalse(is_deferrable(hooks.synchronous))
+
+
+if __name__ == "__main__":
+    unittest.main()
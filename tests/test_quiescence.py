@@ -0,0 +1,190 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the quiescence gate."""
+
+import pathlib
+import tempfile
+import unittest
+from typing import Dict, List
+
+from benchkit.campaign import CampaignIterateVariables
+from benchkit.helpers.linux import procfs
+from benchkit.helpers.linux.quiescence import QuiescenceGate, SystemSnapshot
+from benchkit.platforms import get_current_platform
+from benchkit.results.cache import ResultCache
+from tests.overhead.noop import NoopBench
+
+_SNAPSHOT_OUTPUT = """\
+==> loadavg
+0.42 0.30 0.20 2/300 4242
+==> stat
+cpu  300 0 100 1000 0 0 0 20 0 0
+cpu0 100 0 50 500 0 0 0 10 0 0
+cpu1 200 0 50 500 0 0 0 10 0 0
+intr 1000
+==> interrupts
+           CPU0       CPU1
+  0:         40          2   IO-APIC   2-edge      timer
+LOC:        100        300   Local timer interrupts
+ERR:          0
+==> pressure/memory
+some avg10=0.00 avg60=0.00 avg300=0.00 total=5000
+full avg10=0.00 avg60=0.00 avg300=0.00 total=1000
+==> tasks 4242
+1 (systemd) S 0 1 1 0 -1 4194560 0 0 0 0 10 5 0 0 20 0 1 0 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 \
+0 1 0 0
+77 (cron job) R 1 77 77 0 -1 4194560 0 0 0 0 30 10 0 0 20 0 1 0 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 \
+0 0 0 0 1 0 0
+4242 (cat) R 1 4242 4242 0 -1 4194560 0 0 0 0 0 0 0 0 20 0 1 0 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 \
+0 0 0 1 0 0
+"""
+
+
+def _snapshot(
+    timestamp: float,
+    steal: int = 0,
+    interrupts: int = 0,
+    pressure_us: int = 0,
+    tasks: Dict[int, tuple] | None = None,
+) -> SystemSnapshot:
+    return SystemSnapshot(
+        timestamp=timestamp,
+        load1=0.1,
+        cpu_times={
+            0: [100 * timestamp - steal, 0, 0, 0, 0, 0, 0, steal],
+            1: [100 * timestamp, 0, 0, 0, 0, 0, 0, 0],
+        },
+        interrupts={0: interrupts, 1: 0},
+        memory_pressure_us=pressure_us,
+        tasks={} if tasks is None else tasks,
+    )
+
+
+class _NoisyRunGate(QuiescenceGate):
+    """Gate reporting interference during the first `nb_noisy_runs` runs."""
+
+    def __init__(self, nb_noisy_runs: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.nb_noisy_runs = nb_noisy_runs
+
+    def interference(self, before, after, cpus, ignored_tids=()) -> List[str]:
+        if self.nb_noisy_runs > 0:
+            self.nb_noisy_runs -= 1
+            return ["steal 5.0%"]
+        return []
+
+
+class _InProcessBench(NoopBench):
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return []
+
+    def single_run(self, record_id: int, **kwargs) -> str:  # pylint: disable=arguments-differ
+        return str(record_id)
+
+
+class TestQuiescence(unittest.TestCase):
+    """
+    Unit tests for the quiescence gate.
+    """
+
+    def test_parse_snapshot(self):
+        """The snapshot command output is parsed, without the thread of the command itself."""
+        snapshot = SystemSnapshot.parse(content=_SNAPSHOT_OUTPUT, timestamp=1.0)
+        self.assertEqual(0.42, snapshot.load1)
+        self.assertEqual([0, 1], sorted(snapshot.cpu_times))
+        self.assertEqual(10, snapshot.cpu_times[1][procfs.STEAL_INDEX])
+        self.assertEqual({0: 140, 1: 302}, snapshot.interrupts)
+        self.assertEqual(5000, snapshot.memory_pressure_us)
+        self.assertEqual({1: ("systemd", "S", 0, 15), 77: ("cron job", "R", 0, 40)}, snapshot.tasks)
+
+    def test_invalid(self):
+        """A gate needs at least one threshold, and valid bounds."""
+        with self.assertRaises(ValueError):
+            QuiescenceGate(
+                max_runnable_tasks=None,
+                max_memory_pressure=None,
+                max_steal=None,
+                max_foreign_cpu=None,
+            )
+        with self.assertRaises(ValueError):
+            QuiescenceGate(max_retries=-1)
+
+    def test_noise(self):
+        """Runnable threads on the CPUs of the benchmark, IRQ rate and memory pressure."""
+        gate = QuiescenceGate(max_irq_rate=1000, max_memory_pressure=1.0)
+        cron = {77: ("cron", "R", 1, 0)}
+        before = _snapshot(timestamp=0.0)
+        self.assertEqual([], gate.noise(before, _snapshot(timestamp=1.0, tasks=cron), cpus=[0]))
+        self.assertEqual(
+            [],
+            gate.noise(before, _snapshot(timestamp=1.0, tasks=cron), cpus=[1], ignored_tids=[77]),
+        )
+        noise = gate.noise(
+            before,
+            _snapshot(timestamp=1.0, interrupts=2000, pressure_us=50000, tasks=cron),
+            cpus=[0, 1],
+        )
+        self.assertEqual(["runnable cron/77", "irq 2000/s", "memory pressure 5.0%"], noise)
+
+    def test_interference(self):
+        """Steal and foreign threads running on the CPUs of the benchmark during the run."""
+        gate = QuiescenceGate()
+        before = _snapshot(timestamp=0.0, tasks={1: ("daemon", "S", 0, 0)})
+        quiet = _snapshot(timestamp=1.0, tasks={1: ("daemon", "S", 0, 0), 2: ("bench", "R", 0, 90)})
+        self.assertEqual([], gate.interference(before, quiet, cpus=[0]))
+
+        noisy = _snapshot(timestamp=1.0, steal=5, tasks={1: ("daemon", "S", 0, 10)})
+        self.assertEqual(
+            ["steal 5.0%", "foreign threads 10.0% (daemon/1)"],
+            gate.interference(before, noisy, cpus=[0]),
+        )
+        self.assertEqual([], gate.interference(before, noisy, cpus=[1]))
+        self.assertEqual(
+            ["steal 5.0%"],
+            QuiescenceGate(ignored_commands=["daemon"]).interference(before, noisy, cpus=[0]),
+        )
+
+    def test_snapshot_local(self):
+        """A snapshot of the local host has the counters of all its CPUs."""
+        platform = get_current_platform()
+        snapshot = SystemSnapshot.take(platform=platform)
+        self.assertEqual(platform.nb_cpus(), len(snapshot.cpu_times))
+        self.assertTrue(snapshot.tasks)
+
+    def test_retry(self):
+        """Runs with interference are retried, the retried runs are kept and counted."""
+        with tempfile.TemporaryDirectory() as results_dir:
+            campaign = CampaignIterateVariables(
+                name="quiet",
+                benchmark=_InProcessBench(),
+                nb_runs=1,
+                variables=[{"record_id": 1}, {"record_id": 2}],
+                constants=None,
+                debug=False,
+                gdb=False,
+                enable_data_dir=True,
+                results_dir=results_dir,
+                journal=False,
+                quiescence=_NoisyRunGate(
+                    nb_noisy_runs=4,
+                    max_runnable_tasks=None,
+                    max_memory_pressure=None,
+                    sample_interval_seconds=0.01,
+                    max_retries=2,
+                ),
+            )
+            campaign.run()
+            result_cache = ResultCache.from_csv(csv_path=campaign.csv_output_abs_path())
+            first, second = [result_cache.lookup({"record_id": str(i)}) for i in (1, 2)]
+            retried_dirs = sorted(
+                p.name for p in pathlib.Path(results_dir).glob("**/run-*-retry-*")
+            )
+
+        self.assertEqual(("2", "steal 5.0%"), (first["nb_retries"], first["interference"]))
+        self.assertEqual(("1", ""), (second["nb_retries"], second["interference"]))
+        self.assertEqual(["run-1-retry-1", "run-1-retry-1", "run-1-retry-2"], retried_dirs)
+
+
+if __name__ == "__main__":
+    unittest.main()
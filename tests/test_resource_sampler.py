@@ -0,0 +1,171 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the system resource sampler."""
+
+import array
+import json
+import math
+import pathlib
+import tempfile
+import time
+import unittest
+
+from benchkit.helpers.linux import procfs
+from benchkit.helpers.linux.sampler import (
+    SERIES_COLUMNS,
+    SERIES_FILENAME,
+    SERIES_METADATA_FILENAME,
+    ResourceSampler,
+    summarize,
+    time_series,
+)
+
+_DISKSTATS = """\
+   7       0 loop0 100 0 2000 10 0 0 0 0 0 10 10
+   8       0 sda 300 10 4000 50 200 20 1000 30 0 80 80
+   8       1 sda1 290 10 3900 49 190 20 990 29 0 78 78
+ 259       0 nvme0n1 50 0 600 5 40 0 100 4 0 9 9
+ 259       1 nvme0n1p1 50 0 600 5 40 0 100 4 0 9 9
+ 253       0 dm-0 290 0 3900 60 190 0 990 40 0 90 90
+"""
+
+_NET_DEV = """\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo \
+colls carrier compressed
+    lo:    5000      50    0    0    0     0          0         0     5000      50    0    0    0  \
+   0       0          0
+  eth0:    1200      10    0    0    0     0          0         0      800       8    0    0    0  \
+   0       0          0
+  eth1:      34       1    0    0    0     0          0         0       16       1    0    0    0  \
+   0       0          0
+"""
+
+
+def _sample(t: float, busy: int, idle: int, used: int, disk: int, psi: int) -> dict:
+    return {
+        "t": t,
+        "cpu": [busy, 0, 0, idle, 0, 0, 0, 0],
+        "mem": [1000, 1000 - used],
+        "load": [1.0 + t, 1.0, 1.0],
+        "disk": [disk, 2 * disk],
+        "net": [0, 0],
+        "psi": {"memory": {"some": psi, "full": 0}},
+        "self": 0.001 * t,
+    }
+
+
+class TestResourceSampler(unittest.TestCase):
+    """
+    Unit tests for the system resource sampler.
+    """
+
+    def test_parse_stat(self):
+        """The aggregated CPU times are split into busy and idle time."""
+        cpu_times = procfs.parse_stat("cpu  10 1 5 100 4 0 2 0 0 0\ncpu0 10 1 5 100 4 0 2 0 0 0\n")
+        self.assertEqual([10, 1, 5, 100, 4, 0, 2, 0], cpu_times)
+        self.assertEqual((18, 104), procfs.cpu_busy_idle(cpu_times))
+
+    def test_parse_meminfo(self):
+        """Memory sizes are converted to bytes."""
+        meminfo = procfs.parse_meminfo(
+            "MemTotal:        2048 kB\nMemAvailable:    1024 kB\nHugePages_Total:       0\n"
+        )
+        self.assertEqual(
+            {"MemTotal": 2097152, "MemAvailable": 1048576, "HugePages_Total": 0}, meminfo
+        )
+
+    def test_parse_loadavg(self):
+        """The load averages are parsed."""
+        self.assertEqual((0.5, 0.25, 0.1), procfs.parse_loadavg("0.50 0.25 0.10 1/100 4242\n"))
+
+    def test_parse_diskstats(self):
+        """Only physical disks are counted, not their partitions nor virtual devices."""
+        self.assertEqual(
+            ((4000 + 600) * 512, (1000 + 100) * 512), procfs.parse_diskstats(_DISKSTATS)
+        )
+
+    def test_parse_net_dev(self):
+        """The traffic of all the interfaces but the loopback is counted."""
+        self.assertEqual((1234, 816), procfs.parse_net_dev(_NET_DEV))
+
+    def test_parse_pressure(self):
+        """The total stall times are parsed."""
+        pressure = procfs.parse_pressure(
+            "some avg10=0.00 avg60=0.00 avg300=0.00 total=1234\n"
+            "full avg10=0.00 avg60=0.00 avg300=0.00 total=567\n"
+        )
+        self.assertEqual({"some": 1234, "full": 567}, pressure)
+
+    def test_time_series(self):
+        """The series has one row per interval, with rates and NaN for missing counters."""
+        samples = [
+            _sample(t=0.0, busy=0, idle=0, used=100, disk=0, psi=0),
+            _sample(t=1.0, busy=25, idle=75, used=300, disk=1000, psi=100000),
+            _sample(t=3.0, busy=125, idle=75, used=200, disk=2000, psi=100000),
+        ]
+        first, second = time_series(samples=samples)
+        row = dict(zip(SERIES_COLUMNS, first))
+        self.assertEqual(1.0, row["time_seconds"])
+        self.assertEqual(25.0, row["cpu_util_percent"])
+        self.assertEqual(300, row["mem_used_bytes"])
+        self.assertEqual(1000.0, row["disk_read_bytes_per_second"])
+        self.assertEqual(2000.0, row["disk_written_bytes_per_second"])
+        self.assertEqual(10.0, row["psi_memory_some_percent"])
+        self.assertTrue(math.isnan(row["psi_cpu_some_percent"]))
+        self.assertEqual([3.0, 100.0], second[:2])
+
+    def test_summarize(self):
+        """The summary covers the whole run, with peaks over all its samples."""
+        samples = [
+            _sample(t=0.0, busy=0, idle=0, used=100, disk=0, psi=0),
+            _sample(t=1.0, busy=25, idle=75, used=300, disk=1000, psi=100000),
+            _sample(t=2.0, busy=50, idle=150, used=200, disk=2000, psi=100000),
+        ]
+        summary = summarize(samples=samples)
+        self.assertEqual(25.0, summary["resources/cpu_util_avg"])
+        self.assertEqual(300, summary["resources/mem_used_peak"])
+        self.assertEqual(3.0, summary["resources/load1_max"])
+        self.assertEqual(4000, summary["resources/disk_written_bytes"])
+        self.assertEqual(5.0, summary["resources/psi_memory_some"])
+        self.assertNotIn("resources/psi_cpu_some", summary)
+        self.assertAlmostEqual(0.1, summary["resources/sampler_overhead"])
+
+    def test_local_sampler(self):
+        """The local reader samples the runs, the series and summary are written per record."""
+        sampler = ResourceSampler(interval_seconds=0.05)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            record_data_dir = pathlib.Path(tmp_dir)
+
+            def write_record_file_fun(file_content: str, filename: str) -> None:
+                (record_data_dir / filename).write_text(file_content)
+
+            try:
+                sampler.pre_run_hook(
+                    build_variables={},
+                    run_variables={},
+                    other_variables={},
+                    record_data_dir=record_data_dir,
+                )
+                time.sleep(0.3)
+                summary = sampler.post_run_hook(
+                    experiment_results_lines=[{"rep": 1}],
+                    record_data_dir=record_data_dir,
+                    write_record_file_fun=write_record_file_fun,
+                )
+            finally:
+                sampler.close()
+
+            metadata = json.loads((record_data_dir / SERIES_METADATA_FILENAME).read_text())
+            series = array.array("d")
+            series.frombytes((record_data_dir / SERIES_FILENAME).read_bytes())
+
+        self.assertEqual(SERIES_COLUMNS, metadata["columns"])
+        self.assertGreaterEqual(metadata["nb_rows"], 3)
+        self.assertEqual(metadata["nb_rows"] * len(SERIES_COLUMNS), len(series))
+        self.assertGreater(summary["resources/mem_used_peak"], 0)
+        self.assertIn("resources/sampler_overhead", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
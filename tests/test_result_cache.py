@@ -0,0 +1,60 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the index of recorded results."""
+
+import pathlib
+import tempfile
+import unittest
+
+from benchkit.results.cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Unit tests for the index of recorded results.
+    """
+
+    def setUp(self):
+        self.cache = ResultCache(
+            header=["experiment_name", "nb_threads", "rep", "throughput"],
+            rows=[
+                ["exp", "1", "1", "42.0"],
+                ["exp", "2", "1", "84.0"],
+                ["exp", "2", "2", "85.0"],
+            ],
+        )
+
+    def test_cached_record(self):
+        """Records present in the CSV are found, whatever the result columns are."""
+        self.assertIn({"experiment_name": "exp", "nb_threads": "2", "rep": "2"}, self.cache)
+        self.assertNotIn({"experiment_name": "exp", "nb_threads": "1", "rep": "2"}, self.cache)
+        self.assertNotIn({"experiment_name": "other", "nb_threads": "1", "rep": "1"}, self.cache)
+
+    def test_columns_missing_from_header(self):
+        """Record parameters absent from the CSV header are not compared."""
+        record = {"experiment_name": "exp", "nb_threads": "1", "rep": "1", "new_var": "x"}
+        self.assertIn(record, self.cache)
+
+    def test_partial_rows(self):
+        """Values missing in a truncated row match any value."""
+        cache = ResultCache(header=["nb_threads", "rep"], rows=[["4"]])
+        self.assertIn({"nb_threads": "4", "rep": "3"}, cache)
+        self.assertNotIn({"nb_threads": "5", "rep": "3"}, cache)
+
+    def test_empty(self):
+        """Nothing is cached in an empty cache."""
+        self.assertNotIn({"rep": "1"}, ResultCache.empty())
+
+    def test_from_csv(self):
+        """Comment lines are skipped when reading the CSV output."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = pathlib.Path(tmp_dir) / "results.csv"
+            csv_path.write_text("# comment\nnb_threads;rep;duration\n# other\n8;1;0.5\n")
+            cache = ResultCache.from_csv(csv_path=csv_path)
+        self.assertEqual(["nb_threads", "rep", "duration"], cache.header)
+        self.assertEqual(1, len(cache))
+        self.assertIn({"nb_threads": "8", "rep": "1"}, cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the CSV result sink."""
+
+import pathlib
+import tempfile
+import time
+import unittest
+
+from benchkit.results.cache import ResultCache
+from benchkit.results.sink import CsvResultSink, FlushPolicy
+
+
+class TestCsvResultSink(unittest.TestCase):
+    """
+    Unit tests for the CSV result sink.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = pathlib.Path(self._tmp_dir.name) / "results.csv"
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def read_lines(self):
+        return self.csv_path.read_text().splitlines()
+
+    def test_columns(self):
+        """Thread columns are moved to the end and padded in the header."""
+        with CsvResultSink(csv_path=self.csv_path, max_nb_threads=3, echo=False) as sink:
+            sink.write_lines([{"thread_0": 5, "a": 1, "thread_1": 6, "b": 2}])
+            sink.write_lines([{"a": 3, "b": 4}])
+
+        self.assertEqual(
+            ["a;b;thread_0;thread_1;thread_2", "1;2;5;6", "3;4"],
+            self.read_lines(),
+        )
+
+    def test_buffering(self):
+        """Lines are only written once the buffer is full, flushed or the sink closed."""
+        policy = FlushPolicy(max_buffered_lines=3, max_delay_seconds=3600)
+        sink = CsvResultSink(
+            csv_path=self.csv_path,
+            max_nb_threads=1,
+            flush_policy=policy,
+            echo=False,
+        ).open()
+        try:
+            sink.write_lines([{"a": 1}])
+            self.assertEqual([], self.read_lines())
+            sink.write_lines([{"a": 2}])
+            self.assertEqual(["a", "1", "2"], self.read_lines())
+            sink.write_comment("comment")
+            sink.flush()
+            self.assertEqual(["a", "1", "2", "# comment"], self.read_lines())
+            sink.write_lines([{"a": 3}])
+        finally:
+            sink.close()
+        self.assertEqual(["a", "1", "2", "# comment", "3"], self.read_lines())
+        self.assertFalse(sink.is_open)
+
+    def test_delay(self):
+        """Buffered lines are written after the delay, also when no other line follows them."""
+        policy = FlushPolicy(max_buffered_lines=64, max_delay_seconds=0.1)
+        with CsvResultSink(
+            csv_path=self.csv_path,
+            max_nb_threads=1,
+            flush_policy=policy,
+            echo=False,
+        ) as sink:
+            sink.write_lines([{"a": 1}])
+            self.assertEqual([], self.read_lines())
+            deadline = time.monotonic() + 5
+            while not self.read_lines() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(["a", "1"], self.read_lines())
+            self.assertTrue(sink.is_open)
+
+    def test_continuing(self):
+        """Appended lines without header are read back with the previous ones."""
+        with CsvResultSink(csv_path=self.csv_path, max_nb_threads=1, echo=False) as sink:
+            sink.write_lines([{"a": 1, "b": 2}])
+        with CsvResultSink(csv_path=self.csv_path, max_nb_threads=1, echo=False) as sink:
+            sink.skip_header()
+            sink.write_lines([{"a": 3, "b": 4}])
+
+        result_cache = ResultCache.from_csv(csv_path=self.csv_path)
+        self.assertEqual(2, len(result_cache))
+        self.assertIn({"a": "3", "b": "4"}, result_cache)
+
+    def test_invalid_policy(self):
+        """Invalid flush policies are rejected."""
+        with self.assertRaises(ValueError):
+            FlushPolicy(max_buffered_lines=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
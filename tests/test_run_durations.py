@@ -0,0 +1,136 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the run duration model."""
+
+import math
+import pathlib
+import tempfile
+import unittest
+
+from benchkit.campaign import CampaignCartesianProduct
+from benchkit.results.durations import RunDurationModel
+from tests.overhead.noop import NoopBench
+
+
+class _GroupBench(NoopBench):
+    def __init__(self) -> None:
+        super().__init__()
+        self.group_sizes = []
+
+    def single_run(self, **kwargs) -> str:
+        self.group_sizes.append(len(self._group_pending_runs))
+        return "0"
+
+
+class TestRunDurationModel(unittest.TestCase):
+    """
+    Unit tests for the run duration model.
+    """
+
+    def test_empty(self):
+        """Nothing can be predicted before the first observation."""
+        model = RunDurationModel()
+        self.assertIsNone(model.predict({"size": 10}))
+        self.assertIsNone(model.mean_seconds)
+        self.assertFalse(model.knows({"size": 10}))
+
+    def test_observed_records(self):
+        """Observed records get the mean of their durations, the others the overall mean."""
+        model = RunDurationModel()
+        model.observe({"size": 10}, 1.0)
+        model.observe({"size": 10}, 3.0)
+        self.assertAlmostEqual(2.0, model.predict({"size": 10}))
+        self.assertAlmostEqual(2.0, model.predict({"size": 20}))
+        self.assertAlmostEqual(2.0, model.mean_seconds)
+        self.assertTrue(model.knows({"size": 10}))
+        self.assertFalse(model.knows({"size": 20}))
+
+    def test_power_law(self):
+        """Unseen records are extrapolated from the numeric parameters."""
+        model = RunDurationModel()
+        # duration proportional to size / nb_threads
+        for size in (99, 199, 399):
+            for nb_threads in (0, 1, 3):
+                model.observe(
+                    {"size": size, "nb_threads": nb_threads, "lock": "mcs"},
+                    (size + 1) / (nb_threads + 1),
+                )
+        predicted = model.predict({"size": 799, "nb_threads": 3, "lock": "mcs"})
+        self.assertAlmostEqual(200.0, predicted, places=3)
+        self.assertTrue(model.knows({"size": 799, "nb_threads": 3, "lock": "mcs"}))
+
+    def test_unseen_variation(self):
+        """Records differing along a parameter never seen varying are not extrapolated."""
+        model = RunDurationModel()
+        model.observe({"size": 10, "nb_threads": 1}, 1.0)
+        model.observe({"size": 20, "nb_threads": 1}, 2.0)
+        self.assertTrue(model.knows({"size": 40, "nb_threads": 1}))
+        self.assertFalse(model.knows({"size": 10, "nb_threads": 16}))
+        self.assertFalse(model.knows({"size": 10, "nb_threads": 1, "lock": "mcs"}))
+
+    def test_categorical(self):
+        """Non-numeric parameters contribute a factor per value."""
+        model = RunDurationModel()
+        for size in (1, 3, 7):
+            model.observe({"size": size, "lock": "mcs"}, float(size + 1))
+            model.observe({"size": size, "lock": "tas"}, 2.0 * (size + 1))
+        self.assertAlmostEqual(32.0, model.predict({"size": 15, "lock": "tas"}), places=3)
+        self.assertTrue(model.knows({"size": 15, "lock": "tas"}))
+        self.assertFalse(model.knows({"size": 15, "lock": "ticket"}))
+
+    def test_persistence(self):
+        """Durations are stored in the model file and reloaded, invalid lines are ignored."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = pathlib.Path(tmp_dir) / "run_durations.jsonl"
+            model = RunDurationModel(model_path=model_path)
+            model.observe({"size": 10}, 4.0)
+            with open(model_path, "a") as model_file:
+                model_file.write('{"record": {"size"')
+
+            reloaded = RunDurationModel(model_path=model_path)
+            self.assertEqual(1, reloaded.nb_observations)
+            self.assertAlmostEqual(4.0, reloaded.predict({"size": 10}))
+
+
+class TestRemainingDuration(unittest.TestCase):
+    """
+    Unit tests for the duration estimates of a campaign.
+    """
+
+    def _campaign(self, benchmark: NoopBench, tmp_dir: str) -> CampaignCartesianProduct:
+        return CampaignCartesianProduct(
+            name="durations",
+            benchmark=benchmark,
+            nb_runs=2,
+            variables={"build_id": range(3), "record_id": range(4)},
+            constants=None,
+            debug=False,
+            gdb=False,
+            enable_data_dir=False,
+            results_dir=tmp_dir,
+            journal=False,
+            duration_model_path=pathlib.Path(tmp_dir) / "run_durations.jsonl",
+        )
+
+    def test_estimates(self):
+        """Campaigns are estimated from the mean duration, records are predicted per group."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = _GroupBench()
+            campaign = self._campaign(first, tmp_dir)
+            self.assertIsNone(campaign.campaign_duration_seconds())
+            campaign.run()
+            self.assertEqual([4] * 24, first.group_sizes)
+
+            second = _GroupBench()
+            campaign = self._campaign(second, tmp_dir)
+            mean_seconds = RunDurationModel(
+                model_path=pathlib.Path(tmp_dir) / "run_durations.jsonl"
+            ).mean_seconds
+            self.assertEqual(
+                math.ceil(24 * mean_seconds),
+                campaign.campaign_duration_seconds(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the resource-aware scheduler of campaign suites."""
+
+import multiprocessing
+import time
+import unittest
+
+from benchkit.scheduler import ResourcePool, ResourceRequest, run_scheduled
+
+NUMA_NODES_CPUS = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+
+
+def _sleep_and_exit(duration_seconds: float, exit_code: int) -> None:
+    time.sleep(duration_seconds)
+    raise SystemExit(exit_code)
+
+
+class TestResourcePool(unittest.TestCase):
+    """
+    Unit tests for the allocation of the resources of the machine.
+    """
+
+    def test_packing(self):
+        """Small requests are packed in a single NUMA node, on disjoint CPUs."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS)
+        first = pool.allocate(ResourceRequest(nb_cpus=2))
+        second = pool.allocate(ResourceRequest(nb_cpus=2))
+        self.assertEqual([0, 1], first.cpus)
+        self.assertEqual([2, 3], second.cpus)
+
+        spanning = pool.allocate(ResourceRequest(nb_cpus=4))
+        self.assertEqual([4, 5, 6, 7], spanning.cpus)
+        self.assertIsNone(pool.allocate(ResourceRequest(nb_cpus=1)))
+
+        pool.release(first)
+        self.assertEqual([0, 1], pool.allocate(ResourceRequest(nb_cpus=2)).cpus)
+
+    def test_spanning_nodes(self):
+        """Requests larger than the free CPUs of a node span several nodes."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS)
+        pool.allocate(ResourceRequest(nb_cpus=1))
+        allocation = pool.allocate(ResourceRequest(nb_cpus=6))
+        self.assertEqual([0, 1], allocation.numa_nodes)
+        self.assertEqual([1, 2, 4, 5, 6, 7], allocation.cpus)
+
+    def test_whole_nodes(self):
+        """NUMA node requests only get nodes without any allocated CPU."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS)
+        pool.allocate(ResourceRequest(nb_cpus=1))
+        allocation = pool.allocate(ResourceRequest(nb_numa_nodes=1))
+        self.assertEqual([1], allocation.numa_nodes)
+        self.assertEqual([4, 5, 6, 7], allocation.cpus)
+        self.assertIsNone(pool.allocate(ResourceRequest(nb_numa_nodes=1)))
+
+    def test_exclusive(self):
+        """Exclusive requests (the default) run alone on the machine."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS)
+        allocation = pool.allocate(ResourceRequest())
+        self.assertEqual(list(range(8)), allocation.cpus)
+        self.assertIsNone(pool.allocate(ResourceRequest(nb_cpus=1)))
+
+        pool.release(allocation)
+        small = pool.allocate(ResourceRequest(nb_cpus=1))
+        self.assertIsNone(pool.allocate(ResourceRequest(nb_cpus=2, exclusive=True)))
+        pool.release(small)
+        self.assertEqual([0, 1], pool.allocate(ResourceRequest(nb_cpus=2, exclusive=True)).cpus)
+
+    def test_memory(self):
+        """Memory requests are accounted for."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS, memory_bytes=1000)
+        pool.allocate(ResourceRequest(nb_cpus=1, memory_bytes=600))
+        self.assertIsNone(pool.allocate(ResourceRequest(nb_cpus=1, memory_bytes=600)))
+        self.assertIsNotNone(pool.allocate(ResourceRequest(nb_cpus=1, memory_bytes=400)))
+
+    def test_check(self):
+        """Requests that cannot fit the machine are rejected."""
+        pool = ResourcePool(numa_nodes_cpus=NUMA_NODES_CPUS, memory_bytes=1000)
+        pool.check(ResourceRequest(nb_cpus=8))
+        with self.assertRaises(ValueError):
+            pool.check(ResourceRequest(nb_cpus=9))
+        with self.assertRaises(ValueError):
+            pool.check(ResourceRequest(nb_numa_nodes=3))
+        with self.assertRaises(ValueError):
+            pool.check(ResourceRequest(nb_numa_nodes=1, nb_cpus=5))
+        with self.assertRaises(ValueError):
+            pool.check(ResourceRequest(nb_cpus=1, memory_bytes=2000))
+        with self.assertRaises(ValueError):
+            ResourceRequest(nb_cpus=0)
+
+
+class TestRunScheduled(unittest.TestCase):
+    """
+    Unit tests for the execution of jobs according to their resources.
+    """
+
+    def test_run_scheduled(self):
+        """Jobs that fit run concurrently, the others wait for resources to be released."""
+        pool = ResourcePool(numa_nodes_cpus={0: [0, 1]})
+        requests = [
+            ResourceRequest(nb_cpus=1),
+            ResourceRequest(nb_cpus=2),
+            ResourceRequest(nb_cpus=1),
+        ]
+        started = []
+
+        def start(job_id, allocation):
+            started.append((job_id, allocation.cpus))
+            p = multiprocessing.Process(target=_sleep_and_exit, args=(0.2, job_id))
+            p.start()
+            return p
+
+        exit_codes = run_scheduled(requests=requests, pool=pool, start=start)
+
+        self.assertEqual([0, 1, 2], exit_codes)
+        # the third job backfills next to the first one, the second one waits for both
+        self.assertEqual([(0, [0]), (2, [1]), (1, [0, 1])], started)
+
+    def test_unsatisfiable(self):
+        """Requests larger than the machine are rejected before anything starts."""
+        pool = ResourcePool(numa_nodes_cpus={0: [0, 1]})
+        with self.assertRaises(ValueError):
+            run_scheduled(requests=[ResourceRequest(nb_cpus=3)], pool=pool, start=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the successive halving search space."""
+
+import tempfile
+import unittest
+from typing import List
+
+from benchkit.campaign import CampaignSearch
+from benchkit.results.cache import ResultCache
+from benchkit.utils.search import SuccessiveHalvingSpace
+from tests.overhead.noop import NoopBench
+
+
+class _InProcessBench(NoopBench):
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return []
+
+    @staticmethod
+    def get_run_var_names() -> List[str]:
+        return ["x"]
+
+    def valid_experiment_parameters(self, **kwargs) -> bool:
+        return 8 != kwargs.get("x")
+
+    def single_run(self, x: int, **kwargs) -> str:  # pylint: disable=arguments-differ
+        return str(x)
+
+
+class TestSuccessiveHalving(unittest.TestCase):
+    """
+    Unit tests for the successive halving search space.
+    """
+
+    @staticmethod
+    def run_space(space: SuccessiveHalvingSpace, objective):
+        """Run all the records of the space, feeding back the objective of each one."""
+        records = []
+        for _, group in space.groupby(["a"]):
+            for record in group:
+                records.append(record)
+                space.record_results(record, [{"y": objective(record)}])
+        return records
+
+    def test_rounds(self):
+        """The best configurations are kept with longer durations at each round."""
+        space = SuccessiveHalvingSpace(
+            variables={"a": [1, 2], "b": list(range(10))},
+            objective="y",
+            min_duration_seconds=1,
+            max_duration_seconds=9,
+            nb_samples=9,
+        )
+        self.assertEqual(9 + 3 + 1, len(space))
+        self.assertEqual(9 * 1 + 3 * 3 + 1 * 9, space.expected_duration_seconds(None))
+
+        records = self.run_space(space, objective=lambda r: r["a"] * r["b"])
+        self.assertEqual(len(space), len(records))
+        self.assertEqual([0] * 9 + [1] * 3 + [2], sorted(r["search_round"] for r in records))
+        self.assertEqual({1, 3, 9}, {r["benchmark_duration_seconds"] for r in records})
+
+        best_record, best_value = space.best()
+        sampled = [r for r in records if 0 == r["search_round"]]
+        self.assertEqual(max(r["a"] * r["b"] for r in sampled), best_value)
+        self.assertEqual(best_value, best_record["a"] * best_record["b"])
+
+    def test_minimize(self):
+        """The objective can be minimized."""
+        space = SuccessiveHalvingSpace(
+            variables={"a": list(range(20))},
+            objective="y",
+            min_duration_seconds=1,
+            max_duration_seconds=4,
+            eta=2,
+            maximize=False,
+        )
+        self.run_space(space, objective=lambda r: abs(r["a"] - 7))
+        self.assertEqual(({"a": 7}, 0.0), space.best())
+
+    def test_budget(self):
+        """The number of samples is the largest one fitting in the budget."""
+        variables = {"a": list(range(100))}
+        space = SuccessiveHalvingSpace(
+            variables=variables,
+            objective="y",
+            min_duration_seconds=1,
+            max_duration_seconds=9,
+            budget_seconds=100,
+        )
+        self.assertLessEqual(space.expected_duration_seconds(None), 100)
+        with self.assertRaises(ValueError):
+            SuccessiveHalvingSpace(
+                variables=variables,
+                objective="y",
+                min_duration_seconds=1,
+                max_duration_seconds=9,
+                budget_seconds=10,
+            )
+
+    def test_campaign_with_validation(self):
+        """A search campaign runs all its rounds, also when the benchmark validates records."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            benchmark = _InProcessBench()
+            campaign = CampaignSearch(
+                name="search",
+                benchmark=benchmark,
+                nb_runs=1,
+                variables={"x": list(range(9))},
+                objective="value",
+                min_duration_seconds=1,
+                max_duration_seconds=9,
+                constants=None,
+                debug=False,
+                gdb=False,
+                enable_data_dir=False,
+                results_dir=tmp_dir,
+                journal=False,
+            )
+            self.assertEqual(9 + 3 + 1, benchmark.total_nb_runs())
+            campaign.run()
+
+            result_cache = ResultCache.from_csv(csv_path=campaign.csv_output_abs_path())
+            rounds = [result_cache.lookup({"x": str(x), "search_round": "2"}) for x in range(9)]
+            self.assertEqual(["7"], [r["x"] for r in rounds if r is not None])
+            self.assertIsNone(result_cache.lookup({"x": "8", "search_round": "0"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the asyncio coroutines of the shell and communication layers."""
+
+import asyncio
+import contextlib
+import io
+import os
+import pathlib
+import signal
+import subprocess
+import tempfile
+import time
+import unittest
+
+from benchkit.communication import CommunicationLayer, LocalCommLayer
+from benchkit.shell.shell import shell_out
+from benchkit.shell.shellaio import run_sync, shell_out_aio
+
+
+async def _blocking_shell_out():
+    # blocking call from a coroutine running on the event loop of benchkit
+    return shell_out("true")
+
+
+class TestShellAio(unittest.TestCase):
+    """
+    Unit tests for the asyncio coroutines of the shell and communication layers.
+    """
+
+    def setUp(self):
+        self.comm = LocalCommLayer()
+
+    def _shell_aio(self, command, **kwargs):
+        return self.comm.shell_aio(command=command, print_input=False, print_output=False, **kwargs)
+
+    def test_shell_out_aio(self):
+        """The coroutine returns the output of the command, like the blocking function."""
+        output = asyncio.run(shell_out_aio("printf a\\r\\nb", print_input=False))
+        self.assertEqual("a\nb", output)
+        self.assertEqual(output, shell_out("printf a\\r\\nb", print_input=False))
+        output = asyncio.run(shell_out_aio("cat", std_input="in\n", print_input=False))
+        self.assertEqual("in\n", output)
+
+    def test_errors(self):
+        """Failing commands raise the errors of the subprocess module."""
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            asyncio.run(self._shell_aio(["sh", "-c", "echo out; exit 3"]))
+        self.assertEqual(3, context.exception.returncode)
+        self.assertEqual("out\n", context.exception.output)
+        output = asyncio.run(self._shell_aio(["sh", "-c", "exit 3"], ignore_ret_codes=(3,)))
+        self.assertEqual("", output)
+
+        start = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            asyncio.run(self._shell_aio("sleep 10", timeout=0.2))
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_long_line(self):
+        """Logged outputs may have lines longer than the limit of the stream readers."""
+        command = ["python3", "-c", "print('x' * 200000)"]
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            output = shell_out(command, print_input=False, output_is_log=True)
+        self.assertEqual("x" * 200000 + "\n", output)
+        self.assertEqual(output, printed.getvalue())
+
+    def test_concurrent(self):
+        """Commands awaited together run concurrently."""
+
+        async def gather():
+            return await asyncio.gather(*(self._shell_aio("sleep 0.5") for _ in range(8)))
+
+        start = time.monotonic()
+        asyncio.run(gather())
+        self.assertLess(time.monotonic() - start, 3)
+
+    def test_blocking_in_event_loop(self):
+        """The blocking API also works from a coroutine, but not on the loop of benchkit."""
+
+        async def blocking():
+            return self.comm.shell(command="echo a", print_input=False, print_output=False)
+
+        self.assertEqual("a\n", asyncio.run(blocking()))
+        with self.assertRaises(RuntimeError):
+            run_sync(_blocking_shell_out())
+
+    def test_background_subprocess(self):
+        """Background processes are started, signaled and waited by coroutines."""
+
+        async def run():
+            with open(os.devnull, "w") as devnull:
+                process = await self.comm.background_subprocess_aio(
+                    command="sleep 30",
+                    stdout=devnull,
+                    stderr=devnull,
+                    cwd=None,
+                    env=None,
+                )
+            with self.assertRaises(subprocess.TimeoutExpired):
+                await CommunicationLayer.wait_aio(process, timeout=0.1)
+            await self.comm.signal_aio(pid=process.pid, signal_code=signal.SIGTERM)
+            return await CommunicationLayer.wait_aio(process)
+
+        self.assertEqual(-signal.SIGTERM, asyncio.run(run()))
+
+    def test_read_file(self):
+        """Files are read and copied by coroutines."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = pathlib.Path(tmp_dir) / "source.txt"
+            destination = pathlib.Path(tmp_dir) / "destination.txt"
+            source.write_text("content\n")
+            self.assertEqual("content\n", asyncio.run(self.comm.read_file_aio(source)))
+            if self.comm.which("rsync") is not None:
+                asyncio.run(self.comm.copy_to_host_aio(source=source, destination=destination))
+                self.assertEqual("content\n", destination.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the persistent connections of the SSH communication layer."""
+
+import asyncio
+import os
+import pathlib
+import stat
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from benchkit.communication import SSHCommLayer
+
+# fake ssh client logging its arguments: the master creates its socket and waits, the other
+# invocations run the remote command locally
+_FAKE_SSH = textwrap.dedent("""\
+    #!/bin/sh
+    echo "$@" >> "$FAKE_SSH_LOG"
+    case "$1" in
+    -G) printf 'user bench\\nhostname fakehost\\nport 22\\n'; exit 0 ;;
+    -N)
+        [ -n "$FAKE_SSH_MASTER_FAILS" ] && exit 255
+        socket="${2#-oControlPath=}"
+        touch "$socket"
+        trap 'rm -f "$socket"; exit 0' TERM
+        while true; do sleep 0.05; done ;;
+    esac
+    for last; do :; done
+    exec sh -c "$last"
+    """)
+
+
+class TestSSHMultiplexing(unittest.TestCase):
+    """
+    Unit tests for the persistent connections of the SSH communication layer.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        bin_dir = pathlib.Path(self._tmp_dir.name)
+        fake_ssh = bin_dir / "ssh"
+        fake_ssh.write_text(_FAKE_SSH)
+        fake_ssh.chmod(fake_ssh.stat().st_mode | stat.S_IEXEC)
+        self._log_path = bin_dir / "ssh.log"
+        self._environ = mock.patch.dict(
+            os.environ,
+            {
+                "PATH": f"{bin_dir}:{os.environ['PATH']}",
+                "FAKE_SSH_LOG": str(self._log_path),
+            },
+        )
+        self._environ.start()
+        self.comm = SSHCommLayer(host="fakehost", environment=None)
+
+    def tearDown(self):
+        self.comm.close()
+        self._environ.stop()
+        self._tmp_dir.cleanup()
+
+    def _ssh_calls(self):
+        return [line.split() for line in self._log_path.read_text().splitlines()]
+
+    def _shell(self, command: str) -> str:
+        return self.comm.shell(command=command, print_input=False, print_output=False)
+
+    def test_multiplexed(self):
+        """Commands share a single master connection, through its control socket."""
+        self.assertEqual("a\n", self._shell("echo a"))
+        self.assertEqual("b\n", self._shell("echo b"))
+
+        masters = [c for c in self._ssh_calls() if "-N" == c[0]]
+        commands = [c for c in self._ssh_calls() if c[0] not in ("-N", "-G")]
+        self.assertEqual(1, len(masters))
+        self.assertEqual(2, len(commands))
+        control_option = f"-oControlPath={self.comm.control_path}"
+        self.assertIn(control_option, masters[0])
+        self.assertTrue(all(control_option in c for c in commands))
+
+    def test_reconnect(self):
+        """A dead master connection is restarted by the next command."""
+        self._shell("true")
+        self.comm._master.kill()  # pylint: disable=protected-access
+        self.comm._master.wait()  # pylint: disable=protected-access
+        self.assertEqual("c\n", self._shell("echo c"))
+        self.assertEqual(2, len([c for c in self._ssh_calls() if "-N" == c[0]]))
+
+    def test_background_new_connection(self):
+        """Background processes asking for a new connection bypass the master connection."""
+        with open(os.devnull, "w") as devnull:
+            process = self.comm.background_subprocess(
+                command="true",
+                stdout=devnull,
+                stderr=devnull,
+                cwd=None,
+                env=None,
+                establish_new_connection=True,
+            )
+            process.wait()
+        self.assertEqual([["-oControlPath=none", "-t", "fakehost", "true"]], self._ssh_calls()[1:])
+
+    def test_close(self):
+        """Closing stops the master connection and removes its socket."""
+        self._shell("true")
+        master = self.comm._master  # pylint: disable=protected-access
+        control_path = self.comm.control_path
+        self.comm.close()
+        self.assertIsNotNone(master.poll())
+        self.assertFalse(os.path.exists(control_path))
+
+    def test_master_fails(self):
+        """Without master connection, commands open their own connection."""
+        with mock.patch.dict(os.environ, {"FAKE_SSH_MASTER_FAILS": "1"}):
+            self.assertEqual("d\n", self._shell("echo d"))
+            self.assertEqual("e\n", self._shell("echo e"))
+        calls = self._ssh_calls()
+        self.assertEqual(1, len([c for c in calls if "-N" == c[0]]))
+        self.assertEqual([["-t", "fakehost", "echo", "e"]], calls[-1:])
+
+    def test_agent(self):
+        """With an agent, the file operations share a single session of the master connection."""
+        comm = SSHCommLayer(
+            host="fakehost", environment=None, agent=True, python_path=sys.executable
+        )
+        path = pathlib.Path(self._tmp_dir.name) / "dir" / "file.txt"
+        try:
+            comm.makedirs(path.parent, exist_ok=True)
+            comm.write_content_to_file(content="a\n", output_filename=path)
+            comm.append_line_to_file(line="b", output_filename=path)
+            self.assertEqual("a\nb\n", comm.read_file(path))
+            self.assertTrue(comm.path_exists(path))
+            self.assertTrue(comm.isfile(path))
+            self.assertFalse(comm.isdir(path))
+        finally:
+            comm.close()
+        sessions = [c for c in self._ssh_calls() if c[0] not in ("-N", "-G")]
+        self.assertEqual(1, len(sessions))
+        self.assertIn("-T", sessions[0])
+
+    def test_shell_aio(self):
+        """Concurrent coroutines share the master connection, files are read by the agent."""
+
+        async def gather():
+            return await asyncio.gather(
+                *(
+                    self.comm.shell_aio(command=f"echo {i}", print_input=False, print_output=False)
+                    for i in range(4)
+                )
+            )
+
+        self.assertEqual([f"{i}\n" for i in range(4)], asyncio.run(gather()))
+        self.assertEqual(1, len([c for c in self._ssh_calls() if "-N" == c[0]]))
+
+        comm = SSHCommLayer(
+            host="fakehost", environment=None, agent=True, python_path=sys.executable
+        )
+        path = pathlib.Path(self._tmp_dir.name) / "file.txt"
+        path.write_text("agent\n")
+        try:
+            self.assertEqual("agent\n", asyncio.run(comm.read_file_aio(path)))
+        finally:
+            comm.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the snapshot of the platform topology."""
+
+import unittest
+
+from benchkit.communication import CommunicationLayer
+from benchkit.platforms import Platform
+
+
+class CountingCommLayer(CommunicationLayer):
+    """
+    Communication layer of a fake remote host that counts the commands it receives.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.nb_calls = 0
+        self.nb_cpus = 8
+        self.isolated = "4-7"
+
+    @property
+    def remote_host(self) -> str | None:
+        return "fakehost"
+
+    @property
+    def is_local(self) -> bool:
+        return False
+
+    def shell(self, command, **kwargs) -> str:
+        self.nb_calls += 1
+        match command:
+            case "hostname":
+                return "fakehost\n"
+            case "nproc --all":
+                return f"{self.nb_cpus}\n"
+            case "grep -H . /sys/devices/system/node/node*/cpulist":
+                return (
+                    "/sys/devices/system/node/node0/cpulist:0-3\n"
+                    "/sys/devices/system/node/node1/cpulist:4-5,6-7\n"
+                )
+        raise ValueError(f"Unexpected command: {command}")
+
+    def read_file(self, path) -> str:
+        self.nb_calls += 1
+        if "/proc/meminfo" == path:
+            return "MemTotal:       16384 kB\nMemFree:         8192 kB\n"
+        return f"{self.isolated}\n"
+
+
+class TestTopology(unittest.TestCase):
+    """
+    Unit tests for the snapshot of the platform topology.
+    """
+
+    def setUp(self):
+        self.comm = CountingCommLayer()
+        self.platform = Platform(comm_layer=self.comm)
+        self.comm.nb_calls = 0
+
+    def test_queried_once(self):
+        """Topology queries reach the host only once."""
+        for _ in range(100):
+            self.assertEqual(8, self.platform.nb_cpus())
+            self.assertEqual(4, self.platform.nb_active_cpus())
+            self.assertEqual(4, self.platform.nb_isolated_cpus())
+            self.assertEqual([4, 5, 6, 7], self.platform.isolated_cpus())
+        self.assertEqual(2, self.comm.nb_calls)
+
+    def test_invalidate(self):
+        """Invalidating the snapshot queries the host again."""
+        self.assertEqual(8, self.platform.nb_cpus())
+        self.comm.nb_cpus = 16
+        self.comm.isolated = ""
+        self.assertEqual(8, self.platform.nb_cpus())
+
+        self.platform.invalidate_topology()
+        self.assertEqual(16, self.platform.nb_cpus())
+        self.assertEqual(16, self.platform.nb_active_cpus())
+
+    def test_numa_nodes_and_memory(self):
+        """NUMA nodes and memory are parsed and queried once."""
+        for _ in range(10):
+            self.assertEqual(
+                {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]},
+                self.platform.numa_nodes_cpus(),
+            )
+            self.assertEqual(16384 * 1024, self.platform.memory_total_bytes())
+        self.assertEqual(2, self.comm.nb_calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the self-instrumentation of benchkit."""
+
+import functools
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+
+from benchkit.utils.tracing import (
+    CATEGORY_RUN,
+    Tracer,
+    callable_name,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    traced,
+)
+
+
+@traced(category="test", args=lambda value: {"value": value})
+def _double(value: int) -> int:
+    return 2 * value
+
+
+class TestTracing(unittest.TestCase):
+    """
+    Unit tests for the self-instrumentation of benchkit.
+    """
+
+    def tearDown(self):
+        stop_tracing()
+
+    def test_disabled(self):
+        """Without tracer, spans are not recorded and traced functions behave the same."""
+        with trace_span(name="phase", category="test"):
+            pass
+        self.assertEqual(4, _double(2))
+
+    def test_spans(self):
+        """Spans are recorded with their category, nesting and arguments."""
+        tracer = start_tracing()
+        with trace_span(name="outer", category="build", args={"cores": [1, 2]}):
+            self.assertEqual(6, _double(3))
+        stop_tracing()
+        _double(4)
+
+        inner, outer = tracer.events
+        self.assertEqual(("_double", "test"), (inner["name"], inner["cat"]))
+        self.assertEqual({"value": "3"}, inner["args"])
+        self.assertEqual({"cores": "1 2"}, outer["args"])
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+
+    def test_single_tracer(self):
+        """A tracer cannot be started while another one records the spans of the process."""
+        start_tracing()
+        with self.assertRaises(ValueError):
+            start_tracing()
+        stop_tracing()
+        start_tracing()
+
+    def test_chrome_trace(self):
+        """The trace is a Chrome trace-event JSON document, with the names of the threads."""
+        tracer = Tracer()
+        thread = threading.Thread(
+            target=lambda: tracer.add_span(name="run", category=CATEGORY_RUN, start=0, end=1),
+            name="worker-0",
+        )
+        thread.start()
+        thread.join()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = pathlib.Path(tmp_dir) / "trace.json"
+            tracer.write_chrome_trace(trace_path=trace_path)
+            trace = json.loads(trace_path.read_text())
+
+        metadata, span = trace["traceEvents"]
+        self.assertEqual(("M", "worker-0"), (metadata["ph"], metadata["args"]["name"]))
+        self.assertEqual("X", span["ph"])
+        self.assertEqual(metadata["tid"], span["tid"])
+        self.assertAlmostEqual(1e6, span["dur"])
+
+    def test_summary(self):
+        """The overhead of the framework is the time not spent running the benchmark."""
+        tracer = Tracer()
+        tracer.add_span(name="single_run", category=CATEGORY_RUN, start=0.0, end=6.0)
+        tracer.add_span(name="build_bench", category="build", start=6.0, end=8.0)
+        summary = tracer.summary(total_seconds=10.0)
+        self.assertIn("Benchmark time:            6.000 s", summary)
+        self.assertIn("Framework overhead:        4.000 s (40.0%)", summary)
+
+    def test_callable_name(self):
+        """Hooks are named after their function, method or class."""
+
+        class Hook:
+            def __call__(self):
+                pass
+
+            def method(self):
+                pass
+
+        self.assertEqual("_double", callable_name(_double))
+        self.assertEqual("Hook", callable_name(Hook()).rsplit(".", 1)[-1])
+        self.assertTrue(callable_name(Hook().method).endswith("Hook.method"))
+        self.assertEqual("_double", callable_name(functools.partial(_double, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the warmup policy."""
+
+import unittest
+
+from benchkit.results.warmup import WarmupPolicy, is_stable
+
+
+class TestWarmupPolicy(unittest.TestCase):
+    """
+    Unit tests for the warmup policy.
+    """
+
+    def test_is_stable(self):
+        """Values are stable when all of them are close to their mean."""
+        self.assertTrue(is_stable([100.0, 102.0, 98.0], tolerance=0.05))
+        self.assertFalse(is_stable([100.0, 120.0, 98.0], tolerance=0.05))
+        self.assertTrue(is_stable([0.0, 0.0], tolerance=0.05))
+        self.assertFalse(is_stable([], tolerance=0.05))
+
+    def test_fixed(self):
+        """Without metric, a fixed number of repetitions is warmup."""
+        policy = WarmupPolicy(nb_runs=2)
+        self.assertFalse(policy.is_warm([]))
+        self.assertFalse(policy.is_warm([0.0]))
+        self.assertTrue(policy.is_warm([0.0, 0.0]))
+
+    def test_across_runs(self):
+        """With a metric, the warmup goes on until the last repetitions are stable."""
+        policy = WarmupPolicy(metric="throughput", window=2, tolerance=0.05, max_runs=5)
+        self.assertTrue(policy.across_runs)
+        self.assertFalse(policy.is_warm([50.0]))
+        self.assertFalse(policy.is_warm([50.0, 90.0]))
+        self.assertTrue(policy.is_warm([50.0, 90.0, 91.0]))
+        self.assertTrue(policy.is_warm([10.0, 50.0, 10.0, 50.0, 10.0]))
+
+    def test_within_run(self):
+        """Within a run, the lines before the first stable window are warmup."""
+        policy = WarmupPolicy(metric="tps", window=3, within_run=True)
+        self.assertFalse(policy.across_runs)
+        self.assertTrue(policy.is_warm([]))
+        self.assertEqual(2, policy.steady_state_start([10.0, 60.0, 100.0, 101.0, 99.0, 100.0]))
+        self.assertEqual(0, policy.steady_state_start([100.0, 101.0, 99.0]))
+        self.assertIsNone(policy.steady_state_start([10.0, 100.0, 10.0, 100.0]))
+
+    def test_invalid(self):
+        """Inconsistent policies are rejected."""
+        with self.assertRaises(ValueError):
+            WarmupPolicy()
+        with self.assertRaises(ValueError):
+            WarmupPolicy(nb_runs=1, within_run=True)
+        with self.assertRaises(ValueError):
+            WarmupPolicy(metric="m", window=1)
+        with self.assertRaises(ValueError):
+            WarmupPolicy(nb_runs=5, max_runs=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
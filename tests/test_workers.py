@@ -0,0 +1,152 @@
+# Copyright (C) 2025 Vrije Universiteit Brussel. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the parallel workers of a campaign."""
+
+import glob
+import os
+import tempfile
+import threading
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+from benchkit.campaign import CampaignIterateVariables
+from benchkit.results.cache import ResultCache
+from tests.overhead.noop import NoopBench
+
+
+def _attachment(process, record_data_dir) -> None:  # pylint: disable=unused-argument
+    pass
+
+
+class _InProcessBench(NoopBench):
+    def __init__(self, command_attachments=()) -> None:
+        super().__init__(command_attachments=command_attachments)
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.nb_started = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_build_var_names() -> List[str]:
+        return []
+
+    def single_run(self, record_id: int, **kwargs) -> str:  # pylint: disable=arguments-differ
+        with self._lock:
+            self.nb_started += 1
+        if self._command_attachments:
+            command = ["echo", str(record_id)]
+            return self.run_bench_command(
+                run_command=command,
+                wrapped_run_command=command,
+                current_dir=self.bench_src_path,
+                environment=None,
+                wrapped_environment=None,
+                print_output=False,
+            )
+        # both workers must be running a record at the same time to pass the barrier
+        self.barrier.wait()
+        return str(record_id)
+
+
+class TestWorkers(unittest.TestCase):
+    """
+    Unit tests for the parallel workers of a campaign.
+    """
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        # the slots are pinned to CPUs that may not exist on the machine running the tests
+        self._affinity = mock.patch("os.sched_setaffinity")
+        self.sched_setaffinity = self._affinity.start()
+        self._allocation = mock.patch("os.sched_getaffinity", return_value=set(range(8)))
+        self.sched_getaffinity = self._allocation.start()
+
+    def tearDown(self):
+        self._allocation.stop()
+        self._affinity.stop()
+        self._tmp_dir.cleanup()
+
+    def _run(
+        self,
+        benchmark: _InProcessBench,
+        nb_records: int,
+        nb_cpus: int = 4,
+        **kwargs,
+    ) -> List[Dict]:
+        campaign = CampaignIterateVariables(
+            name="workers",
+            benchmark=benchmark,
+            nb_runs=1,
+            variables=[{"record_id": i} for i in range(nb_records)],
+            constants=None,
+            debug=False,
+            gdb=False,
+            enable_data_dir=False,
+            results_dir=self._tmp_dir.name,
+            journal=False,
+            nb_workers=2,
+            **kwargs,
+        )
+        with (
+            mock.patch.object(benchmark.platform, "nb_cpus", return_value=nb_cpus),
+            mock.patch.object(benchmark.platform, "isolated_cpus", return_value=[]),
+        ):
+            campaign.run()
+        result_cache = ResultCache.from_csv(csv_path=campaign.csv_output_abs_path())
+        records = [result_cache.lookup({"record_id": str(i)}) for i in range(nb_records)]
+        return [r for r in records if r is not None]
+
+    def test_slots(self):
+        """Workers get disjoint slots of equal size, on the isolated CPUs if any."""
+        benchmark = _InProcessBench()
+        benchmark._nb_workers = 2  # pylint: disable=protected-access
+        with mock.patch.object(benchmark.platform, "nb_cpus", return_value=5):
+            with mock.patch.object(benchmark.platform, "isolated_cpus", return_value=[]):
+                self.assertEqual(
+                    [[0, 1], [2, 3]],
+                    benchmark._worker_slots(),  # pylint: disable=protected-access
+                )
+            with mock.patch.object(benchmark.platform, "isolated_cpus", return_value=[2, 3, 4]):
+                self.assertEqual(
+                    [[2], [3]],
+                    benchmark._worker_slots(),  # pylint: disable=protected-access
+                )
+
+    def test_concurrent(self):
+        """Records run concurrently, each worker pinned to its own slot."""
+        benchmark = _InProcessBench()
+        records = self._run(benchmark=benchmark, nb_records=4)
+        self.assertEqual(["0", "1", "2", "3"], sorted(r["value"] for r in records))
+        pinned_cpus = {tuple(c.args[1]) for c in self.sched_setaffinity.call_args_list}
+        self.assertEqual({(0, 1), (2, 3)}, pinned_cpus)
+
+    def test_scheduled(self):
+        """The slots of a scheduled campaign are taken from the CPUs allocated to it."""
+        # the scheduler of a suite pins the process of the campaign to its allocation
+        self.sched_getaffinity.return_value = {3, 4, 5, 6, 7}
+        benchmark = _InProcessBench()
+        records = self._run(benchmark=benchmark, nb_records=4, nb_cpus=8)
+        self.assertEqual(4, len(records))
+        pinned_cpus = {tuple(c.args[1]) for c in self.sched_setaffinity.call_args_list}
+        self.assertEqual({(3, 4), (5, 6)}, pinned_cpus)
+        self.assertEqual([7], benchmark._housekeeping_cpus())  # pylint: disable=protected-access
+
+    def test_stop_on_first_finish(self):
+        """The records that did not start when the first one finished are skipped."""
+        benchmark = _InProcessBench()
+        records = self._run(benchmark=benchmark, nb_records=6, stop_on_first_finish=True)
+        self.assertEqual(2, benchmark.nb_started)
+        self.assertEqual(2, len(records))
+
+    def test_async_output_removed(self):
+        """The temporary output of the asynchronous commands is removed after each run."""
+        pattern = os.path.join(tempfile.gettempdir(), "benchkit_lastcmd-*")
+        before = set(glob.glob(pattern))
+        benchmark = _InProcessBench(command_attachments=[_attachment])
+        records = self._run(benchmark=benchmark, nb_records=4)
+        self.assertEqual(4, len(records))
+        self.assertEqual(before, set(glob.glob(pattern)))
+
+
+if __name__ == "__main__":
+    unittest.main()